@@ -26,25 +26,95 @@ INITIAL_SIDEBAR_STATE = "expanded"
 # 사이드바 관련 설정
 SIDEBAR_MAX_SESSIONS = 10
 SESSION_TITLE_MAX_LENGTH = 30
+SESSION_PREVIEW_MAX_LENGTH = 50
+MAX_PINNED_SESSIONS = 7
 
 # 파일 및 디렉토리 설정
 DEFAULT_CONFIG_DIR = ".ted_os_config"
 CHAT_SESSIONS_DIR = "chat_sessions"
 ARTIFACTS_DIR = "artifacts"
 USAGE_DATA_DIR = "usage_data"
+SESSION_USAGE_MAX_SESSIONS = 1024  # 메모리에 유지할 세션별 사용량 수 (오래된 것부터 제거)
+USAGE_FLUSH_INTERVAL_SECONDS = 1.0  # 사용량 기록을 모아 저장하는 간격 (0이면 바로 저장)
+USAGE_FLUSH_BATCH_SIZE = 64  # 이만큼 쌓이면 간격을 기다리지 않고 저장
+USAGE_FSYNC_POLICY = "batch"  # "batch": 저장할 때마다 fsync, "none": OS에 맡김
+USAGE_HOURLY_CHECKPOINT_RECORDS = 1000  # 시간별 사용량 열을 다시 읽은 기록이 이만큼이면 바로 저장
+USAGE_QUERY_PERCENTILES = (50, 90, 99)  # 사용량 조회에서 버킷 값의 기본 백분위
 FAVORITES_DIR = "favorites"
+RESPONSE_CACHE_DIR = "response_cache"
 
 # 데이터 관리 설정
 DATA_CLEANUP_KEEP_DAYS = 90
 
+# 세션 저장 엔진 설정
+DEFAULT_SESSION_STORAGE_ENGINE = "json"  # "json", "log" 또는 "sqlite"
+SESSION_LOG_COMPACT_MIN_RECORDS = 256  # 로그 압축을 고려할 최소 레코드 수
+SESSION_LOG_COMPACT_RATIO = 2.0  # 레코드 수 / 메시지 수가 이 비율을 넘으면 압축
+SESSION_INDEX_FLUSH_DELAY_SECONDS = 1.0  # 인덱스 변경 후 파일에 저장하기까지 대기 시간
+SESSION_CACHE_MAX_ENTRIES = 64  # 메모리에 유지할 최근 세션 수 (0이면 캐시 사용 안 함)
+
+# 세션 검색 설정
+SEARCH_SNIPPET_RADIUS = 60  # 검색어 앞뒤로 보여줄 글자 수
+SEARCH_MAX_MATCHES_PER_SESSION = 3  # 세션마다 보여줄 최대 일치 메시지 수
+
+# 스트리밍 설정
+STREAM_BRIDGE_BUFFER_SIZE = 64  # 이벤트 루프로 넘기기 전 버퍼에 쌓아둘 최대 청크 수
+STREAM_BRIDGE_MAX_WORKERS = 32  # 동시에 처리할 수 있는 동기 제공업체 스트림 수
+SSE_HEARTBEAT_SECONDS = 15.0  # 이벤트가 없을 때 연결 유지용 주석을 보내는 간격
+SSE_RETRY_MILLISECONDS = 2000  # 클라이언트 재연결 대기 시간 (retry 필드)
+SSE_REPLAY_BUFFER_EVENTS = 4096  # 생성마다 다시 보내기 위해 보관하는 최소 이벤트 수
+SSE_REPLAY_TTL_SECONDS = 60.0  # 생성이 끝난 뒤 이어받기를 허용하는 시간
+SSE_RESUME_GRACE_SECONDS = 30.0  # 연결된 클라이언트가 없을 때 생성을 계속하는 시간
+
+# 저장소 백엔드 설정
+DEFAULT_STORAGE_BACKEND = "json"  # "json" 또는 "sqlite" (세션/즐겨찾기/사용량 공통)
+SQLITE_DB_FILENAME = "tedos.db"
+
 # API 관련 설정
 API_RETRY_ATTEMPTS = 3
 API_TIMEOUT_SECONDS = 30
 STREAMING_CHUNK_SIZE = 1024
 
+# 제공업체 HTTP 연결 풀 설정 (읽기 타임아웃은 API_TIMEOUT_SECONDS)
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 10.0
+HTTP_ENABLE_HTTP2 = True  # h2 패키지가 설치된 경우에만 적용
+
+# 재시도/속도 제한 설정 (API_RETRY_ATTEMPTS는 첫 시도를 포함한 총 시도 횟수)
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 20.0  # Retry-After가 이보다 길면 재시도하지 않음
+PROVIDER_REQUESTS_PER_MINUTE = {"openai": 500, "anthropic": 50, "google": 60}
+RATE_LIMIT_BURST_RATIO = 0.1  # 분당 한도 중 한 번에 몰아 보낼 수 있는 비율
+
+# 응답 캐시 설정 (temperature 0 또는 cacheable=True 호출만 저장)
+RESPONSE_CACHE_ENABLED = False
+RESPONSE_CACHE_TTL_SECONDS = 24 * 60 * 60
+RESPONSE_CACHE_MEMORY_ENTRIES = 256
+RESPONSE_CACHE_DISK_ENTRIES = 2000  # 0이면 디스크에 저장하지 않음
+
+# 의미 기반 응답 캐시 설정 (비슷한 질문에 저장된 답변 재사용)
+SEMANTIC_CACHE_ENABLED = False
+SEMANTIC_CACHE_THRESHOLD = 0.9  # 코사인 유사도가 이 값 이상이면 적중
+SEMANTIC_CACHE_MAX_ENTRIES = 1000
+SEMANTIC_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+SEMANTIC_CACHE_DIMENSIONS = 1024  # 해시 n-gram 벡터 차원
+SEMANTIC_CACHE_REPLAY_CHUNK_CHARS = 32  # 저장된 답변을 스트림으로 보낼 때 청크 크기
+
 # 토큰 및 비용 계산 설정
 TOKEN_ESTIMATION_BUFFER = 1.1  # 10% 여유분
 MAX_CONTEXT_TOKENS = 128000
+MESSAGE_TOKEN_OVERHEAD = 4  # 메시지당 역할/구분자 토큰
+IMAGE_TOKEN_ESTIMATE = 1000  # 이미지 한 장의 대략적인 입력 토큰
+APPROX_BYTES_PER_TOKEN = {"anthropic": 3.5, "google": 4.0}  # 토크나이저가 없을 때 UTF-8 바이트당 토큰 추정
+DEFAULT_BYTES_PER_TOKEN = 4.0
+TOKEN_COUNT_MEMO_SIZE = 10000  # 내용 해시별 토큰 수 메모 항목 수
+
+# 대화 기록 예산 설정 (MAX_HISTORY_LENGTH는 유지할 최근 턴 수, 턴 = 사용자 메시지 + 이어지는 응답)
+CONTEXT_TRIM_POLICY = "drop"  # "drop": 오래된 턴 제외, "summarize": 요약 한 줄씩 남김
+CONTEXT_SUMMARY_MAX_TOKENS = 512
+CONTEXT_SUMMARY_SNIPPET_CHARS = 160
 
 # 로깅 설정
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -5,11 +5,12 @@ Ted OS - Anthropic 인터페이스
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple, Generator
+from typing import Dict, List, Optional, Any, Tuple, Generator, AsyncGenerator
 
 import anthropic  # type: ignore
 
 from .base import LLMInterface
+from .http_transport import HttpTransport
 from ..models.data_models import TokenUsage
 
 logger = logging.getLogger(__name__)
@@ -18,12 +19,19 @@ logger = logging.getLogger(__name__)
 class AnthropicInterface(LLMInterface):
     """Anthropic Claude API 인터페이스"""
 
-    def __init__(self, api_key: str):
+    token_provider = "anthropic"
+
+    def __init__(self, api_key: str, transport: Optional[HttpTransport] = None):
         if not api_key:
             raise ValueError("Anthropic API key is missing.")
 
         try:
-            self.client = anthropic.Anthropic(api_key=api_key)
+            # 공유 연결 풀을 쓰면 키가 바뀌어 다시 만들어도 연결이 유지됨
+            self._transport = transport
+            options = transport.sdk_options() if transport else {}
+            self.client = anthropic.Anthropic(api_key=api_key, **options)
+            self._api_key = api_key
+            self._async_client = None
         except Exception as e:
             logger.error(f"Anthropic client init failed: {e}")
             raise
@@ -119,6 +127,47 @@ class AnthropicInterface(LLMInterface):
 
         return api_args
 
+    def _get_async_client(self):
+        """비동기 클라이언트 (처음 사용할 때 생성)"""
+        if self._async_client is None:
+            options = (
+                self._transport.sdk_options(asynchronous=True) if self._transport else {}
+            )
+            self._async_client = anthropic.AsyncAnthropic(api_key=self._api_key, **options)
+        return self._async_client
+
+    @staticmethod
+    def _build_usage(usage: Any, model: str) -> Optional[TokenUsage]:
+        """Anthropic 사용량 객체를 TokenUsage로 변환"""
+        if not usage:
+            return None
+        return TokenUsage(
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            total_tokens=usage.input_tokens + usage.output_tokens,
+            model_name=model,
+            provider="anthropic",
+            timestamp=datetime.now(),
+        )
+
+    @staticmethod
+    def _event_text(event: Any) -> Optional[str]:
+        """스트리밍 이벤트의 텍스트 (텍스트 델타가 아니면 None)"""
+        if (
+            event
+            and event.type == "content_block_delta"
+            and hasattr(event, "delta")
+            and event.delta
+            and hasattr(event.delta, "type")
+            and event.delta.type == "text_delta"
+            and hasattr(event.delta, "text")
+            and event.delta.text
+        ):
+            text_content = event.delta.text
+            if text_content.strip():  # 빈 문자열 체크
+                return text_content
+        return None
+
     def generate(
         self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
     ) -> Tuple[str, Optional[TokenUsage]]:
@@ -134,21 +183,28 @@ class AnthropicInterface(LLMInterface):
             content = "".join(
                 [block.text for block in response.content if block.type == "text"]
             )
+            return content, self._build_usage(response.usage, model)
 
-            # 토큰 사용량 정보 생성
-            usage_data = None
-            if response.usage:
-                usage_data = TokenUsage(
-                    input_tokens=response.usage.input_tokens,
-                    output_tokens=response.usage.output_tokens,
-                    total_tokens=response.usage.input_tokens
-                    + response.usage.output_tokens,
-                    model_name=model,
-                    provider="anthropic",
-                    timestamp=datetime.now(),
-                )
+        except Exception as e:
+            logger.error(f"Anthropic API error (generate): {e}")
+            raise
+
+    async def agenerate(
+        self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
+    ) -> Tuple[str, Optional[TokenUsage]]:
+        """Anthropic API로 응답 생성 (비동기식)"""
+        try:
+            max_tokens = kwargs.pop("max_tokens", 4096)
+            api_args = self._prepare_anthropic_args(messages, kwargs)
 
-            return content, usage_data
+            response = await self._get_async_client().messages.create(
+                model=model, max_tokens=max_tokens, **api_args
+            )  # type: ignore
+
+            content = "".join(
+                [block.text for block in response.content if block.type == "text"]
+            )
+            return content, self._build_usage(response.usage, model)
 
         except Exception as e:
             logger.error(f"Anthropic API error (generate): {e}")
@@ -167,31 +223,42 @@ class AnthropicInterface(LLMInterface):
                 model=model, max_tokens=max_tokens, **api_args
             ) as stream_obj:  # type: ignore
                 for event in stream_obj:
-                    if (
-                        event  # ← 이 부분들이 새로 추가된 안전장치!
-                        and event.type == "content_block_delta"
-                        and hasattr(event, "delta")
-                        and event.delta
-                        and hasattr(event.delta, "type")
-                        and event.delta.type == "text_delta"
-                        and hasattr(event.delta, "text")
-                        and event.delta.text
-                    ):
-                        text_content = event.delta.text
-                        if text_content.strip():  # 빈 문자열 체크
-                            yield text_content
+                    text_content = self._event_text(event)
+                    if text_content:
+                        yield text_content
 
                 final_message = stream_obj.get_final_message()
-                if final_message and final_message.usage:
-                    final_usage_data = TokenUsage(
-                        input_tokens=final_message.usage.input_tokens,
-                        output_tokens=final_message.usage.output_tokens,
-                        total_tokens=final_message.usage.input_tokens
-                        + final_message.usage.output_tokens,
-                        model_name=model,
-                        provider="anthropic",
-                        timestamp=datetime.now(),
-                    )
+                if final_message:
+                    final_usage_data = self._build_usage(final_message.usage, model)
+
+            if final_usage_data:
+                yield ("__USAGE__", final_usage_data)
+
+        except Exception as e:
+            logger.error(f"Anthropic API streaming error: {e}")
+            raise
+
+    async def astream(
+        self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
+    ) -> AsyncGenerator[Any, None]:
+        """Anthropic API로 스트리밍 응답 생성 (비동기식)"""
+        try:
+            max_tokens = kwargs.pop("max_tokens", 4096)
+            api_args = self._prepare_anthropic_args(messages, kwargs)
+            final_usage_data = None
+
+            # 컨텍스트 매니저가 중간 종료 시에도 HTTP 연결을 정리
+            async with self._get_async_client().messages.stream(
+                model=model, max_tokens=max_tokens, **api_args
+            ) as stream_obj:  # type: ignore
+                async for event in stream_obj:
+                    text_content = self._event_text(event)
+                    if text_content:
+                        yield text_content
+
+                final_message = await stream_obj.get_final_message()
+                if final_message:
+                    final_usage_data = self._build_usage(final_message.usage, model)
 
             if final_usage_data:
                 yield ("__USAGE__", final_usage_data)
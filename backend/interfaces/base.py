@@ -3,15 +3,20 @@
 Ted OS - 기본 인터페이스 추상 클래스
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Tuple, Generator
+from typing import Dict, List, Optional, Any, Tuple, Generator, AsyncGenerator
 
 from ..models.data_models import TokenUsage
+from ..utils.async_stream import iterate_in_thread
+from ..utils.token_counter import get_token_counter
 
 
 class LLMInterface(ABC):
     """AI 모델 인터페이스 기본 클래스"""
 
+    token_provider: Optional[str] = None  # 토큰 계산 방식을 고르는 제공업체 이름
+
     @abstractmethod
     def generate(
         self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
@@ -46,6 +51,29 @@ class LLMInterface(ABC):
         """
         pass
 
+    async def agenerate(
+        self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
+    ) -> Tuple[str, Optional[TokenUsage]]:
+        """
+        AI 응답 생성 (비동기식)
+
+        기본 구현은 동기 generate를 스레드에서 실행합니다.
+        비동기 SDK가 있는 제공업체는 재정의하세요.
+        """
+        return await asyncio.to_thread(self.generate, messages, model, **kwargs)
+
+    async def astream(
+        self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
+    ) -> AsyncGenerator[Any, None]:
+        """
+        AI 응답 스트리밍 생성 (비동기식)
+
+        stream과 같은 청크(텍스트, ("__USAGE__", TokenUsage))를 비동기로 전달합니다.
+        기본 구현은 동기 stream을 스레드에서 실행합니다.
+        """
+        async for chunk in iterate_in_thread(self.stream(messages, model, **kwargs)):
+            yield chunk
+
     def validate_api_key(self, api_key: str) -> bool:
         """
         API 키 유효성 검증
@@ -58,30 +86,21 @@ class LLMInterface(ABC):
         """
         return bool(api_key and api_key.strip())
 
-    def estimate_tokens(self, text: str) -> int:
+    def estimate_tokens(self, text: str, model: Optional[str] = None) -> int:
         """
-        텍스트의 토큰 수 추정 (매우 단순한 추정치)
+        텍스트의 토큰 수 추정
 
-        ⚠️ 중요: 이 구현은 매우 단순한 추정치입니다!
-        - 각 AI 제공업체는 서로 다른 토크나이저를 사용합니다
-        - 정확한 토큰 계산이 필요한 경우 각 클라이언트에서 이 메서드를 재정의하세요
-        - 현재 구현은 대략적인 비용 추정 및 제한 확인용으로만 사용하세요
+        공용 TokenCounter를 사용합니다. 하위 클래스는 token_provider만 지정하면
+        OpenAI는 tiktoken으로, 나머지는 제공업체별 바이트 비율로 계산됩니다.
 
         Args:
             text: 추정할 텍스트
+            model: 모델명 (OpenAI 인코더 선택용)
 
         Returns:
-            추정 토큰 수 (실제 토큰 수와 상당한 차이가 있을 수 있음)
-
-        Note:
-            각 제공업체별 정확한 토큰 계산을 위해서는:
-            - OpenAI: tiktoken 라이브러리 사용
-            - Anthropic: 공식 토크나이저 사용
-            - Google: 해당 모델의 토크나이저 사용
+            추정 토큰 수
         """
-        # 간단한 추정 (단어 수 * 1.3) - 실제와 차이가 클 수 있음
-        words = text.split()
-        return int(len(words) * 1.3)
+        return get_token_counter().count_text(text, self.token_provider, model)
 
     def prepare_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
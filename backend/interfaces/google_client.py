@@ -5,11 +5,12 @@ Ted OS - Google 인터페이스
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple, Generator, Union
+from typing import Dict, List, Optional, Any, Tuple, Generator, AsyncGenerator, Union
 
 from google import generativeai as genai  # type: ignore
 
 from .base import LLMInterface
+from .http_transport import HttpTransport
 from ..models.data_models import TokenUsage
 
 logger = logging.getLogger(__name__)
@@ -18,7 +19,10 @@ logger = logging.getLogger(__name__)
 class GoogleInterface(LLMInterface):
     """Google Gemini API 인터페이스"""
 
-    def __init__(self, api_key: str):
+    token_provider = "google"
+
+    def __init__(self, api_key: str, transport: Optional[HttpTransport] = None):
+        # Google SDK는 자체 gRPC 채널(HTTP/2, 연결 유지)을 쓰므로 transport는 사용하지 않음
         if not api_key:
             raise ValueError("Google API key is missing.")
 
@@ -122,160 +126,200 @@ class GoogleInterface(LLMInterface):
 
         return gemini_contents, system_instruction_text
 
+    def _build_request(
+        self, messages: List[Dict[str, Any]], model: str, kwargs: Dict[str, Any]
+    ) -> Tuple[Any, List[Dict[str, Any]], Any]:
+        """생성 모델, 변환된 메시지, 생성 설정 준비"""
+        gemini_contents, system_instruction = self._prepare_google_args(messages)
+
+        # 모델 생성
+        gen_model_args = {"model_name": model}
+        if system_instruction:
+            gen_model_args["system_instruction"] = system_instruction
+
+        generative_model = genai.GenerativeModel(**gen_model_args)  # type: ignore
+
+        # 생성 설정
+        gen_config_args = {}
+        if "temperature" in kwargs:
+            gen_config_args["temperature"] = kwargs["temperature"]
+        if "max_tokens" in kwargs:
+            gen_config_args["max_output_tokens"] = kwargs["max_tokens"]
+        if "top_p" in kwargs:
+            gen_config_args["top_p"] = kwargs["top_p"]
+
+        generation_config = (
+            genai.types.GenerationConfig(**gen_config_args)
+            if gen_config_args
+            else None
+        )
+        return generative_model, gemini_contents, generation_config
+
+    @staticmethod
+    def _build_usage(usage_meta: Any, model: str) -> TokenUsage:
+        """Gemini usage_metadata를 TokenUsage로 변환"""
+        return TokenUsage(
+            input_tokens=usage_meta.prompt_token_count,
+            output_tokens=usage_meta.candidates_token_count,
+            total_tokens=usage_meta.total_token_count,
+            model_name=model,
+            provider="google",
+            timestamp=datetime.now(),
+        )
+
+    def _parse_response(
+        self, response: Any, model: str
+    ) -> Tuple[str, Optional[TokenUsage]]:
+        """응답 본문과 토큰 사용량 추출 (차단/비정상 종료 시 빈 응답)"""
+        # 1. 응답 후보(candidates)가 없는 경우 확인
+        if not response.candidates:
+            logger.warning("Google API 응답에 후보(candidate)가 없습니다.")
+            if hasattr(response, "prompt_feedback"):
+                logger.warning(f"차단 이유: {response.prompt_feedback}")
+            return "", None
+
+        candidate = response.candidates[0]
+
+        # 2. 요청 종료 이유(finish_reason) 확인 (1이 'STOP', 즉 성공)
+        if candidate.finish_reason != 1:
+            # finish_reason의 이름과 안전 등급을 포함하여 상세한 로그 기록
+            logger.warning(
+                f"Google API 호출이 정상적으로 완료되지 않았습니다. "
+                f"종료 이유: {candidate.finish_reason.name} ({candidate.finish_reason}), "
+                f"안전 등급: {candidate.safety_ratings}"
+            )
+            return "", None  # 차단 또는 오류 시 빈 문자열 반환
+
+        # 3. 응답에 내용(content)이 있는지 확인
+        if not candidate.content or not candidate.content.parts:
+            logger.warning(
+                "Google API 응답이 정상 종료되었으나 내용(content)이 없습니다."
+            )
+            return "", None
+
+        content = "".join(
+            part.text for part in candidate.content.parts if hasattr(part, "text")
+        )
+
+        # 토큰 사용량 정보 생성
+        usage_data = None
+        if hasattr(response, "usage_metadata") and response.usage_metadata:
+            usage_data = self._build_usage(response.usage_metadata, model)
+
+        return content, usage_data
+
+    @staticmethod
+    def _chunk_text(chunk: Any) -> Optional[str]:
+        """스트리밍 청크의 텍스트 (차단되었거나 비어 있으면 None)"""
+        try:
+            # chunk와 chunk.text 존재 여부 확인
+            if chunk and hasattr(chunk, "text"):
+                chunk_text = chunk.text
+                if chunk_text and chunk_text.strip():  # None 체크와 빈 문자열 체크
+                    return chunk_text
+        except ValueError as ve:
+            # 차단된 응답 등의 경우 - 로그만 남기고 계속 진행
+            logger.warning(f"Google streaming chunk blocked or invalid: {ve}")
+        except AttributeError as ae:
+            # chunk.text 속성이 없는 경우
+            logger.warning(f"Google streaming chunk has no text attribute: {ae}")
+        return None
+
     def generate(
         self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
     ) -> Tuple[str, Optional[TokenUsage]]:
         """Google Gemini API로 응답 생성 (안전성 강화)"""
         try:
-            gemini_contents, system_instruction = self._prepare_google_args(messages)
-
-            # 모델 생성
-            gen_model_args = {"model_name": model}
-            if system_instruction:
-                gen_model_args["system_instruction"] = system_instruction
-
-            generative_model = genai.GenerativeModel(**gen_model_args)
-
-            # 생성 설정
-            gen_config_args = {}
-            if "temperature" in kwargs:
-                gen_config_args["temperature"] = kwargs["temperature"]
-            if "max_tokens" in kwargs:
-                gen_config_args["max_output_tokens"] = kwargs["max_tokens"]
-            if "top_p" in kwargs:
-                gen_config_args["top_p"] = kwargs["top_p"]
-
-            generation_config = (
-                genai.types.GenerationConfig(**gen_config_args)
-                if gen_config_args
-                else None
+            generative_model, contents, generation_config = self._build_request(
+                messages, model, kwargs
             )
 
             # 컨텐츠 생성
             response = generative_model.generate_content(
-                contents=gemini_contents, generation_config=generation_config
+                contents=contents, generation_config=generation_config
             )
+            return self._parse_response(response, model)
 
-            # === 아래 부분이 핵심 수정 사항입니다 ===
-            # 1. 응답 후보(candidates)가 없는 경우 확인
-            if not response.candidates:
-                logger.warning("Google API 응답에 후보(candidate)가 없습니다.")
-                if hasattr(response, "prompt_feedback"):
-                    logger.warning(f"차단 이유: {response.prompt_feedback}")
-                return "", None
-
-            candidate = response.candidates[0]
-
-            # 2. 요청 종료 이유(finish_reason) 확인 (1이 'STOP', 즉 성공)
-            if candidate.finish_reason != 1:
-                # finish_reason의 이름과 안전 등급을 포함하여 상세한 로그 기록
-                logger.warning(
-                    f"Google API 호출이 정상적으로 완료되지 않았습니다. "
-                    f"종료 이유: {candidate.finish_reason.name} ({candidate.finish_reason}), "
-                    f"안전 등급: {candidate.safety_ratings}"
-                )
-                return "", None  # 차단 또는 오류 시 빈 문자열 반환
-
-            # 3. 응답에 내용(content)이 있는지 확인
-            if not candidate.content or not candidate.content.parts:
-                logger.warning(
-                    "Google API 응답이 정상 종료되었으나 내용(content)이 없습니다."
-                )
-                return "", None
+        except Exception as e:
+            # 재시도 정책이 일시적 오류(429/5xx)를 판별할 수 있도록 다시 던짐
+            logger.error(f"Google API error (generate): {e}")
+            raise
 
-            content = "".join(
-                part.text for part in candidate.content.parts if hasattr(part, "text")
+    async def agenerate(
+        self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
+    ) -> Tuple[str, Optional[TokenUsage]]:
+        """Google Gemini API로 응답 생성 (비동기식)"""
+        try:
+            generative_model, contents, generation_config = self._build_request(
+                messages, model, kwargs
             )
-            # === 수정 끝 ===
-
-            # 토큰 사용량 정보 생성
-            usage_data = None
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                usage_meta = response.usage_metadata
-                usage_data = TokenUsage(
-                    input_tokens=usage_meta.prompt_token_count,
-                    output_tokens=usage_meta.candidates_token_count,
-                    total_tokens=usage_meta.total_token_count,
-                    model_name=model,
-                    provider="google",
-                    timestamp=datetime.now(),
-                )
 
-            return content, usage_data
+            response = await generative_model.generate_content_async(
+                contents=contents, generation_config=generation_config
+            )
+            return self._parse_response(response, model)
 
         except Exception as e:
-            # 예상치 못한 예외 발생 시, 상세한 오류 로그를 남기고 앱이 중단되지 않도록 함
-            logger.error(
-                f"Google API 'generate' 함수에서 심각한 오류 발생: {e}", exc_info=True
-            )
-            return "", None
+            logger.error(f"Google API error (agenerate): {e}")
+            raise
 
     def stream(
         self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
     ) -> Generator[Any, None, None]:
         """Google Gemini API로 스트리밍 응답 생성"""
         try:
-            gemini_contents, system_instruction = self._prepare_google_args(messages)
-
-            # 모델 생성
-            gen_model_args = {"model_name": model}
-            if system_instruction:
-                gen_model_args["system_instruction"] = system_instruction  # type: ignore
-
-            generative_model = genai.GenerativeModel(**gen_model_args)  # type: ignore
-
-            # 생성 설정
-            gen_config_args = {}
-            if "temperature" in kwargs:
-                gen_config_args["temperature"] = kwargs["temperature"]
-            if "max_tokens" in kwargs:
-                gen_config_args["max_output_tokens"] = kwargs["max_tokens"]
-
-            generation_config = (
-                genai.types.GenerationConfig(**gen_config_args)
-                if gen_config_args
-                else None
+            generative_model, contents, generation_config = self._build_request(
+                messages, model, kwargs
             )
 
             # 스트리밍 생성
             stream_response = generative_model.generate_content(
-                contents=gemini_contents,
+                contents=contents,
                 stream=True,
                 generation_config=generation_config,
             )  # type: ignore
 
             final_usage_data = None
             for chunk in stream_response:
-                try:
-                    # chunk와 chunk.text 존재 여부 확인  ← 이 부분들이 새로 추가된 부분!
-                    if chunk and hasattr(chunk, "text"):
-                        chunk_text = chunk.text
-                        if (
-                            chunk_text and chunk_text.strip()
-                        ):  # None 체크와 빈 문자열 체크
-                            yield chunk_text
-                except ValueError as ve:
-                    # 차단된 응답 등의 경우 - 로그만 남기고 계속 진행
-                    logger.warning(f"Google streaming chunk blocked or invalid: {ve}")
-                    continue
-                except AttributeError as ae:
-                    # chunk.text 속성이 없는 경우
-                    logger.warning(
-                        f"Google streaming chunk has no text attribute: {ae}"
-                    )
-                    continue
+                chunk_text = self._chunk_text(chunk)
+                if chunk_text:
+                    yield chunk_text
 
                 # 사용량 정보 수집
                 if hasattr(chunk, "usage_metadata") and chunk.usage_metadata:
-                    um = chunk.usage_metadata
-                    final_usage_data = TokenUsage(
-                        input_tokens=um.prompt_token_count,
-                        output_tokens=um.candidates_token_count,
-                        total_tokens=um.total_token_count,
-                        model_name=model,
-                        provider="google",
-                        timestamp=datetime.now(),
-                    )
+                    final_usage_data = self._build_usage(chunk.usage_metadata, model)
+
+            if final_usage_data:
+                yield ("__USAGE__", final_usage_data)
+
+        except Exception as e:
+            logger.error(f"Google API streaming error: {e}")
+            raise
+
+    async def astream(
+        self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
+    ) -> AsyncGenerator[Any, None]:
+        """Google Gemini API로 스트리밍 응답 생성 (비동기식)"""
+        try:
+            generative_model, contents, generation_config = self._build_request(
+                messages, model, kwargs
+            )
+
+            stream_response = await generative_model.generate_content_async(
+                contents=contents,
+                stream=True,
+                generation_config=generation_config,
+            )  # type: ignore
+
+            final_usage_data = None
+            async for chunk in stream_response:
+                chunk_text = self._chunk_text(chunk)
+                if chunk_text:
+                    yield chunk_text
+
+                # 사용량 정보 수집
+                if hasattr(chunk, "usage_metadata") and chunk.usage_metadata:
+                    final_usage_data = self._build_usage(chunk.usage_metadata, model)
 
             if final_usage_data:
                 yield ("__USAGE__", final_usage_data)
@@ -0,0 +1,131 @@
+# ted-os-project/backend/interfaces/http_transport.py
+"""
+Ted OS - 제공업체 SDK가 함께 쓰는 HTTP 연결 풀
+
+OpenAI/Anthropic 클라이언트에 같은 httpx 클라이언트를 넘겨 keep-alive 연결을 재사용합니다.
+(API 키가 바뀌어 SDK 클라이언트를 다시 만들어도 연결 풀은 유지)
+httpx가 없으면 각 SDK의 기본 설정을 그대로 사용합니다.
+"""
+
+import importlib.util
+import logging
+import threading
+from typing import Any, Dict
+
+from ..core.config import (
+    API_TIMEOUT_SECONDS,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_ENABLE_HTTP2,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class HttpTransport:
+    """연결 풀 크기, 타임아웃, HTTP/2 설정을 가진 공유 httpx 클라이언트"""
+
+    def __init__(
+        self,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = API_TIMEOUT_SECONDS,
+        http2: bool = HTTP_ENABLE_HTTP2,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        # HTTP/2는 h2 패키지가 있어야 사용 가능
+        self.http2 = bool(http2) and importlib.util.find_spec("h2") is not None
+        self._sync_client = None
+        self._async_client = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings) -> "HttpTransport":
+        """settings의 network 섹션으로 생성"""
+        network = settings.get("network", {}) or {}
+        return cls(
+            max_connections=network.get("max_connections", HTTP_MAX_CONNECTIONS),
+            max_keepalive_connections=network.get(
+                "max_keepalive_connections", HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=network.get("keepalive_expiry", HTTP_KEEPALIVE_EXPIRY_SECONDS),
+            connect_timeout=network.get("connect_timeout", HTTP_CONNECT_TIMEOUT_SECONDS),
+            read_timeout=network.get("read_timeout", API_TIMEOUT_SECONDS),
+            http2=network.get("http2", HTTP_ENABLE_HTTP2),
+        )
+
+    def _client_kwargs(self, httpx) -> Dict[str, Any]:
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "timeout": self._timeout(httpx),
+            "http2": self.http2,
+        }
+
+    def _timeout(self, httpx):
+        """연결/읽기 타임아웃을 분리한 httpx.Timeout"""
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+    def sync_client(self):
+        """공유 동기 클라이언트 (httpx가 없으면 None)"""
+        with self._lock:
+            if self._sync_client is None:
+                try:
+                    import httpx  # type: ignore
+                except ImportError:
+                    logger.warning("httpx not installed, using SDK default HTTP clients")
+                    return None
+                self._sync_client = httpx.Client(**self._client_kwargs(httpx))
+                logger.info(
+                    f"Shared HTTP client created (max_connections={self.max_connections}, "
+                    f"keepalive={self.max_keepalive_connections}, http2={self.http2})"
+                )
+            return self._sync_client
+
+    def async_client(self):
+        """공유 비동기 클라이언트 (httpx가 없으면 None, 처음 사용하는 이벤트 루프에 묶임)"""
+        with self._lock:
+            if self._async_client is None:
+                try:
+                    import httpx  # type: ignore
+                except ImportError:
+                    return None
+                self._async_client = httpx.AsyncClient(**self._client_kwargs(httpx))
+            return self._async_client
+
+    def sdk_options(self, asynchronous: bool = False) -> Dict[str, Any]:
+        """OpenAI/Anthropic SDK 생성자에 넘길 인자 (http_client, timeout, max_retries)"""
+        # 재시도는 ResponseManager의 RetryPolicy가 담당 (SDK 자체 재시도와 중복 방지)
+        options: Dict[str, Any] = {"max_retries": 0}
+        client = self.async_client() if asynchronous else self.sync_client()
+        if client is None:
+            return options
+        import httpx  # type: ignore
+
+        options.update(http_client=client, timeout=self._timeout(httpx))
+        return options
+
+    def close(self):
+        """동기 클라이언트 연결 정리 (비동기 클라이언트는 aclose로 정리)"""
+        with self._lock:
+            client, self._sync_client = self._sync_client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self):
+        """비동기 클라이언트 연결 정리"""
+        with self._lock:
+            client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.aclose()
@@ -5,11 +5,12 @@ Ted OS - OpenAI 인터페이스
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple, Generator
+from typing import Dict, List, Optional, Any, Tuple, Generator, AsyncGenerator
 
 import openai  # type: ignore
 
 from .base import LLMInterface
+from .http_transport import HttpTransport
 from ..models.data_models import TokenUsage
 
 logger = logging.getLogger(__name__)
@@ -18,12 +19,19 @@ logger = logging.getLogger(__name__)
 class OpenAIInterface(LLMInterface):
     """OpenAI API 인터페이스"""
 
-    def __init__(self, api_key: str):
+    token_provider = "openai"
+
+    def __init__(self, api_key: str, transport: Optional[HttpTransport] = None):
         if not api_key:
             raise ValueError("OpenAI API key is missing or empty.")
 
         try:
-            self.client = openai.OpenAI(api_key=api_key)
+            # 공유 연결 풀을 쓰면 키가 바뀌어 다시 만들어도 연결이 유지됨
+            self._transport = transport
+            options = transport.sdk_options() if transport else {}
+            self.client = openai.OpenAI(api_key=api_key, **options)
+            self._api_key = api_key
+            self._async_client = None
         except Exception as e:
             logger.error(f"OpenAI client initialization failed: {e}")
             raise
@@ -76,22 +84,61 @@ class OpenAIInterface(LLMInterface):
 
         return params
 
-        # OpenAI 전용 매개변수
-        valid_openai_params = [
-            "top_p",
-            "presence_penalty",
-            "frequency_penalty",
-            "stop",
-            "seed",
-            "logprobs",
-            "top_logprobs",
-        ]
-
-        for k, v in kwargs.items():
-            if k in valid_openai_params:
-                params[k] = v
+    def _get_async_client(self):
+        """비동기 클라이언트 (처음 사용할 때 생성)"""
+        if self._async_client is None:
+            options = (
+                self._transport.sdk_options(asynchronous=True) if self._transport else {}
+            )
+            self._async_client = openai.AsyncOpenAI(api_key=self._api_key, **options)
+        return self._async_client
+
+    @staticmethod
+    def _parse_response(response: Any, model: str) -> Tuple[str, Optional[TokenUsage]]:
+        """응답 본문과 토큰 사용량 추출"""
+        content = response.choices[0].message.content or ""
+
+        # 토큰 사용량 정보 생성
+        usage_data = None
+        if response.usage:
+            usage_data = TokenUsage(
+                input_tokens=response.usage.prompt_tokens,
+                output_tokens=response.usage.completion_tokens,
+                total_tokens=response.usage.total_tokens,
+                model_name=model,
+                provider="openai",
+                timestamp=datetime.now(),
+            )
 
-        return params
+        return content, usage_data
+
+    @staticmethod
+    def _chunk_content(chunk: Any) -> Optional[str]:
+        """스트리밍 청크의 텍스트 (없으면 None)"""
+        if (
+            chunk.choices
+            and chunk.choices[0].delta
+            and chunk.choices[0].delta.content is not None
+        ):
+            return chunk.choices[0].delta.content or None
+        return None
+
+    @staticmethod
+    def _translate_error(e: Exception) -> Exception:
+        """OpenAI SDK 예외를 앱 공통 예외로 변환"""
+        if isinstance(e, openai.APIConnectionError):  # type: ignore
+            logger.error(f"OpenAI API Connection Error: {e}")
+            return ConnectionError(f"OpenAI API Connection Error: {e}")
+        if isinstance(e, openai.RateLimitError):  # type: ignore
+            logger.error(f"OpenAI API Rate Limit Error: {e}")
+            return PermissionError(f"OpenAI API Rate Limit Error: {e}")
+        if isinstance(e, openai.APIStatusError):  # type: ignore
+            logger.error(
+                f"OpenAI API Status Error (code {e.status_code}): {e.response}"
+            )
+            return ValueError(f"OpenAI API Status Error: {e.response}")
+        logger.error(f"OpenAI API error (generate): {e}")
+        return e
 
     def generate(
         self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
@@ -103,37 +150,31 @@ class OpenAIInterface(LLMInterface):
             response = self.client.chat.completions.create(
                 model=model, messages=messages, **api_params  # type: ignore
             )
+            return self._parse_response(response, model)
 
-            content = response.choices[0].message.content or ""
-
-            # 토큰 사용량 정보 생성
-            usage_data = None
-            if response.usage:
-                usage_data = TokenUsage(
-                    input_tokens=response.usage.prompt_tokens,
-                    output_tokens=response.usage.completion_tokens,
-                    total_tokens=response.usage.total_tokens,
-                    model_name=model,
-                    provider="openai",
-                    timestamp=datetime.now(),
-                )
+        except Exception as e:
+            error = self._translate_error(e)
+            if error is e:
+                raise
+            raise error
 
-            return content, usage_data
+    async def agenerate(
+        self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
+    ) -> Tuple[str, Optional[TokenUsage]]:
+        """OpenAI API로 응답 생성 (비동기식)"""
+        try:
+            api_params = self._get_model_params(model, **kwargs)
 
-        except openai.APIConnectionError as e:  # type: ignore
-            logger.error(f"OpenAI API Connection Error: {e}")
-            raise ConnectionError(f"OpenAI API Connection Error: {e}")
-        except openai.RateLimitError as e:  # type: ignore
-            logger.error(f"OpenAI API Rate Limit Error: {e}")
-            raise PermissionError(f"OpenAI API Rate Limit Error: {e}")
-        except openai.APIStatusError as e:  # type: ignore
-            logger.error(
-                f"OpenAI API Status Error (code {e.status_code}): {e.response}"
+            response = await self._get_async_client().chat.completions.create(
+                model=model, messages=messages, **api_params  # type: ignore
             )
-            raise ValueError(f"OpenAI API Status Error: {e.response}")
+            return self._parse_response(response, model)
+
         except Exception as e:
-            logger.error(f"OpenAI API error (generate): {e}")
-            raise
+            error = self._translate_error(e)
+            if error is e:
+                raise
+            raise error
 
     def stream(
         self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
@@ -150,19 +191,42 @@ class OpenAIInterface(LLMInterface):
             )
 
             for chunk in stream_response:
-                if (
-                    chunk.choices
-                    and chunk.choices[0].delta
-                    and chunk.choices[0].delta.content is not None
-                ):
-                    content = chunk.choices[0].delta.content
-                    if content:
-                        yield content
+                content = self._chunk_content(chunk)
+                if content:
+                    yield content
 
         except Exception as e:
             logger.error(f"OpenAI API streaming error: {e}")
             raise
 
+    async def astream(
+        self, messages: List[Dict[str, Any]], model: str, **kwargs: Any
+    ) -> AsyncGenerator[str, None]:
+        """OpenAI API로 스트리밍 응답 생성 (비동기식)"""
+        stream_response = None
+        try:
+            api_params = self._get_model_params(model, **kwargs)
+
+            stream_response = await self._get_async_client().chat.completions.create(
+                model=model,
+                messages=messages,  # type: ignore
+                stream=True,
+                **api_params,
+            )
+
+            async for chunk in stream_response:
+                content = self._chunk_content(chunk)
+                if content:
+                    yield content
+
+        except Exception as e:
+            logger.error(f"OpenAI API streaming error: {e}")
+            raise
+        finally:
+            # 소비 측이 중간에 멈춰도 HTTP 연결을 바로 반환
+            if stream_response is not None:
+                await stream_response.close()
+
     def get_supported_features(self) -> Dict[str, bool]:
         """OpenAI 지원 기능"""
         return {
@@ -173,18 +237,3 @@ class OpenAIInterface(LLMInterface):
             "logprobs": True,
             "seed": True,
         }
-
-    def estimate_tokens(self, text: str) -> int:
-        """OpenAI tiktoken을 이용한 토큰 수 추정"""
-        try:
-            import tiktoken
-
-            # 기본 인코딩 사용
-            enc = tiktoken.get_encoding("cl100k_base")
-            return len(enc.encode(text))
-        except ImportError:
-            logger.warning("tiktoken not installed, using basic estimation")
-            return super().estimate_tokens(text)
-        except Exception as e:
-            logger.warning(f"Error estimating tokens: {e}")
-            return super().estimate_tokens(text)
@@ -3,10 +3,13 @@
 Ted OS - Backend API Server (FastAPI)
 """
 
+import asyncio
+import atexit
 import sys
+from contextlib import aclosing, asynccontextmanager
 from pathlib import Path
 import uvicorn
-from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks
+from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks, Query, Header
 from fastapi.middleware.cors import CORSMiddleware
 
 # --- 프로젝트 루트 경로 설정 ---
@@ -20,12 +23,21 @@ from backend.managers.settings import SettingsManager
 from backend.managers.chat_sessions import ChatSessionManager
 from backend.managers.model_manager import EnhancedModelManager
 from backend.managers.usage_tracker import UsageTracker
-from backend.models.data_models import ChatSession, FavoriteMessage
+from backend.models.data_models import (
+    ChatSession,
+    SessionSummary,
+    SessionSearchResult,
+    FavoriteMessage,
+)
 from backend.models.enums import ModelProvider
 from backend.managers.favorite_manager import FavoriteManager
 from backend.managers.spotify_manager import SpotifyManager
+from backend.managers.storage import SQLiteDatabase, SQLiteFavoriteStore, SQLiteUsageStore
+from backend.managers.storage.migrate import is_migrated, migrate_json_to_sqlite
 from backend.models.model_registry import ModelRegistry
-from datetime import datetime
+from backend.core.config import MAX_PINNED_SESSIONS
+from backend.utils.sse import SSE_HEADERS, EventStreamRegistry, parse_event_id
+from datetime import datetime, timedelta
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
 from concurrent.futures import ThreadPoolExecutor
@@ -78,13 +90,24 @@ class JobManager:
 
 job_manager = JobManager()
 
+# 생성별 SSE 이벤트 버퍼 (연결이 끊겨도 Last-Event-ID로 이어받기)
+event_streams = EventStreamRegistry()
+
 # ------------------------------------
 
 # --- FastAPI 애플리케이션 생성 ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 종료 시 지연된 쓰기와 제공업체 연결 정리
+    await app_context.model_manager.transport.aclose()
+    app_context.close()
+
 app = FastAPI(
     title="Ted OS Backend API",
     description="Ted OS의 비즈니스 로직을 제공하는 API 서버",
     version="0.1.0",
+    lifespan=lifespan,
 )
 # CORS 설정 추가
 app.add_middleware(
@@ -93,6 +116,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # 모든 HTTP 메서드 허용
     allow_headers=["*"],  # 모든 헤더 허용
+    expose_headers=["X-Generation-Id"],  # 스트리밍 중단 요청에 필요
 )
 # ---------------------------------
 
@@ -103,13 +127,52 @@ class AppContext:
     def __init__(self):
         self.settings = SettingsManager()
         self.settings.ensure_paths_exist()
-        self.usage_tracker = UsageTracker(self.settings.get("paths.usage_tracking"))
+        self.database = self._open_database()
+        self.usage_tracker = UsageTracker.from_settings(
+            self.settings,
+            store=SQLiteUsageStore(self.database) if self.database else None,
+        )
         self.model_manager = EnhancedModelManager(self.settings, self.usage_tracker)
-        self.chat_manager = ChatSessionManager(self.settings.get("paths.chat_sessions"))
-        self.favorite_manager = FavoriteManager(self.settings.get("paths.favorites"))
+        self.chat_manager = ChatSessionManager(
+            self.settings.get("paths.chat_sessions"),
+            engine=(
+                "sqlite"
+                if self.database
+                else self.settings.get("storage.session_engine", "json")
+            ),
+            database=self.database,
+        )
+        self.favorite_manager = FavoriteManager(
+            self.settings.get("paths.favorites"),
+            store=SQLiteFavoriteStore(self.database) if self.database else None,
+        )
         self.spotify_manager = SpotifyManager(self.settings)
 
+    def _open_database(self) -> Optional[SQLiteDatabase]:
+        """storage.backend가 sqlite이면 DB를 열고 처음 한 번 JSON 데이터를 옮김"""
+        if self.settings.get("storage.backend", "json") != "sqlite":
+            return None
+
+        database = SQLiteDatabase(self.settings.get("storage.sqlite_path"))
+        if not is_migrated(database):
+            migrate_json_to_sqlite(
+                database,
+                self.settings.get("paths.chat_sessions"),
+                self.settings.get("paths.favorites"),
+                self.settings.get("paths.usage_tracking"),
+            )
+        return database
+
+    def close(self):
+        """지연된 인덱스/사용량 쓰기를 저장하고 DB/HTTP 연결 정리 (여러 번 호출해도 안전)"""
+        self.chat_manager.close()
+        self.usage_tracker.close()
+        self.model_manager.transport.close()
+        if self.database:
+            self.database.close()
+
 app_context = AppContext()
+atexit.register(app_context.close)  # lifespan 종료 없이 끝나는 경우 대비
 # ------------------------------------
 
 # --- FastAPI 의존성 주입 ---
@@ -167,14 +230,46 @@ class UsageStatsResponse(BaseModel):
     usage_by_model: Dict[str, Any]
     usage_trends: List[Dict[str, Any]]
     estimated_monthly_cost: float
+    retry_stats: Dict[str, Any] = {}  # 제공업체별 재시도/속도 제한 대기 (서버 시작 이후)
+    response_cache: Dict[str, Any] = {}  # 응답 캐시 적중/미스, 절약한 토큰/비용
+    semantic_cache: Dict[str, Any] = {}  # 의미 캐시 적중/미스, 절약한 토큰/비용
     message: str = "Usage statistics retrieved successfully"
 
+class UsageQueryResponse(BaseModel):
+    """사용량 범위 조회 응답 모델 (그룹별 버킷 값, 합계, 백분위)"""
+    start: str
+    end: str
+    bucket: str
+    group_by: List[str]
+    totals: Dict[str, Any]
+    groups: List[Dict[str, Any]]
+    rows: int  # 범위 안의 (시간, 모델) 버킷 수
+    elapsed_ms: float
+    message: str = "Usage query completed successfully"
+
+class SessionUsageResponse(BaseModel):
+    """세션별 사용량 응답 모델 (서버 시작 이후)"""
+    session_id: str
+    usage: Dict[str, Any]
+    message: str = "Session usage retrieved successfully"
+
 class ProviderStatusResponse(BaseModel):
     """AI 제공업체 상태 응답 모델"""
     providers: Dict[str, Dict[str, Any]]
     summary: Dict[str, Any]
     message: str = "Provider status retrieved successfully"
 
+class CacheStatsResponse(BaseModel):
+    """캐시 통계 응답 모델"""
+    session_cache: Dict[str, Any]
+    message: str = "Cache statistics retrieved successfully"
+
+class GenerationListResponse(BaseModel):
+    """진행 중인 AI 응답 생성 목록 응답 모델"""
+    generations: List[Dict[str, Any]]
+    total: int
+    message: str = "Generations retrieved successfully"
+
 class SessionCreateRequest(BaseModel):
     """세션 생성 요청 모델"""
     title: Optional[str] = None
@@ -183,12 +278,31 @@ class SessionUpdateRequest(BaseModel):
     """세션 업데이트 요청 모델"""
     title: Optional[str] = None
     is_pinned: Optional[bool] = None
+    semantic_cache: Optional[bool] = None  # False면 이 세션은 의미 캐시를 쓰지 않음
 
 class SessionResponse(BaseModel):
     """세션 응답 모델"""
     session: ChatSession
     message: str = "Session operation completed successfully"
 
+class SessionListResponse(BaseModel):
+    """세션 목록 응답 모델 (메시지 본문 제외)"""
+    sessions: List[SessionSummary]
+    total: int
+    next_cursor: Optional[str] = None
+    message: str = "Sessions retrieved successfully"
+
+class SessionStatisticsResponse(BaseModel):
+    """세션 통계 응답 모델"""
+    statistics: Dict[str, Any]
+    message: str = "Session statistics retrieved successfully"
+
+class SessionSearchResponse(BaseModel):
+    """세션 검색 응답 모델"""
+    query: str
+    results: List[SessionSearchResult]
+    message: str = "Search completed successfully"
+
 class SpotifyStatusResponse(BaseModel):
     """Spotify 상태 응답 모델"""
     is_configured: bool
@@ -231,14 +345,82 @@ def read_root():
     """헬스 체크 엔드포인트"""
     return {"message": "Ted OS Backend is running"}
 
-@app.get("/api/sessions", response_model=list[ChatSession])
-def get_chat_sessions(context: AppContext = Depends(get_app_context)):
-    """모든 채팅 세션 목록을 가져옵니다."""
-    sessions = context.chat_manager.get_all_sessions()
-    return sessions
+@app.get("/api/sessions", response_model=SessionListResponse)
+def get_chat_sessions(
+        limit: Optional[int] = Query(None, ge=1, le=500),
+        cursor: Optional[str] = None,
+        context: AppContext = Depends(get_app_context)
+):
+    """채팅 세션 요약 목록을 가져옵니다. (인덱스 기반, 메시지 본문 제외)"""
+    try:
+        sessions, next_cursor = context.chat_manager.list_session_summaries(
+            limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return SessionListResponse(
+        sessions=sessions,
+        total=len(context.chat_manager.index),
+        next_cursor=next_cursor
+    )
+
+
+# /api/sessions/{session_id}보다 먼저 등록해야 "statistics", "search"가 세션 ID로 해석되지 않음
+@app.get("/api/sessions/statistics", response_model=SessionStatisticsResponse)
+def get_session_statistics(context: AppContext = Depends(get_app_context)):
+    """세션 수, 메시지 수 등 세션 통계를 조회합니다. (인덱스 집계 기반)"""
+    return SessionStatisticsResponse(
+        statistics=context.chat_manager.get_session_statistics()
+    )
+
+
+@app.post("/api/sessions/statistics/rebuild", response_model=SessionStatisticsResponse)
+def rebuild_session_statistics(context: AppContext = Depends(get_app_context)):
+    """저장된 세션 데이터로 세션 통계를 다시 계산합니다."""
+    return SessionStatisticsResponse(
+        statistics=context.chat_manager.rebuild_session_statistics(),
+        message="Session statistics rebuilt successfully"
+    )
+
+
+@app.get("/api/sessions/search", response_model=SessionSearchResponse)
+def search_chat_sessions(
+        q: str = Query(..., min_length=1, max_length=200),
+        limit: int = Query(10, ge=1, le=50),
+        context: AppContext = Depends(get_app_context)
+):
+    """세션 제목과 메시지 내용에서 검색합니다. (점수순, snippet 포함)"""
+    results = context.chat_manager.search_sessions(q, limit=limit)
+    return SessionSearchResponse(query=q, results=results)
+
+
+@app.get("/api/sessions/{session_id}", response_model=SessionResponse)
+def get_chat_session(
+        session_id: str,
+        context: AppContext = Depends(get_app_context)
+):
+    """메시지를 포함한 채팅 세션 전체를 가져옵니다."""
+    session = context.chat_manager.get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Chat session not found")
+
+    return SessionResponse(session=session, message="Session retrieved successfully")
+
+
+@app.get("/api/sessions/{session_id}/usage", response_model=SessionUsageResponse)
+def get_session_usage(
+        session_id: str,
+        context: AppContext = Depends(get_app_context)
+):
+    """이 세션의 채팅에서 쓴 토큰/비용을 조회합니다 (서버 시작 이후, 메모리 집계)."""
+    return SessionUsageResponse(
+        session_id=session_id,
+        usage=context.usage_tracker.get_session_usage(session_id),
+    )
 
 from fastapi.responses import StreamingResponse
-import asyncio
+from starlette.concurrency import run_in_threadpool
 
 
 @app.post("/api/sessions/{session_id}/chat")
@@ -252,7 +434,8 @@ async def handle_chat_message(
         ">>>>>>>>>>>>> CHAT HANDLER EXECUTING! FILE IS SAVED. <<<<<<<<<<<<<"
     )
 
-    session = context.chat_manager.get_session(session_id)
+    # 세션 파일 읽기/쓰기는 스레드에서 실행하여 이벤트 루프를 막지 않음
+    session = await run_in_threadpool(context.chat_manager.get_session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Chat session not found")
 
@@ -263,7 +446,7 @@ async def handle_chat_message(
     session.messages.append(new_message)
 
     # 3. 변경된 세션 객체를 저장하여 업데이트합니다.
-    context.chat_manager.update_session(session)
+    await run_in_threadpool(context.chat_manager.update_session, session)
 
     provider_name = request.model_provider or context.settings.get("ui.selected_provider")
     model_id = request.model_name or context.settings.get_default_model_for_provider(provider_name)
@@ -271,9 +454,17 @@ async def handle_chat_message(
     if not provider_name or not model_id:
         raise HTTPException(status_code=400, detail="Model provider or name not configured")
 
-    async def stream_wrapper():
+    # 생성 ID를 응답 헤더로 먼저 알려주어 클라이언트가 이 스트림만 중단하거나 이어받을 수 있게 함
+    generation = context.model_manager.start_generation(
+        session_id=session_id, provider_display_name=provider_name, model_id_key=model_id
+    )
+    # 클라이언트가 모두 떠나고 유예 시간 안에 다시 연결하지 않으면 생성 중단
+    events = event_streams.create(generation.id, on_abandoned=generation.cancel)
+
+    async def produce_events():
+        """연결과 별개로 응답을 생성해 이벤트 버퍼에 쌓음"""
         try:
-            current_session = context.chat_manager.get_session(session_id)
+            current_session = session
             messages = current_session.messages
             
             # AI 응답 메시지를 세션에 미리 추가
@@ -281,41 +472,92 @@ async def handle_chat_message(
             current_session.messages.append(ai_message)
             ai_message_index = len(current_session.messages) - 1
 
-            stream_generator = context.model_manager.stream_generate(
+            stream_generator = context.model_manager.astream_generate(
                 messages=messages[:-1],  # AI 응답 메시지는 제외
                 provider_display_name=provider_name,
-                model_id_key=model_id
+                model_id_key=model_id,
+                generation=generation,
+                semantic_cache=current_session.metadata.get("semantic_cache", True),
             )
 
             full_response = ""
-            for chunk, _ in stream_generator:
-                full_response += chunk
-                
-                # 세션에 누적된 응답 저장
-                current_session.messages[ai_message_index]["content"] = full_response
-                
-                # 클라이언트에 청크 전송
-                yield f"data: {chunk}\n\n"
-                await asyncio.sleep(0.01)  # 작은 지연으로 안정성 확보
-
-            # 최종 세션 저장
-            context.chat_manager.update_session(current_session)
-            yield "data: [DONE]\n\n"
+            async with aclosing(stream_generator):
+                async for chunk, usage in stream_generator:
+                    if usage is not None:
+                        events.append("usage", usage.to_dict())
+                    if not chunk:
+                        continue  # 사용량만 담긴 마지막 항목
+                    full_response += chunk
+
+                    # 세션에 누적된 응답 저장
+                    current_session.messages[ai_message_index]["content"] = full_response
+
+                    events.append("token", {"text": chunk})
+
+            # 후처리된 최종 응답으로 교체 후 세션 저장
+            if generation.final_text is not None:
+                current_session.messages[ai_message_index]["content"] = generation.final_text
+            await run_in_threadpool(context.chat_manager.update_session, current_session)
+            events.append(
+                "done",
+                {"final_text": generation.final_text, "cancelled": generation.cancelled},
+            )
 
         except Exception as e:
             logger.error(f"Error during streaming: {e}")
-            yield f"data: 오류가 발생했습니다: {str(e)}\n\n"
-            yield "data: [DONE]\n\n"
+            events.append("error", {"message": f"오류가 발생했습니다: {str(e)}"})
+            events.append("done", {"final_text": None, "cancelled": generation.cancelled})
+        finally:
+            events.close()
+            context.model_manager.finish_generation(generation.id)
+
+    async def stream_events():
+        # 응답을 보내는 이벤트 루프에서 생성 작업 시작
+        if events.task is None:
+            events.task = asyncio.ensure_future(produce_events())
+        async for frame in events.subscribe():
+            yield frame
 
     return StreamingResponse(
-        stream_wrapper(), 
-        media_type="text/plain",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        }
+        stream_events(),
+        media_type="text/event-stream",
+        headers={**SSE_HEADERS, "X-Generation-Id": generation.id},
+    )
+
+
+@app.get("/api/generations/{generation_id}/events")
+async def resume_generation_events(
+        generation_id: str,
+        last_event_id: Optional[str] = Header(None),
+):
+    """끊긴 응답 스트림을 Last-Event-ID 다음 이벤트부터 이어받습니다."""
+    events = event_streams.get(generation_id)
+    if events is None:
+        raise HTTPException(status_code=404, detail="Generation stream not found or expired")
+    return StreamingResponse(
+        events.subscribe(parse_event_id(last_event_id)),
+        media_type="text/event-stream",
+        headers={**SSE_HEADERS, "X-Generation-Id": generation_id},
     )
 
+
+@app.get("/api/generations", response_model=GenerationListResponse)
+def list_generations(context: AppContext = Depends(get_app_context)):
+    """진행 중인 AI 응답 생성 목록(경과 시간, 스트리밍된 양)을 조회합니다."""
+    generations = context.model_manager.list_generations()
+    return GenerationListResponse(generations=generations, total=len(generations))
+
+
+@app.post("/api/generations/{generation_id}/cancel")
+def cancel_generation(
+        generation_id: str,
+        context: AppContext = Depends(get_app_context)
+):
+    """진행 중인 AI 응답 생성을 중단합니다. 제공업체 스트림도 바로 닫힙니다."""
+    if not context.model_manager.cancel_generation(generation_id):
+        raise HTTPException(status_code=404, detail="Generation not found or already finished")
+    return {"message": f"Generation {generation_id} cancelled"}
+
 @app.get("/api/settings", response_model=SettingsResponse)
 def get_settings(context: AppContext = Depends(get_app_context)):
     """현재 애플리케이션 설정을 조회합니다. (API 키 등 민감 정보 제외)"""
@@ -477,23 +719,14 @@ def delete_favorite(
 def get_usage_statistics(context: AppContext = Depends(get_app_context)):
     """토큰 사용량 통계를 조회합니다."""
     try:
-        # 다양한 사용량 통계 수집 (세션 기능 제외)
-        total_usage = context.usage_tracker.get_total_usage_from_history()
-        today_usage = context.usage_tracker.get_today_usage_from_summary()
-        weekly_usage = context.usage_tracker.get_weekly_usage()
-        monthly_usage = context.usage_tracker.get_monthly_usage()
-        usage_by_model = context.usage_tracker.get_usage_by_model(days=30)  # 최근 30일
-        usage_trends = context.usage_tracker.get_usage_trends(days=7)  # 최근 7일
-        estimated_monthly_cost = context.usage_tracker.estimate_monthly_cost()
+        # 모델별은 최근 30일, 추세는 최근 7일 (요약을 한 번만 읽고 기록이 바뀔 때까지 캐시)
+        snapshot = context.usage_tracker.get_usage_snapshot(model_days=30, trend_days=7)
 
         return UsageStatsResponse(
-            total_usage=total_usage,
-            today_usage=today_usage,
-            weekly_usage=weekly_usage,
-            monthly_usage=monthly_usage,
-            usage_by_model=usage_by_model,
-            usage_trends=usage_trends,
-            estimated_monthly_cost=estimated_monthly_cost
+            **snapshot,
+            retry_stats=context.model_manager.get_retry_stats(),
+            response_cache=context.model_manager.get_response_cache_stats(),
+            semantic_cache=context.model_manager.get_semantic_cache_stats(),
         )
 
     except Exception as e:
@@ -501,6 +734,49 @@ def get_usage_statistics(context: AppContext = Depends(get_app_context)):
         raise HTTPException(status_code=500, detail="Failed to retrieve usage statistics")
 
 
+def _parse_usage_time(value: str, end: bool = False) -> datetime:
+    """ISO 날짜/시각 (날짜만 주면 end는 그날 끝까지 포함)"""
+    parsed = datetime.fromisoformat(value)
+    if end and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed
+
+
+@app.get("/api/status/usage/query", response_model=UsageQueryResponse)
+def query_usage_statistics(
+        from_: Optional[str] = Query(None, alias="from"),
+        to: Optional[str] = Query(None),
+        group_by: Optional[str] = Query(None, description="provider, model (쉼표로 구분)"),
+        bucket: str = Query("day", description="hour, day, week, month, total"),
+        percentiles: Optional[str] = Query(None, description="예: 50,95,99"),
+        context: AppContext = Depends(get_app_context),
+):
+    """기간/제공업체/모델별 사용량을 시간 단위 버킷으로 집계합니다. (기본: 최근 30일, 일별)"""
+    try:
+        end = _parse_usage_time(to, end=True) if to else datetime.now()
+        start = _parse_usage_time(from_) if from_ else end - timedelta(days=30)
+        fields = [f.strip() for f in (group_by or "").split(",") if f.strip()]
+        options = {}
+        if percentiles:
+            options["percentiles"] = [float(p) for p in percentiles.split(",") if p.strip()]
+        result = context.usage_tracker.query_usage(
+            start, end, group_by=fields, bucket=bucket, **options
+        )
+        return UsageQueryResponse(**result)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error querying usage statistics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to query usage statistics")
+
+
+@app.get("/api/status/cache", response_model=CacheStatsResponse)
+def get_cache_statistics(context: AppContext = Depends(get_app_context)):
+    """세션 캐시 적중률 등 캐시 통계를 조회합니다."""
+    return CacheStatsResponse(session_cache=context.chat_manager.get_cache_stats())
+
+
 @app.get("/api/status/providers", response_model=ProviderStatusResponse)
 def get_provider_status(context: AppContext = Depends(get_app_context)):
     """AI 제공업체별 상태 정보를 조회합니다."""
@@ -621,10 +897,10 @@ def update_session(
             raise HTTPException(status_code=404, detail="Session not found")
 
         # 최소 하나의 필드는 업데이트되어야 함
-        if request.title is None and request.is_pinned is None:
+        if request.title is None and request.is_pinned is None and request.semantic_cache is None:
             raise HTTPException(
                 status_code=400,
-                detail="At least one field (title or is_pinned) must be provided for update"
+                detail="At least one field (title, is_pinned or semantic_cache) must be provided for update"
             )
 
         # 제목 업데이트
@@ -638,11 +914,17 @@ def update_session(
                 if not pin_success:
                     raise HTTPException(
                         status_code=400,
-                        detail="Failed to pin session (maximum 7 pinned sessions allowed)"
+                        detail=f"Failed to pin session (maximum {MAX_PINNED_SESSIONS} pinned sessions allowed)"
                     )
             else:
                 context.chat_manager.unpin_session(session_id)
 
+        # 의미 캐시 사용 여부 (세션 메타데이터에 저장)
+        if request.semantic_cache is not None:
+            session = context.chat_manager.get_session(session_id)
+            session.metadata["semantic_cache"] = request.semantic_cache
+            context.chat_manager.update_session(session)
+
         # 업데이트된 세션 반환
         updated_session = context.chat_manager.get_session(session_id)
         return SessionResponse(session=updated_session, message="Session updated successfully")
@@ -6,6 +6,8 @@ Ted OS 관리자 클래스들
 from .settings import SettingsManager
 from .chat_sessions import ChatSessionManager
 from .usage_tracker import UsageTracker
+from .session_usage import SessionUsageStore, InMemorySessionUsageStore
+from .usage_columns import HourlyUsageStore
 from .model_manager import ModelManager, EnhancedModelManager
 from .model_management import InterfaceManager, ResponseManager, ConfigManager
 
@@ -13,6 +15,9 @@ __all__ = [
     "SettingsManager",
     "ChatSessionManager",
     "UsageTracker", 
+    "SessionUsageStore",
+    "InMemorySessionUsageStore",
+    "HourlyUsageStore",
     "ModelManager",
     "EnhancedModelManager",
     "InterfaceManager",
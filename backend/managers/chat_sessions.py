@@ -3,47 +3,242 @@
 Ted OS - 채팅 세션 관리자
 """
 
-import json
+import base64
+import binascii
+import bisect
 import logging
+import threading
 import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-
-from ..models.data_models import ChatSession
+from typing import Dict, Hashable, Iterator, List, Optional, Any, Tuple
+
+from ..core.config import (
+    MAX_PINNED_SESSIONS,
+    SESSION_CACHE_MAX_ENTRIES,
+    SESSION_INDEX_FLUSH_DELAY_SECONDS,
+)
+from ..models.data_models import ChatSession, SessionSearchResult, SessionSummary
+from .session_search import SessionSearchIndex, build_matches
+from .storage import (
+    SessionStorage,
+    SQLiteDatabase,
+    build_index_entry,
+    create_session_storage,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _copy_session(session: ChatSession) -> ChatSession:
+    """캐시 항목과 호출자가 받은 객체가 서로 영향을 주지 않도록 얕은 복사"""
+    return ChatSession(
+        id=session.id,
+        title=session.title,
+        messages=[dict(m) for m in session.messages],
+        created_at=session.created_at,
+        updated_at=session.updated_at,
+        metadata=dict(session.metadata),
+        is_pinned=session.is_pinned,
+    )
+
+
+class _SessionCache:
+    """복원된 ChatSession 객체의 LRU 캐시 (저장 엔진의 버전 값으로 검증)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Hashable, ChatSession]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, session_id: str, version: Optional[Hashable]) -> Optional[ChatSession]:
+        """버전이 일치하는 캐시 항목의 복사본 반환"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or version is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return _copy_session(entry[1])
+
+    def put(self, session: ChatSession, version: Optional[Hashable]):
+        """세션 저장 (버전을 알 수 없으면 항목 제거)"""
+        if version is None or self.max_entries <= 0:
+            self.discard(session.id)
+            return
+        with self._lock:
+            self._entries[session.id] = (version, _copy_session(session))
+            self._entries.move_to_end(session.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, session_id: str):
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
 class ChatSessionManager:
     """채팅 세션 관리자"""
 
-    def __init__(self, storage_path: str):
+    def __init__(
+        self,
+        storage_path: str,
+        engine: str = "json",
+        storage: Optional[SessionStorage] = None,
+        database: Optional[SQLiteDatabase] = None,
+        flush_delay: float = SESSION_INDEX_FLUSH_DELAY_SECONDS,
+        cache_size: int = SESSION_CACHE_MAX_ENTRIES,
+    ):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
-        self.index_file = self.storage_path / "chat_sessions.json"
+        # 인덱스 지연 쓰기 상태 (변경 표시 후 flush_delay초 뒤 또는 batch 종료 시 한 번 저장)
+        self.flush_delay = flush_delay
+        self._index_lock = threading.RLock()
+        self._index_dirty = False
+        self._batch_depth = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        # 최근 사용한 세션 캐시 (같은 대화를 이어갈 때 파일을 다시 읽지 않음)
+        self._cache = _SessionCache(cache_size)
+        # 메시지 전문 검색 색인 (첫 검색 때 구축)
+        self._search_index = SessionSearchIndex()
+        # 세션 저장 엔진 (json: 세션당 파일 하나, log: 추가 전용 메시지 로그, sqlite: 공유 DB)
+        self.storage = storage or create_session_storage(
+            engine, storage_path, database
+        )
         self.index = self._load_index()
+        self._backfill_index()
+        # 인덱스에서 유지하는 집계 (세션 파일을 읽지 않음)
+        self._pinned_ids: set = set()  # 고정된 세션 ID
+        self._message_total = 0  # 전체 메시지 수
+        self._created_order: List[Tuple[str, str]] = []  # (created_at, id) 정렬 목록
+        self._rebuild_aggregates()
 
     def _load_index(self) -> Dict[str, dict]:
         """세션 인덱스 로드"""
-        if self.index_file.exists():
-            try:
-                with open(self.index_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                logger.error(
-                    f"Error decoding index: {self.index_file}. Re-initializing."
-                )
-                return {}
-        return {}
+        return self.storage.load_index()
+
+    def _rebuild_aggregates(self):
+        """인덱스 전체에서 고정 목록과 통계 집계 다시 계산"""
+        self._pinned_ids = {
+            s_id for s_id, entry in self.index.items() if entry.get("is_pinned")
+        }
+        self._message_total = sum(
+            entry.get("message_count", 0) for entry in self.index.values()
+        )
+        self._created_order = sorted(
+            (entry["created_at"], s_id) for s_id, entry in self.index.items()
+        )
+
+    def _index_put(self, session_id: str, entry: dict):
+        """인덱스 항목 추가/교체와 집계 갱신"""
+        old = self.index.get(session_id)
+        if old is not None:
+            self._unaccount(session_id, old)
+        self.index[session_id] = entry
+        if entry.get("is_pinned"):
+            self._pinned_ids.add(session_id)
+        self._message_total += entry.get("message_count", 0)
+        bisect.insort(self._created_order, (entry["created_at"], session_id))
+
+    def _index_remove(self, session_id: str) -> bool:
+        """인덱스 항목 삭제와 집계 갱신"""
+        entry = self.index.pop(session_id, None)
+        if entry is None:
+            return False
+        self._unaccount(session_id, entry)
+        return True
+
+    def _unaccount(self, session_id: str, entry: dict):
+        self._pinned_ids.discard(session_id)
+        self._message_total -= entry.get("message_count", 0)
+        key = (entry["created_at"], session_id)
+        pos = bisect.bisect_left(self._created_order, key)
+        if pos < len(self._created_order) and self._created_order[pos] == key:
+            del self._created_order[pos]
+
+    def _sync_index(self):
+        """다른 워커가 저장소를 변경했으면 인덱스 다시 로드"""
+        if self.storage.has_external_changes():
+            with self._index_lock:
+                self.index = self._load_index()
+                self._rebuild_aggregates()
+            self._search_index.mark_stale()
+
+    def _backfill_index(self):
+        """이전 형식의 인덱스 항목에 목록용 필드(고정 여부, 미리보기) 채우기"""
+        updated = False
+        for s_id, entry in self.index.items():
+            if "is_pinned" in entry and "preview" in entry:
+                continue
+
+            session = self.storage.load(s_id)
+            if not session:
+                logger.warning(f"Cannot backfill index entry {s_id}")
+                continue
+
+            self.index[s_id] = build_index_entry(session)
+            updated = True
+
+        if updated:
+            self._save_index()
 
     def _save_index(self):
-        """세션 인덱스 저장"""
+        """인덱스 변경 표시 (실제 저장은 지연/일괄 처리)"""
+        with self._index_lock:
+            self._index_dirty = True
+            if self._batch_depth > 0:
+                return  # batch() 종료 시 저장
+            if self.flush_delay <= 0:
+                self.flush_index()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_delay, self.flush_index)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush_index(self):
+        """변경된 인덱스가 있으면 즉시 저장"""
+        with self._index_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._index_dirty:
+                return
+            self.storage.save_index(dict(self.index))
+            self._index_dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator["ChatSessionManager"]:
+        """여러 세션 변경을 묶어 인덱스를 한 번만 저장"""
+        with self._index_lock:
+            self._batch_depth += 1
         try:
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(self.index, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Error saving index: {e}")
+            yield self
+        finally:
+            with self._index_lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush_index()
+
+    def close(self):
+        """남은 인덱스 변경을 저장하고 저장 엔진 정리 (종료 시 호출)"""
+        self.flush_index()
+        self.storage.close()
 
     def create_session(self, title: str = None) -> ChatSession:
         """새 채팅 세션 생성"""
@@ -64,40 +259,40 @@ class ChatSessionManager:
         return session
 
     def _save_session(self, session: ChatSession):
-        """세션을 파일로 저장"""
-        s_file = self.storage_path / f"{session.id}.json"
-
-        try:
-            with open(s_file, "w", encoding="utf-8") as f:
-                json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Error saving session {s_file}: {e}")
+        """세션을 저장 엔진에 저장"""
+        if not self.storage.save(session):
+            self._cache.discard(session.id)
             return
 
+        # 캐시와 검색 색인에도 반영
+        version = self.storage.version_token(session.id)
+        self._cache.put(session, version)
+        self._search_index.update(session, version)
+
         # 인덱스 업데이트
-        self.index[session.id] = {
-            "title": session.title,
-            "created_at": session.created_at.isoformat(),
-            "updated_at": session.updated_at.isoformat(),
-            "message_count": len(session.messages),
-        }
-        self._save_index()
+        with self._index_lock:
+            self._index_put(session.id, build_index_entry(session))
+            self._save_index()
 
     def get_session(self, session_id: str) -> Optional[ChatSession]:
         """세션 ID로 세션 조회"""
+        self._sync_index()
         if not session_id or session_id not in self.index:
             return None
 
-        s_file = self.storage_path / f"{session_id}.json"
-        if s_file.exists():
-            try:
-                with open(s_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                return ChatSession.from_dict(data)
-            except Exception as e:
-                logger.error(f"Error loading session {s_file}: {e}")
+        version = self.storage.version_token(session_id)
+        session = self._cache.get(session_id, version)
+        if session is not None:
+            return session
+
+        session = self.storage.load(session_id)
+        if session is not None:
+            self._cache.put(session, version)
+        return session
 
-        return None
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """세션 캐시 적중/실패 통계"""
+        return self._cache.stats()
 
     def update_session(self, session: ChatSession):
         """세션 업데이트"""
@@ -106,22 +301,18 @@ class ChatSessionManager:
 
     def delete_session(self, session_id: str) -> bool:
         """세션 삭제"""
-        s_file = self.storage_path / f"{session_id}.json"
-        deleted_file, deleted_index = False, False
+        deleted_index = False
 
-        # 파일 삭제
-        if s_file.exists():
-            try:
-                s_file.unlink()
-                deleted_file = True
-            except Exception as e:
-                logger.error(f"Error deleting file {s_file}: {e}")
+        # 세션 데이터 삭제
+        self._cache.discard(session_id)
+        self._search_index.remove(session_id)
+        deleted_file = self.storage.delete(session_id)
 
         # 인덱스에서 삭제
-        if session_id in self.index:
-            del self.index[session_id]
-            self._save_index()
-            deleted_index = True
+        with self._index_lock:
+            if self._index_remove(session_id):
+                self._save_index()
+                deleted_index = True
 
         if deleted_file or deleted_index:
             logger.info(f"Deleted session: {session_id}")
@@ -131,6 +322,7 @@ class ChatSessionManager:
 
     def get_all_sessions(self) -> List[ChatSession]:
         """모든 세션 조회 (최신순 정렬)"""
+        self._sync_index()
         sessions = []
 
         for s_id in list(self.index.keys()):
@@ -142,6 +334,65 @@ class ChatSessionManager:
         sessions.sort(key=lambda s: s.updated_at, reverse=True)
         return sessions
 
+    def list_session_summaries(
+        self, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Tuple[List[SessionSummary], Optional[str]]:
+        """인덱스만으로 세션 요약 목록 조회 (최신순, 커서 기반 페이지네이션)
+
+        Args:
+            limit: 한 페이지에 담을 최대 세션 수 (None이면 전체)
+            cursor: 이전 페이지가 반환한 커서 (None이면 첫 페이지)
+
+        Returns:
+            tuple: (세션 요약 목록, 다음 페이지 커서 또는 None)
+
+        Raises:
+            ValueError: 커서 형식이 잘못된 경우
+        """
+        self._sync_index()
+        ordered = sorted(
+            self.index.items(),
+            key=lambda item: (item[1]["updated_at"], item[0]),
+            reverse=True,
+        )
+
+        if cursor:
+            after = self._decode_cursor(cursor)
+            ordered = [
+                item for item in ordered if (item[1]["updated_at"], item[0]) < after
+            ]
+
+        has_more = limit is not None and len(ordered) > limit
+        if limit is not None:
+            ordered = ordered[:limit]
+
+        summaries = [
+            SessionSummary.from_index_entry(s_id, entry) for s_id, entry in ordered
+        ]
+
+        next_cursor = None
+        if has_more and ordered:
+            last_id, last_entry = ordered[-1]
+            next_cursor = self._encode_cursor(last_entry["updated_at"], last_id)
+
+        return summaries, next_cursor
+
+    @staticmethod
+    def _encode_cursor(updated_at: str, session_id: str) -> str:
+        """페이지네이션 커서 인코딩"""
+        raw = f"{updated_at}|{session_id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, str]:
+        """페이지네이션 커서 디코딩"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            updated_at, session_id = raw.split("|", 1)
+        except (binascii.Error, UnicodeError, ValueError):
+            raise ValueError(f"Invalid session cursor: {cursor}")
+        return updated_at, session_id
+
     def update_session_title(self, session_id: str, new_title: str):
         """세션 제목 업데이트"""
         session = self.get_session(session_id)
@@ -149,72 +400,115 @@ class ChatSessionManager:
             session.title = new_title
             self.update_session(session)
 
-    def search_sessions(self, query: str, limit: int = 10) -> List[ChatSession]:
-        """세션 검색 (제목 기준)"""
-        all_sessions = self.get_all_sessions()
-
-        if not query:
-            return all_sessions[:limit]
-
-        # 제목에서 검색
-        matching_sessions = []
-        query_lower = query.lower()
-
-        for session in all_sessions:
-            if query_lower in session.title.lower():
-                matching_sessions.append(session)
-                if len(matching_sessions) >= limit:
-                    break
+    def search_sessions(self, query: str, limit: int = 10) -> List[SessionSearchResult]:
+        """세션 제목과 메시지 내용 검색 (점수순, 일치 메시지 snippet 포함)"""
+        self._sync_index()
+        if not query or not query.strip():
+            return []
+
+        if not self._search_index.built or self._search_index.stale:
+            versions = self.storage.version_tokens(list(self.index))
+            if not self._search_index.built:
+                self._search_index.build(versions, self.storage.load)
+            else:
+                # 다른 워커가 바꾼 세션만 다시 색인
+                self._search_index.sync(versions, self.storage.load)
+
+        hits_by_session = self._search_index.search(query)
+        ranked = sorted(
+            (
+                (hits[0][1], s_id, hits)
+                for s_id, hits in hits_by_session.items()
+                if s_id in self.index
+            ),
+            key=lambda item: item[0],
+            reverse=True,
+        )
 
-        return matching_sessions
+        results = []
+        for score, s_id, hits in ranked[:limit]:
+            # 결과로 보여줄 세션만 본문을 읽음 (세션 캐시 사용)
+            session = self.get_session(s_id)
+            if not session:
+                continue
+            results.append(
+                SessionSearchResult(
+                    session_id=s_id,
+                    title=session.title,
+                    updated_at=session.updated_at,
+                    score=round(score, 4),
+                    matches=build_matches(session, hits, query),
+                )
+            )
+        return results
 
     def get_session_statistics(self) -> Dict[str, Any]:
-        """세션 통계 정보"""
-        all_sessions = self.get_all_sessions()
+        """세션 통계 정보 (인덱스 집계 기반, 세션 파일을 읽지 않음)"""
+        self._sync_index()
+        with self._index_lock:
+            total_sessions = len(self.index)
+            if not total_sessions:
+                return {
+                    "total_sessions": 0,
+                    "total_messages": 0,
+                    "avg_messages_per_session": 0,
+                    "oldest_session": None,
+                    "newest_session": None,
+                }
 
-        if not all_sessions:
             return {
-                "total_sessions": 0,
-                "total_messages": 0,
-                "avg_messages_per_session": 0,
-                "oldest_session": None,
-                "newest_session": None,
+                "total_sessions": total_sessions,
+                "total_messages": self._message_total,
+                "avg_messages_per_session": self._message_total / total_sessions,
+                "oldest_session": self._session_brief(self._created_order[0][1]),
+                "newest_session": self._session_brief(self._created_order[-1][1]),
             }
 
-        total_messages = sum(len(s.messages) for s in all_sessions)
-        oldest_session = min(all_sessions, key=lambda s: s.created_at)
-        newest_session = max(all_sessions, key=lambda s: s.created_at)
-
+    def _session_brief(self, session_id: str) -> Dict[str, Any]:
+        entry = self.index[session_id]
         return {
-            "total_sessions": len(all_sessions),
-            "total_messages": total_messages,
-            "avg_messages_per_session": total_messages / len(all_sessions),
-            "oldest_session": {
-                "id": oldest_session.id,
-                "title": oldest_session.title,
-                "created_at": oldest_session.created_at.isoformat(),
-            },
-            "newest_session": {
-                "id": newest_session.id,
-                "title": newest_session.title,
-                "created_at": newest_session.created_at.isoformat(),
-            },
+            "id": session_id,
+            "title": entry.get("title", ""),
+            "created_at": entry["created_at"],
         }
 
+    def rebuild_session_statistics(self) -> Dict[str, Any]:
+        """저장된 세션으로 인덱스 항목과 통계를 다시 계산 (집계가 어긋났을 때 복구용)"""
+        self._sync_index()
+        repaired = 0
+        with self.batch(), self._index_lock:
+            for s_id in list(self.index):
+                session = self.storage.load(s_id)
+                if session is None:
+                    logger.warning(f"Session data missing for index entry {s_id}")
+                    continue
+                entry = build_index_entry(session)
+                if entry != self.index[s_id]:
+                    self.index[s_id] = entry
+                    repaired += 1
+            if repaired:
+                self._save_index()
+            self._rebuild_aggregates()
+
+        logger.info(f"Rebuilt session statistics ({repaired} index entries repaired)")
+        return self.get_session_statistics()
+
     def cleanup_empty_sessions(self) -> int:
         """빈 세션들 정리"""
-        empty_sessions = []
-        all_sessions = self.get_all_sessions()
-
-        for session in all_sessions:
-            if not session.messages:
-                empty_sessions.append(session.id)
-
-        # 빈 세션들 삭제
+        self._sync_index()
+        # 메시지 수는 인덱스에 있으므로 세션 파일을 읽지 않음
+        empty_sessions = [
+            s_id
+            for s_id, entry in list(self.index.items())
+            if entry.get("message_count", 0) == 0
+        ]
+
+        # 빈 세션들 삭제 (인덱스는 마지막에 한 번만 저장)
         deleted_count = 0
-        for session_id in empty_sessions:
-            if self.delete_session(session_id):
-                deleted_count += 1
+        with self.batch():
+            for session_id in empty_sessions:
+                if self.delete_session(session_id):
+                    deleted_count += 1
 
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} empty sessions")
@@ -242,84 +536,100 @@ class ChatSessionManager:
         except Exception as e:
             logger.error(f"Error importing session: {e}")
             return None
+
+    def import_sessions(self, sessions_data: List[Dict[str, Any]]) -> List[ChatSession]:
+        """여러 세션을 가져오고 인덱스는 한 번만 저장"""
+        with self.batch():
+            imported = [self.import_session(data) for data in sessions_data]
+        return [session for session in imported if session]
         
     # ===== 채팅 고정 관련 메서드들 =====
-    
+
     def pin_session(self, session_id: str) -> bool:
         """세션을 고정 상태로 변경"""
-        session = self.get_session(session_id)
-        if not session:
+        self._sync_index()
+        if session_id not in self.index:
             logger.warning(f"Session not found for pinning: {session_id}")
             return False
-            
+
         # 이미 고정된 상태인지 확인
-        if session.is_pinned:
+        if session_id in self._pinned_ids:
             logger.info(f"Session {session_id} is already pinned")
             return True
-            
-        # 고정 개수 제한 체크 (최대 7개)
-        pinned_count = self.get_pinned_sessions_count()
-        if pinned_count >= 7:
-            logger.warning(f"Cannot pin session {session_id}: maximum 7 pinned sessions reached")
+
+        # 고정 개수 제한 체크
+        if self.get_pinned_sessions_count() >= MAX_PINNED_SESSIONS:
+            logger.warning(
+                f"Cannot pin session {session_id}: maximum {MAX_PINNED_SESSIONS} pinned sessions reached"
+            )
             return False
-            
-        session.is_pinned = True
-        self.update_session(session)
-        logger.info(f"Successfully pinned session: {session_id}")
-        return True
-    
+
+        return self._set_pinned(session_id, True)
+
     def unpin_session(self, session_id: str) -> bool:
         """세션의 고정 상태를 해제"""
+        self._sync_index()
+        if session_id not in self.index:
+            logger.warning(f"Session not found for unpinning: {session_id}")
+            return False
+
+        if session_id not in self._pinned_ids:
+            return True
+
+        return self._set_pinned(session_id, False)
+
+    def _set_pinned(self, session_id: str, pinned: bool) -> bool:
+        """대상 세션 하나만 읽어 고정 상태를 저장"""
         session = self.get_session(session_id)
         if not session:
-            logger.warning(f"Session not found for unpinning: {session_id}")
+            logger.warning(f"Session file missing for pin update: {session_id}")
             return False
-            
-        session.is_pinned = False
+
+        session.is_pinned = pinned
         self.update_session(session)
-        logger.info(f"Successfully unpinned session: {session_id}")
+        logger.info(
+            f"Successfully {'pinned' if pinned else 'unpinned'} session: {session_id}"
+        )
         return True
-    
+
     def toggle_session_pin(self, session_id: str) -> bool:
         """세션의 고정 상태를 토글 (고정 ↔ 해제)"""
-        session = self.get_session(session_id)
-        if not session:
+        self._sync_index()
+        if session_id not in self.index:
             return False
-            
-        if session.is_pinned:
+
+        if self.is_session_pinned(session_id):
             return self.unpin_session(session_id)
         else:
             return self.pin_session(session_id)
-    
-    def get_pinned_sessions(self) -> List[ChatSession]:
-        """고정된 세션들만 조회 (최신순 정렬)"""
-        all_sessions = self.get_all_sessions()
-        pinned_sessions = [s for s in all_sessions if s.is_pinned]
-        
-        # 고정된 세션들도 최신 업데이트 순으로 정렬
-        pinned_sessions.sort(key=lambda s: s.updated_at, reverse=True)
-        return pinned_sessions
-    
-    def get_unpinned_sessions(self) -> List[ChatSession]:
-        """고정되지 않은 세션들만 조회 (최신순 정렬)"""
-        all_sessions = self.get_all_sessions()
-        unpinned_sessions = [s for s in all_sessions if not s.is_pinned]
-        
-        # 일반 세션들도 최신 업데이트 순으로 정렬  
-        unpinned_sessions.sort(key=lambda s: s.updated_at, reverse=True)
-        return unpinned_sessions
-    
+
+    def is_session_pinned(self, session_id: str) -> bool:
+        """세션 고정 여부 확인 (인덱스 기반)"""
+        return session_id in self._pinned_ids
+
+    def get_pinned_sessions(self) -> List[SessionSummary]:
+        """고정된 세션 요약만 조회 (최신순 정렬, 인덱스 기반)"""
+        pinned, _ = self.get_sessions_separated()
+        return pinned
+
+    def get_unpinned_sessions(self) -> List[SessionSummary]:
+        """고정되지 않은 세션 요약만 조회 (최신순 정렬, 인덱스 기반)"""
+        _, unpinned = self.get_sessions_separated()
+        return unpinned
+
     def get_pinned_sessions_count(self) -> int:
         """현재 고정된 세션의 개수를 반환"""
-        all_sessions = self.get_all_sessions()
-        return sum(1 for session in all_sessions if session.is_pinned)
-    
-    def get_sessions_separated(self) -> tuple[List[ChatSession], List[ChatSession]]:
-        """고정된 세션과 일반 세션을 분리해서 반환
-        
+        return len(self._pinned_ids)
+
+    def get_sessions_separated(
+        self,
+    ) -> Tuple[List[SessionSummary], List[SessionSummary]]:
+        """고정된 세션과 일반 세션을 분리해서 반환 (인덱스 한 번 순회)
+
         Returns:
             tuple: (고정된_세션들, 일반_세션들) - 각각 최신순 정렬됨
         """
-        pinned_sessions = self.get_pinned_sessions()
-        unpinned_sessions = self.get_unpinned_sessions()
+        summaries, _ = self.list_session_summaries()
+        pinned_sessions = [s for s in summaries if s.id in self._pinned_ids]
+        unpinned_sessions = [s for s in summaries if s.id not in self._pinned_ids]
         return pinned_sessions, unpinned_sessions
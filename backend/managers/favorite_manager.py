@@ -4,7 +4,7 @@ import logging
 import os
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
 
@@ -13,28 +13,38 @@ from backend.models.data_models import FavoriteMessage
 from backend.models.enums import ModelProvider
 from backend.utils.helpers import ensure_directory_exists
 
+if TYPE_CHECKING:
+    from backend.managers.storage import SQLiteFavoriteStore
+
 
 FAVORITES_FILE_NAME = "favorites_data.json" # 즐겨찾기 데이터 저장 파일명
 
 class FavoriteManager:
     """즐겨찾기 메시지를 관리하는 클래스"""
 
-    def __init__(self, storage_dir: str):
+    def __init__(self, storage_dir: str, store: Optional["SQLiteFavoriteStore"] = None):
         """
         FavoriteManager를 초기화합니다.
 
         :param storage_dir: 즐겨찾기 데이터 파일이 저장될 디렉토리 경로입니다.
+        :param store: SQLite 저장소. 지정하면 JSON 파일 대신 항목 단위로 DB에 저장합니다.
         """
         ensure_directory_exists(storage_dir) # 저장 디렉토리 존재 확인 및 생성
         self.favorites_file_path = os.path.join(storage_dir, FAVORITES_FILE_NAME)
+        self.store = store
         self._favorites: Dict[str, FavoriteMessage] = self._load_favorites()
-        logger.info(f"FavoriteManager initialized. Data file: {self.favorites_file_path}")
+        logger.info(
+            f"FavoriteManager initialized. Data: {'SQLite' if store else self.favorites_file_path}"
+        )
 
     def _load_favorites(self) -> Dict[str, FavoriteMessage]:
         """
         파일에서 즐겨찾기 목록을 불러옵니다.
         파일이 없거나 유효하지 않은 JSON인 경우, 빈 딕셔너리를 반환합니다.
         """
+        if self.store:
+            return self.store.load_all()
+
         if not os.path.exists(self.favorites_file_path):
             logger.info(f"Favorites file not found at {self.favorites_file_path}. Initializing with empty list.")
             return {}
@@ -58,6 +68,9 @@ class FavoriteManager:
         """
         현재 즐겨찾기 목록을 파일에 저장합니다.
         """
+        if self.store:
+            return  # SQLite는 변경된 항목만 즉시 기록
+
         try:
             # FavoriteMessage 객체를 딕셔너리 형태로 변환하여 저장
             data_to_save = {
@@ -100,6 +113,8 @@ class FavoriteManager:
             notes=notes
         )
         self._favorites[new_id] = favorite
+        if self.store:
+            self.store.upsert(favorite)
         self._save_favorites()
         logger.info(f"Added new favorite: {new_id} (Session: {session_id}, Message: {message_id})")
         return favorite
@@ -113,6 +128,8 @@ class FavoriteManager:
         """
         if favorite_id in self._favorites:
             del self._favorites[favorite_id]
+            if self.store:
+                self.store.delete(favorite_id)
             self._save_favorites()
             logger.info(f"Removed favorite: {favorite_id}")
             return True
@@ -167,6 +184,8 @@ class FavoriteManager:
             updated = True
         
         if updated:
+            if self.store:
+                self.store.upsert(favorite)
             self._save_favorites()
             logger.info(f"Updated details for favorite: {favorite_id}")
         else:
@@ -182,6 +201,12 @@ class FavoriteManager:
         :param tags: 포함되어야 하는 태그 리스트. 모든 태그를 만족해야 함 (AND 조건).
         :return: 조건에 맞는 FavoriteMessage 객체의 리스트
         """
+        if self.store:
+            # 태그 조건은 favorite_tags 인덱스로 처리
+            results = self.store.find(query=query, tags=tags)
+            logger.debug(f"Found {len(results)} favorites matching query='{query}', tags={tags}")
+            return results
+
         results = []
         
         for favorite in self._favorites.values():
@@ -6,9 +6,21 @@ Ted OS - 모델 관리 모듈
 from .interface_manager import InterfaceManager
 from .response_manager import ResponseManager
 from .config_manager import ConfigManager
+from .generation_registry import Generation, GenerationRegistry
+from .retry_policy import RetryPolicy, RetryStats
+from .response_cache import ResponseCache
+from .semantic_cache import SemanticCache
+from .context_budgeter import ContextBudgeter
 
 __all__ = [
     "InterfaceManager",
     "ResponseManager", 
     "ConfigManager",
+    "Generation",
+    "GenerationRegistry",
+    "RetryPolicy",
+    "RetryStats",
+    "ResponseCache",
+    "SemanticCache",
+    "ContextBudgeter",
 ]
@@ -0,0 +1,186 @@
+# ted-os-project/backend/managers/model_management/context_budgeter.py
+"""
+Ted OS - 제공업체로 보낼 대화 기록을 토큰 예산에 맞게 줄이는 단계
+
+시스템 프롬프트와 마지막 턴은 항상 보내고, 남은 예산 안에서 최근 턴부터 채웁니다.
+예산은 모델의 컨텍스트 한도에서 출력용 max_tokens를 뺀 값과 설정값 중 작은 쪽입니다.
+메시지별 토큰 수는 토큰 계산기의 내용 해시 메모로 재사용하므로 다음 턴에서 다시 세지 않습니다.
+메시지 딕셔너리에는 쓰지 않습니다. (세션에 저장되는 메시지가 바뀌지 않도록)
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...core.config import (
+    CONTEXT_SUMMARY_MAX_TOKENS,
+    CONTEXT_SUMMARY_SNIPPET_CHARS,
+    CONTEXT_TRIM_POLICY,
+    MAX_CONTEXT_TOKENS,
+    MAX_HISTORY_LENGTH,
+    MESSAGE_TOKEN_OVERHEAD,
+    TOKEN_ESTIMATION_BUFFER,
+)
+from ...models.data_models import ModelConfig
+from ...utils.token_counter import TokenCounter, content_text, get_token_counter
+
+logger = logging.getLogger(__name__)
+
+_PROVIDER_MESSAGE_KEYS = ("role", "content", "name")  # 제공업체로 보내는 필드
+
+
+class ContextBudgeter:
+    """대화 기록을 모델 컨텍스트 예산에 맞추는 정책"""
+
+    def __init__(
+        self,
+        policy: str = CONTEXT_TRIM_POLICY,
+        max_history_turns: int = MAX_HISTORY_LENGTH,
+        max_input_tokens: int = MAX_CONTEXT_TOKENS,
+        summary_max_tokens: int = CONTEXT_SUMMARY_MAX_TOKENS,
+        counter: Optional[TokenCounter] = None,
+    ):
+        if policy not in ("drop", "summarize"):
+            logger.warning(f"Unknown context policy '{policy}', using 'drop'")
+            policy = "drop"
+        self.policy = policy
+        self.max_history_turns = max_history_turns
+        self.max_input_tokens = max_input_tokens
+        self.summary_max_tokens = summary_max_tokens
+        self.counter = counter or get_token_counter()
+
+    @classmethod
+    def from_settings(cls, settings) -> "ContextBudgeter":
+        """settings의 context 섹션으로 생성"""
+        section = settings.get("context", {}) or {}
+        return cls(
+            policy=section.get("policy", CONTEXT_TRIM_POLICY),
+            max_history_turns=section.get("max_history_turns", MAX_HISTORY_LENGTH),
+            max_input_tokens=section.get("max_input_tokens", MAX_CONTEXT_TOKENS),
+        )
+
+    # ---- 토큰 수 ----
+
+    def count_text(self, text: str, config: ModelConfig) -> int:
+        return self.counter.count_text(text, config.provider, config.model_name)
+
+    def count_message(self, message: Dict[str, Any], config: ModelConfig) -> int:
+        """메시지 하나의 토큰 수"""
+        return self.count_messages([message], config)[0]
+
+    def count_messages(self, messages: List[Dict[str, Any]], config: ModelConfig) -> List[int]:
+        """메시지별 토큰 수 (이전에 센 내용은 계산기 메모에서 가져옴)"""
+        return self.counter.count_messages(messages, config.provider, config.model_name)
+
+    # ---- 예산 ----
+
+    def budget(self, config: ModelConfig, max_output_tokens: Optional[int]) -> int:
+        """입력에 쓸 수 있는 토큰 수"""
+        output = max_output_tokens or config.max_tokens
+        available = config.context_window - output
+        if self.max_input_tokens:
+            available = min(available, self.max_input_tokens)
+        if not self.counter.is_exact(config.provider, config.model_name):
+            # 추정치로 세는 경우 여유분을 남김
+            available = int(available / TOKEN_ESTIMATION_BUFFER)
+        return max(0, available)
+
+    @staticmethod
+    def _split_turns(
+        messages: List[Dict[str, Any]],
+    ) -> Tuple[List[Dict[str, Any]], List[List[Dict[str, Any]]]]:
+        """(시스템 메시지, 턴 목록) - 턴은 사용자 메시지에서 시작"""
+        system, turns = [], []
+        for message in messages:
+            if message.get("role") == "system":
+                system.append(message)
+            elif message.get("role") == "user" or not turns:
+                turns.append([message])
+            else:
+                turns[-1].append(message)
+        return system, turns
+
+    def fit(
+        self,
+        messages: List[Dict[str, Any]],
+        config: ModelConfig,
+        max_output_tokens: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """예산에 맞춘 메시지 목록 (제공업체로 보낼 필드만 담은 복사본)"""
+        system, turns = self._split_turns(messages)
+        if not turns:
+            return [self._provider_message(m) for m in system]
+
+        budget = self.budget(config, max_output_tokens)
+        tokens = dict(zip(map(id, messages), self.count_messages(messages, config)))
+        used = sum(tokens[id(m)] for m in system)
+        used += sum(tokens[id(m)] for m in turns[-1])
+
+        # 마지막 턴은 항상 포함, 이전 턴은 최근 것부터 예산과 턴 수 한도 안에서 포함
+        first_kept = len(turns) - 1
+        while first_kept > 0:
+            if self.max_history_turns and len(turns) - first_kept >= self.max_history_turns:
+                break
+            turn_tokens = sum(tokens[id(m)] for m in turns[first_kept - 1])
+            if used + turn_tokens > budget:
+                break
+            used += turn_tokens
+            first_kept -= 1
+
+        if used > budget:
+            logger.warning(
+                f"Context for {config.model_name} exceeds budget even after trimming "
+                f"({used} > {budget} tokens)"
+            )
+
+        kept = [m for turn in turns[first_kept:] for m in turn]
+        dropped = [m for turn in turns[:first_kept] for m in turn]
+        system = [self._provider_message(m) for m in system]
+        if dropped:
+            logger.info(
+                f"Context trimmed for {config.model_name}: dropped {first_kept} of "
+                f"{len(turns)} turns ({len(dropped)} messages), ~{used} tokens kept"
+            )
+            if self.policy == "summarize":
+                system = self._with_summary(system, dropped, config, budget - used)
+
+        return system + [self._provider_message(m) for m in kept]
+
+    def _with_summary(
+        self,
+        system: List[Dict[str, Any]],
+        dropped: List[Dict[str, Any]],
+        config: ModelConfig,
+        remaining: int,
+    ) -> List[Dict[str, Any]]:
+        """제외한 턴을 메시지당 한 줄로 요약해 시스템 프롬프트에 덧붙임"""
+        limit = min(self.summary_max_tokens, remaining)
+        header = "Earlier conversation (summarized):"
+        lines: List[str] = []
+        used = self.count_text(header, config) + MESSAGE_TOKEN_OVERHEAD
+        # 최근 것부터 채워 한도를 넘으면 오래된 줄을 버림
+        for message in reversed(dropped):
+            content, _ = content_text(message.get("content"))
+            snippet = " ".join(content.split())[:CONTEXT_SUMMARY_SNIPPET_CHARS]
+            if not snippet:
+                continue
+            line = f"- {message.get('role')}: {snippet}"
+            line_tokens = self.count_text(line, config) + 1
+            if used + line_tokens > limit:
+                break
+            lines.append(line)
+            used += line_tokens
+        if not lines:
+            return system
+
+        summary = "\n".join([header] + lines[::-1])
+        # Anthropic/Google 인터페이스는 마지막 시스템 메시지만 쓰므로 기존 프롬프트에 합침
+        if not system:
+            return [{"role": "system", "content": summary}]
+        if isinstance(system[-1].get("content"), str):
+            system[-1] = dict(system[-1], content=f"{system[-1]['content']}\n\n{summary}")
+        return system
+
+    @staticmethod
+    def _provider_message(message: Dict[str, Any]) -> Dict[str, Any]:
+        """제공업체로 보낼 필드만 담은 복사본"""
+        return {k: message[k] for k in _PROVIDER_MESSAGE_KEYS if k in message}
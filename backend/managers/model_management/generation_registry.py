@@ -0,0 +1,190 @@
+# ted-os-project/backend/managers/model_management/generation_registry.py
+"""
+Ted OS - 진행 중인 AI 응답 생성 목록과 생성별 취소 토큰
+
+생성마다 ID와 취소 토큰을 두어 동시에 진행되는 대화끼리 중단 요청이 섞이지 않게 합니다.
+취소하면 대기 중인 비동기 스트림을 바로 끊어 제공업체 연결도 즉시 닫힙니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from contextlib import suppress
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Generation:
+    """진행 중인 응답 생성 하나 (취소 토큰 + 진행 상황)"""
+
+    def __init__(
+        self,
+        generation_id: str,
+        session_id: Optional[str] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+    ):
+        self.id = generation_id
+        self.session_id = session_id
+        self.provider = provider
+        self.model = model
+        self.started_at = datetime.now()
+        self._started = time.monotonic()
+        self.chunks_streamed = 0
+        self.chars_streamed = 0
+        self.final_text: Optional[str] = None  # 후처리된 최종 응답 (스트림 종료 후)
+        self.usage: Optional[Any] = None  # 이 생성의 TokenUsage (제공업체가 알려준 경우)
+        self._cancelled = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> bool:
+        """취소 요청 (이미 취소된 경우 False)"""
+        with self._lock:
+            if self._cancelled.is_set():
+                return False
+            self._cancelled.set()
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Generation cancel callback failed: {e}")
+        return True
+
+    def add_cancel_callback(self, callback: Callable[[], None]):
+        """취소 시 호출할 함수 등록 (이미 취소됐으면 바로 호출)"""
+        with self._lock:
+            if not self._cancelled.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_cancel_callback(self, callback: Callable[[], None]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def record_chunk(self, text: str):
+        """스트리밍된 청크 집계"""
+        self.chunks_streamed += 1
+        self.chars_streamed += len(text)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "session_id": self.session_id,
+            "provider": self.provider,
+            "model": self.model,
+            "started_at": self.started_at.isoformat(),
+            "elapsed_seconds": round(time.monotonic() - self._started, 3),
+            "chunks_streamed": self.chunks_streamed,
+            "chars_streamed": self.chars_streamed,
+            "cancelled": self.cancelled,
+        }
+
+
+class GenerationRegistry:
+    """진행 중인 생성 목록 (스레드 안전)"""
+
+    def __init__(self):
+        self._generations: Dict[str, Generation] = {}
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        session_id: Optional[str] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        generation_id: Optional[str] = None,
+    ) -> Generation:
+        """새 생성 등록"""
+        generation = Generation(
+            generation_id or uuid.uuid4().hex, session_id, provider, model
+        )
+        with self._lock:
+            self._generations[generation.id] = generation
+        return generation
+
+    def finish(self, generation_id: str):
+        """생성 종료 (여러 번 호출해도 안전)"""
+        with self._lock:
+            self._generations.pop(generation_id, None)
+
+    def get(self, generation_id: str) -> Optional[Generation]:
+        with self._lock:
+            return self._generations.get(generation_id)
+
+    def cancel(self, generation_id: str) -> bool:
+        """생성 취소 (진행 중인 생성이 없으면 False)"""
+        generation = self.get(generation_id)
+        if generation is None:
+            return False
+        logger.info(f"Cancelling generation {generation_id}")
+        generation.cancel()
+        return True
+
+    def cancel_all(self) -> int:
+        """진행 중인 모든 생성 취소"""
+        with self._lock:
+            generations = list(self._generations.values())
+        return sum(1 for generation in generations if generation.cancel())
+
+    def list_active(self) -> List[Dict[str, Any]]:
+        """진행 중인 생성 목록 (오래된 순)"""
+        with self._lock:
+            generations = list(self._generations.values())
+        generations.sort(key=lambda g: g.started_at)
+        return [generation.to_dict() for generation in generations]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._generations)
+
+
+async def iterate_until_cancelled(
+    stream: AsyncIterator[Any], generation: Generation
+) -> AsyncIterator[Any]:
+    """
+    취소되면 다음 청크를 기다리는 중이라도 바로 멈추는 비동기 반복
+
+    대기 중인 __anext__를 취소하므로 제공업체 스트림의 정리 코드(연결 닫기)가 즉시 실행됩니다.
+    """
+    loop = asyncio.get_running_loop()
+    cancelled = loop.create_future()
+
+    def wake():
+        def resolve():
+            if not cancelled.done():
+                cancelled.set_result(None)
+
+        loop.call_soon_threadsafe(resolve)
+
+    generation.add_cancel_callback(wake)
+    iterator = stream.__aiter__()
+    try:
+        while not generation.cancelled:
+            step = asyncio.ensure_future(iterator.__anext__())
+            await asyncio.wait((step, cancelled), return_when=asyncio.FIRST_COMPLETED)
+            if not step.done():
+                step.cancel()
+                with suppress(asyncio.CancelledError, StopAsyncIteration):
+                    await step
+                return
+            try:
+                item = step.result()
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        generation.remove_cancel_callback(wake)
+        if not cancelled.done():
+            cancelled.cancel()
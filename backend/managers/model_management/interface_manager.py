@@ -4,71 +4,63 @@ Ted OS - AI 인터페이스 관리자
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Type
 
 from ...interfaces.base import LLMInterface
 from ...interfaces.openai_client import OpenAIInterface
 from ...interfaces.anthropic_client import AnthropicInterface
 from ...interfaces.google_client import GoogleInterface
+from ...interfaces.http_transport import HttpTransport
 from ...models.enums import ModelProvider
 from ...managers.settings import SettingsManager
 
 logger = logging.getLogger(__name__)
 
+# 제공업체별 인터페이스 클래스
+PROVIDER_INTERFACES: Dict[ModelProvider, Type[LLMInterface]] = {
+    ModelProvider.OPENAI: OpenAIInterface,
+    ModelProvider.ANTHROPIC: AnthropicInterface,
+    ModelProvider.GOOGLE: GoogleInterface,
+}
+
 
 class InterfaceManager:
     """AI 인터페이스 초기화 및 관리 전담 클래스"""
 
     def __init__(self, settings_manager: SettingsManager):
         self.settings = settings_manager
+        self.transport = HttpTransport.from_settings(settings_manager)
         self.interfaces: Dict[ModelProvider, LLMInterface] = {}
+        self._api_keys: Dict[ModelProvider, str] = {}  # 인터페이스를 만든 키
         self._initialize_interfaces()
 
     def _initialize_interfaces(self):
         """AI 인터페이스들 초기화"""
         self.interfaces.clear()
+        self._api_keys.clear()
         api_keys = self.settings.get("api_keys", {})
 
-        # OpenAI 인터페이스
-        openai_key = api_keys.get(ModelProvider.OPENAI.value)
-        if openai_key:
-            try:
-                self.interfaces[ModelProvider.OPENAI] = OpenAIInterface(openai_key)
-                logger.info("OpenAI interface initialized successfully.")
-            except Exception as e:
-                logger.error(f"Failed to initialize OpenAI interface: {e}")
-        else:
-            logger.info(
-                "OpenAI API key not found/empty. OpenAI interface not initialized."
-            )
+        for provider in PROVIDER_INTERFACES:
+            self._build_interface(provider, api_keys.get(provider.value))
 
-        # Anthropic 인터페이스
-        anthropic_key = api_keys.get(ModelProvider.ANTHROPIC.value)
-        if anthropic_key:
-            try:
-                self.interfaces[ModelProvider.ANTHROPIC] = AnthropicInterface(
-                    anthropic_key
-                )
-                logger.info("Anthropic interface initialized successfully.")
-            except Exception as e:
-                logger.error(f"Failed to initialize Anthropic interface: {e}")
-        else:
-            logger.info(
-                "Anthropic API key not found/empty. Anthropic interface not initialized."
-            )
+    def _build_interface(self, provider: ModelProvider, api_key: Optional[str]):
+        """제공업체 인터페이스 생성 (키가 없으면 제거)"""
+        self.interfaces.pop(provider, None)
+        self._api_keys.pop(provider, None)
+        interface_cls = PROVIDER_INTERFACES[provider]
 
-        # Google 인터페이스
-        google_key = api_keys.get(ModelProvider.GOOGLE.value)
-        if google_key:
-            try:
-                self.interfaces[ModelProvider.GOOGLE] = GoogleInterface(google_key)
-                logger.info("Google interface initialized successfully.")
-            except Exception as e:
-                logger.error(f"Failed to initialize Google interface: {e}")
-        else:
+        if not api_key:
             logger.info(
-                "Google API key not found/empty. Google interface not initialized."
+                f"{provider.value} API key not found/empty. {provider.value} interface not initialized."
             )
+            return
+
+        try:
+            self.interfaces[provider] = interface_cls(api_key, transport=self.transport)
+            self._api_keys[provider] = api_key
+            logger.info(f"{provider.value} interface initialized successfully.")
+        except Exception as e:
+            logger.error(f"Failed to initialize {provider.value} interface: {e}")
 
     def get_available_providers(self) -> List[ModelProvider]:
         """사용 가능한 제공업체 목록"""
@@ -82,6 +74,21 @@ class InterfaceManager:
         """특정 제공업체 인터페이스 반환"""
         return self.interfaces.get(provider)
 
-    def refresh_interfaces(self):
-        """인터페이스들 새로고침"""
-        self._initialize_interfaces()
+    def refresh_interfaces(self) -> List[ModelProvider]:
+        """
+        인터페이스들 새로고침
+
+        API 키가 바뀐 제공업체만 다시 만들고, 공유 연결 풀은 그대로 둡니다.
+
+        Returns:
+            다시 만든 제공업체 목록
+        """
+        api_keys = self.settings.get("api_keys", {})
+        changed = [
+            provider
+            for provider in PROVIDER_INTERFACES
+            if (api_keys.get(provider.value) or None) != self._api_keys.get(provider)
+        ]
+        for provider in changed:
+            self._build_interface(provider, api_keys.get(provider.value))
+        return changed
@@ -0,0 +1,288 @@
+# ted-os-project/backend/managers/model_management/response_cache.py
+"""
+Ted OS - 같은 요청에 대한 AI 응답 캐시
+
+정규화한 메시지, 제공업체, 모델, 샘플링 매개변수의 해시를 키로 씁니다.
+결과가 결정적인 호출(temperature 0)이나 cacheable=True로 요청한 호출만 저장합니다.
+메모리(LRU)와 디스크(키당 JSON 파일) 두 단계이며, 둘 다 TTL과 항목 수 제한이 있습니다.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...core.config import (
+    RESPONSE_CACHE_DISK_ENTRIES,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_MEMORY_ENTRIES,
+    RESPONSE_CACHE_TTL_SECONDS,
+)
+from ...models.data_models import TokenUsage
+from ..storage.base import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_content(content: Any) -> Any:
+    """공백 차이만 있는 내용은 같은 키가 되도록 정리"""
+    if isinstance(content, str):
+        return " ".join(content.split())
+    if isinstance(content, list):
+        return [
+            {"type": "text", "text": " ".join(part.get("text", "").split())}
+            if isinstance(part, dict) and part.get("type") == "text"
+            else part
+            for part in content
+        ]
+    return content
+
+
+class CachedResponse:
+    """캐시된 응답 (후처리 전 원문 + 원래 호출의 사용량)"""
+
+    __slots__ = ("text", "usage", "created_at")
+
+    def __init__(self, text: str, usage: Optional[TokenUsage], created_at: float):
+        self.text = text
+        self.usage = usage
+        self.created_at = created_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "text": self.text,
+            "usage": self.usage.to_dict() if self.usage else None,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CachedResponse":
+        usage = data.get("usage")
+        return cls(
+            data["text"],
+            TokenUsage.from_dict(dict(usage)) if usage else None,
+            data["created_at"],
+        )
+
+
+class ResponseCache:
+    """메모리 + 디스크 2단계 응답 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        enabled: bool = RESPONSE_CACHE_ENABLED,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        memory_entries: int = RESPONSE_CACHE_MEMORY_ENTRIES,
+        disk_entries: int = RESPONSE_CACHE_DISK_ENTRIES,
+    ):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries if path else 0
+        self.path = Path(path) if path else None
+        self._memory: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._disk_index: Optional[Dict[str, float]] = None  # 키 -> 저장 시각 (처음 사용할 때 로드)
+        self._lock = threading.RLock()
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expired": 0,
+            "tokens_saved": 0,
+            "cost_saved_usd": 0.0,
+        }
+
+    @classmethod
+    def from_settings(cls, settings) -> "ResponseCache":
+        """settings의 response_cache 섹션으로 생성"""
+        section = settings.get("response_cache", {}) or {}
+        return cls(
+            path=section.get("path"),
+            enabled=section.get("enabled", RESPONSE_CACHE_ENABLED),
+            ttl_seconds=section.get("ttl_seconds", RESPONSE_CACHE_TTL_SECONDS),
+            memory_entries=section.get("memory_entries", RESPONSE_CACHE_MEMORY_ENTRIES),
+            disk_entries=section.get("disk_entries", RESPONSE_CACHE_DISK_ENTRIES),
+        )
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        params: Dict[str, Any],
+    ) -> str:
+        """요청 내용의 SHA-256 키 (메시지의 role/content 외 필드는 무시)"""
+        payload = {
+            "provider": provider,
+            "model": model,
+            "messages": [
+                {"role": m.get("role"), "content": _normalize_content(m.get("content"))}
+                for m in messages
+            ],
+            "params": params,
+        }
+        encoded = json.dumps(
+            payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_cacheable(params: Dict[str, Any], cacheable: Optional[bool]) -> bool:
+        """명시적으로 지정하지 않으면 temperature 0인 호출만 캐시"""
+        if cacheable is not None:
+            return cacheable
+        return params.get("temperature") == 0
+
+    # ---- 조회/저장 ----
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def lookup(
+        self,
+        provider: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        params: Dict[str, Any],
+        cacheable: Optional[bool] = None,
+    ) -> Tuple[Optional[str], Optional[CachedResponse]]:
+        """(캐시 키, 캐시된 응답) - 캐시 대상이 아니면 키도 None"""
+        if not self.enabled or not self.is_cacheable(params, cacheable):
+            return None, None
+        key = self.make_key(provider, model, messages, params)
+        return key, self.get(key)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """캐시된 응답 (없거나 만료되면 None)"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry.created_at, now):
+                    self._memory.move_to_end(key)
+                    self._record_hit("memory_hits", entry)
+                    return entry
+                del self._memory[key]
+                self._counters["expired"] += 1
+
+            entry = self._read_disk(key, now)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._remember(key, entry)
+            self._record_hit("disk_hits", entry)
+            return entry
+
+    def put(self, key: str, text: str, usage: Optional[TokenUsage] = None):
+        """응답 저장 (빈 응답은 저장하지 않음)"""
+        if not text:
+            return
+        entry = CachedResponse(text, usage, time.time())
+        with self._lock:
+            self._remember(key, entry)
+            self._write_disk(key, entry)
+            self._counters["stores"] += 1
+
+    def clear(self):
+        """두 단계 모두 비우기"""
+        with self._lock:
+            self._memory.clear()
+            for key in list(self._load_disk_index()):
+                self._remove_disk(key)
+
+    def _record_hit(self, counter: str, entry: CachedResponse):
+        self._counters[counter] += 1
+        if entry.usage:
+            self._counters["tokens_saved"] += entry.usage.total_tokens
+            self._counters["cost_saved_usd"] = round(
+                self._counters["cost_saved_usd"] + entry.usage.cost_usd, 6
+            )
+
+    def _remember(self, key: str, entry: CachedResponse):
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    # ---- 디스크 단계 ----
+
+    def _disk_file(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def _load_disk_index(self) -> Dict[str, float]:
+        if self._disk_index is None:
+            self._disk_index = {}
+            if self.path is not None and self.path.exists():
+                for file in self.path.glob("*.json"):
+                    try:
+                        self._disk_index[file.stem] = file.stat().st_mtime
+                    except OSError:
+                        continue
+        return self._disk_index
+
+    def _read_disk(self, key: str, now: float) -> Optional[CachedResponse]:
+        if self.disk_entries <= 0 or key not in self._load_disk_index():
+            return None
+        try:
+            with open(self._disk_file(key), "r", encoding="utf-8") as f:
+                entry = CachedResponse.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable response cache entry {key}: {e}")
+            self._remove_disk(key)
+            return None
+        if self._expired(entry.created_at, now):
+            self._remove_disk(key)
+            self._counters["expired"] += 1
+            return None
+        return entry
+
+    def _write_disk(self, key: str, entry: CachedResponse):
+        if self.disk_entries <= 0:
+            return
+        index = self._load_disk_index()
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(self._disk_file(key), entry.to_dict())
+        except OSError as e:
+            logger.error(f"Error writing response cache entry: {e}")
+            return
+        index[key] = entry.created_at
+        while len(index) > self.disk_entries:
+            self._remove_disk(min(index, key=index.get))
+            self._counters["evictions"] += 1
+
+    def _remove_disk(self, key: str):
+        self._load_disk_index().pop(key, None)
+        try:
+            self._disk_file(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Error removing response cache entry {key}: {e}")
+
+    # ---- 통계 ----
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 횟수와 절약한 토큰/비용"""
+        with self._lock:
+            counters = dict(self._counters)
+            hits = counters["memory_hits"] + counters["disk_hits"]
+            lookups = hits + counters["misses"]
+            return {
+                "enabled": self.enabled,
+                "memory_size": len(self._memory),
+                "disk_size": len(self._disk_index or {}) if self.disk_entries > 0 else 0,
+                "hits": hits,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                **counters,
+            }
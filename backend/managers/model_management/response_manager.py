@@ -3,16 +3,22 @@
 Ted OS - AI 응답 생성 관리자
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import List, Optional, Any, Tuple, Generator, Dict
+from typing import List, Optional, Any, Tuple, Generator, AsyncGenerator, Dict
 
 from ...models.enums import ModelProvider
 from ...models.data_models import TokenUsage, ModelConfig
 from ...managers.settings import SettingsManager
 from ...managers.usage_tracker import UsageTracker
 from ...utils.output_renderer import OutputRenderer
+from ...utils.token_counter import get_token_counter
+from .generation_registry import Generation, GenerationRegistry, iterate_until_cancelled
 from .interface_manager import InterfaceManager
+from .context_budgeter import ContextBudgeter
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy, RetryStats
 
 logger = logging.getLogger(__name__)
 
@@ -32,47 +38,57 @@ class ResponseManager:
         self.usage_tracker = usage_tracker
         self.output_renderer = OutputRenderer()
         self.get_active_config = config_resolver_callback
-        self._should_stop_generation = False  # 출력 정지 플래그
-        self._is_generating = False  # 생성 중 상태 플래그
+        self.generations = GenerationRegistry()  # 진행 중인 생성 (생성별 취소 토큰)
+        self.retry_policy = RetryPolicy.from_settings(settings_manager)
+        self.response_cache = ResponseCache.from_settings(settings_manager)
+        self.context_budgeter = ContextBudgeter.from_settings(settings_manager)
 
     def generate(
         self,
         messages: List[Dict[str, Any]],
         provider_display_name: Optional[str] = None,
         model_id_key: Optional[str] = None,
+        cacheable: Optional[bool] = None,
         **kwargs: Any,
     ) -> Tuple[str, Optional[TokenUsage]]:
-        """AI 응답 생성"""
+        """
+        AI 응답 생성
+
+        응답 캐시가 켜져 있으면 temperature 0 또는 cacheable=True 호출은 캐시에서 먼저 찾습니다.
+        캐시 적중은 새 사용량으로 기록하지 않으며 사용량으로 None을 반환합니다.
+        """
         _provider_enum, config, interface = self.get_active_config(
             provider_display_name, model_id_key
         )
 
-        # 매개변수 준비
-        params = {
-            "temperature": self.settings.get("defaults.temperature", 0.7),
-            "max_tokens": min(
-                self.settings.get("defaults.max_tokens", config.max_tokens),
-                config.max_tokens,
-            ),
-        }
-        params.update(kwargs)
+        params = self._build_params(config, kwargs)
+        messages = self.context_budgeter.fit(messages, config, params.get("max_tokens"))
+
+        cache_key, cached = self.response_cache.lookup(
+            config.provider.value, config.model_name, messages, params, cacheable
+        )
+        if cached is not None:
+            logger.info(f"Response cache hit for {config.provider.value}/{config.model_name}")
+            return self.output_renderer.process_output(cached.text), None
 
         logger.info(
             f"Generating with {config.provider.value}/{config.model_name} "
             f"(Display: {config.display_name}). Messages: {len(messages)}. Params: {params}"
         )
 
-        # API 호출
-        response_text, usage = interface.generate(
-            messages, model=config.model_name, **params
+        # API 호출 (일시적 오류는 재시도)
+        retry_stats = RetryStats()
+        response_text, usage = self.retry_policy.call(
+            config.provider.value,
+            lambda: interface.generate(messages, model=config.model_name, **params),
+            retry_stats,
         )
 
         # 사용량 추적
-        if usage and self.usage_tracker:
-            input_cost = (usage.input_tokens / 1000) * config.input_cost_per_1k
-            output_cost = (usage.output_tokens / 1000) * config.output_cost_per_1k
-            usage.cost_usd = round(input_cost + output_cost, 6)
-            self.usage_tracker.add_usage(usage)
+        self._record_usage(usage, config, retry_stats)
+
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response_text, usage)
 
         return self.output_renderer.process_output(response_text), usage
 
@@ -81,13 +97,21 @@ class ResponseManager:
         messages: List[Dict[str, Any]],
         provider_display_name: Optional[str] = None,
         model_id_key: Optional[str] = None,
+        generation: Optional[Generation] = None,
         **kwargs: Any,
     ) -> Generator[Tuple[str, Optional[TokenUsage]], None, None]:
-        """AI 스트리밍 응답 생성"""
-        # 중단 플래그 초기화 및 생성 상태 설정
-        self._should_stop_generation = False
-        self._is_generating = True
-        
+        """
+        AI 스트리밍 응답 생성
+
+        청크는 후처리 없이 그대로 전달하고, 후처리된 전체 응답은 종료 후 generation.final_text에 둡니다.
+        generation을 넘기지 않으면 새로 등록하며, 끝나면 목록에서 제거합니다.
+        """
+        if generation is None:
+            generation = self.generations.start(
+                provider=provider_display_name, model=model_id_key
+            )
+        stream_iterator = None
+
         try:
             _provider_enum, config, interface = self.get_active_config(
                 provider_display_name, model_id_key
@@ -107,68 +131,58 @@ class ResponseManager:
                 response_text, usage = self.generate(
                     messages, actual_provider_name, actual_model_key, **kwargs
                 )
+                generation.final_text = response_text
+                generation.usage = usage
                 yield response_text, usage
                 return
 
-            # 매개변수 준비
-            params = {
-                "temperature": self.settings.get("defaults.temperature", 0.7),
-                "max_tokens": min(
-                    self.settings.get("defaults.max_tokens", config.max_tokens),
-                    config.max_tokens,
-                ),
-            }
-            params.update(kwargs)
+            kwargs.pop("cacheable", None)  # 스트리밍 응답은 캐시하지 않음
+            params = self._build_params(config, kwargs)
+            messages = self.context_budgeter.fit(messages, config, params.get("max_tokens"))
 
             logger.info(
                 f"Streaming with {config.provider.value}/{config.model_name} "
                 f"(Display: {config.display_name}). Messages: {len(messages)}. Params: {params}"
             )
 
-            accumulated_response = ""
+            # 청크는 그대로 전달하고 후처리는 전체 응답에 한 번만 적용
+            renderer = self.output_renderer.stream_renderer()
             final_usage_data: Optional[TokenUsage] = None
 
-            # 스트리밍 호출
-            stream_iterator = interface.stream(messages, model=config.model_name, **params)
+            # 스트리밍 호출 (첫 청크 전 실패만 재시도)
+            retry_stats = RetryStats()
+            stream_iterator = self.retry_policy.stream(
+                config.provider.value,
+                lambda: interface.stream(messages, model=config.model_name, **params),
+                retry_stats,
+            )
 
             for chunk_data in stream_iterator:
                 # 중단 요청 확인
-                if self._should_stop_generation:
-                    logger.info("Generation stopped by user request")
+                if generation.cancelled:
+                    logger.info(f"Generation {generation.id} stopped by user request")
                     break
-                    
-                try:
-                    if (
-                        isinstance(chunk_data, tuple)
-                        and len(chunk_data) == 2
-                        and chunk_data[0] == "__USAGE__"
-                    ):
-                        # 사용량 정보
-                        final_usage_data = chunk_data[1]
-                        if final_usage_data and self.usage_tracker:
-                            input_cost = (
-                                final_usage_data.input_tokens / 1000
-                            ) * config.input_cost_per_1k
-                            output_cost = (
-                                final_usage_data.output_tokens / 1000
-                            ) * config.output_cost_per_1k
-                            final_usage_data.cost_usd = round(input_cost + output_cost, 6)
-                            self.usage_tracker.add_usage(final_usage_data)
-                    elif isinstance(chunk_data, str):
-                        # 새로운 청크만 yield (누적하지 않음)
-                        if chunk_data:  # 빈 문자열이 아닌 경우만
-                            accumulated_response += chunk_data
-                            yield self.output_renderer.process_output(chunk_data), final_usage_data
-                    elif chunk_data is None:
-                        # None 값은 무시하고 계속 진행
-                        continue
-                    else:
-                        # 예상치 못한 데이터 타입
-                        continue
-                except Exception as e:
-                    continue  # 개별 청크 오류 시 전체 스트리밍을 중단하지 않음
-
-            # OpenAI의 경우 수동으로 토큰 사용량 계산
+
+                if (
+                    isinstance(chunk_data, tuple)
+                    and len(chunk_data) == 2
+                    and chunk_data[0] == "__USAGE__"
+                ):
+                    # 사용량 정보
+                    final_usage_data = chunk_data[1]
+                    generation.usage = final_usage_data
+                    self._record_usage(
+                        final_usage_data, config, retry_stats, generation.session_id
+                    )
+                elif isinstance(chunk_data, str) and chunk_data:
+                    # 새로운 청크만 yield (누적하지 않음, None 등 다른 값은 무시)
+                    generation.record_chunk(chunk_data)
+                    yield renderer.feed(chunk_data), final_usage_data
+
+            accumulated_response = renderer.raw_text
+            generation.final_text = renderer.finalize()
+
+            # OpenAI의 경우 수동으로 토큰 사용량 계산 (본문은 이미 전달했으므로 사용량만)
             if (
                 not final_usage_data
                 and accumulated_response
@@ -177,72 +191,251 @@ class ResponseManager:
                 final_usage_data = self._estimate_openai_usage(
                     messages, accumulated_response, config
                 )
-                if final_usage_data and self.usage_tracker:
-                    input_cost = (
-                        final_usage_data.input_tokens / 1000
-                    ) * config.input_cost_per_1k
-                    output_cost = (
-                        final_usage_data.output_tokens / 1000
-                    ) * config.output_cost_per_1k
-                    final_usage_data.cost_usd = round(input_cost + output_cost, 6)
-                    self.usage_tracker.add_usage(final_usage_data)
-                yield self.output_renderer.process_output(
-                    accumulated_response
-                ), final_usage_data
+                generation.usage = final_usage_data
+                self._record_usage(
+                    final_usage_data, config, retry_stats, generation.session_id
+                )
+                yield "", final_usage_data
 
             # 최종 응답이 없는 경우
             elif not accumulated_response and final_usage_data:
                 yield "", final_usage_data
-                
+
+        finally:
+            # 중단 시 제공업체 스트림을 바로 닫음
+            close = getattr(stream_iterator, "close", None)
+            if close is not None:
+                close()
+            self.generations.finish(generation.id)
+            if generation.cancelled:
+                logger.info(f"AI generation {generation.id} stopped by user request")
+
+    async def agenerate(
+        self,
+        messages: List[Dict[str, Any]],
+        provider_display_name: Optional[str] = None,
+        model_id_key: Optional[str] = None,
+        cacheable: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Tuple[str, Optional[TokenUsage]]:
+        """AI 응답 생성 (비동기식, 캐시 규칙은 generate와 동일)"""
+        _provider_enum, config, interface = self.get_active_config(
+            provider_display_name, model_id_key
+        )
+
+        params = self._build_params(config, kwargs)
+        # 토큰 계산은 CPU 작업이라 스레드에서 실행
+        messages = await asyncio.to_thread(
+            self.context_budgeter.fit, messages, config, params.get("max_tokens")
+        )
+
+        # 디스크 단계 조회가 있으므로 스레드에서 실행
+        cache_key, cached = await asyncio.to_thread(
+            self.response_cache.lookup,
+            config.provider.value,
+            config.model_name,
+            messages,
+            params,
+            cacheable,
+        )
+        if cached is not None:
+            logger.info(f"Response cache hit for {config.provider.value}/{config.model_name}")
+            return self.output_renderer.process_output(cached.text), None
+
+        logger.info(
+            f"Generating (async) with {config.provider.value}/{config.model_name} "
+            f"(Display: {config.display_name}). Messages: {len(messages)}. Params: {params}"
+        )
+
+        retry_stats = RetryStats()
+        response_text, usage = await self.retry_policy.acall(
+            config.provider.value,
+            lambda: interface.agenerate(messages, model=config.model_name, **params),
+            retry_stats,
+        )
+
+        # 사용량 기록은 파일 I/O라 스레드에서 실행
+        await asyncio.to_thread(self._record_usage, usage, config, retry_stats)
+
+        if cache_key is not None:
+            await asyncio.to_thread(self.response_cache.put, cache_key, response_text, usage)
+
+        return self.output_renderer.process_output(response_text), usage
+
+    async def astream_generate(
+        self,
+        messages: List[Dict[str, Any]],
+        provider_display_name: Optional[str] = None,
+        model_id_key: Optional[str] = None,
+        generation: Optional[Generation] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Tuple[str, Optional[TokenUsage]], None]:
+        """
+        AI 스트리밍 응답 생성 (비동기식, 청크 형식은 stream_generate와 동일)
+
+        취소되면 다음 청크를 기다리는 중이어도 바로 제공업체 스트림을 닫습니다.
+        """
+        if generation is None:
+            generation = self.generations.start(
+                provider=provider_display_name, model=model_id_key
+            )
+        stream_iterator = None
+
+        try:
+            _provider_enum, config, interface = self.get_active_config(
+                provider_display_name, model_id_key
+            )
+
+            # 스트리밍 미지원 모델은 일반 생성으로 대체
+            if not config.supports_streaming:
+                logger.info(
+                    f"Model {config.display_name} does not support streaming. Falling back to agenerate."
+                )
+                actual_provider_name = provider_display_name or self.settings.get(
+                    "ui.selected_provider"
+                )
+                actual_model_key = model_id_key or self.settings.get_default_model_for_provider(
+                    actual_provider_name
+                )
+                response_text, usage = await self.agenerate(
+                    messages, actual_provider_name, actual_model_key, **kwargs
+                )
+                generation.final_text = response_text
+                generation.usage = usage
+                yield response_text, usage
+                return
+
+            kwargs.pop("cacheable", None)  # 스트리밍 응답은 캐시하지 않음
+            params = self._build_params(config, kwargs)
+            messages = await asyncio.to_thread(
+                self.context_budgeter.fit, messages, config, params.get("max_tokens")
+            )
+
+            logger.info(
+                f"Streaming (async) with {config.provider.value}/{config.model_name} "
+                f"(Display: {config.display_name}). Messages: {len(messages)}. Params: {params}"
+            )
+
+            # 청크는 그대로 전달하고 후처리는 전체 응답에 한 번만 적용
+            renderer = self.output_renderer.stream_renderer()
+            final_usage_data: Optional[TokenUsage] = None
+
+            retry_stats = RetryStats()
+            stream_iterator = self.retry_policy.astream(
+                config.provider.value,
+                lambda: interface.astream(messages, model=config.model_name, **params),
+                retry_stats,
+            )
+
+            async for chunk_data in iterate_until_cancelled(stream_iterator, generation):
+                if (
+                    isinstance(chunk_data, tuple)
+                    and len(chunk_data) == 2
+                    and chunk_data[0] == "__USAGE__"
+                ):
+                    final_usage_data = chunk_data[1]
+                    generation.usage = final_usage_data
+                    await asyncio.to_thread(
+                        self._record_usage,
+                        final_usage_data,
+                        config,
+                        retry_stats,
+                        generation.session_id,
+                    )
+                elif isinstance(chunk_data, str) and chunk_data:
+                    generation.record_chunk(chunk_data)
+                    yield renderer.feed(chunk_data), final_usage_data
+
+            accumulated_response = renderer.raw_text
+            generation.final_text = await asyncio.to_thread(renderer.finalize)
+
+            # OpenAI의 경우 수동으로 토큰 사용량 계산 (tiktoken은 CPU 작업, 사용량만 전달)
+            if (
+                not final_usage_data
+                and accumulated_response
+                and config.provider == ModelProvider.OPENAI
+            ):
+                final_usage_data = await asyncio.to_thread(
+                    self._estimate_openai_usage, messages, accumulated_response, config
+                )
+                generation.usage = final_usage_data
+                await asyncio.to_thread(
+                    self._record_usage,
+                    final_usage_data,
+                    config,
+                    retry_stats,
+                    generation.session_id,
+                )
+                yield "", final_usage_data
+
+            elif not accumulated_response and final_usage_data:
+                yield "", final_usage_data
+
         finally:
-            # 생성 상태 플래그 리셋
-            self._is_generating = False
-            if self._should_stop_generation:
-                logger.info("AI generation stopped by user request")
+            # 중단/연결 종료 시 제공업체 스트림을 바로 닫음
+            if stream_iterator is not None:
+                await stream_iterator.aclose()
+            self.generations.finish(generation.id)
+            if generation.cancelled:
+                logger.info(f"AI generation {generation.id} stopped by user request")
+
+    def fit_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        provider_display_name: Optional[str] = None,
+        model_id_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """제공업체로 보낼 메시지 (generate와 같은 컨텍스트 예산 적용)"""
+        _provider_enum, config, _interface = self.get_active_config(
+            provider_display_name, model_id_key
+        )
+        params = self._build_params(config, kwargs)
+        return self.context_budgeter.fit(messages, config, params.get("max_tokens"))
+
+    def _build_params(self, config: ModelConfig, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """기본 설정과 호출 인자를 합친 API 매개변수"""
+        params = {
+            "temperature": self.settings.get("defaults.temperature", 0.7),
+            "max_tokens": min(
+                self.settings.get("defaults.max_tokens", config.max_tokens),
+                config.max_tokens,
+            ),
+        }
+        params.update(kwargs)
+        return params
+
+    def _record_usage(
+        self,
+        usage: Optional[TokenUsage],
+        config: ModelConfig,
+        retry_stats: Optional[RetryStats] = None,
+        session_key: Optional[str] = None,
+    ):
+        """모델 단가로 비용을 계산해 사용량 기록 (재시도 횟수 포함)"""
+        if not usage:
+            return
+        if retry_stats is not None:
+            usage.retries = retry_stats.retries
+        if not self.usage_tracker:
+            return
+        input_cost = (usage.input_tokens / 1000) * config.input_cost_per_1k
+        output_cost = (usage.output_tokens / 1000) * config.output_cost_per_1k
+        usage.cost_usd = round(input_cost + output_cost, 6)
+        self.usage_tracker.add_usage(usage, session_key)
 
     def _estimate_openai_usage(
         self, messages: List[Dict[str, Any]], response_text: str, config: ModelConfig
     ) -> Optional[TokenUsage]:
-        """OpenAI 토큰 사용량 추정"""
+        """OpenAI 스트림 토큰 사용량 추정 (이전 메시지는 공용 계산기 메모로 다시 세지 않음)"""
         try:
-            import tiktoken
-
-            # 모델명 매핑
-            tiktoken_model_name = config.model_name
-            if "gpt-4o-mini" in config.model_name:
-                tiktoken_model_name = "gpt-4o-mini"
-            elif "gpt-4-turbo" in config.model_name:
-                tiktoken_model_name = "gpt-4-turbo"
-            elif "gpt-4o" == config.model_name:
-                tiktoken_model_name = "gpt-4o"
-            elif "gpt-3.5-turbo" in config.model_name:
-                tiktoken_model_name = "gpt-3.5-turbo"
-
-            # 인코더 가져오기
-            try:
-                enc = tiktoken.encoding_for_model(tiktoken_model_name)
-            except KeyError:
-                logger.warning(
-                    f"Tiktoken encoding for '{tiktoken_model_name}' not found, using 'cl100k_base'."
-                )
-                enc = tiktoken.get_encoding("cl100k_base")
-
-            # 입력 토큰 계산
-            num_input_tokens = 0
-            for msg in messages:
-                content_str = ""
-                if isinstance(msg.get("content"), str):
-                    content_str = msg.get("content", "")
-                elif isinstance(msg.get("content"), list):
-                    for part in msg.get("content", []):  # type: ignore
-                        if part.get("type") == "text":
-                            content_str += part.get("text", "") + "\n"
-                num_input_tokens += (
-                    len(enc.encode(content_str)) + 5
-                )  # 메시지당 오버헤드
-
-            # 출력 토큰 계산
-            num_output_tokens = len(enc.encode(response_text))
+            counter = get_token_counter()
+            num_input_tokens = sum(
+                counter.count_messages(messages, config.provider, config.model_name)
+            )
+            num_output_tokens = counter.count_text(
+                response_text, config.provider, config.model_name
+            )
 
             usage_data = TokenUsage(
                 input_tokens=num_input_tokens,
@@ -258,22 +451,42 @@ class ResponseManager:
             )
             return usage_data
 
-        except ImportError:
-            logger.warning(
-                "tiktoken library not installed. Cannot calculate token usage for OpenAI streaming."
-            )
-            return None
         except Exception as e:
             logger.error(
                 f"Error during manual TokenUsage construction for OpenAI stream: {e}"
             )
             return None
 
+    def start_generation(
+        self,
+        session_id: Optional[str] = None,
+        provider_display_name: Optional[str] = None,
+        model_id_key: Optional[str] = None,
+    ) -> Generation:
+        """스트리밍 전에 생성 등록 (ID를 클라이언트에 먼저 알려줄 때 사용)"""
+        return self.generations.start(session_id, provider_display_name, model_id_key)
+
+    def cancel_generation(self, generation_id: str) -> bool:
+        """특정 생성 중단 (진행 중인 생성이 없으면 False)"""
+        return self.generations.cancel(generation_id)
+
+    def list_generations(self) -> List[Dict[str, Any]]:
+        """진행 중인 생성 목록"""
+        return self.generations.list_active()
+
     def stop_generation(self):
-        """현재 진행 중인 AI 응답 생성을 중단"""
-        logger.info("User requested to stop AI generation")
-        self._should_stop_generation = True
+        """진행 중인 모든 AI 응답 생성을 중단"""
+        logger.info("User requested to stop all AI generations")
+        self.generations.cancel_all()
+
+    def get_response_cache_stats(self) -> Dict[str, Any]:
+        """응답 캐시 적중/미스 집계"""
+        return self.response_cache.stats()
+
+    def get_retry_stats(self) -> Dict[str, Dict[str, float]]:
+        """제공업체별 재시도/속도 제한 대기 집계"""
+        return self.retry_policy.get_stats()
 
     def is_generating(self) -> bool:
-        """현재 AI 응답 생성 중인지 확인"""
-        return self._is_generating
+        """AI 응답 생성이 하나라도 진행 중인지 확인"""
+        return len(self.generations) > 0
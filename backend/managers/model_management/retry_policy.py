@@ -0,0 +1,368 @@
+# ted-os-project/backend/managers/model_management/retry_policy.py
+"""
+Ted OS - 제공업체 호출 재시도와 속도 제한
+
+일시적인 오류(429, 5xx, 연결/타임아웃)는 지터를 섞은 지수 백오프로 다시 시도하고,
+서버가 Retry-After를 보내면 그 시간을 따릅니다.
+스트림은 첫 청크가 나가기 전에 실패한 경우에만 다시 시도합니다 (응답이 중복되지 않도록).
+제공업체별 토큰 버킷으로 요청이 한꺼번에 몰리지 않게 고르게 내보냅니다.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+from ...core.config import (
+    API_RETRY_ATTEMPTS,
+    PROVIDER_REQUESTS_PER_MINUTE,
+    RATE_LIMIT_BURST_RATIO,
+    RETRY_BASE_DELAY_SECONDS,
+    RETRY_MAX_DELAY_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# 다시 시도해도 되는 HTTP 상태 코드 (529: Anthropic 과부하)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 425, 429, 500, 502, 503, 504, 529})
+# SDK/httpx의 연결·타임아웃 예외 (패키지를 import하지 않고 이름으로 판별)
+_TRANSIENT_ERROR_NAMES = frozenset(
+    {
+        "APIConnectionError",
+        "APITimeoutError",
+        "ConnectError",
+        "ConnectTimeout",
+        "ReadError",
+        "ReadTimeout",
+        "RemoteProtocolError",
+        "DeadlineExceeded",
+    }
+)
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    for candidate in (
+        getattr(error, "status_code", None),
+        getattr(getattr(error, "response", None), "status_code", None),
+        getattr(error, "code", None),  # google.api_core 예외
+    ):
+        if isinstance(candidate, int) and 100 <= candidate < 600:
+            return candidate
+    return None
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """응답 헤더의 retry-after-ms / retry-after (초 또는 HTTP 날짜)"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            return max(0.0, float(value) / 1000)
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(error: BaseException) -> Tuple[bool, Optional[float]]:
+    """
+    (재시도 가능 여부, Retry-After 초) 판별
+
+    인터페이스가 SDK 예외를 내장 예외로 바꿔 다시 던지므로 __cause__/__context__를 따라갑니다.
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        status = _status_code(current)
+        if status is not None:
+            return status in RETRYABLE_STATUS_CODES, _retry_after(current)
+        if isinstance(current, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+            return True, None
+        if type(current).__name__ in _TRANSIENT_ERROR_NAMES:
+            return True, None
+        current = current.__cause__ or current.__context__
+    return False, None
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate = rate_per_second
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float):
+        """서버가 Retry-After를 보냈을 때 그동안 새 요청을 보류"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+@dataclass
+class RetryStats:
+    """요청 하나의 재시도 집계"""
+
+    retries: int = 0
+    waited_seconds: float = 0.0
+
+
+class RetryPolicy:
+    """지터 지수 백오프 재시도 + 제공업체별 토큰 버킷"""
+
+    def __init__(
+        self,
+        attempts: int = API_RETRY_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY_SECONDS,
+        max_delay: float = RETRY_MAX_DELAY_SECONDS,
+        requests_per_minute: Optional[Dict[str, float]] = None,
+        burst_ratio: float = RATE_LIMIT_BURST_RATIO,
+    ):
+        self.attempts = max(1, int(attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.burst_ratio = burst_ratio
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._counters: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        limits = (
+            PROVIDER_REQUESTS_PER_MINUTE
+            if requests_per_minute is None
+            else requests_per_minute
+        )
+        for provider, rpm in limits.items():
+            self.set_rate_limit(provider, rpm)
+
+    @classmethod
+    def from_settings(cls, settings) -> "RetryPolicy":
+        """settings의 rate_limits 섹션(분당 요청 수)으로 생성"""
+        limits = dict(PROVIDER_REQUESTS_PER_MINUTE)
+        limits.update(settings.get("rate_limits", {}) or {})
+        return cls(requests_per_minute=limits)
+
+    def set_rate_limit(self, provider: str, requests_per_minute: Optional[float]):
+        """제공업체 분당 요청 한도 설정 (0/None이면 제한 없음)"""
+        with self._lock:
+            if not requests_per_minute:
+                self._buckets.pop(provider, None)
+                return
+            rate = requests_per_minute / 60.0
+            self._buckets[provider] = TokenBucket(
+                rate, requests_per_minute * self.burst_ratio
+            )
+
+    # ---- 집계 ----
+
+    def _count(self, provider: str, key: str, amount: float = 1):
+        with self._lock:
+            counters = self._counters.setdefault(
+                provider,
+                {
+                    "retries": 0,
+                    "retried_requests": 0,
+                    "exhausted": 0,
+                    "throttled": 0,
+                    "throttled_seconds": 0.0,
+                },
+            )
+            counters[key] += amount
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """제공업체별 재시도/대기 누적 집계"""
+        with self._lock:
+            return {
+                provider: {
+                    k: round(v, 3) if isinstance(v, float) else v
+                    for k, v in counters.items()
+                }
+                for provider, counters in self._counters.items()
+            }
+
+    # ---- 판단 ----
+
+    def _throttle_delay(self, provider: str) -> float:
+        with self._lock:
+            bucket = self._buckets.get(provider)
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve()
+        if wait > 0:
+            self._count(provider, "throttled")
+            self._count(provider, "throttled_seconds", wait)
+        return wait
+
+    def _backoff(
+        self, provider: str, error: BaseException, attempt: int, stats: RetryStats
+    ) -> Optional[float]:
+        """다시 시도할 경우 대기 시간, 포기하면 None"""
+        retryable, retry_after = classify_error(error)
+        if not retryable:
+            return None
+        if attempt + 1 >= self.attempts or (
+            retry_after is not None and retry_after > self.max_delay
+        ):
+            self._count(provider, "exhausted")
+            return None
+
+        if retry_after is not None:
+            # 같은 제공업체로 가는 다른 요청도 함께 보류
+            with self._lock:
+                bucket = self._buckets.get(provider)
+            if bucket is not None:
+                bucket.pause(retry_after)
+            delay = retry_after + random.uniform(0, self.base_delay)
+        else:
+            # full jitter: 0 ~ min(max, base * 2^attempt)
+            delay = random.uniform(
+                0, min(self.max_delay, self.base_delay * (2**attempt))
+            )
+
+        if stats.retries == 0:
+            self._count(provider, "retried_requests")
+        stats.retries += 1
+        stats.waited_seconds += delay
+        self._count(provider, "retries")
+        logger.warning(
+            f"{provider} call failed ({type(error).__name__}: {error}), "
+            f"retry {stats.retries}/{self.attempts - 1} in {delay:.2f}s"
+        )
+        return delay
+
+    # ---- 동기 ----
+
+    def call(
+        self,
+        provider: str,
+        func: Callable[[], Any],
+        stats: Optional[RetryStats] = None,
+    ) -> Any:
+        """func를 재시도 정책에 따라 호출"""
+        stats = stats if stats is not None else RetryStats()
+        attempt = 0
+        while True:
+            time.sleep(self._throttle_delay(provider))
+            try:
+                return func()
+            except Exception as e:
+                delay = self._backoff(provider, e, attempt, stats)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def stream(
+        self,
+        provider: str,
+        open_stream: Callable[[], Iterator[Any]],
+        stats: Optional[RetryStats] = None,
+    ) -> Iterator[Any]:
+        """첫 청크 전에 실패한 경우에만 스트림을 다시 여는 제너레이터"""
+        stats = stats if stats is not None else RetryStats()
+        attempt = 0
+        while True:
+            time.sleep(self._throttle_delay(provider))
+            iterator = open_stream()
+            started = False
+            try:
+                for item in iterator:
+                    started = True
+                    yield item
+                return
+            except Exception as e:
+                delay = None if started else self._backoff(provider, e, attempt, stats)
+                if delay is None:
+                    raise
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+            time.sleep(delay)
+            attempt += 1
+
+    # ---- 비동기 ----
+
+    async def acall(
+        self,
+        provider: str,
+        func: Callable[[], Awaitable[Any]],
+        stats: Optional[RetryStats] = None,
+    ) -> Any:
+        """비동기 버전의 call (func는 호출할 때마다 새 코루틴을 반환)"""
+        stats = stats if stats is not None else RetryStats()
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._throttle_delay(provider))
+            try:
+                return await func()
+            except Exception as e:
+                delay = self._backoff(provider, e, attempt, stats)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def astream(
+        self,
+        provider: str,
+        open_stream: Callable[[], AsyncIterator[Any]],
+        stats: Optional[RetryStats] = None,
+    ) -> AsyncIterator[Any]:
+        """비동기 버전의 stream"""
+        stats = stats if stats is not None else RetryStats()
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._throttle_delay(provider))
+            iterator = open_stream()
+            started = False
+            try:
+                async for item in iterator:
+                    started = True
+                    yield item
+                return
+            except Exception as e:
+                delay = None if started else self._backoff(provider, e, attempt, stats)
+                if delay is None:
+                    raise
+            finally:
+                aclose = getattr(iterator, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
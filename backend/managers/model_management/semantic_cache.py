@@ -0,0 +1,315 @@
+# ted-os-project/backend/managers/model_management/semantic_cache.py
+"""
+Ted OS - 비슷한 질문에 저장된 답변을 재사용하는 의미 기반 캐시
+
+마지막 사용자 메시지를 단어/글자 n-gram 해시 벡터로 바꾸므로 네트워크나 임베딩 모델이 필요 없습니다.
+같은 제공업체/모델/시스템 프롬프트/이전 대화 기록 범위 안에서 코사인 유사도가 임계값 이상이면 적중입니다.
+벡터는 NumPy 행렬 하나에 모아 두어 조회가 행렬-벡터 곱 한 번으로 끝납니다.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ...core.config import (
+    SEMANTIC_CACHE_DIMENSIONS,
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_MAX_ENTRIES,
+    SEMANTIC_CACHE_REPLAY_CHUNK_CHARS,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_TTL_SECONDS,
+)
+from ...models.data_models import TokenUsage
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+_REPLAY_PIECE_RE = re.compile(r"\s*\S+\s*|\s+")
+
+
+def _message_text(message: Dict[str, Any]) -> Optional[str]:
+    """메시지의 텍스트 (이미지 등 텍스트가 아닌 내용이 있으면 None)"""
+    content = message.get("content")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for part in content:
+            if not isinstance(part, dict) or part.get("type") != "text":
+                return None
+            parts.append(part.get("text", ""))
+        return "\n".join(parts)
+    return None
+
+
+class HashedNgramEmbedder:
+    """단어 1~2-gram과 글자 n-gram을 부호 있는 해시로 고정 차원에 모은 L2 정규화 벡터"""
+
+    def __init__(self, dimensions: int = SEMANTIC_CACHE_DIMENSIONS, char_ngram: int = 3):
+        self.dimensions = dimensions
+        self.char_ngram = char_ngram
+
+    def features(self, text: str) -> List[str]:
+        normalized = " ".join(text.lower().split())
+        words = _WORD_RE.findall(normalized)
+        features = [f"w:{w}" for w in words]
+        features.extend(f"b:{a} {b}" for a, b in zip(words, words[1:]))
+        padded = f" {normalized} "
+        n = self.char_ngram
+        features.extend(f"c:{padded[i:i + n]}" for i in range(len(padded) - n + 1))
+        return features
+
+    def embed(self, text: str):
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        features = self.features(text)
+        if not features:
+            return vector
+        hashes = np.fromiter(
+            (zlib.crc32(f.encode("utf-8")) for f in features),
+            dtype=np.uint32,
+            count=len(features),
+        )
+        signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+        np.add.at(vector, (hashes % self.dimensions).astype(np.intp), signs)
+        norm = float(np.linalg.norm(vector))
+        if norm > 0:
+            vector /= norm
+        return vector
+
+
+class SemanticEntry:
+    """저장된 답변 하나"""
+
+    __slots__ = ("scope", "prompt", "text", "usage", "created_at", "hits")
+
+    def __init__(self, scope: str, prompt: str, text: str, usage: Optional[TokenUsage]):
+        self.scope = scope
+        self.prompt = prompt
+        self.text = text
+        self.usage = usage
+        self.created_at = time.time()
+        self.hits = 0
+
+
+class SemanticCache:
+    """해시 n-gram 벡터 + 코사인 유사도 캐시 (메모리, 스레드 안전)"""
+
+    def __init__(
+        self,
+        enabled: bool = SEMANTIC_CACHE_ENABLED,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = SEMANTIC_CACHE_TTL_SECONDS,
+        dimensions: int = SEMANTIC_CACHE_DIMENSIONS,
+        replay_chunk_chars: int = SEMANTIC_CACHE_REPLAY_CHUNK_CHARS,
+    ):
+        self.enabled = bool(enabled) and max_entries > 0
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.replay_chunk_chars = replay_chunk_chars
+        self.embedder = HashedNgramEmbedder(dimensions)
+        self._lock = threading.Lock()
+        self._entries: List[Optional[SemanticEntry]] = [None] * max_entries
+        if max_entries > 0:
+            # 슬롯별 벡터/범위/마지막 사용 시각 (빈 슬롯은 active=False)
+            self._vectors = np.zeros((max_entries, dimensions), dtype=np.float32)
+            self._scopes = np.zeros(max_entries, dtype=np.int64)
+            self._created = np.zeros(max_entries, dtype=np.float64)
+            self._last_used = np.zeros(max_entries, dtype=np.float64)
+            self._active = np.zeros(max_entries, dtype=bool)
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "tokens_saved": 0,
+            "cost_saved_usd": 0.0,
+        }
+
+    @classmethod
+    def from_settings(cls, settings) -> "SemanticCache":
+        """settings의 semantic_cache 섹션으로 생성"""
+        section = settings.get("semantic_cache", {}) or {}
+        return cls(
+            enabled=section.get("enabled", SEMANTIC_CACHE_ENABLED),
+            threshold=section.get("threshold", SEMANTIC_CACHE_THRESHOLD),
+            max_entries=section.get("max_entries", SEMANTIC_CACHE_MAX_ENTRIES),
+            ttl_seconds=section.get("ttl_seconds", SEMANTIC_CACHE_TTL_SECONDS),
+        )
+
+    # ---- 키 ----
+
+    @staticmethod
+    def prepare(
+        provider: str, model: str, messages: List[Dict[str, Any]]
+    ) -> Optional[Tuple[str, str]]:
+        """
+        (범위, 임베딩할 프롬프트) - 마지막 메시지가 텍스트 사용자 메시지가 아니면 None
+
+        임베딩은 마지막 사용자 메시지만 쓰고 이전 기록은 다이제스트로 범위에 넣습니다.
+        긴 대화에서는 기록 전체가 매 턴 거의 같으므로, 기록을 임베딩하면 새 질문이 직전 답변에 적중합니다.
+        n-gram 벡터로는 숫자만 다른 질문("1번"과 "10번")이 거의 같게 나오므로
+        질문의 숫자도 범위에 넣어 정확히 일치해야 적중하게 합니다.
+        """
+        turns = [(message.get("role"), _message_text(message)) for message in messages]
+        if not turns or turns[-1][0] != "user" or any(text is None for _, text in turns):
+            return None
+        system = " ".join("\n".join(text for role, text in turns if role == "system").split())
+        history = "\x1e".join(f"{role}: {text}" for role, text in turns[:-1] if role != "system")
+        prompt = turns[-1][1]
+        scope = "\x1f".join(
+            [
+                provider.lower(),
+                model,
+                system,
+                hashlib.blake2b(history.encode("utf-8"), digest_size=16).hexdigest(),
+                ",".join(_NUMBER_RE.findall(prompt)),
+            ]
+        )
+        return scope, prompt
+
+    @staticmethod
+    def _scope_id(scope: str) -> int:
+        digest = hashlib.blake2b(scope.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little", signed=True)
+
+    # ---- 조회/저장 ----
+
+    def lookup(
+        self, provider: str, model: str, messages: List[Dict[str, Any]]
+    ) -> Optional[SemanticEntry]:
+        """같은 범위에서 가장 비슷한 저장 답변 (임계값 미만이면 None)"""
+        if not self.enabled:
+            return None
+        prepared = self.prepare(provider, model, messages)
+        if prepared is None:
+            return None
+        scope, prompt = prepared
+        query = self.embedder.embed(prompt)
+        now = time.time()
+
+        with self._lock:
+            self._expire(now)
+            candidates = self._active & (self._scopes == self._scope_id(scope))
+            if not candidates.any():
+                self._counters["misses"] += 1
+                return None
+            scores = np.where(candidates, self._vectors @ query, -1.0)
+            slot = int(np.argmax(scores))
+            entry = self._entries[slot]
+            if scores[slot] < self.threshold or entry is None or entry.scope != scope:
+                self._counters["misses"] += 1
+                return None
+
+            self._last_used[slot] = now
+            entry.hits += 1
+            self._counters["hits"] += 1
+            if entry.usage:
+                self._counters["tokens_saved"] += entry.usage.total_tokens
+                self._counters["cost_saved_usd"] = round(
+                    self._counters["cost_saved_usd"] + entry.usage.cost_usd, 6
+                )
+            logger.info(f"Semantic cache hit (similarity {float(scores[slot]):.3f})")
+            return entry
+
+    def store(
+        self,
+        provider: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        text: str,
+        usage: Optional[TokenUsage] = None,
+    ):
+        """답변 저장 (거의 같은 프롬프트가 이미 있으면 교체)"""
+        if not self.enabled or not text:
+            return
+        prepared = self.prepare(provider, model, messages)
+        if prepared is None:
+            return
+        scope, prompt = prepared
+        vector = self.embedder.embed(prompt)
+        now = time.time()
+        scope_id = self._scope_id(scope)
+
+        with self._lock:
+            self._expire(now)
+            same_scope = self._active & (self._scopes == scope_id)
+            slot = None
+            if same_scope.any():
+                scores = np.where(same_scope, self._vectors @ vector, -1.0)
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    slot = best
+            if slot is None:
+                free = np.flatnonzero(~self._active)
+                if free.size:
+                    slot = int(free[0])
+                else:
+                    # 가장 오래 쓰이지 않은 항목 제거
+                    slot = int(np.argmin(self._last_used))
+                    self._counters["evictions"] += 1
+
+            self._entries[slot] = SemanticEntry(scope, prompt, text, usage)
+            self._vectors[slot] = vector
+            self._scopes[slot] = scope_id
+            self._created[slot] = now
+            self._last_used[slot] = now
+            self._active[slot] = True
+            self._counters["stores"] += 1
+
+    def _expire(self, now: float):
+        """TTL이 지난 항목 제거 (잠금을 잡은 상태에서 호출)"""
+        if self.ttl_seconds <= 0:
+            return
+        expired = np.flatnonzero(self._active & (self._created < now - self.ttl_seconds))
+        for slot in expired:
+            self._remove(int(slot))
+            self._counters["evictions"] += 1
+
+    def _remove(self, slot: int):
+        self._entries[slot] = None
+        self._active[slot] = False
+        self._last_used[slot] = 0.0
+
+    def clear(self):
+        """저장된 답변 모두 삭제"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            for slot in range(self.max_entries):
+                self._remove(slot)
+
+    def replay(self, text: str) -> Iterator[str]:
+        """저장된 답변을 스트림 청크로 나누기 (단어 경계 유지)"""
+        chunk = ""
+        for piece in _REPLAY_PIECE_RE.findall(text):
+            chunk += piece
+            if len(chunk) >= self.replay_chunk_chars:
+                yield chunk
+                chunk = ""
+        if chunk:
+            yield chunk
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 횟수와 절약한 토큰/비용"""
+        with self._lock:
+            counters = dict(self._counters)
+            size = int(self._active.sum()) if self.enabled else 0
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "enabled": self.enabled,
+            "threshold": self.threshold,
+            "size": size,
+            "max_entries": self.max_entries,
+            "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+            **counters,
+        }
+
@@ -3,13 +3,21 @@
 Ted OS - 모델 관리자 (리팩토링됨)
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Tuple, Generator
+from typing import Dict, List, Optional, Any, Tuple, Generator, AsyncGenerator
 
 from ..models.data_models import TokenUsage
 from ..managers.settings import SettingsManager
 from ..managers.usage_tracker import UsageTracker
-from .model_management import InterfaceManager, ResponseManager, ConfigManager
+from .model_management import (
+    InterfaceManager,
+    ResponseManager,
+    ConfigManager,
+    Generation,
+    SemanticCache,
+)
+from .model_management.semantic_cache import SemanticEntry
 
 logger = logging.getLogger(__name__)
 
@@ -32,37 +40,233 @@ class EnhancedModelManager(ModelManager):
         self.response_manager = ResponseManager(
             self, settings_manager, usage_tracker, self.config_manager.get_active_config
         )
+        # 비슷한 질문에 저장된 답변을 재사용하는 의미 캐시 (세션별로 끌 수 있음)
+        self.semantic_cache = SemanticCache.from_settings(settings_manager)
 
     def generate(
         self,
         messages: List[Dict[str, Any]],
         provider_display_name: Optional[str] = None,
         model_id_key: Optional[str] = None,
+        semantic_cache: bool = True,
         **kwargs: Any,
     ) -> Tuple[str, Optional[TokenUsage]]:
-        """AI 응답 생성 - ResponseManager에 위임"""
-        return self.response_manager.generate(
+        """AI 응답 생성 - 의미 캐시를 먼저 확인하고 ResponseManager에 위임"""
+        target = self._semantic_target(provider_display_name, model_id_key, semantic_cache)
+        if target:
+            context, entry = self._semantic_lookup(
+                target, messages, provider_display_name, model_id_key, kwargs
+            )
+            if entry is not None:
+                return entry.text, None  # 캐시 적중은 새 사용량이 없음
+
+        response_text, usage = self.response_manager.generate(
             messages, provider_display_name, model_id_key, **kwargs
         )
+        if target:
+            self.semantic_cache.store(*target, context, response_text, usage)
+        return response_text, usage
 
     def stream_generate(
         self,
         messages: List[Dict[str, Any]],
         provider_display_name: Optional[str] = None,
         model_id_key: Optional[str] = None,
+        generation: Optional[Generation] = None,
+        semantic_cache: bool = True,
         **kwargs: Any,
     ) -> Generator[Tuple[str, Optional[TokenUsage]], None, None]:
-        """AI 스트리밍 응답 생성 - ResponseManager에 위임"""
+        """AI 스트리밍 응답 생성 - 의미 캐시 적중 시 저장된 답변을 스트림으로 재생"""
+        target = self._semantic_target(provider_display_name, model_id_key, semantic_cache)
+        if target:
+            context, entry = self._semantic_lookup(
+                target, messages, provider_display_name, model_id_key, kwargs
+            )
+            if entry is not None:
+                try:
+                    for chunk in self.semantic_cache.replay(entry.text):
+                        if generation is not None:
+                            if generation.cancelled:
+                                return
+                            generation.record_chunk(chunk)
+                        yield chunk, None
+                    if generation is not None:
+                        generation.final_text = entry.text
+                finally:
+                    if generation is not None:
+                        self.finish_generation(generation.id)
+                return
+            if generation is None:
+                # 최종 응답(generation.final_text)을 저장하려면 생성 객체가 필요
+                generation = self.start_generation(
+                    provider_display_name=provider_display_name, model_id_key=model_id_key
+                )
+
         yield from self.response_manager.stream_generate(
+            messages, provider_display_name, model_id_key, generation=generation, **kwargs
+        )
+
+        if target and not generation.cancelled and generation.final_text:
+            self.semantic_cache.store(
+                *target, context, generation.final_text, generation.usage
+            )
+
+    async def agenerate(
+        self,
+        messages: List[Dict[str, Any]],
+        provider_display_name: Optional[str] = None,
+        model_id_key: Optional[str] = None,
+        semantic_cache: bool = True,
+        **kwargs: Any,
+    ) -> Tuple[str, Optional[TokenUsage]]:
+        """AI 응답 생성 (비동기식) - 의미 캐시를 먼저 확인하고 ResponseManager에 위임"""
+        target = self._semantic_target(provider_display_name, model_id_key, semantic_cache)
+        if target:
+            # 기록 정리와 임베딩은 CPU 작업이라 스레드에서 실행
+            context, entry = await asyncio.to_thread(
+                self._semantic_lookup,
+                target,
+                messages,
+                provider_display_name,
+                model_id_key,
+                kwargs,
+            )
+            if entry is not None:
+                return entry.text, None
+
+        response_text, usage = await self.response_manager.agenerate(
+            messages, provider_display_name, model_id_key, **kwargs
+        )
+        if target:
+            await asyncio.to_thread(
+                self.semantic_cache.store, *target, context, response_text, usage
+            )
+        return response_text, usage
+
+    async def astream_generate(
+        self,
+        messages: List[Dict[str, Any]],
+        provider_display_name: Optional[str] = None,
+        model_id_key: Optional[str] = None,
+        generation: Optional[Generation] = None,
+        semantic_cache: bool = True,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Tuple[str, Optional[TokenUsage]], None]:
+        """AI 스트리밍 응답 생성 (비동기식) - 의미 캐시 적중 시 저장된 답변을 스트림으로 재생"""
+        target = self._semantic_target(provider_display_name, model_id_key, semantic_cache)
+        if target:
+            context, entry = await asyncio.to_thread(
+                self._semantic_lookup,
+                target,
+                messages,
+                provider_display_name,
+                model_id_key,
+                kwargs,
+            )
+            if entry is not None:
+                try:
+                    for chunk in self.semantic_cache.replay(entry.text):
+                        if generation is not None:
+                            if generation.cancelled:
+                                return
+                            generation.record_chunk(chunk)
+                        yield chunk, None
+                        await asyncio.sleep(0)  # 긴 답변 재생 중에도 다른 요청 처리
+                    if generation is not None:
+                        generation.final_text = entry.text
+                finally:
+                    if generation is not None:
+                        self.finish_generation(generation.id)
+                return
+            if generation is None:
+                generation = self.start_generation(
+                    provider_display_name=provider_display_name, model_id_key=model_id_key
+                )
+
+        async for item in self.response_manager.astream_generate(
+            messages, provider_display_name, model_id_key, generation=generation, **kwargs
+        ):
+            yield item
+
+        if target and not generation.cancelled and generation.final_text:
+            await asyncio.to_thread(
+                self.semantic_cache.store,
+                *target,
+                context,
+                generation.final_text,
+                generation.usage,
+            )
+
+    def _semantic_target(
+        self,
+        provider_display_name: Optional[str],
+        model_id_key: Optional[str],
+        enabled: bool,
+    ) -> Optional[Tuple[str, str]]:
+        """의미 캐시 범위로 쓸 (제공업체, 모델) - 캐시를 쓰지 않으면 None"""
+        if not enabled or not self.semantic_cache.enabled:
+            return None
+        provider = provider_display_name or self.settings.get("ui.selected_provider")
+        model = model_id_key or self.settings.get_default_model_for_provider(provider)
+        if not provider or not model:
+            return None
+        return provider, model
+
+    def _semantic_lookup(
+        self,
+        target: Tuple[str, str],
+        messages: List[Dict[str, Any]],
+        provider_display_name: Optional[str],
+        model_id_key: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[List[Dict[str, Any]], Optional[SemanticEntry]]:
+        """(캐시 키용 메시지, 적중 항목) - 키는 실제로 보낼 예산 적용 후 기록으로 만듦"""
+        context = self.response_manager.fit_messages(
             messages, provider_display_name, model_id_key, **kwargs
         )
+        return context, self.semantic_cache.lookup(*target, context)
+
+    def get_semantic_cache_stats(self) -> Dict[str, Any]:
+        """의미 캐시 적중/미스, 절약한 토큰/비용"""
+        return self.semantic_cache.stats()
+
+    def start_generation(
+        self,
+        session_id: Optional[str] = None,
+        provider_display_name: Optional[str] = None,
+        model_id_key: Optional[str] = None,
+    ) -> Generation:
+        """스트리밍 전에 생성 등록 - ResponseManager에 위임"""
+        return self.response_manager.start_generation(
+            session_id, provider_display_name, model_id_key
+        )
+
+    def cancel_generation(self, generation_id: str) -> bool:
+        """특정 생성 중단 - ResponseManager에 위임"""
+        return self.response_manager.cancel_generation(generation_id)
+
+    def list_generations(self) -> List[Dict[str, Any]]:
+        """진행 중인 생성 목록 - ResponseManager에 위임"""
+        return self.response_manager.list_generations()
+
+    def get_response_cache_stats(self) -> Dict[str, Any]:
+        """응답 캐시 집계 - ResponseManager에 위임"""
+        return self.response_manager.get_response_cache_stats()
+
+    def get_retry_stats(self) -> Dict[str, Dict[str, float]]:
+        """제공업체별 재시도 집계 - ResponseManager에 위임"""
+        return self.response_manager.get_retry_stats()
+
+    def finish_generation(self, generation_id: str):
+        """생성 종료 처리 - ResponseManager에 위임"""
+        self.response_manager.generations.finish(generation_id)
 
     def stop_generation(self):
-        """현재 진행 중인 AI 응답 생성을 중단 - ResponseManager에 위임"""
+        """진행 중인 모든 AI 응답 생성을 중단 - ResponseManager에 위임"""
         self.response_manager.stop_generation()
 
     def is_generating(self) -> bool:
-        """현재 AI 응답 생성 중인지 확인 - ResponseManager에 위임"""
+        """AI 응답 생성이 하나라도 진행 중인지 확인 - ResponseManager에 위임"""
         return self.response_manager.is_generating()
 
     def get_model_info(
@@ -0,0 +1,307 @@
+# ted-os-project/backend/managers/session_search.py
+"""
+Ted OS - 채팅 메시지 전문 검색 인덱스
+
+메시지(와 세션 제목)를 문서로 보는 메모리 역색인입니다.
+- 한글/한자/가나는 글자 2-gram, 그 외 문자는 단어 단위로 토큰화
+- 세션 저장/삭제 시 바뀐 메시지만 다시 색인
+- 다른 워커가 바꾼 세션은 저장 버전(version_token)이 달라진 것만 다시 읽음
+- BM25로 점수를 매기고, 본문은 결과 표시할 때만 읽어 snippet 생성
+"""
+
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from ..core.config import SEARCH_MAX_MATCHES_PER_SESSION, SEARCH_SNIPPET_RADIUS
+from ..models.data_models import ChatSession, SearchMatch
+from .storage import message_text
+
+# 한글 음절/자모, 가나, CJK 한자
+_CJK_CHARS = (
+    "\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf"
+    "\u4e00-\u9fff\uac00-\ud7a3\uf900-\ufaff"
+)
+_TOKEN_RE = re.compile(f"[{_CJK_CHARS}]+|[^\\W{_CJK_CHARS}]+")
+_CJK_RE = re.compile(f"[{_CJK_CHARS}]")
+
+TITLE_POSITION = -1  # 제목 문서의 메시지 위치
+TITLE_BOOST = 1.5
+
+# BM25 파라미터
+_K1 = 1.2
+_B = 0.75
+
+DocKey = Tuple[str, int]  # (세션 ID, 메시지 위치)
+
+
+def tokenize(text: str) -> List[str]:
+    """검색용 토큰 목록 (NFKC 정규화 + 소문자)"""
+    tokens = []
+    for run in _TOKEN_RE.findall(unicodedata.normalize("NFKC", text).lower()):
+        if _CJK_RE.match(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+class SessionSearchIndex:
+    """세션 메시지 역색인 (처음 검색할 때 구축, 이후 증분 갱신)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[DocKey, int]] = {}
+        self._doc_terms: Dict[DocKey, Tuple[str, ...]] = {}
+        self._doc_len: Dict[DocKey, int] = {}
+        self._total_len = 0
+        # 세션별 색인된 문서의 텍스트 해시 (변경 감지용, 0번이 제목)
+        self._session_hashes: Dict[str, List[int]] = {}
+        # 세션별 색인 당시 저장 버전 (다른 워커의 변경 감지용)
+        self._versions: Dict[str, Optional[Hashable]] = {}
+        self.built = False
+        self.stale = False
+
+    # ===== 색인 =====
+
+    def build(
+        self,
+        versions: Dict[str, Optional[Hashable]],
+        loader: Callable[[str], Optional[ChatSession]],
+    ):
+        """전체 세션으로 색인 구축 (versions: 세션 ID -> 저장 버전)"""
+        with self._lock:
+            self.clear()
+            for session_id, version in versions.items():
+                session = loader(session_id)
+                if session is not None:
+                    self._index_session(session)
+                    self._versions[session_id] = version
+            self.built = True
+
+    def sync(
+        self,
+        versions: Dict[str, Optional[Hashable]],
+        loader: Callable[[str], Optional[ChatSession]],
+    ):
+        """저장 버전이 달라진 세션만 다시 읽어 반영하고 사라진 세션은 제거"""
+        with self._lock:
+            self.stale = False
+            for session_id in [s_id for s_id in self._versions if s_id not in versions]:
+                self.remove(session_id)
+            for session_id, version in versions.items():
+                if session_id in self._versions and self._versions[session_id] == version:
+                    continue
+                session = loader(session_id)
+                if session is None:
+                    self.remove(session_id)
+                    continue
+                self._index_session(session)
+                self._versions[session_id] = version
+
+    def mark_stale(self):
+        """다른 워커가 저장소를 바꿨음을 표시 (다음 검색 때 sync)"""
+        with self._lock:
+            if self.built:
+                self.stale = True
+
+    def clear(self):
+        """색인 비우기 (다음 검색 때 다시 구축)"""
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_len.clear()
+            self._total_len = 0
+            self._session_hashes.clear()
+            self._versions.clear()
+            self.built = False
+            self.stale = False
+
+    def update(self, session: ChatSession, version: Optional[Hashable] = None):
+        """저장된 세션 반영 (구축 전이면 무시)"""
+        with self._lock:
+            if self.built:
+                self._index_session(session)
+                self._versions[session.id] = version
+
+    def remove(self, session_id: str):
+        """삭제된 세션 제거"""
+        with self._lock:
+            self._versions.pop(session_id, None)
+            hashes = self._session_hashes.pop(session_id, None)
+            if hashes is None:
+                return
+            for position in range(TITLE_POSITION, len(hashes) - 1):
+                self._remove_doc((session_id, position))
+
+    def _index_session(self, session: ChatSession):
+        texts = [session.title] + [message_text(m) for m in session.messages]
+        new_hashes = [hash(text) for text in texts]
+        old_hashes = self._session_hashes.get(session.id, [])
+
+        for i, text in enumerate(texts):
+            if i < len(old_hashes) and old_hashes[i] == new_hashes[i]:
+                continue
+            key = (session.id, i - 1)
+            self._remove_doc(key)
+            self._add_doc(key, text)
+
+        for i in range(len(texts), len(old_hashes)):
+            self._remove_doc((session.id, i - 1))
+
+        self._session_hashes[session.id] = new_hashes
+
+    def _add_doc(self, key: DocKey, text: str):
+        counts = Counter(tokenize(text))
+        if not counts:
+            return
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[key] = tf
+        self._doc_terms[key] = tuple(counts)
+        length = sum(counts.values())
+        self._doc_len[key] = length
+        self._total_len += length
+
+    def _remove_doc(self, key: DocKey):
+        terms = self._doc_terms.pop(key, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_len -= self._doc_len.pop(key, 0)
+
+    # ===== 검색 =====
+
+    def search(self, query: str) -> Dict[str, List[Tuple[int, float]]]:
+        """
+        검색어가 포함된 문서를 세션별로 묶어 반환
+
+        모든 검색어 토큰을 포함한 문서를 우선 찾고, 없으면 일부만 포함한 문서를 찾습니다.
+
+        Returns:
+            {세션 ID: [(메시지 위치, 점수), ...]} (점수 내림차순)
+        """
+        with self._lock:
+            term_groups = self._query_terms(query)
+            if not term_groups:
+                return {}
+
+            group_postings = [self._merge_postings(group) for group in term_groups]
+            ordered = sorted(group_postings, key=len)
+            candidates: Set[DocKey] = set(ordered[0])
+            for postings in ordered[1:]:
+                candidates.intersection_update(postings)
+                if not candidates:
+                    break
+            if not candidates:
+                candidates = set().union(*group_postings)
+
+            n_docs = max(len(self._doc_len), 1)
+            avg_len = self._total_len / n_docs if self._total_len else 1.0
+            idf = [
+                math.log(1 + (n_docs - len(p) + 0.5) / (len(p) + 0.5))
+                for p in group_postings
+            ]
+
+            results: Dict[str, List[Tuple[int, float]]] = {}
+            for key in candidates:
+                norm = _K1 * (1 - _B + _B * self._doc_len[key] / avg_len)
+                score = 0.0
+                for weight, postings in zip(idf, group_postings):
+                    tf = postings.get(key)
+                    if tf:
+                        score += weight * tf * (_K1 + 1) / (tf + norm)
+                if key[1] == TITLE_POSITION:
+                    score *= TITLE_BOOST
+                results.setdefault(key[0], []).append((key[1], score))
+
+        for hits in results.values():
+            hits.sort(key=lambda hit: hit[1], reverse=True)
+        return results
+
+    def _query_terms(self, query: str) -> List[List[str]]:
+        """검색어 토큰별 색인 용어 목록 (한 글자 한글은 그 글자를 포함한 2-gram으로 확장)"""
+        groups = []
+        for token in dict.fromkeys(tokenize(query)):
+            if len(token) == 1 and _CJK_RE.match(token):
+                expanded = [term for term in self._postings if token in term]
+                groups.append(expanded or [token])
+            else:
+                groups.append([token])
+        return groups
+
+    def _merge_postings(self, terms: List[str]) -> Dict[DocKey, int]:
+        if len(terms) == 1:
+            return self._postings.get(terms[0], {})
+        merged: Dict[DocKey, int] = {}
+        for term in terms:
+            for key, tf in self._postings.get(term, {}).items():
+                merged[key] = merged.get(key, 0) + tf
+        return merged
+
+
+def build_matches(
+    session: ChatSession,
+    hits: List[Tuple[int, float]],
+    query: str,
+    max_matches: int = SEARCH_MAX_MATCHES_PER_SESSION,
+    radius: int = SEARCH_SNIPPET_RADIUS,
+) -> List[SearchMatch]:
+    """검색 결과 메시지의 snippet과 강조 위치 생성"""
+    matches = []
+    for position, score in hits:
+        if position == TITLE_POSITION:
+            text, role = session.title, "title"
+        elif position < len(session.messages):
+            message = session.messages[position]
+            text, role = message_text(message), message.get("role", "")
+        else:
+            continue  # 색인 이후 세션이 바뀐 경우
+
+        spans = _find_spans(text, query)
+        if spans:
+            start = max(spans[0][0] - radius, 0)
+            end = min(spans[0][1] + radius, len(text))
+        else:
+            start, end = 0, min(len(text), radius * 2)
+
+        matches.append(
+            SearchMatch(
+                message_index=position,
+                role=role,
+                snippet=text[start:end],
+                offset=start,
+                highlights=[(s - start, e - start) for s, e in spans if s >= start and e <= end],
+                score=round(score, 4),
+            )
+        )
+        if len(matches) >= max_matches:
+            break
+    return matches
+
+
+def _find_spans(text: str, query: str) -> List[Tuple[int, int]]:
+    """본문에서 검색어(전체, 없으면 단어별)가 나타나는 위치"""
+    lowered = text.lower()
+    needles = [query.strip().lower()]
+    if needles[0] not in lowered:
+        needles = [word for word in needles[0].split() if word]
+
+    spans = []
+    for needle in needles:
+        start = lowered.find(needle)
+        while start != -1:
+            spans.append((start, start + len(needle)))
+            start = lowered.find(needle, start + len(needle))
+    spans.sort()
+    return spans
@@ -0,0 +1,107 @@
+# ted-os-project/backend/managers/session_usage.py
+"""
+Ted OS - 세션별(채팅 세션/API 클라이언트) 사용량 저장소
+
+UsageTracker는 세션 사용량을 이 인터페이스로만 다루므로 백엔드 프로세스는 UI 프레임워크를 import하지 않습니다.
+기본 구현은 프로세스 메모리의 딕셔너리이고, Streamlit UI는 session_state 어댑터를 끼워 씁니다.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..core.config import SESSION_USAGE_MAX_SESSIONS
+from ..models.data_models import TokenUsage
+
+DEFAULT_SESSION_KEY = "default"  # 세션을 지정하지 않은 호출
+
+
+def empty_session_usage() -> Dict[str, Any]:
+    """새 세션의 사용량 집계"""
+    return {"total_tokens": 0, "total_cost": 0.0, "requests": 0, "by_model": {}}
+
+
+def apply_usage(data: Dict[str, Any], usage: TokenUsage):
+    """세션 집계에 사용량 하나 반영"""
+    data["total_tokens"] += usage.total_tokens
+    data["total_cost"] = round(data["total_cost"] + usage.cost_usd, 6)
+    data["requests"] += 1
+
+    model_key = f"{usage.provider}_{usage.model_name}"
+    model_stats = data["by_model"].setdefault(
+        model_key, {"tokens": 0, "cost": 0.0, "requests": 0}
+    )
+    model_stats["tokens"] += usage.total_tokens
+    model_stats["cost"] = round(model_stats["cost"] + usage.cost_usd, 6)
+    model_stats["requests"] += 1
+
+
+def session_usage_report(start_time: datetime, data: Dict[str, Any]) -> Dict[str, Any]:
+    """get_session_usage 응답 형식"""
+    duration = datetime.now() - start_time
+    return {
+        "session_start": start_time.isoformat(),
+        "session_duration_minutes": round(duration.total_seconds() / 60, 2),
+        "total_tokens": data["total_tokens"],
+        "total_cost": round(data["total_cost"], 6),
+        "total_requests": data["requests"],
+        "by_model": {key: dict(stats) for key, stats in data["by_model"].items()},
+    }
+
+
+class SessionUsageStore(ABC):
+    """세션 사용량 저장소 인터페이스"""
+
+    @abstractmethod
+    def record(self, usage: TokenUsage, session_key: Optional[str] = None):
+        """세션 집계에 사용량 기록"""
+        pass
+
+    @abstractmethod
+    def get(self, session_key: Optional[str] = None) -> Dict[str, Any]:
+        """세션 사용량 보고서 반환"""
+        pass
+
+    @abstractmethod
+    def reset(self, session_key: Optional[str] = None):
+        """세션 집계 초기화"""
+        pass
+
+
+class InMemorySessionUsageStore(SessionUsageStore):
+    """세션 키별 집계를 담는 딕셔너리 (스레드 안전, 오래 쓰지 않은 세션부터 제거)"""
+
+    def __init__(self, max_sessions: int = SESSION_USAGE_MAX_SESSIONS):
+        self.max_sessions = max(1, max_sessions)
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _session(self, session_key: Optional[str]) -> Dict[str, Any]:
+        """세션 항목 (없으면 생성, 잠금을 잡은 상태에서 호출)"""
+        key = session_key or DEFAULT_SESSION_KEY
+        entry = self._sessions.get(key)
+        if entry is None:
+            entry = {"start_time": datetime.now(), "data": empty_session_usage()}
+            self._sessions[key] = entry
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(key)
+        return entry
+
+    def record(self, usage: TokenUsage, session_key: Optional[str] = None):
+        with self._lock:
+            apply_usage(self._session(session_key)["data"], usage)
+
+    def get(self, session_key: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            entry = self._sessions.get(session_key or DEFAULT_SESSION_KEY)
+            if entry is None:
+                return session_usage_report(datetime.now(), empty_session_usage())
+            return session_usage_report(entry["start_time"], entry["data"])
+
+    def reset(self, session_key: Optional[str] = None):
+        with self._lock:
+            self._sessions.pop(session_key or DEFAULT_SESSION_KEY, None)
@@ -20,6 +20,31 @@ from ..core.config import (
     FAVORITES_DIR,
     DEFAULT_MODELS,
     DEFAULT_PROVIDER,
+    DEFAULT_SESSION_STORAGE_ENGINE,
+    DEFAULT_STORAGE_BACKEND,
+    SQLITE_DB_FILENAME,
+    API_TIMEOUT_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_ENABLE_HTTP2,
+    PROVIDER_REQUESTS_PER_MINUTE,
+    RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_TTL_SECONDS,
+    RESPONSE_CACHE_MEMORY_ENTRIES,
+    RESPONSE_CACHE_DISK_ENTRIES,
+    USAGE_FLUSH_BATCH_SIZE,
+    USAGE_FLUSH_INTERVAL_SECONDS,
+    USAGE_FSYNC_POLICY,
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_MAX_ENTRIES,
+    SEMANTIC_CACHE_TTL_SECONDS,
+    MAX_HISTORY_LENGTH,
+    MAX_CONTEXT_TOKENS,
+    CONTEXT_TRIM_POLICY,
 )
 
 logger = logging.getLogger(__name__)
@@ -88,6 +113,46 @@ class SettingsManager:
                 "temperature": 0.7,
                 "max_tokens": 4000,
             },
+            # 제공업체로 보낼 대화 기록 예산 (모델 한도와 이 값 중 작은 쪽 적용)
+            "context": {
+                "policy": CONTEXT_TRIM_POLICY,
+                "max_history_turns": MAX_HISTORY_LENGTH,
+                "max_input_tokens": MAX_CONTEXT_TOKENS,
+            },
+            "storage": {
+                "backend": DEFAULT_STORAGE_BACKEND,
+                "session_engine": DEFAULT_SESSION_STORAGE_ENGINE,
+                "sqlite_path": str(self.config_path / SQLITE_DB_FILENAME),
+            },
+            "network": {
+                "max_connections": HTTP_MAX_CONNECTIONS,
+                "max_keepalive_connections": HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                "keepalive_expiry": HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                "connect_timeout": HTTP_CONNECT_TIMEOUT_SECONDS,
+                "read_timeout": API_TIMEOUT_SECONDS,
+                "http2": HTTP_ENABLE_HTTP2,
+            },
+            # 제공업체별 분당 요청 한도 (0이면 제한 없음)
+            "rate_limits": dict(PROVIDER_REQUESTS_PER_MINUTE),
+            "response_cache": {
+                "enabled": RESPONSE_CACHE_ENABLED,
+                "ttl_seconds": RESPONSE_CACHE_TTL_SECONDS,
+                "memory_entries": RESPONSE_CACHE_MEMORY_ENTRIES,
+                "disk_entries": RESPONSE_CACHE_DISK_ENTRIES,
+                "path": str(self.config_path / RESPONSE_CACHE_DIR),
+            },
+            "semantic_cache": {
+                "enabled": SEMANTIC_CACHE_ENABLED,
+                "threshold": SEMANTIC_CACHE_THRESHOLD,
+                "max_entries": SEMANTIC_CACHE_MAX_ENTRIES,
+                "ttl_seconds": SEMANTIC_CACHE_TTL_SECONDS,
+            },
+            # 사용량 기록은 모아서 백그라운드에서 저장
+            "usage_writes": {
+                "flush_interval_seconds": USAGE_FLUSH_INTERVAL_SECONDS,
+                "batch_size": USAGE_FLUSH_BATCH_SIZE,
+                "fsync": USAGE_FSYNC_POLICY,
+            },
             "ui": {
                 "selected_provider": DEFAULT_PROVIDER,  # ← 기본 제공업체 설정
                 "theme": "auto",
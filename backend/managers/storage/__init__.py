@@ -0,0 +1,54 @@
+# ted-os-project/backend/managers/storage/__init__.py
+"""
+Ted OS - 채팅 세션 저장 엔진
+"""
+
+from typing import Optional
+
+from .base import SessionStorage, build_index_entry, message_text
+from .json_storage import JsonSessionStorage
+from .log_storage import LogSessionStorage
+from .sqlite_store import (
+    SQLiteDatabase,
+    SQLiteFavoriteStore,
+    SQLiteSessionStorage,
+    SQLiteUsageStore,
+)
+
+SESSION_STORAGE_ENGINES = {
+    "json": JsonSessionStorage,
+    "log": LogSessionStorage,
+    "sqlite": SQLiteSessionStorage,
+}
+
+
+def create_session_storage(
+    engine: str, storage_path: str, database: Optional[SQLiteDatabase] = None
+) -> SessionStorage:
+    """설정값(엔진 이름)에 맞는 세션 저장 엔진 생성"""
+    engine_cls = SESSION_STORAGE_ENGINES.get(engine)
+    if engine_cls is None:
+        raise ValueError(
+            f"Unknown session storage engine: {engine} "
+            f"(available: {', '.join(SESSION_STORAGE_ENGINES)})"
+        )
+    if engine_cls is SQLiteSessionStorage:
+        if database is None:
+            raise ValueError("The sqlite session engine requires a database")
+        return SQLiteSessionStorage(storage_path, database)
+    return engine_cls(storage_path)
+
+
+__all__ = [
+    "SessionStorage",
+    "build_index_entry",
+    "message_text",
+    "JsonSessionStorage",
+    "LogSessionStorage",
+    "SQLiteDatabase",
+    "SQLiteSessionStorage",
+    "SQLiteFavoriteStore",
+    "SQLiteUsageStore",
+    "SESSION_STORAGE_ENGINES",
+    "create_session_storage",
+]
@@ -0,0 +1,192 @@
+# ted-os-project/backend/managers/storage/base.py
+"""
+Ted OS - 채팅 세션 저장소 기본 인터페이스
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, TextIO
+
+from ...core.config import SESSION_PREVIEW_MAX_LENGTH
+from ...models.data_models import ChatSession
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStorage(ABC):
+    """채팅 세션 저장 엔진 기본 클래스
+
+    세션 본문(메시지 등)과 세션 인덱스의 영속화를 담당합니다.
+    인덱스 항목의 내용은 ChatSessionManager가 결정하고, 엔진은 저장만 합니다.
+    """
+
+    def __init__(self, storage_path: str):
+        self.storage_path = Path(storage_path)
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.storage_path / "chat_sessions.json"
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[ChatSession]:
+        """
+        세션 로드
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            세션 객체 (없거나 읽을 수 없으면 None)
+        """
+        pass
+
+    @abstractmethod
+    def save(self, session: ChatSession) -> bool:
+        """
+        세션 저장
+
+        Args:
+            session: 저장할 세션
+
+        Returns:
+            저장 성공 여부
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """
+        세션 데이터 삭제
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            삭제된 데이터가 있었는지 여부
+        """
+        pass
+
+    def version_token(self, session_id: str) -> Optional[Hashable]:
+        """
+        세션 저장 상태를 나타내는 값 (세션 캐시 검증용)
+
+        저장된 세션이 바뀌면 다른 값을 반환해야 합니다.
+        None이면 검증할 수 없으므로 캐시를 사용하지 않습니다.
+        """
+        return None
+
+    def version_tokens(self, session_ids: Iterable[str]) -> Dict[str, Optional[Hashable]]:
+        """여러 세션의 version_token (한 번에 읽을 수 있는 엔진만 재정의)"""
+        return {session_id: self.version_token(session_id) for session_id in session_ids}
+
+    def load_index(self) -> Dict[str, dict]:
+        """세션 인덱스 로드"""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                logger.error(
+                    f"Error decoding index: {self.index_file}. Re-initializing."
+                )
+                return {}
+        return {}
+
+    def save_index(self, index: Dict[str, dict]):
+        """세션 인덱스 저장 (원자적 교체, 들여쓰기 없음)"""
+        try:
+            write_json_atomic(self.index_file, index)
+        except Exception as e:
+            logger.error(f"Error saving index: {e}")
+
+    def has_external_changes(self) -> bool:
+        """다른 프로세스가 인덱스를 변경했는지 확인 (공유 저장소 엔진만 재정의)"""
+        return False
+
+    def close(self):
+        """엔진 리소스 정리 (필요한 엔진만 재정의)"""
+        pass
+
+
+def build_index_entry(session: ChatSession) -> dict:
+    """세션 목록 표시에 필요한 정보만 담은 인덱스 항목 생성"""
+    return {
+        "title": session.title,
+        "created_at": session.created_at.isoformat(),
+        "updated_at": session.updated_at.isoformat(),
+        "message_count": len(session.messages),
+        "is_pinned": session.is_pinned,
+        "preview": make_preview(session.messages),
+    }
+
+
+def make_preview(messages: List[Dict[str, Any]]) -> str:
+    """마지막 메시지의 텍스트 미리보기 생성"""
+    if not messages:
+        return ""
+
+    return message_text(messages[-1])[:SESSION_PREVIEW_MAX_LENGTH]
+
+
+def message_text(message: Dict[str, Any]) -> str:
+    """메시지의 텍스트 부분만 추출 (멀티모달 메시지는 text 파트만)"""
+    content = message.get("content", "")
+    if isinstance(content, list):
+        return " ".join(
+            part.get("text", "")
+            for part in content
+            if isinstance(part, dict) and part.get("type") == "text"
+        )
+    if not isinstance(content, str):
+        return str(content)
+    return content
+
+
+def message_digest(message: Dict[str, Any]) -> str:
+    """메시지 내용 해시 (변경된 메시지 감지용)"""
+    raw = json.dumps(message, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def file_version(*paths: Path) -> Optional[tuple]:
+    """파일들의 (수정 시각, 크기) 묶음 (모두 없으면 None)"""
+    version = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            version.append(None)
+            continue
+        version.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(version) if any(version) else None
+
+
+def write_file_atomic(path: Path, write: Callable[[TextIO], None], fsync: bool = False):
+    """임시 파일에 쓴 뒤 os.replace로 교체 (쓰기 도중 중단되어도 기존 파일 보존, fsync: 교체 전 디스크 동기화)"""
+    # 호출마다 고유한 임시 파일을 써서 동시 저장끼리 임시 파일을 덮어쓰지 않음
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            write(f)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except Exception:
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_atomic(
+    path: Path, data: Any, indent: Optional[int] = None, fsync: bool = False
+):
+    """JSON 파일을 write_file_atomic으로 교체"""
+    write_file_atomic(
+        path, lambda f: json.dump(data, f, indent=indent, ensure_ascii=False), fsync
+    )
@@ -0,0 +1,63 @@
+# ted-os-project/backend/managers/storage/json_storage.py
+"""
+Ted OS - JSON 파일 세션 저장소 (세션당 <id>.json 하나)
+"""
+
+import json
+import logging
+from typing import Optional
+
+from ...models.data_models import ChatSession
+from .base import SessionStorage, file_version
+
+logger = logging.getLogger(__name__)
+
+
+class JsonSessionStorage(SessionStorage):
+    """세션 전체를 하나의 JSON 파일로 저장하는 기본 엔진"""
+
+    def _session_file(self, session_id: str):
+        return self.storage_path / f"{session_id}.json"
+
+    def version_token(self, session_id: str) -> Optional[tuple]:
+        """세션 파일의 수정 시각과 크기"""
+        return file_version(self._session_file(session_id))
+
+    def load(self, session_id: str) -> Optional[ChatSession]:
+        """세션 파일 로드"""
+        s_file = self._session_file(session_id)
+        if s_file.exists():
+            try:
+                with open(s_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                return ChatSession.from_dict(data)
+            except Exception as e:
+                logger.error(f"Error loading session {s_file}: {e}")
+
+        return None
+
+    def save(self, session: ChatSession) -> bool:
+        """세션 전체를 파일로 저장"""
+        s_file = self._session_file(session.id)
+
+        try:
+            with open(s_file, "w", encoding="utf-8") as f:
+                json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"Error saving session {s_file}: {e}")
+            return False
+
+        return True
+
+    def delete(self, session_id: str) -> bool:
+        """세션 파일 삭제"""
+        s_file = self._session_file(session_id)
+        if not s_file.exists():
+            return False
+
+        try:
+            s_file.unlink()
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting file {s_file}: {e}")
+            return False
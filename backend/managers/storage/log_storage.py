@@ -0,0 +1,242 @@
+# ted-os-project/backend/managers/storage/log_storage.py
+"""
+Ted OS - 추가 전용(append-only) 메시지 로그 세션 저장소
+
+세션마다 두 개의 파일을 사용합니다.
+- <id>.meta.json : 제목, 시간, 메타데이터 등 작은 헤더 (매 저장 시 원자적 교체)
+- <id>.log.jsonl : 메시지 변경 레코드 (append / truncate)
+
+메시지 하나를 추가하면 로그에는 해당 메시지 레코드만 추가되므로
+쓰기량이 대화 길이가 아니라 메시지 크기에 비례합니다.
+"""
+
+import copy
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...core.config import (
+    SESSION_LOG_COMPACT_MIN_RECORDS,
+    SESSION_LOG_COMPACT_RATIO,
+)
+from ...models.data_models import ChatSession
+from .base import file_version, write_file_atomic, write_json_atomic
+from .json_storage import JsonSessionStorage
+
+logger = logging.getLogger(__name__)
+
+
+class _LogState:
+    """세션별 로그 상태 (메모리)"""
+
+    __slots__ = ("messages", "records")
+
+    def __init__(self, messages: List[Dict[str, Any]], records: int):
+        self.messages = messages  # 로그에 반영된 메시지들의 사본 (세션 객체와 공유하지 않음)
+        self.records = records  # 로그 파일의 레코드 수 (압축 판단용)
+
+
+class LogSessionStorage(JsonSessionStorage):
+    """메시지를 세션별 JSONL 로그에 추가 기록하는 저장 엔진
+
+    기존 <id>.json 세션은 그대로 읽을 수 있으며, 처음 저장될 때 로그 형식으로 전환됩니다.
+    """
+
+    def __init__(
+        self,
+        storage_path: str,
+        compact_min_records: int = SESSION_LOG_COMPACT_MIN_RECORDS,
+        compact_ratio: float = SESSION_LOG_COMPACT_RATIO,
+    ):
+        super().__init__(storage_path)
+        self.compact_min_records = compact_min_records
+        self.compact_ratio = compact_ratio
+        self._states: Dict[str, _LogState] = {}
+        self._lock = threading.RLock()
+
+    def _meta_file(self, session_id: str):
+        return self.storage_path / f"{session_id}.meta.json"
+
+    def _log_file(self, session_id: str):
+        return self.storage_path / f"{session_id}.log.jsonl"
+
+    def _replay(self, session_id: str) -> Tuple[List[Dict[str, Any]], int]:
+        """로그를 재생하여 메시지 목록 복원 (끝의 불완전한 레코드는 잘라냄)"""
+        log_file = self._log_file(session_id)
+        messages: List[Dict[str, Any]] = []
+        records = 0
+        if not log_file.exists():
+            return messages, records
+
+        valid_offset = 0
+        with open(log_file, "rb") as f:
+            for raw_line in f:
+                if not raw_line.endswith(b"\n"):
+                    break  # 쓰기 도중 중단된 레코드
+                try:
+                    record = json.loads(raw_line)
+                except json.JSONDecodeError:
+                    break
+
+                if record.get("op") == "append":
+                    messages.append(record["m"])
+                elif record.get("op") == "truncate":
+                    del messages[record["n"]:]
+                records += 1
+                valid_offset += len(raw_line)
+
+        if valid_offset < log_file.stat().st_size:
+            logger.warning(
+                f"Truncating incomplete records in session log {log_file}"
+            )
+            with open(log_file, "r+b") as f:
+                f.truncate(valid_offset)
+
+        return messages, records
+
+    def _get_state(self, session_id: str) -> _LogState:
+        """세션 로그 상태 조회 (메모리에 없으면 로그 재생)"""
+        state = self._states.get(session_id)
+        if state is None:
+            messages, records = self._replay(session_id)
+            state = _LogState(messages, records)
+            self._states[session_id] = state
+        return state
+
+    def version_token(self, session_id: str) -> Optional[tuple]:
+        """메타/로그 파일(전환 전이면 <id>.json)의 수정 시각과 크기"""
+        return file_version(
+            self._meta_file(session_id),
+            self._log_file(session_id),
+            self._session_file(session_id),
+        )
+
+    def load(self, session_id: str) -> Optional[ChatSession]:
+        """메타 파일과 메시지 로그로 세션 복원"""
+        meta_file = self._meta_file(session_id)
+        if not meta_file.exists():
+            # 로그 형식 전환 전의 세션
+            return super().load(session_id)
+
+        with self._lock:
+            try:
+                with open(meta_file, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                messages, records = self._replay(session_id)
+            except Exception as e:
+                logger.error(f"Error loading session log {session_id}: {e}")
+                return None
+
+            self._states[session_id] = _LogState(copy.deepcopy(messages), records)
+
+        meta["messages"] = messages
+        return ChatSession.from_dict(meta)
+
+    def save(self, session: ChatSession) -> bool:
+        """변경된 메시지만 로그에 추가하고 메타 파일 갱신"""
+        with self._lock:
+            legacy_file = self._session_file(session.id)
+            migrating = legacy_file.exists() and not self._meta_file(session.id).exists()
+            if migrating:
+                self._drop_log(session.id)
+
+            state = self._get_state(session.id)
+
+            # 로그에 반영된 메시지와 처음 달라지는 위치 찾기
+            # (사본과 직접 비교하므로 바뀌지 않은 메시지는 직렬화/해시하지 않음)
+            common = 0
+            limit = min(len(state.messages), len(session.messages))
+            while common < limit and session.messages[common] == state.messages[common]:
+                common += 1
+
+            records = []
+            if common < len(state.messages):
+                records.append({"op": "truncate", "n": common})
+            for message in session.messages[common:]:
+                records.append({"op": "append", "m": message})
+
+            try:
+                if records:
+                    with open(self._log_file(session.id), "a", encoding="utf-8") as f:
+                        f.write(
+                            "".join(
+                                json.dumps(r, ensure_ascii=False) + "\n"
+                                for r in records
+                            )
+                        )
+
+                meta = session.to_dict()
+                del meta["messages"]
+                write_json_atomic(self._meta_file(session.id), meta)
+            except Exception as e:
+                logger.error(f"Error saving session log {session.id}: {e}")
+                self._states.pop(session.id, None)  # 다음 저장 시 로그 재생
+                return False
+
+            state.messages[common:] = copy.deepcopy(session.messages[common:])
+            state.records += len(records)
+
+            if migrating:
+                try:
+                    legacy_file.unlink()
+                except OSError as e:
+                    logger.warning(f"Could not remove legacy session file {legacy_file}: {e}")
+
+            if self._should_compact(state):
+                self.compact(session.id)
+
+        return True
+
+    def _should_compact(self, state: _LogState) -> bool:
+        """무효 레코드가 충분히 쌓였는지 확인"""
+        live = max(len(state.messages), 1)
+        return (
+            state.records >= self.compact_min_records
+            and state.records > live * self.compact_ratio
+        )
+
+    def compact(self, session_id: str) -> bool:
+        """로그를 현재 메시지의 append 레코드만 남도록 다시 작성"""
+        with self._lock:
+            log_file = self._log_file(session_id)
+            if not log_file.exists():
+                return False
+
+            try:
+                messages, _ = self._replay(session_id)
+                write_file_atomic(
+                    log_file,
+                    lambda f: f.writelines(
+                        json.dumps({"op": "append", "m": message}, ensure_ascii=False) + "\n"
+                        for message in messages
+                    ),
+                )
+            except Exception as e:
+                logger.error(f"Error compacting session log {session_id}: {e}")
+                return False
+
+            self._states[session_id] = _LogState(messages, len(messages))
+            logger.info(f"Compacted session log {session_id}: {len(messages)} records")
+            return True
+
+    def _drop_log(self, session_id: str):
+        """세션 로그 파일과 메모리 상태 제거"""
+        self._states.pop(session_id, None)
+        log_file = self._log_file(session_id)
+        if log_file.exists():
+            log_file.unlink()
+
+    def delete(self, session_id: str) -> bool:
+        """메타, 로그, 이전 형식 파일 모두 삭제"""
+        with self._lock:
+            deleted = super().delete(session_id)
+            for path in (self._meta_file(session_id), self._log_file(session_id)):
+                if path.exists():
+                    try:
+                        path.unlink()
+                        deleted = True
+                    except Exception as e:
+                        logger.error(f"Error deleting file {path}: {e}")
+            self._states.pop(session_id, None)
+            return deleted
@@ -0,0 +1,148 @@
+# ted-os-project/backend/managers/storage/migrate.py
+"""
+Ted OS - JSON 저장소 → SQLite 일회성 마이그레이션
+
+세션(json/log 형식), 즐겨찾기(favorites_data.json), 사용량(usage_history.jsonl)을
+SQLite 데이터베이스로 옮깁니다. 완료 표시가 meta 테이블에 남으므로 한 번만 실행됩니다.
+원본 파일은 삭제하지 않습니다.
+
+실행: python -m backend.managers.storage.migrate [--force]
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+from ...models.data_models import FavoriteMessage, TokenUsage
+from .log_storage import LogSessionStorage
+from .sqlite_store import (
+    SQLiteDatabase,
+    SQLiteFavoriteStore,
+    SQLiteSessionStorage,
+    SQLiteUsageStore,
+)
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_MARKER = "json_migrated_at"
+
+
+def is_migrated(database: SQLiteDatabase) -> bool:
+    """마이그레이션 완료 여부"""
+    return database.get_meta(MIGRATION_MARKER) is not None
+
+
+def migrate_json_to_sqlite(
+    database: SQLiteDatabase,
+    sessions_path: str,
+    favorites_path: str,
+    usage_path: str,
+    force: bool = False,
+) -> Dict[str, int]:
+    """
+    기존 JSON 저장소 데이터를 SQLite로 복사
+
+    Args:
+        database: 대상 데이터베이스
+        sessions_path: 세션 저장 디렉토리
+        favorites_path: 즐겨찾기 저장 디렉토리
+        usage_path: 사용량 저장 디렉토리
+        force: 이미 마이그레이션된 경우에도 다시 실행
+
+    Returns:
+        항목별 이전 개수
+    """
+    counts = {"sessions": 0, "favorites": 0, "usage": 0}
+    if is_migrated(database) and not force:
+        logger.info("JSON storage already migrated to SQLite, skipping")
+        return counts
+
+    # 전체 복사와 완료 표시를 한 트랜잭션으로 (중간에 실패하면 아무것도 남기지 않음)
+    with database.transaction():
+        # 세션: LogSessionStorage는 기존 <id>.json과 로그 형식을 모두 읽을 수 있음
+        source = LogSessionStorage(sessions_path)
+        target = SQLiteSessionStorage(sessions_path, database)
+        for session_id in source.load_index():
+            session = source.load(session_id)
+            if session is None:
+                logger.warning(f"Skipping unreadable session during migration: {session_id}")
+                continue
+            if target.save(session):
+                counts["sessions"] += 1
+
+        # 즐겨찾기
+        favorites_file = Path(favorites_path) / "favorites_data.json"
+        if favorites_file.exists():
+            favorite_store = SQLiteFavoriteStore(database)
+            try:
+                with open(favorites_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except json.JSONDecodeError as e:
+                logger.error(f"Cannot migrate favorites, invalid JSON: {e}")
+                data = {}
+            if not isinstance(data, dict):
+                logger.error("Cannot migrate favorites, expected a JSON object")
+                data = {}
+            for fav_id, fav_data in data.items():
+                try:
+                    favorite_store.upsert(FavoriteMessage.from_dict(fav_data))
+                except Exception as e:
+                    logger.warning(f"Favorite {fav_id}: skipping - {e}")
+                    continue
+                counts["favorites"] += 1
+
+        # 사용량 (요약 파일은 사용량 행에서 다시 계산되므로 옮기지 않음)
+        usage_file = Path(usage_path) / "usage_history.jsonl"
+        if usage_file.exists():
+            usages = []
+            with open(usage_file, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        usages.append(TokenUsage.from_dict(json.loads(line)))
+                    except Exception as e:
+                        logger.warning(f"Usage line {line_number}: skipping - {e}")
+            usage_store = SQLiteUsageStore(database)
+            if force:
+                usage_store.clear()  # 세션/즐겨찾기와 달리 행 추가라 중복 방지
+            if usages:
+                usage_store.add_many(usages)
+            counts["usage"] = len(usages)
+
+        database.set_meta(MIGRATION_MARKER, datetime.now().isoformat())
+
+    logger.info(
+        f"Migrated to SQLite: {counts['sessions']} sessions, "
+        f"{counts['favorites']} favorites, {counts['usage']} usage records"
+    )
+    return counts
+
+
+def main():
+    """설정 파일의 경로를 사용해 마이그레이션 실행 (--force: 다시 실행)"""
+    import sys
+
+    from ..settings import SettingsManager
+
+    logging.basicConfig(level=logging.INFO)
+    settings = SettingsManager()
+    database = SQLiteDatabase(settings.get("storage.sqlite_path"))
+    try:
+        counts = migrate_json_to_sqlite(
+            database,
+            settings.get("paths.chat_sessions"),
+            settings.get("paths.favorites"),
+            settings.get("paths.usage_tracking"),
+            force="--force" in sys.argv[1:],
+        )
+    finally:
+        database.close()
+    print(json.dumps(counts))
+
+
+if __name__ == "__main__":
+    main()
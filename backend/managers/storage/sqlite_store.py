@@ -0,0 +1,615 @@
+# ted-os-project/backend/managers/storage/sqlite_store.py
+"""
+Ted OS - SQLite(WAL) 저장소
+
+세션, 즐겨찾기, 사용량을 하나의 SQLite 파일에 저장합니다.
+WAL 모드를 사용하므로 여러 API 워커가 읽는 동안 한 워커가 쓸 수 있습니다.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ...models.data_models import ChatSession, FavoriteMessage, TokenUsage
+from .base import SessionStorage, build_index_entry, message_digest
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    is_pinned INTEGER NOT NULL DEFAULT 0,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    preview TEXT NOT NULL DEFAULT '',
+    metadata TEXT NOT NULL DEFAULT '{}',
+    version INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at);
+
+CREATE TABLE IF NOT EXISTS messages (
+    session_id TEXT NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (session_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS favorites (
+    id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    favorited_at TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    model_provider TEXT,
+    model_name TEXT,
+    context_messages TEXT,
+    tags TEXT NOT NULL DEFAULT '[]',
+    notes TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_favorites_favorited_at ON favorites(favorited_at);
+
+CREATE TABLE IF NOT EXISTS favorite_tags (
+    favorite_id TEXT NOT NULL REFERENCES favorites(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (favorite_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_favorite_tags_tag ON favorite_tags(tag);
+
+CREATE TABLE IF NOT EXISTS usage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    day TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    total_tokens INTEGER NOT NULL,
+    cost_usd REAL NOT NULL DEFAULT 0,
+    retries INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_usage_timestamp ON usage(timestamp);
+CREATE INDEX IF NOT EXISTS idx_usage_day_model ON usage(day, provider, model_name);
+CREATE INDEX IF NOT EXISTS idx_usage_model ON usage(provider, model_name, timestamp);
+"""
+
+# 기존 데이터베이스에 나중에 추가된 열 (테이블 -> [(열, 정의)])
+ADDED_COLUMNS = {
+    "usage": [("retries", "INTEGER NOT NULL DEFAULT 0")],
+}
+
+
+class SQLiteDatabase:
+    """스레드별 연결을 관리하는 SQLite 데이터베이스 (WAL 모드)"""
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()  # 프로세스 내 쓰기 직렬화
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        self.connection().executescript(SCHEMA)
+        self._add_missing_columns()
+        logger.info(f"SQLite database ready: {self.db_path}")
+
+    def _add_missing_columns(self):
+        """이전 스키마로 만들어진 테이블에 새 열 추가"""
+        conn = self.connection()
+        for table, columns in ADDED_COLUMNS.items():
+            existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for name, definition in columns:
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+                    logger.info(f"Added column {table}.{name}")
+
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드 전용 연결 반환"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=30,
+                isolation_level=None,  # 트랜잭션은 직접 관리
+                check_same_thread=False,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        쓰기 트랜잭션 (BEGIN IMMEDIATE로 다른 프로세스의 쓰기와 충돌 방지)
+
+        이미 트랜잭션 안에서 다시 열면 SAVEPOINT로 바깥 트랜잭션에 합쳐지고,
+        안쪽에서 실패하면 안쪽 변경만 되돌립니다.
+        """
+        conn = self.connection()
+        if conn.in_transaction:
+            conn.execute("SAVEPOINT nested")
+            try:
+                yield conn
+                conn.execute("RELEASE nested")
+            except Exception:
+                conn.execute("ROLLBACK TO nested")
+                conn.execute("RELEASE nested")
+                raise
+            return
+
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                # COMMIT이 실패해도(디스크 부족, 지연된 제약 조건 등) 연결이 트랜잭션 안에 남지 않도록
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """메타 값 조회"""
+        row = self.connection().execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row["value"] if row else None
+
+    def set_meta(self, key: str, value: str):
+        """메타 값 저장"""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def close(self):
+        """모든 연결 닫기"""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.warning(f"Error closing SQLite connection: {e}")
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class SQLiteSessionStorage(SessionStorage):
+    """SQLite 세션 저장 엔진
+
+    인덱스 항목(제목, 시간, 고정 여부 등)은 sessions 테이블 컬럼으로 save()에서 함께 기록되므로
+    save_index()는 별도 작업을 하지 않습니다.
+    세션을 변경할 때마다 meta 테이블의 버전 값을 올려 다른 워커의 변경을 감지합니다.
+    """
+
+    VERSION_KEY = "sessions_version"
+
+    def __init__(self, storage_path: str, database: SQLiteDatabase):
+        super().__init__(storage_path)
+        self.database = database
+        self._seen_version: Optional[int] = None
+
+    def _current_version(self) -> int:
+        return int(self.database.get_meta(self.VERSION_KEY) or 0)
+
+    def _bump_version(self, conn: sqlite3.Connection):
+        """트랜잭션 안에서 버전 증가 (그 사이 다른 워커가 변경했으면 재로드 대상으로 남김)"""
+        row = conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (self.VERSION_KEY,)
+        ).fetchone()
+        current = int(row["value"]) if row else 0
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (self.VERSION_KEY, str(current + 1)),
+        )
+        if current == self._seen_version:
+            self._seen_version = current + 1
+
+    def load_index(self) -> Dict[str, dict]:
+        """sessions 테이블에서 인덱스 구성 (메시지 본문은 읽지 않음)"""
+        conn = self.database.connection()
+        conn.execute("BEGIN")  # 버전과 행을 같은 스냅샷에서 읽기
+        try:
+            version = self._current_version()
+            rows = conn.execute(
+                "SELECT id, title, created_at, updated_at, message_count, is_pinned, "
+                "preview FROM sessions"
+            ).fetchall()
+        finally:
+            conn.execute("COMMIT")
+        self._seen_version = version
+        return {
+            row["id"]: {
+                "title": row["title"],
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+                "message_count": row["message_count"],
+                "is_pinned": bool(row["is_pinned"]),
+                "preview": row["preview"],
+            }
+            for row in rows
+        }
+
+    def save_index(self, index: Dict[str, dict]):
+        """인덱스는 save()에서 행 단위로 기록됨"""
+        pass
+
+    def has_external_changes(self) -> bool:
+        """다른 워커가 세션을 변경했는지 확인"""
+        return self._current_version() != self._seen_version
+
+    def version_token(self, session_id: str) -> Optional[int]:
+        """세션 행의 버전 (저장할 때마다 증가)"""
+        row = self.database.connection().execute(
+            "SELECT version FROM sessions WHERE id = ?", (session_id,)
+        ).fetchone()
+        return row["version"] if row else None
+
+    def version_tokens(self, session_ids: Iterable[str]) -> Dict[str, Optional[int]]:
+        """sessions 테이블 한 번 조회로 여러 세션의 버전"""
+        rows = self.database.connection().execute("SELECT id, version FROM sessions")
+        versions = {row["id"]: row["version"] for row in rows}
+        return {session_id: versions.get(session_id) for session_id in session_ids}
+
+    def load(self, session_id: str) -> Optional[ChatSession]:
+        """세션 행과 메시지 행으로 세션 복원"""
+        conn = self.database.connection()
+        try:
+            row = conn.execute(
+                "SELECT * FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+            if not row:
+                return None
+
+            messages = [
+                json.loads(m["body"])
+                for m in conn.execute(
+                    "SELECT body FROM messages WHERE session_id = ? ORDER BY position",
+                    (session_id,),
+                )
+            ]
+        except Exception as e:
+            logger.error(f"Error loading session {session_id} from SQLite: {e}")
+            return None
+
+        return ChatSession.from_dict(
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "messages": messages,
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+                "metadata": json.loads(row["metadata"]),
+                "is_pinned": bool(row["is_pinned"]),
+            }
+        )
+
+    def save(self, session: ChatSession) -> bool:
+        """세션 행 갱신 + 변경된 메시지 행만 다시 기록"""
+        entry = build_index_entry(session)
+        digests = [message_digest(m) for m in session.messages]
+
+        try:
+            with self.database.transaction() as conn:
+                conn.execute(
+                    "INSERT INTO sessions (id, title, created_at, updated_at, is_pinned, "
+                    "message_count, preview, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET title = excluded.title, "
+                    "created_at = excluded.created_at, updated_at = excluded.updated_at, "
+                    "is_pinned = excluded.is_pinned, message_count = excluded.message_count, "
+                    "preview = excluded.preview, metadata = excluded.metadata, "
+                    "version = sessions.version + 1",
+                    (
+                        session.id,
+                        entry["title"],
+                        entry["created_at"],
+                        entry["updated_at"],
+                        int(entry["is_pinned"]),
+                        entry["message_count"],
+                        entry["preview"],
+                        json.dumps(session.metadata, ensure_ascii=False),
+                    ),
+                )
+
+                stored = [
+                    r["digest"]
+                    for r in conn.execute(
+                        "SELECT digest FROM messages WHERE session_id = ? ORDER BY position",
+                        (session.id,),
+                    )
+                ]
+                common = 0
+                limit = min(len(stored), len(digests))
+                while common < limit and stored[common] == digests[common]:
+                    common += 1
+
+                conn.execute(
+                    "DELETE FROM messages WHERE session_id = ? AND position >= ?",
+                    (session.id, common),
+                )
+                conn.executemany(
+                    "INSERT INTO messages (session_id, position, digest, body) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            session.id,
+                            position,
+                            digests[position],
+                            json.dumps(session.messages[position], ensure_ascii=False),
+                        )
+                        for position in range(common, len(session.messages))
+                    ],
+                )
+                self._bump_version(conn)
+        except Exception as e:
+            logger.error(f"Error saving session {session.id} to SQLite: {e}")
+            return False
+
+        return True
+
+    def delete(self, session_id: str) -> bool:
+        """세션 행 삭제 (메시지는 CASCADE로 삭제)"""
+        try:
+            with self.database.transaction() as conn:
+                cursor = conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+                self._bump_version(conn)
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"Error deleting session {session_id} from SQLite: {e}")
+            return False
+
+
+class SQLiteFavoriteStore:
+    """SQLite 즐겨찾기 저장소 (태그는 별도 테이블로 인덱싱)"""
+
+    def __init__(self, database: SQLiteDatabase):
+        self.database = database
+
+    @staticmethod
+    def _row_to_favorite(row: sqlite3.Row) -> FavoriteMessage:
+        return FavoriteMessage.from_dict(
+            {
+                "id": row["id"],
+                "session_id": row["session_id"],
+                "message_id": row["message_id"],
+                "role": row["role"],
+                "content": row["content"],
+                "favorited_at": row["favorited_at"],
+                "created_at": row["created_at"],
+                "model_provider": row["model_provider"],
+                "model_name": row["model_name"],
+                "context_messages": (
+                    json.loads(row["context_messages"])
+                    if row["context_messages"]
+                    else None
+                ),
+                "tags": json.loads(row["tags"]),
+                "notes": row["notes"],
+            }
+        )
+
+    def load_all(self) -> Dict[str, FavoriteMessage]:
+        """전체 즐겨찾기 로드"""
+        rows = self.database.connection().execute(
+            "SELECT * FROM favorites ORDER BY favorited_at DESC"
+        ).fetchall()
+        return {row["id"]: self._row_to_favorite(row) for row in rows}
+
+    def get(self, favorite_id: str) -> Optional[FavoriteMessage]:
+        """ID로 즐겨찾기 조회"""
+        row = self.database.connection().execute(
+            "SELECT * FROM favorites WHERE id = ?", (favorite_id,)
+        ).fetchone()
+        return self._row_to_favorite(row) if row else None
+
+    def upsert(self, favorite: FavoriteMessage):
+        """즐겨찾기 추가/갱신 (태그 테이블 포함)"""
+        data = favorite.to_dict()
+        with self.database.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO favorites (id, session_id, message_id, role, "
+                "content, favorited_at, created_at, model_provider, model_name, "
+                "context_messages, tags, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    data["id"],
+                    data["session_id"],
+                    data["message_id"],
+                    data["role"],
+                    data["content"],
+                    data["favorited_at"],
+                    data["created_at"],
+                    data["model_provider"],
+                    data["model_name"],
+                    (
+                        json.dumps(data["context_messages"], ensure_ascii=False)
+                        if data["context_messages"] is not None
+                        else None
+                    ),
+                    json.dumps(data["tags"], ensure_ascii=False),
+                    data["notes"],
+                ),
+            )
+            conn.execute(
+                "DELETE FROM favorite_tags WHERE favorite_id = ?", (favorite.id,)
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO favorite_tags (favorite_id, tag) VALUES (?, ?)",
+                [(favorite.id, tag) for tag in favorite.tags],
+            )
+
+    def delete(self, favorite_id: str) -> bool:
+        """즐겨찾기 삭제"""
+        with self.database.transaction() as conn:
+            cursor = conn.execute("DELETE FROM favorites WHERE id = ?", (favorite_id,))
+        return cursor.rowcount > 0
+
+    def find(
+        self, query: Optional[str] = None, tags: Optional[List[str]] = None
+    ) -> List[FavoriteMessage]:
+        """태그(AND, 인덱스 사용)와 내용 검색어로 즐겨찾기 검색"""
+        sql = "SELECT * FROM favorites"
+        params: List[Any] = []
+        unique_tags = list({tag.lower(): tag for tag in tags or []}.values())
+        if unique_tags:
+            placeholders = ", ".join("?" for _ in unique_tags)
+            sql += (
+                " WHERE id IN (SELECT favorite_id FROM favorite_tags "
+                f"WHERE tag IN ({placeholders}) GROUP BY favorite_id "
+                "HAVING COUNT(*) = ?)"
+            )
+            params.extend(unique_tags)
+            params.append(len(unique_tags))
+        sql += " ORDER BY favorited_at DESC"
+
+        results = [
+            self._row_to_favorite(row)
+            for row in self.database.connection().execute(sql, params)
+        ]
+
+        # 내용 검색은 유니코드 대소문자 처리를 위해 파이썬에서 수행
+        if query:
+            query_lower = query.lower()
+            results = [
+                fav
+                for fav in results
+                if query_lower in fav.content.lower()
+                or (fav.notes and query_lower in fav.notes.lower())
+            ]
+        return results
+
+
+class SQLiteUsageStore:
+    """SQLite 사용량 저장소 (요청 단위 행 + 인덱스 기반 집계)"""
+
+    def __init__(self, database: SQLiteDatabase):
+        self.database = database
+
+    def add(self, usage: TokenUsage):
+        """사용량 행 추가"""
+        self.add_many([usage])
+
+    def add_many(self, usages: List[TokenUsage]):
+        """사용량 행 여러 개를 한 트랜잭션으로 추가"""
+        with self.database.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO usage (timestamp, day, provider, model_name, input_tokens, "
+                "output_tokens, total_tokens, cost_usd, retries) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        u.timestamp.isoformat(),
+                        u.timestamp.date().isoformat(),
+                        u.provider,
+                        u.model_name,
+                        u.input_tokens,
+                        u.output_tokens,
+                        u.total_tokens,
+                        u.cost_usd,
+                        u.retries,
+                    )
+                    for u in usages
+                ],
+            )
+
+    def totals(self) -> dict:
+        """전체 누적 사용량"""
+        row = self.database.connection().execute(
+            "SELECT COALESCE(SUM(total_tokens), 0) AS tokens, "
+            "COALESCE(SUM(cost_usd), 0) AS cost, COUNT(*) AS requests, "
+            "COALESCE(SUM(retries), 0) AS retries FROM usage"
+        ).fetchone()
+        return {
+            "total_tokens": row["tokens"],
+            "total_cost": round(row["cost"], 6),
+            "total_requests": row["requests"],
+            "total_retries": row["retries"],
+        }
+
+    def daily_summary(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """daily_summary.json과 같은 형태의 일별 요약 생성"""
+        sql = (
+            "SELECT day, provider, model_name, SUM(total_tokens) AS tokens, "
+            "SUM(cost_usd) AS cost, COUNT(*) AS requests, SUM(retries) AS retries FROM usage"
+        )
+        params: List[Any] = []
+        if start_date and end_date:
+            sql += " WHERE day BETWEEN ? AND ?"
+            params = [start_date.isoformat(), end_date.isoformat()]
+        sql += " GROUP BY day, provider, model_name ORDER BY day"
+
+        summary: Dict[str, Dict[str, Any]] = {}
+        for row in self.database.connection().execute(sql, params):
+            day_data = summary.setdefault(
+                row["day"],
+                {
+                    "total_tokens": 0,
+                    "total_cost": 0.0,
+                    "requests": 0,
+                    "retries": 0,
+                    "by_model": {},
+                },
+            )
+            day_data["total_tokens"] += row["tokens"]
+            day_data["total_cost"] = round(day_data["total_cost"] + row["cost"], 6)
+            day_data["requests"] += row["requests"]
+            day_data["retries"] += row["retries"]
+            day_data["by_model"][f"{row['provider']}_{row['model_name']}"] = {
+                "tokens": row["tokens"],
+                "cost": round(row["cost"], 6),
+                "requests": row["requests"],
+            }
+        return summary
+
+    def rows_after(self, last_id: int) -> List[Dict[str, Any]]:
+        """id가 last_id보다 큰 사용량 행 (id 순)"""
+        rows = self.database.connection().execute(
+            "SELECT id, timestamp, provider, model_name, input_tokens, output_tokens, "
+            "total_tokens, cost_usd, retries FROM usage WHERE id > ? ORDER BY id",
+            (last_id,),
+        )
+        return [dict(row) for row in rows]
+
+    def max_id(self) -> int:
+        """가장 최근 사용량 행의 id (없으면 0)"""
+        row = self.database.connection().execute(
+            "SELECT COALESCE(MAX(id), 0) FROM usage"
+        ).fetchone()
+        return row[0]
+
+    def clear(self):
+        """사용량 행 전체 삭제"""
+        with self.database.transaction() as conn:
+            conn.execute("DELETE FROM usage")
+
+    def delete_before(self, cutoff_date: date) -> int:
+        """기준일 이전 데이터 삭제, 삭제된 일수 반환"""
+        with self.database.transaction() as conn:
+            removed_days = conn.execute(
+                "SELECT COUNT(DISTINCT day) FROM usage WHERE day < ?",
+                (cutoff_date.isoformat(),),
+            ).fetchone()[0]
+            conn.execute("DELETE FROM usage WHERE day < ?", (cutoff_date.isoformat(),))
+        return removed_days
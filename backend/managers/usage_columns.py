@@ -0,0 +1,406 @@
+# ted-os-project/backend/managers/usage_columns.py
+"""
+Ted OS - 시간별 사용량 열 저장소 (분석 조회용)
+
+기록을 (시간, 제공업체/모델) 버킷 하나당 한 행으로 모아 NumPy 열(토큰, 비용, 요청 수 등)에 저장합니다.
+범위/그룹/버킷 조회는 열 마스크와 bincount로 계산하므로 몇 달치 데이터도 밀리초 단위로 끝납니다.
+원본은 usage_history.jsonl 또는 SQLite usage 테이블이며, 마지막으로 반영한 위치를 체크포인트에 함께 저장해
+다음 실행에서는 그 뒤의 기록만 다시 읽습니다.
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.config import USAGE_HOURLY_CHECKPOINT_RECORDS, USAGE_QUERY_PERCENTILES
+from .storage.base import write_json_atomic
+from .usage_totals import read_history_tail
+
+logger = logging.getLogger(__name__)
+
+BUCKETS = ("hour", "day", "week", "month", "total")
+GROUP_FIELDS = ("provider", "model")
+# 열 이름 -> dtype (hour: 1970-01-01 00시부터 지난 시간 수, series: 제공업체/모델 번호)
+_COLUMNS = {
+    "hour": "int64",
+    "series": "int32",
+    "input_tokens": "int64",
+    "output_tokens": "int64",
+    "tokens": "int64",
+    "cost": "float64",
+    "requests": "int64",
+    "retries": "int64",
+}
+_VALUE_COLUMNS = ("input_tokens", "output_tokens", "tokens", "cost", "requests", "retries")
+_PERCENTILE_COLUMNS = ("tokens", "cost", "requests")
+_EPOCH = datetime(1970, 1, 1)
+_HOUR = timedelta(hours=1)
+
+
+def _local(timestamp: datetime) -> datetime:
+    """시간대가 있으면 로컬 시각으로 (기록은 로컬 시각으로 저장됨)"""
+    if timestamp.tzinfo is not None:
+        return timestamp.astimezone().replace(tzinfo=None)
+    return timestamp
+
+
+def hour_index(timestamp: datetime) -> int:
+    """시각이 속한 시간 버킷 번호"""
+    return (_local(timestamp) - _EPOCH) // _HOUR
+
+
+def _bucket_start(bucket: str, key: int) -> str:
+    if bucket == "hour":
+        return (_EPOCH + timedelta(hours=key)).isoformat()
+    if bucket == "day":
+        return (_EPOCH + timedelta(days=key)).date().isoformat()
+    if bucket == "week":
+        return (_EPOCH + timedelta(days=key * 7 - 3)).date().isoformat()
+    return date(1970 + key // 12, key % 12 + 1, 1).isoformat()
+
+
+def _value_row(values: Dict[str, Any]) -> Dict[str, Any]:
+    """열별 합계를 응답 형식으로 (비용만 실수)"""
+    return {
+        name: round(float(values[name]), 6) if name == "cost" else int(round(values[name]))
+        for name in _VALUE_COLUMNS
+    }
+
+
+class HourlyUsageStore:
+    """(시간, 제공업체/모델) 버킷별 사용량 열 저장소 (스레드 안전)"""
+
+    def __init__(
+        self,
+        checkpoint_file: Optional[Path] = None,
+        checkpoint_records: int = USAGE_HOURLY_CHECKPOINT_RECORDS,
+        capacity: int = 1024,
+    ):
+        self.checkpoint_file = Path(checkpoint_file) if checkpoint_file else None
+        self.checkpoint_records = checkpoint_records
+        self._initial_capacity = max(1, capacity)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._reset_state(None)
+
+    def _reset_state(self, source: Optional[str]):
+        self._source = source  # "jsonl" 또는 "sqlite"
+        self._cursor = 0  # JSONL 바이트 오프셋 또는 SQLite 마지막 id
+        self._head = 0  # JSONL 앞부분 CRC (교체 감지용)
+        self._size = 0
+        self._rows: Dict[Tuple[int, int], int] = {}  # (시간, 시리즈) -> 행
+        self._series: List[Tuple[str, str]] = []  # 시리즈 번호 -> (제공업체, 모델)
+        self._series_ids: Dict[Tuple[str, str], int] = {}
+        self._unsaved = 0  # 체크포인트 이후 반영한 기록 수
+        self._dirty = False
+        self._columns = {
+            name: np.zeros(self._initial_capacity, dtype=dtype) for name, dtype in _COLUMNS.items()
+        }
+
+    def reset(self):
+        """모두 비우고 다음 조회 때 원본에서 다시 만들기 (원본 기록을 지운 경우)"""
+        with self._lock:
+            self._loaded = True
+            self._reset_state(self._source)
+            self._dirty = True
+
+    # ---- 반영 ----
+
+    def _add(self, data: Dict[str, Any]) -> bool:
+        """기록 하나를 버킷에 더함 (잠금을 잡은 상태에서 호출)"""
+        try:
+            timestamp = data["timestamp"]
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp)
+            hour = hour_index(timestamp)
+            values = (
+                int(data["input_tokens"]),
+                int(data["output_tokens"]),
+                int(data["total_tokens"]),
+                float(data["cost_usd"]),
+                1,
+                int(data.get("retries") or 0),
+            )
+        except (KeyError, ValueError, TypeError):
+            return False
+
+        series_key = (str(data["provider"]), str(data["model_name"]))
+        series = self._series_ids.get(series_key)
+        if series is None:
+            series = self._series_ids[series_key] = len(self._series)
+            self._series.append(series_key)
+
+        row = self._rows.get((hour, series))
+        if row is None:
+            row = self._rows[(hour, series)] = self._size
+            self._grow(row + 1)
+            self._columns["hour"][row] = hour
+            self._columns["series"][row] = series
+            self._size += 1
+        for name, value in zip(_VALUE_COLUMNS, values):
+            self._columns[name][row] += value
+        return True
+
+    def _grow(self, size: int):
+        capacity = len(self._columns["hour"])
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+
+    def _fold(self, records: Sequence[Dict[str, Any]]):
+        added = sum(1 for data in records if self._add(data))
+        if added:
+            self._unsaved += added
+            self._dirty = True
+        if self._unsaved >= self.checkpoint_records:
+            self._save()
+
+    def _prepare(self, source: str):
+        """체크포인트를 불러오고, 원본 종류가 바뀌었으면 처음부터 다시 만들기"""
+        if not self._loaded:
+            self._load_checkpoint()
+        if self._source != source:
+            if self._source is not None:
+                logger.info(f"Usage source changed to {source}, rebuilding hourly usage")
+            self._reset_state(source)
+            self._dirty = True
+
+    def catch_up_history(self, history_file: Path):
+        """usage_history.jsonl에 추가된 완전한 줄 반영"""
+        with self._lock:
+            self._prepare("jsonl")
+            records, offset, head, replaced = read_history_tail(
+                Path(history_file), self._cursor, self._head
+            )
+            if replaced:
+                logger.info("Usage history was replaced, rebuilding hourly usage")
+                self._reset_state("jsonl")
+                self._dirty = True
+            if offset != self._cursor:
+                self._dirty = True
+            self._cursor, self._head = offset, head
+            self._fold(records)
+
+    def catch_up_rows(self, store):
+        """SQLiteUsageStore에 추가된 행 반영"""
+        with self._lock:
+            self._prepare("sqlite")
+            if store.max_id() < self._cursor:
+                logger.info("Usage table was cleared, rebuilding hourly usage")
+                self._reset_state("sqlite")
+                self._dirty = True
+            rows = store.rows_after(self._cursor)
+            if rows:
+                self._cursor = rows[-1]["id"]
+                self._dirty = True
+            self._fold(rows)
+
+    # ---- 체크포인트 ----
+
+    def _load_checkpoint(self):
+        self._loaded = True
+        if self.checkpoint_file is None or not self.checkpoint_file.exists():
+            return
+        try:
+            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            series = [tuple(key) for key in data["series"]]
+            columns = {
+                name: np.asarray(data["columns"][name], dtype=dtype)
+                for name, dtype in _COLUMNS.items()
+            }
+            size = len(columns["hour"])
+            if any(len(column) != size for column in columns.values()):
+                raise ValueError("column lengths differ")
+            if size and int(columns["series"].max()) >= len(series):
+                raise ValueError("unknown series")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable hourly usage checkpoint: {e}")
+            return
+
+        self._reset_state(data.get("source"))
+        self._grow(size)
+        for name, column in columns.items():
+            self._columns[name][:size] = column
+        self._size = size
+        self._series = series
+        self._series_ids = {key: i for i, key in enumerate(series)}
+        self._rows = {
+            (hour, series_id): row
+            for row, (hour, series_id) in enumerate(
+                zip(columns["hour"].tolist(), columns["series"].tolist())
+            )
+        }
+        self._cursor = int(data.get("cursor", 0))
+        self._head = int(data.get("head", 0))
+
+    def _save(self):
+        """체크포인트 저장 (잠금을 잡은 상태에서 호출)"""
+        self._unsaved = 0
+        if self.checkpoint_file is None:
+            self._dirty = False
+            return
+        try:
+            write_json_atomic(
+                self.checkpoint_file,
+                {
+                    "source": self._source,
+                    "cursor": self._cursor,
+                    "head": self._head,
+                    "series": self._series,
+                    "columns": {
+                        name: column[: self._size].tolist()
+                        for name, column in self._columns.items()
+                    },
+                },
+            )
+            self._dirty = False
+        except OSError as e:
+            logger.error(f"Error saving hourly usage checkpoint: {e}")
+
+    def save(self):
+        """반영한 내용이 있으면 체크포인트 저장 (종료할 때 호출)"""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    # ---- 조회 ----
+
+    def query(
+        self,
+        start: datetime,
+        end: datetime,
+        group_by: Sequence[str] = (),
+        bucket: str = "day",
+        percentiles: Sequence[float] = USAGE_QUERY_PERCENTILES,
+    ) -> Dict[str, Any]:
+        """
+        [start, end) 범위의 사용량을 group_by별, bucket 단위로 집계
+
+        그룹마다 버킷별 값, 합계, 버킷 값의 백분위(사용량이 있는 버킷 기준)를 돌려줍니다.
+        bucket: hour, day, week(월요일 시작), month, total
+        group_by: provider, model 중 0개 이상
+        """
+        if bucket not in BUCKETS:
+            raise ValueError(f"Unknown bucket '{bucket}' (expected one of: {', '.join(BUCKETS)})")
+        group_by = list(dict.fromkeys(group_by))
+        unknown = [field for field in group_by if field not in GROUP_FIELDS]
+        if unknown:
+            raise ValueError(
+                f"Unknown group_by field '{unknown[0]}' (expected: {', '.join(GROUP_FIELDS)})"
+            )
+        if any(not 0 <= p <= 100 for p in percentiles):
+            raise ValueError("Percentiles must be between 0 and 100")
+        started = time.perf_counter()
+        start_hour = hour_index(start)
+        end_hour = -((_EPOCH - _local(end)) // _HOUR)  # 올림 (end는 포함하지 않음)
+
+        with self._lock:
+            size = self._size
+            hours = self._columns["hour"][:size]
+            mask = (hours >= start_hour) & (hours < end_hour)
+            picked = {name: column[:size][mask] for name, column in self._columns.items()}
+            series = list(self._series)
+
+        # 버킷 번호
+        hours = picked["hour"]
+        if bucket == "hour":
+            bucket_keys = hours
+        elif bucket == "day":
+            bucket_keys = hours // 24
+        elif bucket == "week":
+            bucket_keys = (hours // 24 + 3) // 7  # 1970-01-01은 목요일
+        elif bucket == "month":
+            bucket_keys = (
+                (hours // 24).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+            )
+        else:
+            bucket_keys = np.zeros_like(hours)
+
+        # 시리즈 -> 그룹 번호
+        group_keys: Dict[Tuple[str, ...], int] = {}
+        fields = {"provider": 0, "model": 1}
+        series_group = np.array(
+            [
+                group_keys.setdefault(tuple(key[fields[f]] for f in group_by), len(group_keys))
+                for key in series
+            ],
+            dtype=np.int64,
+        )
+        row_group = series_group[picked["series"]]
+
+        # (그룹, 버킷) 칸별 합계
+        buckets = np.unique(bucket_keys)
+        width = max(1, len(buckets))
+        cells, cell_index = np.unique(
+            row_group * width + np.searchsorted(buckets, bucket_keys), return_inverse=True
+        )
+        sums = {
+            name: np.bincount(cell_index.reshape(-1), weights=picked[name], minlength=len(cells))
+            for name in _VALUE_COLUMNS
+        }
+        cell_group = cells // width
+
+        # 응답 변환은 칸마다가 아니라 열/버킷 단위로 한 번에
+        if bucket == "total":
+            labels = [_local(start).isoformat()]
+        else:
+            labels = [_bucket_start(bucket, key) for key in buckets.tolist()]
+        cell_labels = [labels[i] for i in (cells % width).tolist()]
+        cell_values = {
+            name: (
+                np.round(values, 6) if name == "cost" else np.rint(values).astype(np.int64)
+            ).tolist()
+            for name, values in sums.items()
+        }
+
+        group_names = {index: key for key, index in group_keys.items()}
+        groups = []
+        bounds = np.searchsorted(cell_group, np.unique(cell_group)).tolist()
+        for begin, stop in zip(bounds, bounds[1:] + [len(cells)]):
+            group_sums = {name: values[begin:stop] for name, values in sums.items()}
+            groups.append(
+                {
+                    "key": dict(zip(group_by, group_names[int(cell_group[begin])])),
+                    "totals": _value_row(
+                        {name: values.sum() for name, values in group_sums.items()}
+                    ),
+                    "percentiles": {
+                        f"p{p:g}": {
+                            name: round(float(np.percentile(group_sums[name], p)), 6)
+                            for name in _PERCENTILE_COLUMNS
+                        }
+                        for p in percentiles
+                    },
+                    "buckets": [
+                        {"start": label, **dict(zip(_VALUE_COLUMNS, values))}
+                        for label, values in zip(
+                            cell_labels[begin:stop],
+                            zip(*(cell_values[name][begin:stop] for name in _VALUE_COLUMNS)),
+                        )
+                    ],
+                }
+            )
+        groups.sort(key=lambda group: group["totals"]["tokens"], reverse=True)
+
+        return {
+            "start": _local(start).isoformat(),
+            "end": _local(end).isoformat(),
+            "bucket": bucket,
+            "group_by": group_by,
+            "totals": _value_row({name: values.sum() for name, values in sums.items()}),
+            "groups": groups,
+            "rows": int(mask.sum()),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
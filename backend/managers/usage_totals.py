@@ -0,0 +1,177 @@
+# ted-os-project/backend/managers/usage_totals.py
+"""
+Ted OS - usage_history.jsonl 전체 누적 합계와 체크포인트
+
+합계와 함께 마지막으로 반영한 줄 끝의 바이트 오프셋을 작은 JSON 파일에 저장해 두고,
+시작할 때나 기록이 추가될 때는 그 뒤(꼬리)만 읽어 합칩니다.
+히스토리 파일이 줄었거나 앞부분이 바뀌었으면(교체/백업 후 새 파일) 처음부터 다시 계산합니다.
+"""
+
+import json
+import logging
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .storage.base import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# 사용량 줄로 인정하는 필수 필드 (히스토리 로드와 동일)
+REQUIRED_USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "model_name",
+    "provider",
+    "timestamp",
+    "cost_usd",
+)
+_HEAD_BYTES = 256  # 파일이 교체됐는지 확인할 때 비교하는 앞부분 크기
+
+
+def _head_crc(f, length: int) -> int:
+    f.seek(0)
+    return zlib.crc32(f.read(min(length, _HEAD_BYTES)))
+
+
+def read_history_tail(
+    history_file: Path, offset: int, head: int
+) -> Tuple[List[Dict[str, Any]], int, int, bool]:
+    """
+    히스토리에서 offset 이후의 완전한 줄만 읽기
+
+    (필수 필드가 있는 기록, 새 오프셋, 새 앞부분 CRC, 교체 여부)를 반환합니다.
+    파일이 없어졌거나 줄었거나 앞부분이 바뀌었으면 처음부터 읽고 교체 여부를 True로 돌려줍니다.
+    """
+    if not history_file.exists():
+        return [], 0, 0, offset != 0
+
+    records: List[Dict[str, Any]] = []
+    replaced = False
+    with open(history_file, "rb") as f:
+        size = f.seek(0, 2)
+        if size < offset or (offset and _head_crc(f, offset) != head):
+            replaced = True
+            offset, head = 0, 0
+        if size == offset:
+            return records, offset, head, replaced
+
+        f.seek(offset)
+        replayed = False
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break  # 쓰는 중인 마지막 줄은 다음에 반영
+            offset += len(raw)
+            replayed = True
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(data, dict) and all(field in data for field in REQUIRED_USAGE_FIELDS):
+                records.append(data)
+        if replayed:
+            head = _head_crc(f, offset)
+    return records, offset, head, replaced
+
+
+class RunningUsageTotals:
+    """JSONL 히스토리의 누적 합계 (스레드 안전)"""
+
+    def __init__(self, history_file: Path, checkpoint_file: Path):
+        self.history_file = Path(history_file)
+        self.checkpoint_file = Path(checkpoint_file)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._reset_state()
+
+    def _reset_state(self):
+        self.total_tokens = 0
+        self.total_cost = 0.0
+        self.total_requests = 0
+        self.total_retries = 0
+        self.offset = 0  # 반영한 마지막 줄 끝의 바이트 위치
+        self.head = 0  # 파일 앞부분의 CRC (교체 감지용)
+
+    def totals(self) -> Dict[str, Any]:
+        """get_total_usage_from_history 형식의 합계 (새로 추가된 줄까지 반영)"""
+        with self._lock:
+            self._catch_up()
+            return {
+                "total_tokens": self.total_tokens,
+                "total_cost": round(self.total_cost, 6),
+                "total_requests": self.total_requests,
+                "total_retries": self.total_retries,
+            }
+
+    def refresh(self):
+        """히스토리에 추가된 줄을 반영하고 체크포인트 저장 (add_usage 후 호출)"""
+        with self._lock:
+            self._catch_up()
+
+    # ---- 내부 ----
+
+    def _load_checkpoint(self):
+        self._loaded = True
+        if not self.checkpoint_file.exists():
+            return
+        try:
+            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.total_tokens = int(data["total_tokens"])
+            self.total_cost = float(data["total_cost"])
+            self.total_requests = int(data["total_requests"])
+            self.total_retries = int(data.get("total_retries", 0))
+            self.offset = int(data["offset"])
+            self.head = int(data.get("head", 0))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable usage totals checkpoint: {e}")
+            self._reset_state()
+
+    def _catch_up(self):
+        """체크포인트 이후의 완전한 줄만 읽어 합계에 반영 (잠금을 잡은 상태에서 호출)"""
+        if not self._loaded:
+            self._load_checkpoint()
+        records, offset, head, replaced = read_history_tail(
+            self.history_file, self.offset, self.head
+        )
+        if replaced:
+            logger.info("Usage history was replaced, recomputing totals")
+            self._reset_state()
+        changed = replaced or offset != self.offset
+
+        for data in records:
+            try:
+                tokens = int(data["total_tokens"])
+                cost = float(data["cost_usd"])
+                retries = int(data.get("retries", 0))
+            except (ValueError, TypeError):
+                continue
+            self.total_tokens += tokens
+            self.total_cost += cost
+            self.total_requests += 1
+            self.total_retries += retries
+        self.offset, self.head = offset, head
+
+        if changed:
+            self._save()
+
+    def _save(self):
+        try:
+            write_json_atomic(
+                self.checkpoint_file,
+                {
+                    "total_tokens": self.total_tokens,
+                    "total_cost": self.total_cost,
+                    "total_requests": self.total_requests,
+                    "total_retries": self.total_retries,
+                    "offset": self.offset,
+                    "head": self.head,
+                },
+            )
+        except OSError as e:
+            logger.error(f"Error saving usage totals checkpoint: {e}")
@@ -3,44 +3,108 @@
 Ted OS - 사용량 추적 관리자
 """
 
+import copy
 import json
 import logging
+import os
+import threading
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-
+from typing import Dict, List, Optional, Any, Sequence, TYPE_CHECKING
+
+from ..core.config import (
+    USAGE_FLUSH_BATCH_SIZE,
+    USAGE_FLUSH_INTERVAL_SECONDS,
+    USAGE_FSYNC_POLICY,
+    USAGE_QUERY_PERCENTILES,
+)
 from ..models.data_models import TokenUsage
+from .session_usage import InMemorySessionUsageStore, SessionUsageStore
+from .storage.base import write_json_atomic
+from .usage_columns import HourlyUsageStore
+from .usage_totals import REQUIRED_USAGE_FIELDS, RunningUsageTotals
+
+if TYPE_CHECKING:
+    from .storage import SQLiteUsageStore
 
 logger = logging.getLogger(__name__)
 
 
 class UsageTracker:
-    """토큰 사용량 추적 관리자"""
-
-    def __init__(self, storage_path: str):
+    """
+    토큰 사용량 추적 관리자
+
+    add_usage는 메모리 요약만 갱신하고 기록을 버퍼에 넣습니다.
+    파일/DB 쓰기는 백그라운드 스레드가 batch_size개가 모이거나 flush_interval초마다 한 번에 처리하며,
+    close()는 남은 기록을 모두 저장합니다. flush_interval이 0이면 호출할 때마다 바로 저장합니다.
+    """
+
+    def __init__(
+        self,
+        storage_path: str,
+        store: Optional["SQLiteUsageStore"] = None,
+        session_store: Optional[SessionUsageStore] = None,
+        flush_interval: float = USAGE_FLUSH_INTERVAL_SECONDS,
+        batch_size: int = USAGE_FLUSH_BATCH_SIZE,
+        fsync_policy: str = USAGE_FSYNC_POLICY,
+    ):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.usage_file = self.storage_path / "usage_history.jsonl"
         self.daily_summary_file = self.storage_path / "daily_summary.json"
-
-        # 🔧 세션별 사용량 추적 - Streamlit session_state 활용
-        import streamlit as st
-
-        # session_state에 세션 사용량이 없으면 초기화
-        if "usage_session_start_time" not in st.session_state:
-            st.session_state.usage_session_start_time = datetime.now()
-
-        if "usage_session_data" not in st.session_state:
-            st.session_state.usage_session_data = {
-                "total_tokens": 0,
-                "total_cost": 0.0,
-                "requests": 0,
-                "by_model": {},
-            }
-
-        # 기존 속성들을 session_state 참조로 변경
-        self.session_start_time = st.session_state.usage_session_start_time
-        self.session_usage = st.session_state.usage_session_data
+        # 전체 합계 체크포인트 (히스토리 파일을 매번 다시 읽지 않도록)
+        self.running_totals = RunningUsageTotals(
+            self.usage_file, self.storage_path / "usage_totals.json"
+        )
+        # 분석 조회용 시간별 열 저장소 (조회할 때 히스토리/DB에서 새 기록만 반영)
+        self.hourly_usage = HourlyUsageStore(self.storage_path / "usage_hourly.json")
+        # SQLite 저장소 (지정하면 JSONL/요약 파일 대신 사용, 일별 요약은 집계 쿼리로 계산)
+        self.store = store
+        # 세션별 사용량 (기본은 메모리, Streamlit UI는 session_state 어댑터 사용)
+        self.session_store = session_store or InMemorySessionUsageStore()
+        # daily_summary.json 메모리 사본과 읽을 때의 (mtime, 크기)
+        self._summary: Optional[Dict[str, Any]] = None
+        self._summary_stamp: Optional[tuple] = None
+        self._summary_lock = threading.RLock()
+        # 대시보드 스냅샷 캐시 (기록이 바뀔 때마다 버전 증가)
+        self._usage_version = 0
+        self._snapshot: Optional[tuple] = None  # (키, 스냅샷)
+        # 쓰기 버퍼
+        if fsync_policy not in ("none", "batch"):
+            logger.warning(f"Unknown usage fsync policy '{fsync_policy}', using 'batch'")
+            fsync_policy = "batch"
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+        self.fsync_policy = fsync_policy
+        self._pending: List[TokenUsage] = []  # 아직 쓰지 않은 기록
+        self._inflight: List[TokenUsage] = []  # 쓰는 중인 기록 (합계에 포함)
+        self._summary_dirty = False  # 메모리 요약에 저장하지 않은 변경이 있음
+        self._writing = False  # 요약 파일을 쓰는 중 (외부 변경 감지 중지)
+        self._io_lock = threading.Lock()  # 쓰기 순서 보장 (_summary_lock보다 먼저 잡음)
+        self._wake = threading.Event()
+        self._closing = False
+        self._flusher: Optional[threading.Thread] = None
+        if self.store is None:
+            # 시작할 때 체크포인트 이후의 꼬리만 반영
+            self.running_totals.refresh()
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings,
+        store: Optional["SQLiteUsageStore"] = None,
+        session_store: Optional[SessionUsageStore] = None,
+    ) -> "UsageTracker":
+        """settings의 paths.usage_tracking과 usage_writes 섹션으로 생성"""
+        section = settings.get("usage_writes", {}) or {}
+        return cls(
+            settings.get("paths.usage_tracking"),
+            store=store,
+            session_store=session_store,
+            flush_interval=section.get("flush_interval_seconds", USAGE_FLUSH_INTERVAL_SECONDS),
+            batch_size=section.get("batch_size", USAGE_FLUSH_BATCH_SIZE),
+            fsync_policy=section.get("fsync", USAGE_FSYNC_POLICY),
+        )
 
     def _load_usage_history(self) -> List[TokenUsage]:
         """사용량 히스토리 로드 (안전장치 포함)"""
@@ -62,17 +126,7 @@ class UsageTracker:
                         usage_data = json.loads(line)
 
                         # 필수 필드 검증
-                        required_fields = [
-                            "input_tokens",
-                            "output_tokens",
-                            "total_tokens",
-                            "model_name",
-                            "provider",
-                            "timestamp",
-                            "cost_usd",
-                        ]
-
-                        if all(field in usage_data for field in required_fields):
+                        if all(field in usage_data for field in REQUIRED_USAGE_FIELDS):
                             history.append(TokenUsage.from_dict(usage_data))
                         else:
                             logger.warning(
@@ -110,33 +164,184 @@ class UsageTracker:
         logger.info(f"Loaded {len(history)} usage records from history")
         return history
 
-    def add_usage(self, usage: TokenUsage):
-        """사용량 기록 추가"""
-        try:
-            # JSONL 파일에 추가
-            with open(self.usage_file, "a", encoding="utf-8") as f:
-                json.dump(usage.to_dict(), f, ensure_ascii=False)
-                f.write("\n")
-        except Exception as e:
-            logger.error(f"Error saving usage entry: {e}")
+    def add_usage(self, usage: TokenUsage, session_key: Optional[str] = None):
+        """사용량 기록 추가 (session_key: 채팅 세션 또는 API 클라이언트 ID)"""
+        with self._summary_lock:
+            self._pending.append(usage)
+            if self.store is None:
+                # 메모리 요약은 바로 갱신 (잠금 안에서 더하므로 동시 호출에도 누락 없음)
+                self._apply_to_daily_summary(usage)
+            self._usage_version += 1
+            pending = len(self._pending)
 
         # 세션 사용량 업데이트
-        self._update_session_usage(usage)
+        self._update_session_usage(usage, session_key)
+
+        if self.flush_interval <= 0:
+            self.flush()
+            return
+        self._ensure_flusher()
+        if pending >= self.batch_size:
+            self._wake.set()
+
+    # ---- 쓰기 버퍼 ----
+
+    def _ensure_flusher(self):
+        with self._summary_lock:
+            if self._flusher is not None or self._closing:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="usage-flusher", daemon=True
+            )
+            self._flusher.start()
 
-        # 일간 요약 업데이트
-        self._update_daily_summary(usage)
+    def _flush_loop(self):
+        while not self._closing:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing usage records: {e}")
+
+    def flush(self) -> int:
+        """버퍼의 기록과 요약을 저장하고 저장한 기록 수 반환"""
+        with self._io_lock:
+            with self._summary_lock:
+                batch, self._pending = self._pending, []
+                summary = None
+                if self.store is None and self._summary_dirty:
+                    summary = copy.deepcopy(self._summary)  # 잠금 밖에서 쓸 스냅샷
+                    self._summary_dirty = False
+                    self._writing = True
+                self._inflight = batch
+            if not batch and summary is None:
+                return 0
+
+            appended = False
+            try:
+                if self.store:
+                    self.store.add_many(batch)
+                else:
+                    if batch:
+                        self._append_history(batch)
+                        appended = True
+                    if summary is not None:
+                        write_json_atomic(
+                            self.daily_summary_file,
+                            summary,
+                            indent=2,
+                            fsync=self.fsync_policy == "batch",
+                        )
+                written = len(batch)
+            except Exception as e:
+                logger.error(f"Error saving usage records: {e}")
+                with self._summary_lock:
+                    # 다음 저장 때 다시 시도 (히스토리에 이미 쓴 기록은 제외)
+                    if not appended:
+                        self._pending[:0] = batch
+                    self._summary_dirty = self._summary_dirty or summary is not None
+                written = 0
+            finally:
+                with self._summary_lock:
+                    self._inflight = []
+                    if summary is not None:
+                        self._writing = False
+                        self._summary_stamp = self._file_stamp()
+            return written
+
+    def _fsync(self, f):
+        if self.fsync_policy == "batch":
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _append_history(self, batch: List[TokenUsage]):
+        """
+        JSONL 파일에 한 번에 추가하고 누적 합계에 반영
+
+        쓰기, 누적 합계 반영, 쓰는 중 목록 비우기를 한 잠금 안에서 처리하므로
+        그 사이에 합계를 읽어도 같은 기록을 두 번 세지 않습니다. fsync는 잠금 밖에서 합니다.
+        """
+        lines = "".join(
+            json.dumps(usage.to_dict(), ensure_ascii=False) + "\n" for usage in batch
+        )
+        with open(self.usage_file, "a", encoding="utf-8") as f:
+            with self._summary_lock:
+                f.write(lines)
+                f.flush()
+                self.running_totals.refresh()
+                self._inflight = []
+            try:
+                self._fsync(f)
+            except OSError as e:
+                # 이미 파일에 쓴 기록이므로 다시 넣지 않음
+                logger.error(f"Error syncing usage history: {e}")
+
+    def close(self):
+        """백그라운드 쓰기를 멈추고 남은 기록 저장 (여러 번 호출해도 안전)"""
+        with self._summary_lock:
+            self._closing = True
+            flusher = self._flusher
+        self._wake.set()
+        if flusher is not None:
+            flusher.join()
+        self.flush()
+        self.hourly_usage.save()
+
+    def _pending_totals(self) -> Dict[str, Any]:
+        """아직 파일/DB에 반영되지 않은 기록의 합계"""
+        with self._summary_lock:
+            unsaved = self._pending + self._inflight
+        return {
+            "total_tokens": sum(u.total_tokens for u in unsaved),
+            "total_cost": sum(u.cost_usd for u in unsaved),
+            "total_requests": len(unsaved),
+            "total_retries": sum(u.retries for u in unsaved),
+        }
 
-    def _update_daily_summary(self, usage: TokenUsage):
-        """일간 요약 업데이트"""
-        today = datetime.now().date().isoformat()
-        summary = {}
+    # ---- 일간 요약 ----
 
-        if self.daily_summary_file.exists():
-            try:
-                with open(self.daily_summary_file, "r", encoding="utf-8") as f:
-                    summary = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                summary = {}
+    def _file_stamp(self) -> Optional[tuple]:
+        try:
+            stat = self.daily_summary_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_daily_summary(self) -> Dict[str, Any]:
+        """
+        daily_summary.json 내용 (메모리 사본)
+
+        파일이 이 프로세스 밖에서 바뀐 경우(mtime/크기 변경)에만 다시 읽습니다.
+        저장하지 않은 변경이 있거나 쓰는 중이면 메모리 사본이 최신입니다.
+        반환값은 캐시 자체이므로 호출하는 쪽에서 수정하지 않습니다.
+        """
+        with self._summary_lock:
+            if self._summary is not None:
+                if self._summary_dirty or self._writing:
+                    return self._summary
+                stamp = self._file_stamp()
+                if stamp == self._summary_stamp:
+                    return self._summary
+            else:
+                stamp = self._file_stamp()
+
+            summary = {}
+            if stamp is not None:
+                try:
+                    with open(self.daily_summary_file, "r", encoding="utf-8") as f:
+                        summary = json.load(f)
+                except (json.JSONDecodeError, FileNotFoundError):
+                    summary = {}
+            self._summary = summary
+            self._summary_stamp = stamp
+            self._usage_version += 1
+            return summary
+
+    def _apply_to_daily_summary(self, usage: TokenUsage):
+        """메모리 요약에 기록 반영 (잠금을 잡은 상태에서 호출, 파일은 flush에서 저장)"""
+        today = datetime.now().date().isoformat()
+        summary = self._read_daily_summary()
 
         # 오늘 데이터 업데이트
         day_data = summary.setdefault(
@@ -146,6 +351,7 @@ class UsageTracker:
         day_data["total_tokens"] += usage.total_tokens
         day_data["total_cost"] = round(day_data["total_cost"] + usage.cost_usd, 6)
         day_data["requests"] += 1
+        day_data["retries"] = day_data.get("retries", 0) + usage.retries
 
         # 모델별 통계
         model_key = f"{usage.provider}_{usage.model_name}"
@@ -157,33 +363,34 @@ class UsageTracker:
         model_stats["cost"] = round(model_stats["cost"] + usage.cost_usd, 6)
         model_stats["requests"] += 1
 
-        # 파일 저장
-        try:
-            with open(self.daily_summary_file, "w", encoding="utf-8") as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Error saving daily summary: {e}")
+        self._summary_dirty = True
 
     def get_total_usage_from_history(self) -> dict:
         """전체 사용량 (히스토리 기반)"""
-        all_history = self._load_usage_history()
-        return {
-            "total_tokens": sum(u.total_tokens for u in all_history),
-            "total_cost": round(sum(u.cost_usd for u in all_history), 6),
-            "total_requests": len(all_history),
-        }
+        if self.store:
+            self.flush()
+            return self.store.totals()
+
+        # 파일에 반영된 합계 + 아직 버퍼에 있는 기록 (flush가 쓰는 도중에도 일관되게 같은 잠금 안에서)
+        with self._summary_lock:
+            totals = self.running_totals.totals()
+            pending = self._pending_totals()
+        if pending["total_requests"]:
+            totals = {key: totals[key] + pending[key] for key in totals}
+            totals["total_cost"] = round(totals["total_cost"], 6)
+        return totals
 
     def get_today_usage_from_summary(self) -> dict:
         """오늘 사용량 (요약 기반)"""
         today = datetime.now().date().isoformat()
         summary = {}
 
-        if self.daily_summary_file.exists():
-            try:
-                with open(self.daily_summary_file, "r", encoding="utf-8") as f:
-                    summary = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
+        if self.store:
+            self.flush()
+            today_date = datetime.now().date()
+            summary = self.store.daily_summary(today_date, today_date)
+        else:
+            summary = self._read_daily_summary()
 
         today_data = summary.get(
             today, {"total_tokens": 0, "total_cost": 0.0, "requests": 0}
@@ -193,28 +400,28 @@ class UsageTracker:
             "total_tokens": today_data["total_tokens"],
             "total_cost": round(today_data["total_cost"], 6),
             "total_requests": today_data["requests"],
+            "total_retries": today_data.get("retries", 0),
         }
 
     def get_usage_by_date_range(
         self, start_date: date, end_date: date
     ) -> Dict[str, Dict[str, Any]]:
         """날짜 범위별 사용량"""
-        summary = {}
-
-        if self.daily_summary_file.exists():
-            try:
-                with open(self.daily_summary_file, "r", encoding="utf-8") as f:
-                    all_summary = json.load(f)
+        if self.store:
+            self.flush()
+            return self.store.daily_summary(start_date, end_date)
 
-                current_date = start_date
-                while current_date <= end_date:
-                    date_str = current_date.isoformat()
-                    if date_str in all_summary:
-                        summary[date_str] = all_summary[date_str]
-                    current_date += timedelta(days=1)
+        summary = {}
+        with self._summary_lock:
+            all_summary = self._read_daily_summary()
 
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
+            # add_usage가 메모리 요약을 바로 고치므로 복사본을 돌려줌
+            current_date = start_date
+            while current_date <= end_date:
+                date_str = current_date.isoformat()
+                if date_str in all_summary:
+                    summary[date_str] = copy.deepcopy(all_summary[date_str])
+                current_date += timedelta(days=1)
 
         return summary
 
@@ -337,35 +544,163 @@ class UsageTracker:
 
         return 0.0
 
+    def get_usage_snapshot(
+        self, model_days: int = 30, trend_days: int = 7
+    ) -> Dict[str, Any]:
+        """
+        대시보드용 사용량 통계 전체 (/api/status/usage)
+
+        일별 요약을 한 번만 가져와 한 번의 순회로 오늘/주간/월간/모델별/추세/예상 비용을 계산합니다.
+        결과는 기록이 추가되거나 날짜가 바뀔 때까지 캐시하므로 평상시에는 디스크를 읽지 않습니다.
+        반환값은 캐시와 공유하므로 호출하는 쪽에서 수정하지 않습니다.
+        """
+        today = datetime.now().date()
+        with self._summary_lock:
+            if self.store is None:
+                self._read_daily_summary()  # 파일이 밖에서 바뀌었으면 버전이 올라감
+            key = (self._usage_version, today, model_days, trend_days)
+            if self._snapshot is not None and self._snapshot[0] == key:
+                return self._snapshot[1]
+
+        week_start = today - timedelta(days=6)
+        month_start = today.replace(day=1)
+        model_start = today - timedelta(days=model_days - 1)
+        trend_start = today - timedelta(days=trend_days - 1)
+        daily = self.get_usage_by_date_range(
+            min(week_start, month_start, model_start, trend_start), today
+        )
+
+        empty_day = {"total_tokens": 0, "total_cost": 0.0, "requests": 0}
+        periods = {
+            "weekly": (week_start, {}),
+            "monthly": (month_start, {}),
+        }
+        model_stats: Dict[str, Dict[str, Any]] = {}
+        for date_str, day_data in daily.items():
+            day = date.fromisoformat(date_str)
+            for start, breakdown in periods.values():
+                if day >= start:
+                    breakdown[date_str] = day_data
+            if day >= model_start:
+                for model_key, model_data in day_data.get("by_model", {}).items():
+                    stats = model_stats.setdefault(
+                        model_key, {"tokens": 0, "cost": 0.0, "requests": 0}
+                    )
+                    stats["tokens"] += model_data.get("tokens", 0)
+                    stats["cost"] += model_data.get("cost", 0.0)
+                    stats["requests"] += model_data.get("requests", 0)
+        for stats in model_stats.values():
+            stats["cost"] = round(stats["cost"], 6)
+
+        def period_usage(start: date, breakdown: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "period": f"{start.isoformat()} ~ {today.isoformat()}",
+                "total_tokens": sum(d.get("total_tokens", 0) for d in breakdown.values()),
+                "total_cost": round(
+                    sum(d.get("total_cost", 0.0) for d in breakdown.values()), 6
+                ),
+                "total_requests": sum(d.get("requests", 0) for d in breakdown.values()),
+                "daily_breakdown": breakdown,
+            }
+
+        weekly = period_usage(*periods["weekly"])
+        monthly = period_usage(*periods["monthly"])
+        today_data = daily.get(today.isoformat(), empty_day)
+
+        trends = []
+        for offset in range(trend_days):
+            date_str = (trend_start + timedelta(days=offset)).isoformat()
+            day_stats = daily.get(date_str, empty_day)
+            trends.append(
+                {
+                    "date": date_str,
+                    "tokens": day_stats["total_tokens"],
+                    "cost": round(day_stats["total_cost"], 6),
+                    "requests": day_stats["requests"],
+                }
+            )
+
+        days_elapsed = (today - month_start).days + 1
+        snapshot = {
+            "total_usage": self.get_total_usage_from_history(),
+            "today_usage": {
+                "total_tokens": today_data["total_tokens"],
+                "total_cost": round(today_data["total_cost"], 6),
+                "total_requests": today_data["requests"],
+                "total_retries": today_data.get("retries", 0),
+            },
+            "weekly_usage": weekly,
+            "monthly_usage": monthly,
+            "usage_by_model": model_stats,
+            "usage_trends": trends,
+            # 일평균 * 한달 일수(30일 평균)
+            "estimated_monthly_cost": round(monthly["total_cost"] / days_elapsed * 30, 6),
+        }
+
+        with self._summary_lock:
+            # 계산하는 동안 기록이 추가됐으면 다음 요청에서 다시 계산
+            if self._usage_version == key[0]:
+                self._snapshot = (key, snapshot)
+        return snapshot
+
+    def query_usage(
+        self,
+        start: datetime,
+        end: datetime,
+        group_by: Sequence[str] = (),
+        bucket: str = "day",
+        percentiles: Sequence[float] = USAGE_QUERY_PERCENTILES,
+    ) -> Dict[str, Any]:
+        """
+        임의 범위의 사용량 분석 조회 (/api/status/usage/query)
+
+        버퍼의 기록을 저장한 뒤 시간별 열 저장소에 새 기록만 반영하고 집계합니다.
+        형식은 HourlyUsageStore.query 참고 (bucket/group_by가 잘못되면 ValueError)
+        """
+        self.flush()
+        if self.store:
+            self.hourly_usage.catch_up_rows(self.store)
+        else:
+            self.hourly_usage.catch_up_history(self.usage_file)
+        return self.hourly_usage.query(start, end, group_by, bucket, percentiles)
+
     def cleanup_old_data(self, keep_days: int = 90) -> int:
         """오래된 데이터 정리"""
         cutoff_date = datetime.now().date() - timedelta(days=keep_days)
 
-        # 일간 요약에서 오래된 데이터 제거
+        if self.store:
+            self.flush()
+            removed_days = self.store.delete_before(cutoff_date)
+            if removed_days:
+                self.hourly_usage.reset()
+            with self._summary_lock:
+                self._usage_version += 1
+            logger.info(f"Cleaned up {removed_days} days of old usage data")
+            return removed_days
+
+        # 일간 요약에서 오래된 데이터 제거 (메모리 요약을 고친 뒤 저장)
         removed_days = 0
-        if self.daily_summary_file.exists():
-            try:
-                with open(self.daily_summary_file, "r", encoding="utf-8") as f:
-                    summary = json.load(f)
+        with self._summary_lock:
+            summary = self._read_daily_summary()
 
-                keys_to_remove = []
-                for date_str in summary.keys():
-                    try:
-                        file_date = datetime.fromisoformat(date_str).date()
-                        if file_date < cutoff_date:
-                            keys_to_remove.append(date_str)
-                    except ValueError:
-                        continue
-
-                for key in keys_to_remove:
-                    del summary[key]
-                    removed_days += 1
-
-                with open(self.daily_summary_file, "w", encoding="utf-8") as f:
-                    json.dump(summary, f, indent=2, ensure_ascii=False)
-
-            except Exception as e:
-                logger.error(f"Error during cleanup: {e}")
+            keys_to_remove = []
+            for date_str in summary.keys():
+                try:
+                    file_date = datetime.fromisoformat(date_str).date()
+                    if file_date < cutoff_date:
+                        keys_to_remove.append(date_str)
+                except ValueError:
+                    continue
+
+            for key in keys_to_remove:
+                del summary[key]
+                removed_days += 1
+
+            if removed_days:
+                self._summary_dirty = True
+                self._usage_version += 1
+        if removed_days:
+            self.flush()
 
         logger.info(f"Cleaned up {removed_days} days of old usage data")
         return removed_days
@@ -378,14 +713,11 @@ class UsageTracker:
             data = self.get_usage_by_date_range(start_date, end_date)
         else:
             # 전체 데이터
-            if self.daily_summary_file.exists():
-                try:
-                    with open(self.daily_summary_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                except Exception:
-                    data = {}
+            if self.store:
+                self.flush()
+                data = self.store.daily_summary()
             else:
-                data = {}
+                data = copy.deepcopy(self._read_daily_summary())
 
         return {
             "exported_at": datetime.now().isoformat(),
@@ -402,62 +734,17 @@ class UsageTracker:
             },
         }
 
-    def _update_session_usage(self, usage: TokenUsage):
-        """세션 사용량 업데이트 (session_state 사용)"""
-        import streamlit as st
-
-        # session_state에서 직접 업데이트
-        st.session_state.usage_session_data["total_tokens"] += usage.total_tokens
-        st.session_state.usage_session_data["total_cost"] = round(
-            st.session_state.usage_session_data["total_cost"] + usage.cost_usd, 6
-        )
-        st.session_state.usage_session_data["requests"] += 1
-
-        # 모델별 통계
-        model_key = f"{usage.provider}_{usage.model_name}"
-        model_stats = st.session_state.usage_session_data["by_model"].setdefault(
-            model_key, {"tokens": 0, "cost": 0.0, "requests": 0}
-        )
-
-        model_stats["tokens"] += usage.total_tokens
-        model_stats["cost"] = round(model_stats["cost"] + usage.cost_usd, 6)
-        model_stats["requests"] += 1
-
-        # 로컬 참조도 업데이트
-        self.session_usage = st.session_state.usage_session_data
-
-    def get_session_usage(self) -> Dict[str, Any]:
-        """현재 세션 사용량 반환 (session_state 사용)"""
-        import streamlit as st
-
-        # session_state에서 최신 데이터 가져오기
-        session_start = st.session_state.usage_session_start_time
-        session_data = st.session_state.usage_session_data
-
-        session_duration = datetime.now() - session_start
-
-        return {
-            "session_start": session_start.isoformat(),
-            "session_duration_minutes": round(session_duration.total_seconds() / 60, 2),
-            "total_tokens": session_data["total_tokens"],
-            "total_cost": round(session_data["total_cost"], 6),
-            "total_requests": session_data["requests"],
-            "by_model": session_data["by_model"],
-        }
+    def _update_session_usage(self, usage: TokenUsage, session_key: Optional[str] = None):
+        """세션 사용량 업데이트"""
+        try:
+            self.session_store.record(usage, session_key)
+        except Exception as e:
+            logger.error(f"Error updating session usage: {e}")
 
-    def reset_session_usage(self):
-        """세션 사용량 리셋 (새 세션 시작시 사용) - session_state 사용"""
-        import streamlit as st
-
-        # session_state 초기화
-        st.session_state.usage_session_start_time = datetime.now()
-        st.session_state.usage_session_data = {
-            "total_tokens": 0,
-            "total_cost": 0.0,
-            "requests": 0,
-            "by_model": {},
-        }
+    def get_session_usage(self, session_key: Optional[str] = None) -> Dict[str, Any]:
+        """세션 사용량 반환 (session_key를 생략하면 기본 세션)"""
+        return self.session_store.get(session_key)
 
-        # 로컬 참조도 업데이트
-        self.session_start_time = st.session_state.usage_session_start_time
-        self.session_usage = st.session_state.usage_session_data
+    def reset_session_usage(self, session_key: Optional[str] = None):
+        """세션 사용량 리셋 (새 세션 시작시 사용)"""
+        self.session_store.reset(session_key)
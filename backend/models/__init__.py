@@ -4,7 +4,15 @@ Ted OS 데이터 모델
 """
 
 from .enums import ModelProvider, MessageRole, UIPage, LogLevel
-from .data_models import ModelConfig, TokenUsage, ChatSession, AppState
+from .data_models import (
+    ModelConfig,
+    TokenUsage,
+    ChatSession,
+    SessionSummary,
+    SearchMatch,
+    SessionSearchResult,
+    AppState,
+)
 from .model_registry import ModelRegistry
 
 __all__ = [
@@ -17,6 +25,9 @@ __all__ = [
     "ModelConfig",
     "TokenUsage",
     "ChatSession",
+    "SessionSummary",
+    "SearchMatch",
+    "SessionSearchResult",
     "AppState",
     # Registry
     "ModelRegistry",
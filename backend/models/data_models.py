@@ -6,9 +6,10 @@ Ted OS - 데이터 모델 정의
 import logging
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from .enums import ModelProvider
+from ..core.config import MAX_CONTEXT_TOKENS
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,7 @@ class ModelConfig:
     description: str = ""
     input_cost_per_1k: float = 0.0  # USD per 1K input tokens
     output_cost_per_1k: float = 0.0  # USD per 1K output tokens
+    context_window: int = MAX_CONTEXT_TOKENS  # 입력 + 출력 토큰 한도
 
 
 @dataclass
@@ -40,6 +42,7 @@ class TokenUsage:
     provider: str
     timestamp: datetime
     cost_usd: float = 0.0
+    retries: int = 0  # 일시적 오류로 다시 시도한 횟수
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
@@ -89,6 +92,78 @@ class ChatSession:
         )
 
 
+@dataclass
+class SessionSummary:
+    """세션 목록용 요약 정보 (메시지 본문 제외)"""
+
+    id: str
+    title: str
+    created_at: datetime
+    updated_at: datetime
+    message_count: int = 0
+    is_pinned: bool = False
+    preview: str = ""  # 마지막 메시지 미리보기
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환"""
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        data["updated_at"] = self.updated_at.isoformat()
+        return data
+
+    @classmethod
+    def from_index_entry(cls, session_id: str, entry: dict) -> "SessionSummary":
+        """세션 인덱스 항목에서 객체 생성"""
+        return cls(
+            id=session_id,
+            title=entry.get("title", ""),
+            created_at=datetime.fromisoformat(entry["created_at"]),
+            updated_at=datetime.fromisoformat(entry["updated_at"]),
+            message_count=entry.get("message_count", 0),
+            is_pinned=entry.get("is_pinned", False),
+            preview=entry.get("preview", ""),
+        )
+
+
+@dataclass
+class SearchMatch:
+    """검색어가 일치한 메시지 하나"""
+
+    message_index: int  # 세션 내 메시지 위치 (-1이면 제목)
+    role: str
+    snippet: str
+    offset: int  # 메시지 본문에서 snippet이 시작하는 위치
+    highlights: List[Tuple[int, int]] = field(default_factory=list)  # snippet 기준 (시작, 끝)
+    score: float = 0.0
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환"""
+        data = asdict(self)
+        data["highlights"] = [list(h) for h in self.highlights]
+        return data
+
+
+@dataclass
+class SessionSearchResult:
+    """세션 단위 검색 결과 (점수 순)"""
+
+    session_id: str
+    title: str
+    updated_at: datetime
+    score: float
+    matches: List[SearchMatch] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환"""
+        return {
+            "session_id": self.session_id,
+            "title": self.title,
+            "updated_at": self.updated_at.isoformat(),
+            "score": self.score,
+            "matches": [m.to_dict() for m in self.matches],
+        }
+
+
 @dataclass
 class AppState:
     """애플리케이션 상태 정보"""
@@ -9,6 +9,7 @@ import os
 from typing import Dict, List, Optional
 
 from .data_models import ModelConfig
+from ..core.config import MAX_CONTEXT_TOKENS
 from .enums import ModelProvider
 
 logger = logging.getLogger(__name__)
@@ -97,6 +98,9 @@ class ModelRegistry:
                             output_cost_per_1k=model_data.get(
                                 "output_cost_per_1k", 0.0
                             ),
+                            context_window=model_data.get(
+                                "context_window", MAX_CONTEXT_TOKENS
+                            ),
                         )
                         models[model_key] = model_config
 
@@ -53,6 +53,7 @@ class ApiTester:
                         provider_display_name=provider_enum.name.capitalize(),
                         max_tokens=50,
                         temperature=0.1,
+                        cacheable=False,  # 연결 테스트는 항상 실제 API 호출
                     )
 
                     st.success(f"✅ {selected_provider} API 연결 성공!")
@@ -50,6 +50,10 @@ class DataInspector:
                 deleted = self.chat_manager.cleanup_empty_sessions()
                 st.success(f"{deleted}개의 빈 세션을 정리했습니다.")
                 st.rerun()
+            if st.button("통계 재계산", key="rebuild_session_stats_btn"):
+                self.chat_manager.rebuild_session_statistics()
+                st.success("세션 통계를 다시 계산했습니다.")
+                st.rerun()
 
         # 현재 세션 상세 정보
         current_session = st.session_state.get("current_session")
@@ -83,17 +87,19 @@ class DataInspector:
         # 전체 세션 목록
         st.subheader("전체 세션 목록")
 
-        all_sessions = self.chat_manager.get_all_sessions()
-        if all_sessions:
+        # 인덱스 기반 요약만 조회 (최대 20개만 표시)
+        summaries, _ = self.chat_manager.list_session_summaries(limit=20)
+        total_sessions = len(self.chat_manager.index)
+        if summaries:
             session_data = []
-            for session in all_sessions[:20]:  # 최대 20개만 표시
+            for summary in summaries:
                 session_data.append(
                     {
-                        "ID": session.id[:8] + "...",
-                        "제목": session.title[:30]
-                        + ("..." if len(session.title) > 30 else ""),
-                        "메시지": len(session.messages),
-                        "수정일": session.updated_at.strftime("%Y-%m-%d %H:%M"),
+                        "ID": summary.id[:8] + "...",
+                        "제목": summary.title[:30]
+                        + ("..." if len(summary.title) > 30 else ""),
+                        "메시지": summary.message_count,
+                        "수정일": summary.updated_at.strftime("%Y-%m-%d %H:%M"),
                     }
                 )
 
@@ -102,8 +108,8 @@ class DataInspector:
             df = pd.DataFrame(session_data)
             st.dataframe(df, use_container_width=True)
 
-            if len(all_sessions) > 20:
-                st.info(f"+ {len(all_sessions) - 20}개 더 있음")
+            if total_sessions > 20:
+                st.info(f"+ {total_sessions - 20}개 더 있음")
         else:
             st.info("저장된 세션이 없습니다.")
 
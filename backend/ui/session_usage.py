@@ -0,0 +1,42 @@
+# ted-os-project/backend/ui/session_usage.py
+"""
+Ted OS - Streamlit session_state에 세션 사용량을 저장하는 어댑터 (레거시 UI 전용)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+from ..managers.session_usage import (
+    SessionUsageStore,
+    apply_usage,
+    empty_session_usage,
+    session_usage_report,
+)
+from ..models.data_models import TokenUsage
+
+
+class StreamlitSessionUsageStore(SessionUsageStore):
+    """브라우저 세션마다 하나인 session_state를 쓰므로 session_key는 무시"""
+
+    def _ensure(self):
+        if "usage_session_start_time" not in st.session_state:
+            st.session_state.usage_session_start_time = datetime.now()
+        if "usage_session_data" not in st.session_state:
+            st.session_state.usage_session_data = empty_session_usage()
+
+    def record(self, usage: TokenUsage, session_key: Optional[str] = None):
+        self._ensure()
+        apply_usage(st.session_state.usage_session_data, usage)
+
+    def get(self, session_key: Optional[str] = None) -> Dict[str, Any]:
+        self._ensure()
+        return session_usage_report(
+            st.session_state.usage_session_start_time,
+            st.session_state.usage_session_data,
+        )
+
+    def reset(self, session_key: Optional[str] = None):
+        st.session_state.usage_session_start_time = datetime.now()
+        st.session_state.usage_session_data = empty_session_usage()
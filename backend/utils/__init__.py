@@ -9,7 +9,8 @@ from .logging_handler import (
     get_app_logger,
     get_log_handler,
 )
-from .output_renderer import OutputRenderer, SpecializedRenderer
+from .output_renderer import OutputRenderer, SpecializedRenderer, StreamingRenderer
+from .token_counter import TokenCounter, get_token_counter
 from .helpers import *
 
 __all__ = [
@@ -21,6 +22,10 @@ __all__ = [
     # Output Processing
     "OutputRenderer",
     "SpecializedRenderer",
+    "StreamingRenderer",
+    # Token Counting
+    "TokenCounter",
+    "get_token_counter",
     # Helper functions (exported from helpers.py)
     "generate_id",
     "generate_short_id",
@@ -0,0 +1,101 @@
+# ted-os-project/backend/utils/async_stream.py
+"""
+Ted OS - 동기 스트림을 이벤트 루프를 막지 않고 소비하기 위한 브리지
+
+동기 제너레이터(제공업체 SDK 스트림)는 전용 스레드 풀에서 돌리고,
+청크는 asyncio.Queue로 이벤트 루프에 전달합니다.
+버퍼가 가득 차면 생산 스레드가 기다리므로 느린 클라이언트 때문에 메모리가 늘지 않습니다.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterable, Optional, Union
+
+from ..core.config import STREAM_BRIDGE_BUFFER_SIZE, STREAM_BRIDGE_MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_DONE = object()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """스트림 전용 스레드 풀 (요청 처리용 기본 풀과 분리)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=STREAM_BRIDGE_MAX_WORKERS, thread_name_prefix="stream-bridge"
+            )
+        return _executor
+
+
+async def iterate_in_thread(
+    stream: Union[Iterable[Any], AsyncIterator[Any]],
+    buffer_size: int = STREAM_BRIDGE_BUFFER_SIZE,
+) -> AsyncIterator[Any]:
+    """
+    동기 이터러블을 스레드에서 돌려 비동기로 소비 (비동기 이터레이터는 그대로 전달)
+
+    소비 측이 중간에 멈추면(클라이언트 연결 종료 등) 생산 스레드에서 제너레이터를 닫아
+    제공업체 스트림도 정리되도록 합니다.
+    """
+    if hasattr(stream, "__aiter__"):
+        async for item in stream:
+            yield item
+        return
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = threading.Semaphore(buffer_size)
+    stopped = threading.Event()
+
+    def produce():
+        iterator = iter(stream)
+        try:
+            for item in iterator:
+                # 버퍼 자리가 날 때까지 대기 (소비 측이 멈추면 종료)
+                while not slots.acquire(timeout=0.1):
+                    if stopped.is_set():
+                        return
+                if stopped.is_set():
+                    return
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            loop.call_soon_threadsafe(queue.put_nowait, _DONE)
+        except BaseException as e:
+            if not stopped.is_set():
+                loop.call_soon_threadsafe(queue.put_nowait, _Failure(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"Error closing stream: {e}")
+
+    producer = loop.run_in_executor(_get_executor(), produce)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        stopped.set()
+        slots.release()  # 대기 중인 생산 스레드 깨우기
+        if producer.done():
+            producer.result()
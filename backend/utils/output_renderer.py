@@ -5,13 +5,66 @@ Ted OS - 출력 렌더러
 
 import re
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+# 후처리 패턴 (모듈 로드 시 한 번만 컴파일)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_HEADER_RE = re.compile(r"\n(#+)\s*([^\n]+)\s*\n")
+_BULLET_SPACING_RE = re.compile(r"\n(\s*)([-*+])\s+")
+_FENCE_OPEN_BLANKS_RE = re.compile(r"```(\w+)?\n\n+")
+_FENCE_CLOSE_BLANKS_RE = re.compile(r"\n\n+```")
+_INLINE_CODE_RE = re.compile(r"`\s+([^`]+)\s+`")
+_CODE_BLOCK_RE = re.compile(r"```(\w+)?\n(.*?)\n```", re.DOTALL)
+_LIST_ITEM_RE = re.compile(r"\s*(?:\d+\.|[-*+])\s+")  # 번호 또는 불릿 목록 항목
+
+# 메타데이터/특수 렌더러 패턴
+_HAS_LIST_RE = re.compile(r"^\s*[-*+\d]+\.\s+", re.MULTILINE)
+_HAS_HEADER_RE = re.compile(r"^#+\s+", re.MULTILINE)
+_HTML_HEADER_RE = re.compile(r"^(#{1,3}) (.+)$", re.MULTILINE)
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.+?)\*")
+_INLINE_CODE_SPAN_RE = re.compile(r"`(.+?)`")
+_STRIP_HEADER_RE = re.compile(r"^#+\s+(.+)$", re.MULTILINE)
+_STRIP_CODE_BLOCK_RE = re.compile(r"```[\w]*\n(.*?)\n```", re.DOTALL)
+_STRIP_BULLET_RE = re.compile(r"^\s*[-*+]\s+", re.MULTILINE)
+_STRIP_NUMBERED_RE = re.compile(r"^\s*\d+\.\s+", re.MULTILINE)
+
+
+def _guess_code_lang(match: "re.Match") -> str:
+    """언어가 없는 코드 블록에 언어 추론"""
+    lang = match.group(1) or ""
+    code = match.group(2)
+
+    if not lang and code:
+        if "def " in code or "import " in code or "print(" in code:
+            lang = "python"
+        elif "function " in code or "const " in code or "let " in code:
+            lang = "javascript"
+        elif (
+            "<" in code
+            and ">" in code
+            and ("html" in code.lower() or "div" in code.lower())
+        ):
+            lang = "html"
+        elif (
+            "{" in code
+            and "}" in code
+            and ("background" in code or "color" in code)
+        ):
+            lang = "css"
+
+    return f"```{lang}\n{code}\n```"
+
 
 class OutputRenderer:
-    """AI 출력 텍스트 렌더링 및 후처리"""
+    """
+    AI 출력 텍스트 렌더링 및 후처리
+
+    패턴은 미리 컴파일해 두고, 대상 문자(``` , `, #)가 없는 단계는 건너뜁니다.
+    목록 정리는 줄마다 한 번만 분류하는 단일 패스입니다.
+    """
 
     def __init__(self):
         self.post_processors = [
@@ -39,97 +92,63 @@ class OutputRenderer:
     def _clean_whitespace(self, text: str) -> str:
         """공백 정리"""
         # 연속된 빈 줄 제거 (최대 2개까지만 허용)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        if "\n\n\n" in text:
+            text = _BLANK_LINES_RE.sub("\n\n", text)
 
         # 줄 끝 공백 제거
-        lines = text.split("\n")
-        cleaned_lines = [line.rstrip() for line in lines]
-
-        return "\n".join(cleaned_lines)
+        return "\n".join([line.rstrip() for line in text.split("\n")])
 
     def _fix_markdown_formatting(self, text: str) -> str:
         """마크다운 형식 수정"""
         # 제목 앞뒤 공백 정리
-        text = re.sub(r"\n(#+)\s*([^\n]+)\s*\n", r"\n\1 \2\n\n", text)
+        if "#" in text:
+            text = _HEADER_RE.sub(r"\n\1 \2\n\n", text)
 
         # 목록 항목 들여쓰기 정리
-        text = re.sub(r"\n(\s*)([-*+])\s+", r"\n\1\2 ", text)
+        text = _BULLET_SPACING_RE.sub(r"\n\1\2 ", text)
 
         # 코드 블록 정리
-        text = re.sub(r"```(\w+)?\n\n+", r"```\1\n", text)
-        text = re.sub(r"\n\n+```", r"\n```", text)
+        if "```" in text:
+            text = _FENCE_OPEN_BLANKS_RE.sub(r"```\1\n", text)
+            text = _FENCE_CLOSE_BLANKS_RE.sub(r"\n```", text)
 
         return text
 
     def _enhance_code_blocks(self, text: str) -> str:
         """코드 블록 개선"""
+        if "`" not in text:
+            return text
+
         # 인라인 코드 정리
-        text = re.sub(r"`\s+([^`]+)\s+`", r"`\1`", text)
+        text = _INLINE_CODE_RE.sub(r"`\1`", text)
 
         # 코드 블록 언어 지정 개선
-        def improve_code_lang(match):
-            lang = match.group(1) or ""
-            code = match.group(2)
-
-            # 언어 추론
-            if not lang and code:
-                if "def " in code or "import " in code or "print(" in code:
-                    lang = "python"
-                elif "function " in code or "const " in code or "let " in code:
-                    lang = "javascript"
-                elif (
-                    "<" in code
-                    and ">" in code
-                    and ("html" in code.lower() or "div" in code.lower())
-                ):
-                    lang = "html"
-                elif (
-                    "{" in code
-                    and "}" in code
-                    and ("background" in code or "color" in code)
-                ):
-                    lang = "css"
-
-            return f"```{lang}\n{code}\n```"
-
-        text = re.sub(
-            r"```(\w+)?\n(.*?)\n```", improve_code_lang, text, flags=re.DOTALL
-        )
+        if "```" in text:
+            text = _CODE_BLOCK_RE.sub(_guess_code_lang, text)
 
         return text
 
     def _fix_list_formatting(self, text: str) -> str:
-        """목록 형식 수정"""
+        """목록 형식 수정 (앞 줄이 목록이 아닌 내용이면 목록 앞에 빈 줄 추가)"""
         lines = text.split("\n")
         fixed_lines = []
+        append = fixed_lines.append
+        match_item = _LIST_ITEM_RE.match
 
-        for i, line in enumerate(lines):
-            # 번호 목록 정리
-            if re.match(r"^\s*\d+\.\s+", line):
-                # 앞에 빈 줄이 없고 이전 줄이 목록이 아니면 빈 줄 추가
-                if (
-                    i > 0
-                    and lines[i - 1].strip()
-                    and not re.match(r"^\s*\d+\.\s+", lines[i - 1])
-                    and not re.match(r"^\s*[-*+]\s+", lines[i - 1])
-                ):
-                    fixed_lines.append("")
-
-            # 불릿 목록 정리
-            elif re.match(r"^\s*[-*+]\s+", line):
-                # 앞에 빈 줄이 없고 이전 줄이 목록이 아니면 빈 줄 추가
-                if (
-                    i > 0
-                    and lines[i - 1].strip()
-                    and not re.match(r"^\s*\d+\.\s+", lines[i - 1])
-                    and not re.match(r"^\s*[-*+]\s+", lines[i - 1])
-                ):
-                    fixed_lines.append("")
-
-            fixed_lines.append(line)
+        previous_is_text = False  # 이전 줄이 목록이 아닌 내용 줄인지
+        for line in lines:
+            is_item = match_item(line) is not None
+            if is_item and previous_is_text:
+                append("")
+            append(line)
+            previous_is_text = not is_item and bool(line.strip())
 
         return "\n".join(fixed_lines)
 
+    def stream_renderer(self) -> "StreamingRenderer":
+        """스트리밍 응답용 렌더러 (청크는 그대로, 후처리는 끝에서 한 번)"""
+        return StreamingRenderer(self)
+
     def add_post_processor(self, processor_func):
         """사용자 정의 후처리 함수 추가"""
         self.post_processors.append(processor_func)
@@ -150,10 +169,8 @@ class OutputRenderer:
             "original_length": len(text),
             "processed_length": len(processed_text),
             "has_code_blocks": "```" in processed_text,
-            "has_lists": bool(
-                re.search(r"^\s*[-*+\d]+\.\s+", processed_text, re.MULTILINE)
-            ),
-            "has_headers": bool(re.search(r"^#+\s+", processed_text, re.MULTILINE)),
+            "has_lists": bool(_HAS_LIST_RE.search(processed_text)),
+            "has_headers": bool(_HAS_HEADER_RE.search(processed_text)),
         }
 
         if metadata:
@@ -162,6 +179,32 @@ class OutputRenderer:
         return result
 
 
+class StreamingRenderer:
+    """
+    스트리밍 응답 렌더러
+
+    청크마다 후처리하면 CPU를 낭비하고 청크 경계에 걸친 마크다운(코드 블록, 목록)이 깨지므로
+    청크는 그대로 통과시키고 전체 텍스트에 한 번만 후처리를 적용합니다.
+    """
+
+    def __init__(self, renderer: OutputRenderer):
+        self.renderer = renderer
+        self._parts: List[str] = []
+
+    def feed(self, chunk: str) -> str:
+        """청크 누적 후 그대로 반환"""
+        self._parts.append(chunk)
+        return chunk
+
+    @property
+    def raw_text(self) -> str:
+        return "".join(self._parts)
+
+    def finalize(self) -> str:
+        """누적된 전체 텍스트 후처리"""
+        return self.renderer.process_output(self.raw_text)
+
+
 class SpecializedRenderer(OutputRenderer):
     """특수 용도 렌더러"""
 
@@ -176,17 +219,20 @@ class SpecializedRenderer(OutputRenderer):
 
     def _markdown_to_html_basic(self, text: str) -> str:
         """기본적인 마크다운 → HTML 변환"""
-        # 헤더
-        text = re.sub(r"^### (.+)$", r"<h3>\1</h3>", text, flags=re.MULTILINE)
-        text = re.sub(r"^## (.+)$", r"<h2>\1</h2>", text, flags=re.MULTILINE)
-        text = re.sub(r"^# (.+)$", r"<h1>\1</h1>", text, flags=re.MULTILINE)
+        # 헤더 (###, ##, # 순서로 적용하던 것과 같은 결과)
+        if "#" in text:
+            text = _HTML_HEADER_RE.sub(
+                lambda m: f"<h{len(m.group(1))}>{m.group(2)}</h{len(m.group(1))}>", text
+            )
 
         # 굵게, 기울임
-        text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
-        text = re.sub(r"\*(.+?)\*", r"<em>\1</em>", text)
+        if "*" in text:
+            text = _BOLD_RE.sub(r"<strong>\1</strong>", text)
+            text = _ITALIC_RE.sub(r"<em>\1</em>", text)
 
         # 인라인 코드
-        text = re.sub(r"`(.+?)`", r"<code>\1</code>", text)
+        if "`" in text:
+            text = _INLINE_CODE_SPAN_RE.sub(r"<code>\1</code>", text)
 
         # 줄바꿈
         text = text.replace("\n", "<br>\n")
@@ -196,20 +242,21 @@ class SpecializedRenderer(OutputRenderer):
     def _strip_markdown(self, text: str) -> str:
         """마크다운 형식 제거"""
         # 헤더
-        text = re.sub(r"^#+\s+(.+)$", r"\1", text, flags=re.MULTILINE)
+        if "#" in text:
+            text = _STRIP_HEADER_RE.sub(r"\1", text)
 
         # 굵게, 기울임
-        text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-        text = re.sub(r"\*(.+?)\*", r"\1", text)
-
-        # 인라인 코드
-        text = re.sub(r"`(.+?)`", r"\1", text)
+        if "*" in text:
+            text = _BOLD_RE.sub(r"\1", text)
+            text = _ITALIC_RE.sub(r"\1", text)
 
-        # 코드 블록
-        text = re.sub(r"```[\w]*\n(.*?)\n```", r"\1", text, flags=re.DOTALL)
+        # 인라인 코드, 코드 블록
+        if "`" in text:
+            text = _INLINE_CODE_SPAN_RE.sub(r"\1", text)
+            text = _STRIP_CODE_BLOCK_RE.sub(r"\1", text)
 
         # 목록
-        text = re.sub(r"^\s*[-*+]\s+", "• ", text, flags=re.MULTILINE)
-        text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)
+        text = _STRIP_BULLET_RE.sub("• ", text)
+        text = _STRIP_NUMBERED_RE.sub("", text)
 
         return text
@@ -0,0 +1,239 @@
+# ted-os-project/backend/utils/sse.py
+"""
+Ted OS - Server-Sent Events 형식과 생성별 다시 보내기 버퍼
+
+이벤트 종류는 token/usage/error/done이고, data는 한 줄 JSON이라 청크에 줄바꿈이 있어도 안전합니다.
+생성 결과는 연결과 별개로 버퍼에 쌓이므로, 연결이 끊긴 클라이언트는
+Last-Event-ID로 다시 연결해 놓친 이벤트부터 이어받을 수 있습니다.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from ..core.config import (
+    SSE_HEARTBEAT_SECONDS,
+    SSE_REPLAY_BUFFER_EVENTS,
+    SSE_REPLAY_TTL_SECONDS,
+    SSE_RESUME_GRACE_SECONDS,
+    SSE_RETRY_MILLISECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# 프록시가 스트림을 버퍼링하거나 캐시하지 않도록
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_event(
+    event: str,
+    data: Any,
+    event_id: Optional[int] = None,
+    retry: Optional[int] = None,
+) -> str:
+    """SSE 이벤트 하나 (data는 JSON으로 직렬화)"""
+    lines = []
+    if retry is not None:
+        lines.append(f"retry: {retry}")
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    # json.dumps는 줄바꿈을 \n으로 이스케이프하므로 data는 항상 한 줄
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def format_comment(text: str) -> str:
+    """클라이언트가 무시하는 주석 줄 (연결 유지용)"""
+    return f": {text}\n\n"
+
+
+def parse_event_id(value: Optional[str]) -> Optional[int]:
+    """Last-Event-ID 헤더 값 (형식이 맞지 않으면 None)"""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+class StreamEvent:
+    """버퍼에 보관하는 이벤트"""
+
+    __slots__ = ("id", "event", "data")
+
+    def __init__(self, event_id: int, event: str, data: Any):
+        self.id = event_id
+        self.event = event
+        self.data = data
+
+
+class EventBuffer:
+    """
+    생성 하나의 이벤트 버퍼 (이벤트 루프 안에서만 사용)
+
+    최근 max_events개 이상을 보관하고, 구독자가 모두 떠난 채 grace_seconds가 지나면
+    on_abandoned를 호출합니다 (보통 생성 취소).
+    """
+
+    def __init__(
+        self,
+        stream_id: str,
+        max_events: int = SSE_REPLAY_BUFFER_EVENTS,
+        heartbeat_seconds: float = SSE_HEARTBEAT_SECONDS,
+        retry_milliseconds: int = SSE_RETRY_MILLISECONDS,
+        grace_seconds: float = SSE_RESUME_GRACE_SECONDS,
+        on_abandoned: Optional[Callable[[], Any]] = None,
+    ):
+        self.id = stream_id
+        self.max_events = max(1, max_events)
+        self.heartbeat_seconds = heartbeat_seconds
+        self.retry_milliseconds = retry_milliseconds
+        self.grace_seconds = grace_seconds
+        self.on_abandoned = on_abandoned
+        self.closed = False
+        self.closed_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None  # 이벤트를 채우는 작업 (참조 유지용)
+        self._events: List[StreamEvent] = []
+        self._first_id = 1  # _events[0]의 ID
+        self._next_id = 1
+        self._changed = asyncio.Event()
+        self._subscribers = 0
+        self._abandon_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def last_event_id(self) -> int:
+        return self._next_id - 1
+
+    def append(self, event: str, data: Any) -> int:
+        """이벤트 추가 후 ID 반환"""
+        if self.closed:
+            raise RuntimeError(f"Event stream {self.id} is closed")
+        event_id = self._next_id
+        self._next_id += 1
+        self._events.append(StreamEvent(event_id, event, data))
+        # 앞쪽 삭제 비용을 줄이려고 두 배가 되면 한 번에 잘라냄
+        if len(self._events) >= 2 * self.max_events:
+            drop = len(self._events) - self.max_events
+            del self._events[:drop]
+            self._first_id += drop
+        self._wake()
+        return event_id
+
+    def close(self):
+        """더 이상 이벤트가 없음 (구독자는 남은 이벤트를 받고 종료)"""
+        if self.closed:
+            return
+        self.closed = True
+        self.closed_at = time.monotonic()
+        self._cancel_abandon_timer()
+        self._wake()
+
+    def _wake(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def subscribe(self, last_event_id: Optional[int] = None) -> AsyncIterator[str]:
+        """last_event_id 다음 이벤트부터 SSE 문자열로 보내는 비동기 반복"""
+        self._attach()
+        try:
+            cursor = last_event_id or 0
+            retry: Optional[int] = self.retry_milliseconds
+            while True:
+                if cursor < self._first_id - 1:
+                    # 버퍼에서 이미 밀려난 이벤트가 있으면 빠짐없이 이어받을 수 없음
+                    yield format_event(
+                        "error",
+                        {"message": "Replay buffer no longer holds the requested events"},
+                        retry=retry,
+                    )
+                    return
+                changed = self._changed
+                start = cursor - self._first_id + 1
+                for item in self._events[start:]:
+                    yield format_event(item.event, item.data, item.id, retry)
+                    retry = None
+                    cursor = item.id
+                if cursor < self.last_event_id:
+                    continue  # 보내는 동안 추가된 이벤트
+                if self.closed:
+                    return
+                try:
+                    await asyncio.wait_for(changed.wait(), self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield format_comment("heartbeat")
+        finally:
+            self._detach()
+
+    # ---- 구독자 관리 ----
+
+    def _attach(self):
+        self._subscribers += 1
+        self._cancel_abandon_timer()
+
+    def _detach(self):
+        self._subscribers -= 1
+        if self._subscribers > 0 or self.closed or self.on_abandoned is None:
+            return
+        loop = asyncio.get_running_loop()
+        self._abandon_handle = loop.call_later(self.grace_seconds, self._abandoned)
+
+    def _cancel_abandon_timer(self):
+        if self._abandon_handle is not None:
+            self._abandon_handle.cancel()
+            self._abandon_handle = None
+
+    def _abandoned(self):
+        self._abandon_handle = None
+        if self._subscribers == 0 and not self.closed:
+            logger.info(f"No client resumed event stream {self.id}, abandoning it")
+            self.on_abandoned()
+
+
+class EventStreamRegistry:
+    """생성 ID별 이벤트 버퍼 (끝난 버퍼는 ttl_seconds 동안 유지)"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = SSE_REPLAY_TTL_SECONDS,
+        **buffer_options: Any,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.buffer_options = buffer_options
+        self._buffers: Dict[str, EventBuffer] = {}
+        self._lock = threading.Lock()
+
+    def create(
+        self, stream_id: str, on_abandoned: Optional[Callable[[], Any]] = None
+    ) -> EventBuffer:
+        buffer = EventBuffer(stream_id, on_abandoned=on_abandoned, **self.buffer_options)
+        with self._lock:
+            self._purge()
+            self._buffers[stream_id] = buffer
+        return buffer
+
+    def get(self, stream_id: str) -> Optional[EventBuffer]:
+        """버퍼 (없거나 보관 시간이 지났으면 None)"""
+        with self._lock:
+            self._purge()
+            return self._buffers.get(stream_id)
+
+    def _purge(self):
+        now = time.monotonic()
+        expired = [
+            stream_id
+            for stream_id, buffer in self._buffers.items()
+            if buffer.closed and now - buffer.closed_at > self.ttl_seconds
+        ]
+        for stream_id in expired:
+            del self._buffers[stream_id]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._buffers)
@@ -0,0 +1,214 @@
+# ted-os-project/backend/utils/token_counter.py
+"""
+Ted OS - 제공업체별 토큰 수 계산 서비스
+
+OpenAI 모델은 tiktoken 인코더를 모델별로 한 번만 만들어 재사용하고,
+Anthropic/Google처럼 로컬 토크나이저가 없는 경우는 UTF-8 바이트 수로 추정합니다.
+같은 내용은 해시로 메모해 두어 대화가 길어져도 이전 메시지를 다시 인코딩하지 않습니다.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import (
+    APPROX_BYTES_PER_TOKEN,
+    DEFAULT_BYTES_PER_TOKEN,
+    IMAGE_TOKEN_ESTIMATE,
+    MESSAGE_TOKEN_OVERHEAD,
+    TOKEN_COUNT_MEMO_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+# tiktoken이 모델명을 모를 때 접두사로 고르는 인코딩
+_O200K_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-4.5", "chatgpt-4o", "o1", "o3", "o4")
+
+
+def _provider_key(provider: Any) -> str:
+    """ModelProvider 또는 문자열을 소문자 이름으로"""
+    return str(getattr(provider, "value", provider) or "").lower()
+
+
+def content_text(content: Any) -> Tuple[str, int]:
+    """(메시지 내용의 텍스트, 텍스트가 아닌 부분 수)"""
+    if isinstance(content, str):
+        return content, 0
+    texts, others = [], 0
+    for part in content or []:
+        if isinstance(part, dict) and part.get("type") == "text":
+            texts.append(part.get("text", ""))
+        else:
+            others += 1
+    return "\n".join(texts), others
+
+
+class TokenCounter:
+    """인코더 캐시 + 내용 해시 메모를 가진 토큰 계산기 (스레드 안전)"""
+
+    def __init__(self, memo_size: int = TOKEN_COUNT_MEMO_SIZE):
+        self.memo_size = memo_size
+        self._encodings: Dict[str, Any] = {}  # 모델명 -> 인코더 (불러오지 못하면 None)
+        self._memo: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ---- 인코더 ----
+
+    def encoding_for(self, model: Optional[str]):
+        """모델의 tiktoken 인코더 (tiktoken이 없거나 불러오지 못하면 None)"""
+        model = model or ""
+        with self._lock:
+            if model in self._encodings:
+                return self._encodings[model]
+        encoding = self._load_encoding(model)
+        with self._lock:
+            return self._encodings.setdefault(model, encoding)
+
+    @staticmethod
+    def _load_encoding(model: str):
+        try:
+            import tiktoken
+        except ImportError:
+            logger.warning("tiktoken not installed, using approximate token counts")
+            return None
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                name = "o200k_base" if model.startswith(_O200K_PREFIXES) else "cl100k_base"
+                return tiktoken.get_encoding(name)
+        except Exception as e:
+            # 인코딩 파일을 내려받지 못한 경우 등 (다음 실행 때 다시 시도)
+            logger.warning(f"Could not load tiktoken encoding for '{model}': {e}")
+            return None
+
+    def method(self, provider: Any, model: Optional[str] = None) -> str:
+        """토큰 계산 방식 이름 (같은 방식이면 결과를 공유)"""
+        provider = _provider_key(provider)
+        if provider == "openai":
+            encoding = self.encoding_for(model)
+            if encoding is not None:
+                return f"tiktoken:{encoding.name}"
+        return f"approx:{APPROX_BYTES_PER_TOKEN.get(provider, DEFAULT_BYTES_PER_TOKEN)}"
+
+    def is_exact(self, provider: Any, model: Optional[str] = None) -> bool:
+        """실제 토크나이저로 계산하는지 여부"""
+        return self.method(provider, model).startswith("tiktoken:")
+
+    # ---- 계산 ----
+
+    def _memo_get(self, key: Tuple[str, bytes]) -> Optional[int]:
+        with self._lock:
+            tokens = self._memo.get(key)
+            if tokens is None:
+                self.misses += 1
+                return None
+            self._memo.move_to_end(key)
+            self.hits += 1
+            return tokens
+
+    def _memo_put(self, key: Tuple[str, bytes], tokens: int):
+        if self.memo_size <= 0:
+            return
+        with self._lock:
+            self._memo[key] = tokens
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    @staticmethod
+    def _approximate(text: str, method: str) -> int:
+        bytes_per_token = float(method.split(":", 1)[1])
+        return max(1, round(len(text.encode("utf-8")) / bytes_per_token))
+
+    def count_texts(
+        self, texts: Sequence[str], provider: Any, model: Optional[str] = None
+    ) -> List[int]:
+        """여러 텍스트의 토큰 수 (메모에 없는 것만 한 번에 인코딩)"""
+        method = self.method(provider, model)
+        counts: List[Optional[int]] = []
+        pending: Dict[Tuple[str, bytes], List[int]] = {}
+        pending_texts: List[str] = []
+        for i, text in enumerate(texts):
+            if not text:
+                counts.append(0)
+                continue
+            key = (method, self._digest(text))
+            tokens = self._memo_get(key)
+            counts.append(tokens)
+            if tokens is None:
+                if key not in pending:
+                    pending[key] = []
+                    pending_texts.append(text)
+                pending[key].append(i)
+
+        if pending_texts:
+            if method.startswith("tiktoken:"):
+                encoding = self.encoding_for(model)
+                encoded = encoding.encode_batch(pending_texts, disallowed_special=())
+                results = [len(tokens) for tokens in encoded]
+            else:
+                results = [self._approximate(text, method) for text in pending_texts]
+            for (key, positions), tokens in zip(pending.items(), results):
+                self._memo_put(key, tokens)
+                for i in positions:
+                    counts[i] = tokens
+        return counts  # type: ignore[return-value]
+
+    def count_text(self, text: str, provider: Any, model: Optional[str] = None) -> int:
+        """텍스트 하나의 토큰 수"""
+        return self.count_texts([text], provider, model)[0]
+
+    def count_messages(
+        self,
+        messages: Sequence[Dict[str, Any]],
+        provider: Any,
+        model: Optional[str] = None,
+    ) -> List[int]:
+        """메시지별 토큰 수 (역할/구분자 오버헤드와 이미지 추정치 포함)"""
+        parts = [content_text(m.get("content")) for m in messages]
+        text_counts = self.count_texts([text for text, _ in parts], provider, model)
+        return [
+            tokens + others * IMAGE_TOKEN_ESTIMATE + MESSAGE_TOKEN_OVERHEAD
+            for tokens, (_, others) in zip(text_counts, parts)
+        ]
+
+    def count_message(
+        self, message: Dict[str, Any], provider: Any, model: Optional[str] = None
+    ) -> int:
+        """메시지 하나의 토큰 수"""
+        return self.count_messages([message], provider, model)[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "memo_size": len(self._memo),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "encodings": sorted(
+                    f"{model or '-'}={getattr(enc, 'name', None)}"
+                    for model, enc in self._encodings.items()
+                ),
+            }
+
+
+_default_counter: Optional[TokenCounter] = None
+_default_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """프로세스 공용 토큰 계산기"""
+    global _default_counter
+    with _default_counter_lock:
+        if _default_counter is None:
+            _default_counter = TokenCounter()
+        return _default_counter
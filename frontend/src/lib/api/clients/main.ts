@@ -1,6 +1,16 @@
 // ted-os-project/frontend/src/lib/api/clients/main.ts
 // API 클라이언트 - FastAPI 백엔드와 통신
 const API_BASE = '/api';
+const MAX_STREAM_RESUMES = 3; // 응답 스트림이 끊겼을 때 이어받기 시도 횟수
+
+// 서버가 보낸 오류 이벤트 (이어받기 대상이 아님)
+class StreamError extends Error {}
+
+interface ServerSentEvent {
+  event: string; // token, usage, error, done
+  data: string;
+  id?: string;
+}
 
 export interface ChatSession {
   id: string;
@@ -12,6 +22,40 @@ export interface ChatSession {
   is_pinned?: boolean;
 }
 
+export interface SessionSummary {
+  id: string;
+  title: string;
+  created_at: string;
+  updated_at: string;
+  message_count: number;
+  is_pinned: boolean;
+  preview: string;
+}
+
+export interface SessionListResponse {
+  sessions: SessionSummary[];
+  total: number;
+  next_cursor: string | null;
+  message: string;
+}
+
+export interface SearchMatch {
+  message_index: number; // -1이면 제목
+  role: string;
+  snippet: string;
+  offset: number;
+  highlights: [number, number][]; // snippet 기준 [시작, 끝]
+  score: number;
+}
+
+export interface SessionSearchResult {
+  session_id: string;
+  title: string;
+  updated_at: string;
+  score: number;
+  matches: SearchMatch[];
+}
+
 export interface ChatMessage {
   role: 'user' | 'assistant';
   content: string | any[];
@@ -262,12 +306,33 @@ class ApiClient {
   }
 
   // 세션 관리
-  async getSessions(): Promise<ChatSession[]> {
-    const response = await fetch(`${API_BASE}/sessions`);
+  async getSessions(limit?: number, cursor?: string): Promise<SessionListResponse> {
+    const params = new URLSearchParams();
+    if (limit) params.set('limit', String(limit));
+    if (cursor) params.set('cursor', cursor);
+
+    const response = await fetch(`${API_BASE}/sessions?${params}`);
     if (!response.ok) throw new Error('세션 목록을 가져올 수 없습니다');
     return response.json();
   }
 
+  async searchSessions(query: string, limit?: number): Promise<SessionSearchResult[]> {
+    const params = new URLSearchParams({ q: query });
+    if (limit) params.set('limit', String(limit));
+
+    const response = await fetch(`${API_BASE}/sessions/search?${params}`);
+    if (!response.ok) throw new Error('세션을 검색할 수 없습니다');
+    const data = await response.json();
+    return data.results;
+  }
+
+  async getSession(sessionId: string): Promise<ChatSession> {
+    const response = await fetch(`${API_BASE}/sessions/${sessionId}`);
+    if (!response.ok) throw new Error('세션을 가져올 수 없습니다');
+    const data = await response.json();
+    return data.session;
+  }
+
   async createSession(title?: string): Promise<ChatSession> {
     const response = await fetch(`${API_BASE}/sessions`, {
       method: 'POST',
@@ -298,7 +363,13 @@ class ApiClient {
   }
 
   // 채팅 메시지 전송 (스트리밍)
-  async *sendMessage(sessionId: string, prompt: string, modelProvider?: string, modelName?: string): AsyncGenerator<string, void, unknown> {
+  async *sendMessage(
+    sessionId: string,
+    prompt: string,
+    modelProvider?: string,
+    modelName?: string,
+    onGeneration?: (generationId: string) => void
+  ): AsyncGenerator<string, void, unknown> {
     const response = await fetch(`${API_BASE}/sessions/${sessionId}/chat`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
@@ -311,11 +382,47 @@ class ApiClient {
 
     if (!response.ok) throw new Error('메시지를 전송할 수 없습니다');
 
+    // 중단 요청(cancelGeneration)과 이어받기에 쓰는 생성 ID
+    const generationId = response.headers.get('X-Generation-Id');
+    if (generationId && onGeneration) onGeneration(generationId);
+
+    let lastEventId: string | null = null;
+    let current: Response = response;
+
+    for (let attempt = 0; ; attempt++) {
+      try {
+        for await (const event of this.readEvents(current)) {
+          if (event.id) lastEventId = event.id;
+          const data = event.data ? JSON.parse(event.data) : {};
+          if (event.event === 'token') yield data.text;
+          else if (event.event === 'error') throw new StreamError(data.message);
+          else if (event.event === 'done') return;
+        }
+      } catch (err) {
+        if (err instanceof StreamError || !generationId || attempt >= MAX_STREAM_RESUMES) throw err;
+        console.warn('스트림 연결이 끊겨 이어받기를 시도합니다:', err);
+      }
+
+      // done 이벤트 전에 연결이 끊기면 마지막으로 받은 이벤트 다음부터 이어받음
+      if (!generationId || attempt >= MAX_STREAM_RESUMES) {
+        throw new Error('응답 스트림이 중간에 끊겼습니다');
+      }
+      await new Promise((resolve) => setTimeout(resolve, 500 * (attempt + 1)));
+      current = await fetch(`${API_BASE}/generations/${generationId}/events`, {
+        headers: lastEventId ? { 'Last-Event-ID': lastEventId } : {}
+      });
+      if (!current.ok) throw new Error('응답 스트림을 이어받을 수 없습니다');
+    }
+  }
+
+  // text/event-stream 응답을 이벤트 단위로 읽기 (주석/하트비트 줄은 무시)
+  private async *readEvents(response: Response): AsyncGenerator<ServerSentEvent, void, unknown> {
     const reader = response.body?.getReader();
     if (!reader) throw new Error('스트리밍을 지원하지 않습니다');
 
     const decoder = new TextDecoder();
     let buffer = '';
+    let event: ServerSentEvent = { event: 'message', data: '' };
 
     try {
       while (true) {
@@ -326,12 +433,24 @@ class ApiClient {
         const lines = buffer.split('\n');
         buffer = lines.pop() || '';
 
-        for (const line of lines) {
-          if (line.startsWith('data: ')) {
-            const data = line.slice(6).trim();
-            if (data === '[DONE]') return;
-            if (data) yield data;
+        for (const rawLine of lines) {
+          const line = rawLine.endsWith('\r') ? rawLine.slice(0, -1) : rawLine;
+          if (line === '') {
+            // 빈 줄에서 이벤트 하나가 끝남
+            if (event.data || event.id) yield event;
+            event = { event: 'message', data: '' };
+            continue;
           }
+          if (line.startsWith(':')) continue;
+
+          const colon = line.indexOf(':');
+          const field = colon === -1 ? line : line.slice(0, colon);
+          let value = colon === -1 ? '' : line.slice(colon + 1);
+          if (value.startsWith(' ')) value = value.slice(1);
+
+          if (field === 'event') event.event = value;
+          else if (field === 'data') event.data = event.data ? `${event.data}\n${value}` : value;
+          else if (field === 'id') event.id = value;
         }
       }
     } finally {
@@ -339,6 +458,15 @@ class ApiClient {
     }
   }
 
+  // 진행 중인 응답 생성 중단
+  async cancelGeneration(generationId: string): Promise<void> {
+    const response = await fetch(`${API_BASE}/generations/${generationId}/cancel`, {
+      method: 'POST'
+    });
+    // 404는 이미 끝난 생성이므로 무시
+    if (!response.ok && response.status !== 404) throw new Error('응답 생성을 중단할 수 없습니다');
+  }
+
   // 사용량 통계
   async getUsageStats(): Promise<UsageStats> {
     const response = await fetch(`${API_BASE}/status/usage`);
@@ -1,9 +1,23 @@
 // ted-os-project/frontend/src/lib/stores/chat/index.ts
 import { writable, get } from 'svelte/store';
-import { api, type ChatSession, type ChatMessage } from '$lib/api/clients/main';
+import { api, type ChatSession, type ChatMessage, type SessionSummary } from '$lib/api/clients/main';
 
-// 채팅 세션들
-export const sessions = writable<ChatSession[]>([]);
+// 채팅 세션 요약 목록 (메시지 본문은 세션 선택 시 로드)
+export const sessions = writable<SessionSummary[]>([]);
+
+// 전체 세션을 목록용 요약으로 변환
+function toSummary(session: ChatSession): SessionSummary {
+  const last = session.messages[session.messages.length - 1];
+  return {
+    id: session.id,
+    title: session.title,
+    created_at: session.created_at,
+    updated_at: session.updated_at,
+    message_count: session.messages.length,
+    is_pinned: session.is_pinned ?? false,
+    preview: last ? last.content.toString().substring(0, 50) : ''
+  };
+}
 
 // 현재 활성 세션
 export const currentSession = writable<ChatSession | null>(null);
@@ -30,7 +44,7 @@ export const chatStore = {
       isLoading.set(true);
       error.set(null);
       
-      const sessionList = await api.getSessions();
+      const { sessions: sessionList } = await api.getSessions();
       sessions.set(sessionList);
       
       console.log('세션 로드 완료:', sessionList.length);
@@ -52,7 +66,7 @@ export const chatStore = {
       const newSession = await api.createSession(title);
       
       // 세션 목록에 추가
-      sessions.update(list => [newSession, ...list]);
+      sessions.update(list => [toSummary(newSession), ...list]);
       
       // 새 세션을 활성 세션으로 설정
       currentSession.set(newSession);
@@ -69,10 +83,18 @@ export const chatStore = {
     }
   },
   
-  // 세션 선택
-  selectSession(session: ChatSession) {
-    currentSession.set(session);
-    console.log('세션 선택:', session.title);
+  // 세션 선택 (메시지를 포함한 전체 세션 로드)
+  async selectSession(summary: SessionSummary) {
+    try {
+      error.set(null);
+      const session = await api.getSession(summary.id);
+      currentSession.set(session);
+      console.log('세션 선택:', session.title);
+    } catch (err) {
+      const errorMessage = err instanceof Error ? err.message : '세션을 불러오는데 실패했습니다';
+      error.set(errorMessage);
+      console.error('세션 선택 오류:', err);
+    }
   },
   
   // 세션 삭제
@@ -166,7 +188,7 @@ export const chatStore = {
       const finalSession = get(currentSession);
       if (finalSession) {
         sessions.update(list => 
-          list.map(s => s.id === session.id ? finalSession : s)
+          list.map(s => s.id === session.id ? toSummary(finalSession) : s)
         );
       }
       
@@ -10,3 +10,55 @@ def stub_external_modules():
     google_mod.generativeai = types.SimpleNamespace(GenerativeModel=lambda *a, **k: object(), configure=lambda *a, **k: None)
     sys.modules.setdefault('google', google_mod)
     yield
+
+
+class RecordingTracker:
+    """add_usage로 받은 사용량을 기록만 하는 UsageTracker 대역"""
+
+    def __init__(self):
+        self.usages = []
+
+    def add_usage(self, usage, session_key=None):
+        self.usages.append(usage)
+
+
+@pytest.fixture
+def recording_tracker():
+    return RecordingTracker()
+
+
+@pytest.fixture
+def make_response_manager():
+    """
+    더미 모델 설정으로 ResponseManager를 만드는 팩토리
+
+    interface가 dict이면 요청한 제공업체 이름으로 인터페이스를 고릅니다.
+    """
+    from backend.managers.model_management.response_manager import ResponseManager
+    from backend.models.data_models import ModelConfig
+    from backend.models.enums import ModelProvider
+
+    def make(interface, tracker=None, provider=ModelProvider.ANTHROPIC):
+        config = ModelConfig(
+            provider=provider,
+            model_name="dummy",
+            display_name="Dummy",
+            max_tokens=100,
+            supports_streaming=True,
+            supports_functions=False,
+            input_cost_per_1k=0.002,
+            output_cost_per_1k=0.004,
+        )
+        settings = types.SimpleNamespace(get=lambda key, default=None: default)
+        return ResponseManager(
+            interface_manager=object(),
+            settings_manager=settings,
+            usage_tracker=tracker,
+            config_resolver_callback=lambda p, m: (
+                provider,
+                config,
+                interface[p] if isinstance(interface, dict) else interface,
+            ),
+        )
+
+    return make
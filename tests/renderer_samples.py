@@ -0,0 +1,44 @@
+"""렌더러 테스트/벤치마크용 LLM 응답 샘플 생성"""
+
+import random
+
+_PARAGRAPHS = [
+    "Python의 제너레이터는 값을 하나씩 만들어 내므로 메모리를 아낄 수 있습니다.  ",
+    "The event loop schedules coroutines cooperatively; blocking calls stall every request.",
+    "요약하면 `asyncio.to_thread` 를 쓰거나 ` 비동기 클라이언트 ` 를 사용하세요.",
+    "Performance depends on **allocation patterns** and *cache locality* more than on syntax.",
+]
+
+_BLOCKS = [
+    "## 설치 방법\n",
+    "### Step {n}: configure\n",
+    "#Heading without space\n",
+    "- 첫 번째 항목\n-   두 번째 항목\n* star item\n+ plus item\n",
+    "1. 준비\n2. 실행\n10.   정리\n",
+    "   - nested bullet\n   1. nested number\n",
+    "```\nimport os\nprint(os.getcwd())\n```\n",
+    "```python\n\n\ndef handler(event):\n    return event\n\n\n```\n",
+    "```\nconst x = 1;\nlet y = x + 1;\n```\n",
+    "```\n<div class=\"html\">hello</div>\n```\n",
+    "```\nbody { background: #fff; color: red; }\n```\n",
+    "| col | value |\n|-----|-------|\n| a | 1 |\n",
+    "> 인용문입니다.\n",
+]
+
+
+def make_llm_answer(size: int = 50_000, seed: int = 0) -> str:
+    """제목, 목록, 코드 블록, 빈 줄이 섞인 size 글자 정도의 응답"""
+    rng = random.Random(seed)
+    parts = []
+    total = 0
+    n = 0
+    while total < size:
+        n += 1
+        if rng.random() < 0.5:
+            part = rng.choice(_PARAGRAPHS)
+        else:
+            part = rng.choice(_BLOCKS).replace("{n}", str(n))
+        part += "\n" * rng.choice([0, 1, 1, 2, 3, 4]) + " " * rng.choice([0, 0, 2])
+        parts.append(part)
+        total += len(part)
+    return "".join(parts)
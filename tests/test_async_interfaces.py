@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from backend.interfaces.base import LLMInterface
+from backend.interfaces.openai_client import OpenAIInterface
+from backend.models.data_models import TokenUsage
+
+
+class SyncOnlyInterface(LLMInterface):
+    def generate(self, messages, model, **kwargs):
+        return f"{model}:{len(messages)}", None
+
+    def stream(self, messages, model, **kwargs):
+        yield "a"
+        yield "b"
+
+
+class AsyncStreamInterface(LLMInterface):
+    def __init__(self):
+        self.closed = False
+
+    def generate(self, messages, model, **kwargs):
+        raise AssertionError("sync path must not be used")
+
+    def stream(self, messages, model, **kwargs):
+        raise AssertionError("sync path must not be used")
+
+    async def astream(self, messages, model, **kwargs):
+        try:
+            yield "hello "
+            yield "world"
+            usage = TokenUsage(
+                input_tokens=1000,
+                output_tokens=500,
+                total_tokens=1500,
+                model_name=model,
+                provider="anthropic",
+                timestamp=datetime.now(),
+            )
+            yield ("__USAGE__", usage)
+        finally:
+            self.closed = True
+
+
+def test_default_async_methods_wrap_sync_implementation():
+    async def main():
+        iface = SyncOnlyInterface()
+        text, _ = await iface.agenerate([{"role": "user", "content": "x"}], "m")
+        chunks = [c async for c in iface.astream([], "m")]
+        return text, chunks
+
+    assert asyncio.run(main()) == ("m:1", ["a", "b"])
+
+
+def test_astream_generate_records_usage_and_closes_upstream(make_response_manager, recording_tracker):
+    iface = AsyncStreamInterface()
+    tracker = recording_tracker
+    rm = make_response_manager(iface, tracker)
+
+    async def collect():
+        return [item async for item in rm.astream_generate([{"role": "user", "content": "hi"}])]
+
+    items = asyncio.run(collect())
+    assert [chunk for chunk, _ in items] == ["hello ", "world"]
+    assert tracker.usages[0].cost_usd == 0.004
+    assert iface.closed and not rm.is_generating()
+
+    # 소비 측이 중간에 멈추면 제공업체 스트림도 닫힘
+    iface = AsyncStreamInterface()
+    rm = make_response_manager(iface)
+
+    async def first_only():
+        stream = rm.astream_generate([])
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+    asyncio.run(first_only())
+    assert iface.closed
+
+
+def test_openai_astream_uses_async_client_and_closes_stream():
+    class FakeStream:
+        def __init__(self, parts):
+            self.parts = parts
+            self.closed = False
+
+        def __aiter__(self):
+            return self._iterate()
+
+        async def _iterate(self):
+            for part in self.parts:
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))])
+
+        async def close(self):
+            self.closed = True
+
+    stream = FakeStream(["Hi", None, "!"])
+    calls = {}
+
+    async def create(**kwargs):
+        calls.update(kwargs)
+        return stream
+
+    iface = OpenAIInterface.__new__(OpenAIInterface)
+    iface._async_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    async def collect():
+        return [c async for c in iface.astream([{"role": "user", "content": "x"}], "gpt-4o", max_tokens=5)]
+
+    assert asyncio.run(collect()) == ["Hi", "!"]
+    assert calls["stream"] is True and calls["max_tokens"] == 5
+    assert stream.closed
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.utils.async_stream import iterate_in_thread
+
+
+def _slow_stream(chunks, delay):
+    for i in range(chunks):
+        time.sleep(delay)  # 블로킹 네트워크 읽기 흉내
+        yield f"c{i}", None
+
+
+async def _collect(stream, **kwargs):
+    return [item async for item in iterate_in_thread(stream, **kwargs)]
+
+
+def test_concurrent_blocking_streams_do_not_block_the_loop():
+    async def main():
+        ticks = 0
+        stop = False
+
+        async def heartbeat():
+            nonlocal ticks
+            while not stop:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        beat = asyncio.create_task(heartbeat())
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(_collect(_slow_stream(10, 0.03)) for _ in range(10))
+        )
+        elapsed = time.perf_counter() - started
+        stop = True
+        await beat
+        return results, elapsed, ticks
+
+    results, elapsed, ticks = asyncio.run(main())
+
+    assert all([c for c, _ in r] == [f"c{i}" for i in range(10)] for r in results)
+    # 순차 실행이면 3초, 병렬이면 0.3초 남짓
+    assert elapsed < 1.5
+    assert ticks > 10
+
+
+def test_errors_are_raised_in_the_consumer():
+    def failing():
+        yield "ok", None
+        raise RuntimeError("provider failed")
+
+    async def main():
+        received = []
+        with pytest.raises(RuntimeError, match="provider failed"):
+            async for item in iterate_in_thread(failing()):
+                received.append(item)
+        return received
+
+    assert asyncio.run(main()) == [("ok", None)]
+
+
+def test_stopping_early_closes_the_sync_generator():
+    closed = threading.Event()
+
+    def endless():
+        try:
+            while True:
+                yield "x", None
+        finally:
+            closed.set()
+
+    async def main():
+        async for _ in iterate_in_thread(endless(), buffer_size=2):
+            break
+
+    asyncio.run(main())
+    assert closed.wait(timeout=2)
+
+
+def test_async_iterators_pass_through():
+    async def agen():
+        yield "a", None
+        yield "b", None
+
+    assert asyncio.run(_collect(agen())) == [("a", None), ("b", None)]
@@ -0,0 +1,212 @@
+import json
+
+import pytest
+
+from backend.managers.chat_sessions import ChatSessionManager
+
+
+def test_list_session_summaries_reads_index_only(tmp_path):
+    manager = ChatSessionManager(str(tmp_path))
+    session = manager.create_session("first")
+    session.messages.append({"role": "user", "content": "hello there"})
+    manager.update_session(session)
+
+    # 세션 파일이 없어도 목록은 인덱스만으로 만들어져야 함
+    (tmp_path / f"{session.id}.json").unlink()
+
+    summaries, next_cursor = manager.list_session_summaries()
+
+    assert next_cursor is None
+    assert [s.id for s in summaries] == [session.id]
+    assert summaries[0].message_count == 1
+    assert summaries[0].preview == "hello there"
+    assert summaries[0].is_pinned is False
+
+
+def test_list_session_summaries_paginates_newest_first(tmp_path):
+    manager = ChatSessionManager(str(tmp_path))
+    created = [manager.create_session(f"s{i}") for i in range(5)]
+
+    first_page, cursor = manager.list_session_summaries(limit=2)
+    second_page, cursor2 = manager.list_session_summaries(limit=2, cursor=cursor)
+    last_page, cursor3 = manager.list_session_summaries(limit=2, cursor=cursor2)
+
+    listed = [s.id for s in first_page + second_page + last_page]
+    assert listed == [s.id for s in reversed(created)]
+    assert cursor3 is None
+
+
+def test_list_session_summaries_rejects_bad_cursor(tmp_path):
+    manager = ChatSessionManager(str(tmp_path))
+
+    with pytest.raises(ValueError):
+        manager.list_session_summaries(cursor="not-a-cursor")
+
+
+def test_legacy_index_entries_are_backfilled(tmp_path):
+    manager = ChatSessionManager(str(tmp_path))
+    session = manager.create_session("legacy")
+    session.is_pinned = True
+    manager.update_session(session)
+    manager.close()
+
+    # 이전 형식의 인덱스 (고정 여부/미리보기 없음)
+    index_file = tmp_path / "chat_sessions.json"
+    index = json.loads(index_file.read_text(encoding="utf-8"))
+    for entry in index.values():
+        entry.pop("is_pinned")
+        entry.pop("preview")
+    index_file.write_text(json.dumps(index), encoding="utf-8")
+
+    reloaded = ChatSessionManager(str(tmp_path))
+    summaries, _ = reloaded.list_session_summaries()
+
+    assert summaries[0].is_pinned is True
+    assert "preview" in reloaded.index[session.id]
+
+
+def test_pin_limit_and_separation_use_index_only(tmp_path, monkeypatch):
+    manager = ChatSessionManager(str(tmp_path))
+    sessions = [manager.create_session(f"s{i}") for i in range(9)]
+
+    for session in sessions[:7]:
+        assert manager.pin_session(session.id) is True
+    assert manager.get_pinned_sessions_count() == 7
+    assert manager.pin_session(sessions[7].id) is False
+
+    def fail_get_session(session_id):
+        raise AssertionError("separated listing must not load session files")
+
+    monkeypatch.setattr(manager, "get_session", fail_get_session)
+    pinned, unpinned = manager.get_sessions_separated()
+
+    assert {s.id for s in pinned} == {s.id for s in sessions[:7]}
+    assert {s.id for s in unpinned} == {s.id for s in sessions[7:]}
+
+
+def test_unpin_and_delete_keep_pinned_set_in_sync(tmp_path):
+    manager = ChatSessionManager(str(tmp_path))
+    first = manager.create_session("a")
+    second = manager.create_session("b")
+    manager.pin_session(first.id)
+    manager.pin_session(second.id)
+
+    manager.unpin_session(first.id)
+    manager.delete_session(second.id)
+
+    assert manager.get_pinned_sessions_count() == 0
+    assert manager.get_session(first.id).is_pinned is False
+    manager.close()
+    assert ChatSessionManager(str(tmp_path)).get_pinned_sessions_count() == 0
+
+
+def test_index_writes_are_batched_and_debounced(tmp_path, monkeypatch):
+    manager = ChatSessionManager(str(tmp_path), flush_delay=60)
+    writes = []
+    original_save_index = manager.storage.save_index
+    monkeypatch.setattr(
+        manager.storage,
+        "save_index",
+        lambda index: (writes.append(len(index)), original_save_index(index)),
+    )
+
+    with manager.batch():
+        sessions = [manager.create_session(f"s{i}") for i in range(5)]
+        imported = manager.import_sessions([s.to_dict() for s in sessions])
+    assert writes == [10]
+    assert len(imported) == 5
+
+    # 일반 저장은 타이머가 돌 때까지 모아둠
+    manager.create_session("pending")
+    assert writes == [10]
+    assert manager.cleanup_empty_sessions() == 11
+    assert writes == [10, 0]
+
+    manager.create_session("on shutdown")
+    manager.close()
+    assert writes == [10, 0, 1]
+    assert len(ChatSessionManager(str(tmp_path)).index) == 1
+
+
+def test_debounce_timer_flushes_index(tmp_path):
+    manager = ChatSessionManager(str(tmp_path), flush_delay=0.05)
+    session = manager.create_session("timer")
+
+    timer = manager._flush_timer
+    if timer is not None:
+        timer.join(timeout=5)
+
+    index = json.loads((tmp_path / "chat_sessions.json").read_text(encoding="utf-8"))
+    assert list(index) == [session.id]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_session_cache_serves_hot_sessions_and_detects_external_writes(tmp_path, monkeypatch):
+    manager = ChatSessionManager(str(tmp_path), cache_size=2)
+    session = manager.create_session("hot")
+    session.messages.append({"role": "user", "content": "hi"})
+    manager.update_session(session)
+
+    loads = []
+    original_load = manager.storage.load
+    monkeypatch.setattr(
+        manager.storage, "load", lambda s_id: (loads.append(s_id), original_load(s_id))[1]
+    )
+
+    first = manager.get_session(session.id)
+    first.messages[0]["content"] = "unsaved change"
+    second = manager.get_session(session.id)
+
+    assert loads == []
+    assert second.messages == [{"role": "user", "content": "hi"}]
+    assert manager.get_cache_stats()["hits"] == 2
+
+    # 다른 프로세스가 파일을 바꾸면 캐시 항목은 무효
+    data = json.loads((tmp_path / f"{session.id}.json").read_text(encoding="utf-8"))
+    data["messages"].append({"role": "assistant", "content": "from elsewhere"})
+    (tmp_path / f"{session.id}.json").write_text(json.dumps(data), encoding="utf-8")
+
+    assert len(manager.get_session(session.id).messages) == 2
+    assert loads == [session.id]
+
+    others = [manager.create_session(f"o{i}") for i in range(2)]
+    manager.get_session(session.id)
+    assert loads == [session.id, session.id]
+    assert manager.get_cache_stats()["size"] == 2
+    assert manager.delete_session(others[1].id)
+    assert manager.get_cache_stats()["size"] == 1
+
+
+def test_session_statistics_are_kept_incrementally(tmp_path, monkeypatch):
+    manager = ChatSessionManager(str(tmp_path))
+    first = manager.create_session("first")
+    second = manager.create_session("second")
+    second.messages.extend([{"role": "user", "content": "a"}, {"role": "assistant", "content": "b"}])
+    manager.update_session(second)
+    third = manager.create_session("third")
+
+    def fail_load(session_id):
+        raise AssertionError("statistics must not load sessions")
+
+    original_load = manager.storage.load
+    monkeypatch.setattr(manager.storage, "load", fail_load)
+    monkeypatch.setattr(manager, "get_session", fail_load)
+
+    stats = manager.get_session_statistics()
+    assert stats["total_sessions"] == 3
+    assert stats["total_messages"] == 2
+    assert stats["oldest_session"]["id"] == first.id
+    assert stats["newest_session"]["id"] == third.id
+
+    manager.delete_session(first.id)
+    manager.delete_session(third.id)
+    stats = manager.get_session_statistics()
+    assert stats["avg_messages_per_session"] == 2
+    assert stats["oldest_session"]["id"] == stats["newest_session"]["id"] == second.id
+
+    # 인덱스가 실제 데이터와 어긋난 경우 재계산으로 복구
+    monkeypatch.setattr(manager.storage, "load", original_load)
+    manager.index[second.id] = dict(manager.index[second.id], message_count=99)
+    manager._rebuild_aggregates()
+    assert manager.get_session_statistics()["total_messages"] == 99
+    assert manager.rebuild_session_statistics()["total_messages"] == 2
@@ -0,0 +1,73 @@
+import copy
+
+from backend.managers.model_management.context_budgeter import ContextBudgeter
+from backend.models.data_models import ModelConfig
+from backend.models.enums import ModelProvider
+from backend.utils.token_counter import TokenCounter
+
+
+def _config(context_window=1000, max_tokens=200):
+    return ModelConfig(
+        provider=ModelProvider.ANTHROPIC,
+        model_name="dummy",
+        display_name="Dummy",
+        max_tokens=max_tokens,
+        supports_streaming=True,
+        supports_functions=False,
+        context_window=context_window,
+    )
+
+
+def _history(turns, words=40):
+    messages = [{"role": "system", "content": "Be helpful."}]
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"question {i} " + "word " * words})
+        messages.append({"role": "assistant", "content": f"answer {i} " + "word " * words})
+    return messages
+
+
+def test_recent_turns_fit_budget_and_counts_are_cached():
+    counter = TokenCounter()
+    budgeter = ContextBudgeter(max_history_turns=0, max_input_tokens=0, counter=counter)
+    messages = _history(20)
+    messages[-1:] = [{"role": "user", "content": "latest question"}]
+    original_messages = copy.deepcopy(messages)
+
+    fitted = budgeter.fit(messages, _config(), max_output_tokens=200)
+
+    assert fitted[0] == {"role": "system", "content": "Be helpful."}
+    assert fitted[-1] == {"role": "user", "content": "latest question"}
+    assert fitted[1]["role"] == "user"  # 턴 단위로 잘림
+    assert len(fitted) < len(messages)
+    assert sum(budgeter.count_messages(fitted, _config())) <= 800
+    # 세션 메시지는 그대로 두고, 제공업체로 보내는 메시지에도 다른 필드가 없음
+    assert messages == original_messages
+    assert all(set(m) == {"role", "content"} for m in fitted)
+
+    # 다음 턴에서는 새 메시지만 계산
+    before = counter.stats()["misses"]
+    messages.append({"role": "assistant", "content": "reply"})
+    messages.append({"role": "user", "content": "follow-up"})
+    budgeter.fit(messages, _config(), max_output_tokens=200)
+    assert counter.stats()["misses"] - before == 2
+
+    # 내용이 바뀌면 다시 계산
+    messages[-1]["content"] = "edited follow-up"
+    before = counter.stats()["misses"]
+    budgeter.fit(messages, _config(), max_output_tokens=200)
+    assert counter.stats()["misses"] - before == 1
+
+
+def test_history_turn_limit_and_summary_policy():
+    messages = _history(5, words=2) + [{"role": "user", "content": "now"}]
+
+    dropped = ContextBudgeter(max_history_turns=2).fit(messages, _config(100000))
+    assert [m["content"] for m in dropped[1:]][-3:] == [messages[-3]["content"], messages[-2]["content"], "now"]
+    assert len(dropped) == 1 + 3
+
+    summarized = ContextBudgeter(policy="summarize", max_history_turns=2).fit(messages, _config(100000))
+    system = summarized[0]["content"]
+    assert len(summarized) == len(dropped)
+    assert system.startswith("Be helpful.\n\nEarlier conversation (summarized):")
+    assert "- user: question 0 word word" in system and "- assistant: answer 3" in system
+    assert "question 4" not in system  # 유지한 턴은 요약에 넣지 않음
@@ -32,7 +32,8 @@ streamlit_stub = ModuleType("streamlit")
 streamlit_stub.session_state = DummyState()
 sys.modules.setdefault("streamlit", streamlit_stub)
 
-from backend.main import handle_chat_message, ChatMessageRequest
+from backend.main import handle_chat_message, resume_generation_events, ChatMessageRequest
+from backend.managers.model_management import GenerationRegistry
 from backend.managers.model_management.response_manager import ResponseManager
 from backend.models.data_models import ChatSession, ModelConfig
 from backend.models.enums import ModelProvider
@@ -70,8 +71,15 @@ class FakeModelManager:
     def __init__(self):
         self.last_provider = None
         self.last_model = None
+        self.generations = GenerationRegistry()
 
-    def stream_generate(self, messages, provider_display_name=None, model_id_key=None, **kwargs):
+    def start_generation(self, session_id=None, provider_display_name=None, model_id_key=None):
+        return self.generations.start(session_id, provider_display_name, model_id_key)
+
+    def finish_generation(self, generation_id):
+        self.generations.finish(generation_id)
+
+    def astream_generate(self, messages, provider_display_name=None, model_id_key=None, **kwargs):
         self.last_provider = provider_display_name
         self.last_model = model_id_key
         async def gen():
@@ -100,6 +108,30 @@ def test_handle_chat_message_uses_default_model():
     assert context.model_manager.last_model == "gpt-4.1-mini"
 
 
+def test_chat_stream_is_sse_and_resumable():
+    session = ChatSession(id="s2", title="t", messages=[], created_at=datetime.now(), updated_at=datetime.now(), metadata={})
+    context = SimpleNamespace(
+        settings=FakeSettings(),
+        chat_manager=FakeChatManager(session),
+        model_manager=FakeModelManager()
+    )
+
+    async def main():
+        response = await handle_chat_message("s2", ChatMessageRequest(prompt="hi"), context)
+        frames = [frame async for frame in response.body_iterator]
+        generation_id = response.headers["X-Generation-Id"]
+        resumed = await resume_generation_events(generation_id, last_event_id="1")
+        return response, frames, [frame async for frame in resumed.body_iterator]
+
+    response, frames, resumed = asyncio.run(main())
+
+    assert response.media_type == "text/event-stream"
+    assert frames[0] == 'retry: 2000\nid: 1\nevent: token\ndata: {"text": "done"}\n\n'
+    assert frames[1].startswith("id: 2\nevent: done\n")
+    assert resumed == ["retry: 2000\n" + frames[1]]
+    assert session.messages[-1]["content"] == "done"
+
+
 def test_response_manager_stream_uses_default(monkeypatch):
     settings = FakeSettings()
 
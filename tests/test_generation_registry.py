@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+from backend.managers.model_management.generation_registry import GenerationRegistry
+
+
+class SlowInterface:
+    """청크 하나를 보낸 뒤 오래 기다리는 제공업체 스트림"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.closed = False
+
+    async def astream(self, messages, model, **kwargs):
+        try:
+            yield "first"
+            await asyncio.sleep(self.delay)
+            yield "second"
+        finally:
+            self.closed = True
+
+
+def test_cancel_stops_only_that_generation_and_closes_upstream(make_response_manager):
+    slow, fast = SlowInterface(30), SlowInterface(0.05)
+    rm = make_response_manager({"slow": slow, "fast": fast})
+
+    async def consume(provider, generation):
+        return [c async for c, _ in rm.astream_generate([], provider, generation=generation)]
+
+    async def main():
+        slow_gen = rm.start_generation("s1", "slow")
+        fast_gen = rm.start_generation("s2", "fast")
+        tasks = [
+            asyncio.create_task(consume("slow", slow_gen)),
+            asyncio.create_task(consume("fast", fast_gen)),
+        ]
+        await asyncio.sleep(0.01)
+
+        listed = {g["id"]: g for g in rm.list_generations()}
+        assert listed[slow_gen.id]["chunks_streamed"] == 1
+        assert listed[slow_gen.id]["session_id"] == "s1"
+
+        started = time.perf_counter()
+        assert rm.cancel_generation(slow_gen.id)
+        results = await asyncio.gather(*tasks)
+        return results, time.perf_counter() - started
+
+    (slow_chunks, fast_chunks), elapsed = asyncio.run(main())
+
+    assert slow_chunks == ["first"] and fast_chunks == ["first", "second"]
+    assert slow.closed and elapsed < 1
+    assert rm.list_generations() == [] and not rm.is_generating()
+
+
+def test_registry_cancel_unknown_and_finish_are_safe():
+    registry = GenerationRegistry()
+    generation = registry.start(provider="OpenAI")
+    assert registry.cancel("missing") is False
+
+    generation.record_chunk("abcdefgh")
+    info = registry.list_active()[0]
+    assert info["chars_streamed"] == 8 and "tokens_streamed" not in info
+
+    registry.finish(generation.id)
+    registry.finish(generation.id)
+    assert len(registry) == 0
+    assert registry.cancel(generation.id) is False
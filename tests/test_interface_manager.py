@@ -0,0 +1,55 @@
+from backend.interfaces.http_transport import HttpTransport
+from backend.managers.model_management import interface_manager
+from backend.managers.model_management.interface_manager import InterfaceManager
+from backend.models.enums import ModelProvider
+
+
+class FakeSettings:
+    def __init__(self, api_keys, network=None):
+        self.values = {"api_keys": api_keys, "network": network or {}}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class FakeInterface:
+    def __init__(self, api_key, transport=None):
+        self.api_key = api_key
+        self.transport = transport
+
+
+def test_refresh_rebuilds_only_providers_whose_key_changed(monkeypatch):
+    monkeypatch.setattr(
+        interface_manager,
+        "PROVIDER_INTERFACES",
+        {provider: FakeInterface for provider in ModelProvider},
+    )
+    settings = FakeSettings({"openai": "o-1", "anthropic": "a-1", "google": ""})
+    manager = InterfaceManager(settings)
+
+    openai_iface = manager.get_interface(ModelProvider.OPENAI)
+    anthropic_iface = manager.get_interface(ModelProvider.ANTHROPIC)
+    assert openai_iface.transport is manager.transport
+    assert not manager.is_provider_available(ModelProvider.GOOGLE)
+
+    assert manager.refresh_interfaces() == []
+    assert manager.get_interface(ModelProvider.OPENAI) is openai_iface
+
+    settings.values["api_keys"] = {"openai": "o-1", "anthropic": "a-2", "google": "g-1"}
+    assert manager.refresh_interfaces() == [ModelProvider.ANTHROPIC, ModelProvider.GOOGLE]
+    assert manager.get_interface(ModelProvider.OPENAI) is openai_iface
+    assert manager.get_interface(ModelProvider.ANTHROPIC) is not anthropic_iface
+    assert manager.get_interface(ModelProvider.ANTHROPIC).api_key == "a-2"
+
+    settings.values["api_keys"]["openai"] = ""
+    assert manager.refresh_interfaces() == [ModelProvider.OPENAI]
+    assert not manager.is_provider_available(ModelProvider.OPENAI)
+
+
+def test_transport_reads_network_settings():
+    transport = HttpTransport.from_settings(
+        FakeSettings({}, {"max_connections": 7, "read_timeout": 12, "http2": False})
+    )
+    assert transport.max_connections == 7
+    assert transport.read_timeout == 12
+    assert transport.http2 is False
@@ -0,0 +1,78 @@
+import pytest
+
+from backend.models.enums import ModelProvider
+from backend.utils.output_renderer import OutputRenderer, SpecializedRenderer
+
+
+CHUNKS = ["Here is ", "code:\n``", "`\nimport os\n", "print(os.name)\n``", "`\n\n\n\nDone.  "]
+
+
+class ChunkInterface:
+    def stream(self, messages, model, **kwargs):
+        yield from CHUNKS
+
+
+def test_stream_passes_raw_chunks_and_renders_final_text_once(make_response_manager):
+    rm = make_response_manager(ChunkInterface())
+    generation = rm.start_generation()
+
+    chunks = [chunk for chunk, _ in rm.stream_generate([], generation=generation)]
+
+    assert chunks == CHUNKS
+    # 청크 경계에 걸친 코드 블록도 전체 텍스트 기준으로 처리
+    assert generation.final_text == OutputRenderer().process_output("".join(CHUNKS))
+
+
+def test_openai_stream_does_not_repeat_the_response(make_response_manager):
+    rm = make_response_manager(ChunkInterface(), provider=ModelProvider.OPENAI)
+
+    text = "".join(chunk for chunk, _ in rm.stream_generate([]))
+
+    assert text == "".join(CHUNKS)
+
+
+def test_stream_renderer_accumulates_without_processing():
+    renderer = OutputRenderer().stream_renderer()
+    assert renderer.feed("a  ") == "a  "
+    assert renderer.feed("\n\n\n\nb") == "\n\n\n\nb"
+    assert renderer.raw_text == "a  \n\n\n\nb"
+    assert renderer.finalize() == "a\n\nb"
+
+
+# 최적화 전 구현의 출력을 고정한 사례
+RENDER_CASES = [
+    (
+        "#Title\nSome text\n- a\n-b\n* c\n1. one\n2.two\n\n\n\nEnd  ",
+        {
+            "markdown": "#Title\nSome text\n\n- a\n-b\n\n* c\n1. one\n2.two\n\nEnd",
+            "html": "#Title<br>\nSome text<br>\n<br>\n- a<br>\n-b<br>\n<br>\n* c<br>\n"
+            "1. one<br>\n2.two<br>\n<br>\nEnd",
+            "plain": "#Title\nSome text\n• a\n-b\n• c\none\n2.two\n\nEnd",
+        },
+    ),
+    (
+        "Here:\n```\nimport os\nprint(os.name)\n```\nDone",
+        {
+            "markdown": "Here:\n```import os\nprint(os.name)```\nDone",
+            "html": "Here:<br>\n<code>`</code>import os<br>\n"
+            "print(os.name)<code>`</code><br>\nDone",
+            "plain": "Here:\n`import os\nprint(os.name)`\nDone",
+        },
+    ),
+    (
+        "## Head\n**bold** and `code`\n+ item",
+        {
+            "markdown": "## Head\n**bold** and `code`\n\n+ item",
+            "html": "<h2>Head</h2><br>\n<strong>bold</strong> and <code>code</code><br>\n"
+            "<br>\n+ item",
+            "plain": "Head\nbold and code\n• item",
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize("text,expected", RENDER_CASES)
+def test_renderer_output_is_unchanged(text, expected):
+    assert OutputRenderer().process_output(text) == expected["markdown"]
+    for kind, output in expected.items():
+        assert SpecializedRenderer(kind).process_output(text) == output
@@ -0,0 +1,38 @@
+"""
+OutputRenderer 벤치마크 (pytest-benchmark 필요, requirements-dev.txt에 포함)
+
+기본 pytest 실행에서는 건너뛰고 --benchmark-only를 줄 때만 측정합니다.
+
+    pip install -r requirements-dev.txt
+    pytest tests/test_output_renderer_benchmark.py --benchmark-only --benchmark-group-by=param:kind
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from backend.utils.output_renderer import OutputRenderer, SpecializedRenderer
+from tests.renderer_samples import make_llm_answer
+
+ANSWERS = [make_llm_answer(50_000, seed) for seed in range(3)]
+
+RENDERERS = {
+    "markdown": OutputRenderer,
+    "html": lambda: SpecializedRenderer("html"),
+    "plain": lambda: SpecializedRenderer("plain"),
+}
+
+
+@pytest.fixture(autouse=True)
+def benchmark_only(request):
+    if not request.config.getoption("benchmark_only"):
+        pytest.skip("run with --benchmark-only")
+
+
+def _render_all(renderer):
+    return [renderer.process_output(text) for text in ANSWERS]
+
+
+@pytest.mark.parametrize("kind", RENDERERS)
+def test_benchmark_renderer(benchmark, kind):
+    benchmark(_render_all, RENDERERS[kind]())
@@ -0,0 +1,88 @@
+import time
+from datetime import datetime
+
+from backend.managers.model_management.response_cache import ResponseCache
+from backend.models.data_models import TokenUsage
+
+
+class CountingInterface:
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, messages, model, **kwargs):
+        self.calls += 1
+        usage = TokenUsage(
+            input_tokens=1000,
+            output_tokens=1000,
+            total_tokens=2000,
+            model_name=model,
+            provider="anthropic",
+            timestamp=datetime.now(),
+        )
+        return f"answer {self.calls}", usage
+
+
+def test_deterministic_calls_are_served_from_cache_without_new_spend(
+    tmp_path, make_response_manager, recording_tracker
+):
+    iface = CountingInterface()
+    tracker = recording_tracker
+    rm = make_response_manager(iface, tracker)
+    rm.response_cache = ResponseCache(path=str(tmp_path), enabled=True)
+
+    messages = [{"role": "user", "content": "요약해줘", "timestamp": "t1"}]
+    first, usage = rm.generate(messages, temperature=0)
+    # 메시지의 부가 필드와 공백 차이는 키에 영향 없음
+    second, cached_usage = rm.generate(
+        [{"role": "user", "content": " 요약해줘 ", "timestamp": "t2"}], temperature=0
+    )
+
+    assert first == second == "answer 1"
+    assert usage.cost_usd == 0.006 and cached_usage is None
+    assert iface.calls == 1 and len(tracker.usages) == 1
+
+    # 샘플링이 있는 호출은 명시적으로 요청한 경우만 캐시
+    rm.generate(messages, temperature=0.7)
+    rm.generate(messages, temperature=0.7)
+    assert iface.calls == 3
+    rm.generate(messages, temperature=0.7, cacheable=True)
+    rm.generate(messages, temperature=0.7, cacheable=True)
+    assert iface.calls == 4
+
+    stats = rm.get_response_cache_stats()
+    assert stats["hits"] == 2 and stats["misses"] == 2
+    assert stats["tokens_saved"] == 4000 and stats["cost_saved_usd"] == 0.012
+
+    # 디스크 단계는 재시작 후에도 유지
+    restarted = ResponseCache(path=str(tmp_path), enabled=True)
+    key = ResponseCache.make_key("anthropic", "dummy", messages, {"temperature": 0, "max_tokens": 100})
+    assert restarted.get(key).text == "answer 1"
+    assert restarted.stats()["disk_hits"] == 1
+
+
+def test_ttl_and_size_bounds(tmp_path):
+    cache = ResponseCache(
+        path=str(tmp_path), enabled=True, ttl_seconds=60, memory_entries=2, disk_entries=3
+    )
+    for i in range(5):
+        cache.put(f"k{i}", f"v{i}")
+
+    assert len(list(tmp_path.glob("*.json"))) == 3
+    stats = cache.stats()
+    assert stats["memory_size"] == 2 and stats["disk_size"] == 3
+    assert cache.get("k0") is None and cache.get("k2").text == "v2"
+
+    cache.ttl_seconds = 0.01
+    time.sleep(0.05)
+    assert cache.get("k4") is None
+    assert cache.stats()["expired"] >= 1
+
+
+def test_disabled_cache_is_bypassed(make_response_manager):
+    iface = CountingInterface()
+    rm = make_response_manager(iface)
+    assert not rm.response_cache.enabled  # 기본값은 꺼짐
+
+    rm.generate([{"role": "user", "content": "x"}], temperature=0)
+    rm.generate([{"role": "user", "content": "x"}], temperature=0)
+    assert iface.calls == 2
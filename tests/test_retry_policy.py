@@ -0,0 +1,174 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from backend.managers.model_management.retry_policy import (
+    RetryPolicy,
+    RetryStats,
+    TokenBucket,
+    classify_error,
+)
+from backend.models.data_models import TokenUsage
+
+
+class StatusError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(f"status {status}")
+        self.status_code = status
+        self.response = SimpleNamespace(status_code=status, headers=headers or {})
+
+
+def _translated(error):
+    """OpenAIInterface처럼 SDK 예외를 내장 예외로 바꿔 던진 경우"""
+    try:
+        raise error
+    except Exception as e:
+        try:
+            raise PermissionError("OpenAI API Rate Limit Exceeded") from e
+        except PermissionError as translated:
+            return translated
+
+
+def _policy(**kwargs):
+    kwargs.setdefault("requests_per_minute", {})
+    return RetryPolicy(base_delay=0.0, **kwargs)
+
+
+def test_classify_error_follows_cause_and_reads_retry_after():
+    assert classify_error(_translated(StatusError(429, {"retry-after": "2"}))) == (True, 2.0)
+    assert classify_error(StatusError(503, {"retry-after-ms": "250"})) == (True, 0.25)
+    assert classify_error(StatusError(400)) == (False, None)
+    assert classify_error(ConnectionError("reset")) == (True, None)
+    assert classify_error(ValueError("bad request")) == (False, None)
+
+
+def test_call_retries_transient_errors_only():
+    policy = _policy(attempts=3)
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise StatusError(503, {"retry-after": "0"})
+        return "ok"
+
+    stats = RetryStats()
+    assert policy.call("openai", flaky, stats) == "ok"
+    assert stats.retries == 2
+    assert policy.get_stats()["openai"]["retries"] == 2
+
+    def failing(status):
+        def call():
+            calls.append(status)
+            raise StatusError(status)
+
+        return call
+
+    calls.clear()
+    with pytest.raises(StatusError):
+        policy.call("openai", failing(401))
+    assert calls == [401]  # 인증 오류는 재시도하지 않음
+
+    with pytest.raises(StatusError):
+        policy.call("openai", failing(500))
+    assert calls.count(500) == 3
+    assert policy.get_stats()["openai"]["exhausted"] == 1
+
+
+def test_stream_is_retried_only_before_the_first_chunk():
+    policy = _policy(attempts=3)
+    opened = []
+
+    def open_stream():
+        opened.append(1)
+        if len(opened) == 1:
+            raise ConnectionError("connect failed")
+        yield "a"
+        if len(opened) == 2:
+            raise ConnectionError("dropped mid-stream")
+        yield "b"
+
+    received = []
+    with pytest.raises(ConnectionError, match="mid-stream"):
+        for chunk in policy.stream("anthropic", open_stream):
+            received.append(chunk)
+    assert received == ["a"] and len(opened) == 2
+
+    async def astream_case():
+        attempts = []
+
+        async def open_async():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise StatusError(529)
+            yield "x"
+
+        return [c async for c in policy.astream("anthropic", open_async)], len(attempts)
+
+    assert asyncio.run(astream_case()) == (["x"], 2)
+
+
+def test_token_bucket_smooths_bursts_and_honors_pause():
+    bucket = TokenBucket(rate_per_second=10, capacity=2)
+    assert bucket.reserve() == 0 and bucket.reserve() == 0
+    assert 0.05 < bucket.reserve() <= 0.1
+    bucket.pause(5)
+    assert bucket.reserve() > 4
+
+
+def test_response_manager_reports_retries_in_usage(make_response_manager, recording_tracker):
+    class FlakyInterface:
+        def __init__(self):
+            self.calls = 0
+
+        def generate(self, messages, model, **kwargs):
+            self.calls += 1
+            if self.calls == 1:
+                raise _translated(StatusError(429, {"retry-after": "0"}))
+            usage = TokenUsage(
+                input_tokens=10,
+                output_tokens=5,
+                total_tokens=15,
+                model_name=model,
+                provider="anthropic",
+                timestamp=datetime.now(),
+            )
+            return "answer", usage
+
+    tracker = recording_tracker
+    rm = make_response_manager(FlakyInterface(), tracker)
+    rm.retry_policy = _policy()
+    text, usage = rm.generate([{"role": "user", "content": "hi"}])
+    assert text == "answer"
+    assert tracker.usages[0].retries == 1 and usage.to_dict()["retries"] == 1
+    assert rm.get_retry_stats()["anthropic"]["retried_requests"] == 1
+
+
+def test_google_generate_errors_reach_the_retry_policy():
+    from backend.interfaces.google_client import GoogleInterface
+
+    errors = [StatusError(503)]
+    calls = []
+
+    class FlakyModel:
+        def generate_content(self, contents, generation_config=None):
+            calls.append(1)
+            if errors:
+                raise errors.pop(0)
+            return SimpleNamespace(candidates=[])
+
+    interface = GoogleInterface("test-key")
+    interface._build_request = lambda messages, model, kwargs: (FlakyModel(), [], None)
+    messages = [{"role": "user", "content": "hi"}]
+    stats = RetryStats()
+
+    result = _policy().call("google", lambda: interface.generate(messages, "gemini"), stats)
+    assert result == ("", None)
+    assert stats.retries == 1 and len(calls) == 2
+
+    # 재시도 대상이 아닌 오류는 빈 응답이 아니라 예외로 전달
+    errors.append(StatusError(400))
+    with pytest.raises(StatusError):
+        _policy().call("google", lambda: interface.generate(messages, "gemini"))
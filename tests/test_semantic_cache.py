@@ -0,0 +1,147 @@
+import asyncio
+import time
+
+from backend.managers.model_management.semantic_cache import SemanticCache
+from backend.managers.model_manager import EnhancedModelManager
+from tests.test_async_interfaces import AsyncStreamInterface
+
+
+def _ask(text):
+    return [{"role": "system", "content": "You are helpful."}, {"role": "user", "content": text}]
+
+
+def test_similar_prompts_hit_within_scope_only():
+    cache = SemanticCache(enabled=True, threshold=0.9)
+    cache.store("OpenAI", "gpt-4o", _ask("Explain quantum computing in simple terms"), "answer")
+
+    assert cache.lookup("OpenAI", "gpt-4o", _ask("explain quantum computing in simple terms please")).text == "answer"
+    # 다른 모델, 다른 시스템 프롬프트, 숫자만 다른 질문은 적중하지 않음
+    assert cache.lookup("OpenAI", "gpt-4o-mini", _ask("Explain quantum computing in simple terms")) is None
+    assert cache.lookup(
+        "OpenAI", "gpt-4o", [{"role": "system", "content": "Be terse."}] + _ask("Explain quantum computing in simple terms")[1:]
+    ) is None
+    cache.store("OpenAI", "gpt-4o", _ask("What is 12 times 12?"), "144")
+    assert cache.lookup("OpenAI", "gpt-4o", _ask("What is 12 times 13?")) is None
+    assert cache.lookup("OpenAI", "gpt-4o", _ask("What is 2 + 2?")) is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["size"] == 2
+
+
+def test_eviction_by_lru_and_ttl():
+    cache = SemanticCache(enabled=True, max_entries=2, ttl_seconds=60)
+    cache.store("p", "m", _ask("first question about cats"), "a1")
+    cache.store("p", "m", _ask("second question about dogs"), "a2")
+    assert cache.lookup("p", "m", _ask("first question about cats")).text == "a1"
+    cache.store("p", "m", _ask("third question about birds"), "a3")  # dogs가 가장 오래 안 쓰임
+
+    assert cache.lookup("p", "m", _ask("second question about dogs")) is None
+    assert cache.lookup("p", "m", _ask("first question about cats")) is not None
+    assert cache.stats()["evictions"] == 1
+
+    cache.ttl_seconds = 0.01
+    time.sleep(0.05)
+    assert cache.lookup("p", "m", _ask("third question about birds")) is None
+    assert cache.stats()["size"] == 0
+
+    text = "Hello world, this answer is long enough to be replayed in several chunks.\n\n- item"
+    assert "".join(cache.replay(text)) == text
+
+
+class FakeSettings:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def _manager(make_response_manager, iface, tracker, semantic_cache=None):
+    """설정으로 의미 캐시를 켠 EnhancedModelManager (모델 해석만 더미 인터페이스로 교체)"""
+    settings = FakeSettings({"api_keys": {}, "semantic_cache": semantic_cache or {"enabled": True}})
+    manager = EnhancedModelManager(settings, tracker)
+    manager.response_manager.get_active_config = make_response_manager(iface).get_active_config
+    return manager
+
+
+def test_manager_builds_semantic_cache_from_settings(make_response_manager):
+    manager = _manager(
+        make_response_manager, AsyncStreamInterface(), None, {"enabled": True, "threshold": 0.8}
+    )
+    assert manager.semantic_cache.enabled and manager.semantic_cache.threshold == 0.8
+
+    manager = _manager(make_response_manager, AsyncStreamInterface(), None, {"enabled": False})
+    assert not manager.semantic_cache.enabled
+    assert manager.get_semantic_cache_stats()["enabled"] is False
+
+
+def test_hits_replay_as_stream_without_new_spend(make_response_manager, recording_tracker):
+    iface = AsyncStreamInterface()
+    tracker = recording_tracker
+    manager = _manager(make_response_manager, iface, tracker)
+
+    async def chat(prompt, **kwargs):
+        generation = manager.start_generation(provider_display_name="Anthropic", model_id_key="dummy")
+        chunks = [
+            chunk
+            async for chunk, _ in manager.astream_generate(
+                _ask(prompt), "Anthropic", "dummy", generation=generation, **kwargs
+            )
+        ]
+        return "".join(chunks), generation.final_text
+
+    first = asyncio.run(chat("How do I sort a list in Python?"))
+    iface.closed = False
+    second = asyncio.run(chat("how do I sort a list in python"))
+
+    assert first == second == ("hello world", "hello world")
+    assert not iface.closed  # 제공업체를 다시 호출하지 않음
+    assert len(tracker.usages) == 1
+    stats = manager.get_semantic_cache_stats()
+    assert stats["hits"] == 1 and stats["cost_saved_usd"] == 0.004
+    assert not manager.is_generating()
+
+    # 세션에서 끄면 항상 제공업체 호출
+    asyncio.run(chat("How do I sort a list in Python?", semantic_cache=False))
+    assert iface.closed and len(tracker.usages) == 2
+
+
+class EchoInterface(AsyncStreamInterface):
+    """마지막 질문을 그대로 담아 답하는 인터페이스 (호출 횟수 기록)"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def generate(self, messages, model, **kwargs):
+        self.calls += 1
+        return f"answer to: {messages[-1]['content']}", None
+
+
+def test_multi_turn_chat_only_hits_for_same_question_and_history(make_response_manager):
+    iface = EchoInterface()
+    manager = _manager(make_response_manager, iface, None)
+    questions = [
+        "how do I reverse a linked list",
+        "what causes the northern lights",
+        "give me a recipe for pancakes",
+        "explain how a hash map handles collisions",
+        "what is the capital of australia",
+        "recommend a good science fiction novel",
+    ]
+
+    history = [{"role": "system", "content": "You are helpful."}]
+    for question in questions:
+        history.append({"role": "user", "content": question})
+        answer, _ = manager.generate(history, "Anthropic", "dummy")
+        assert answer == f"answer to: {question}"
+        history.append({"role": "assistant", "content": answer})
+    assert iface.calls == 6 and manager.get_semantic_cache_stats()["hits"] == 0
+
+    # 같은 기록 뒤의 비슷한 질문만 적중, 기록이 다르면 다시 호출
+    replay = history[:-2] + [{"role": "user", "content": "Recommend a good science fiction novel"}]
+    assert manager.generate(replay, "Anthropic", "dummy")[0].endswith(questions[-1])
+    assert iface.calls == 6
+    other = _ask("what is the capital of australia")
+    assert manager.generate(other, "Anthropic", "dummy")[0] == f"answer to: {other[-1]['content']}"
+    assert iface.calls == 7
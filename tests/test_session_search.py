@@ -0,0 +1,63 @@
+from backend.managers.chat_sessions import ChatSessionManager
+from backend.managers.session_search import tokenize
+
+
+def _session(manager, title, *contents):
+    session = manager.create_session(title)
+    for i, content in enumerate(contents):
+        role = "user" if i % 2 == 0 else "assistant"
+        session.messages.append({"role": role, "content": content})
+    manager.update_session(session)
+    return session
+
+
+def test_tokenize_uses_bigrams_for_korean_and_words_for_latin():
+    assert tokenize("Python으로 검색엔진") == ["python", "으로", "검색", "색엔", "엔진"]
+    assert tokenize("ＡＢＣ 한") == ["abc", "한"]
+
+
+def test_search_ranks_message_contents_with_snippets(tmp_path):
+    manager = ChatSessionManager(str(tmp_path))
+    recipe = _session(manager, "저녁 메뉴", "김치찌개 레시피 알려줘", "김치찌개는 김치와 돼지고기로 끓입니다. 김치찌개 팁!")
+    _session(manager, "여행", "부산 여행 코스 추천", "해운대와 광안리를 추천합니다")
+    code = _session(manager, "code", "How do I sort a list in Python?", "Use sorted(items).")
+
+    results = manager.search_sessions("김치찌개")
+    assert [r.session_id for r in results] == [recipe.id]
+    match = results[0].matches[0]
+    assert match.message_index == 1
+    start, end = match.highlights[0]
+    assert match.snippet[start:end] == "김치찌개"
+
+    results = manager.search_sessions("python SORT")
+    assert [r.session_id for r in results] == [code.id]
+    assert results[0].matches[0].role == "user"
+
+    # 한 글자 한국어 검색어는 그 글자를 포함한 2-gram으로 확장
+    assert {r.session_id for r in manager.search_sessions("산")} == {
+        r.session_id for r in manager.search_sessions("부산")
+    }
+    assert manager.search_sessions("없는검색어") == []
+
+
+def test_search_index_is_updated_incrementally(tmp_path, monkeypatch):
+    manager = ChatSessionManager(str(tmp_path))
+    session = _session(manager, "notes", "first draft")
+    assert manager.search_sessions("draft")
+
+    def fail_load(session_id):
+        raise AssertionError("index must not be rebuilt after the first search")
+
+    monkeypatch.setattr(manager.storage, "load", fail_load)
+
+    session.messages[0]["content"] = "final version"
+    manager.update_session(session)
+    assert manager.search_sessions("draft") == []
+    assert manager.search_sessions("final")[0].matches[0].snippet == "final version"
+
+    other = _session(manager, "새 메모", "회의록 정리")
+    assert manager.search_sessions("회의록")[0].session_id == other.id
+
+    manager.delete_session(other.id)
+    assert manager.search_sessions("회의록") == []
+    assert manager.search_sessions("메모") == []
@@ -0,0 +1,136 @@
+import json
+import threading
+
+from backend.managers.chat_sessions import ChatSessionManager
+from backend.managers.storage import JsonSessionStorage, LogSessionStorage
+from backend.managers.storage.base import write_json_atomic
+
+
+def test_log_engine_roundtrip(tmp_path):
+    manager = ChatSessionManager(str(tmp_path), engine="log")
+    session = manager.create_session("log")
+    session.messages.append({"role": "user", "content": "안녕하세요"})
+    session.messages.append({"role": "assistant", "content": "반갑습니다"})
+    session.metadata["k"] = "v"
+    manager.update_session(session)
+    manager.close()
+
+    restored = ChatSessionManager(str(tmp_path), engine="log").get_session(session.id)
+
+    assert restored.messages == session.messages
+    assert restored.metadata == {"k": "v"}
+    assert not (tmp_path / f"{session.id}.json").exists()
+
+
+def test_log_engine_appends_only_new_messages(tmp_path):
+    manager = ChatSessionManager(str(tmp_path), engine="log")
+    session = manager.create_session("log")
+    for i in range(50):
+        session.messages.append({"role": "user", "content": "x" * 200 + str(i)})
+    manager.update_session(session)
+
+    log_file = tmp_path / f"{session.id}.log.jsonl"
+    size_before = log_file.stat().st_size
+
+    session.messages.append({"role": "user", "content": "one more"})
+    manager.update_session(session)
+
+    appended = log_file.stat().st_size - size_before
+    assert appended < 100
+
+
+def test_log_engine_save_serializes_only_new_messages(tmp_path, monkeypatch):
+    storage = LogSessionStorage(str(tmp_path))
+    manager = ChatSessionManager(str(tmp_path), storage=storage)
+    session = manager.create_session("log")
+    session.messages.extend({"role": "user", "content": f"message {i}"} for i in range(50))
+    manager.update_session(session)
+
+    dumped = []
+    original_dumps = json.dumps
+    monkeypatch.setattr(
+        json, "dumps", lambda obj, **kw: dumped.append(obj) or original_dumps(obj, **kw)
+    )
+    session.messages.append({"role": "user", "content": "one more"})
+    storage.save(session)
+
+    assert dumped == [{"op": "append", "m": {"role": "user", "content": "one more"}}]
+
+
+def test_log_engine_records_in_place_edits(tmp_path):
+    manager = ChatSessionManager(str(tmp_path), engine="log")
+    session = manager.create_session("log")
+    session.messages.extend(
+        [{"role": "user", "content": "q"}, {"role": "assistant", "content": ""}]
+    )
+    manager.update_session(session)
+
+    session.messages[-1]["content"] = "streamed answer"
+    manager.update_session(session)
+    session.messages.pop(0)
+    manager.update_session(session)
+
+    restored = LogSessionStorage(str(tmp_path)).load(session.id)
+    assert restored.messages == [{"role": "assistant", "content": "streamed answer"}]
+
+
+def test_log_engine_compacts_and_repairs_torn_tail(tmp_path):
+    storage = LogSessionStorage(str(tmp_path), compact_min_records=4, compact_ratio=2.0)
+    manager = ChatSessionManager(str(tmp_path), storage=storage)
+    session = manager.create_session("log")
+    session.messages.append({"role": "assistant", "content": ""})
+    for i in range(6):
+        session.messages[-1]["content"] = f"partial {i}"
+        manager.update_session(session)
+
+    log_file = tmp_path / f"{session.id}.log.jsonl"
+    assert len(log_file.read_text(encoding="utf-8").splitlines()) <= 4
+    assert not list(tmp_path.glob("*.tmp"))
+
+    with open(log_file, "a", encoding="utf-8") as f:
+        f.write('{"op": "append", "m": {"role": "us')
+
+    restored = LogSessionStorage(str(tmp_path)).load(session.id)
+    assert restored.messages == [{"role": "assistant", "content": "partial 5"}]
+    assert log_file.read_text(encoding="utf-8").endswith("\n")
+
+
+def test_log_engine_migrates_json_sessions(tmp_path):
+    json_manager = ChatSessionManager(str(tmp_path))
+    session = json_manager.create_session("legacy")
+    session.messages.append({"role": "user", "content": "old"})
+    json_manager.update_session(session)
+    json_manager.close()
+
+    log_manager = ChatSessionManager(str(tmp_path), engine="log")
+    loaded = log_manager.get_session(session.id)
+    loaded.messages.append({"role": "assistant", "content": "new"})
+    log_manager.update_session(loaded)
+
+    assert not (tmp_path / f"{session.id}.json").exists()
+    meta = json.loads((tmp_path / f"{session.id}.meta.json").read_text(encoding="utf-8"))
+    assert "messages" not in meta
+    assert LogSessionStorage(str(tmp_path)).load(session.id).messages == loaded.messages
+    assert JsonSessionStorage(str(tmp_path)).load(session.id) is None
+
+
+def test_concurrent_atomic_writes_use_separate_temp_files(tmp_path):
+    target = tmp_path / "index.json"
+    errors = []
+
+    def writer(n):
+        try:
+            for i in range(50):
+                write_json_atomic(target, {"writer": n, "i": i, "pad": "x" * 2000})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert json.loads(target.read_text(encoding="utf-8"))["i"] == 49
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from backend.managers.session_usage import InMemorySessionUsageStore
+from backend.managers.usage_tracker import UsageTracker
+from backend.models.data_models import TokenUsage
+
+
+def _usage(tokens, cost, model="gpt-4o"):
+    return TokenUsage(
+        input_tokens=tokens,
+        output_tokens=0,
+        total_tokens=tokens,
+        model_name=model,
+        provider="openai",
+        timestamp=datetime.now(),
+        cost_usd=cost,
+    )
+
+
+def test_session_usage_is_tracked_per_key(tmp_path):
+    tracker = UsageTracker(str(tmp_path), session_store=InMemorySessionUsageStore(max_sessions=2))
+    tracker.add_usage(_usage(100, 0.01), "s1")
+    tracker.add_usage(_usage(50, 0.02, "gpt-4o-mini"), "s1")
+    tracker.add_usage(_usage(10, 0.5))
+
+    s1 = tracker.get_session_usage("s1")
+    assert (s1["total_tokens"], s1["total_cost"], s1["total_requests"]) == (150, 0.03, 2)
+    assert s1["by_model"]["openai_gpt-4o-mini"] == {"tokens": 50, "cost": 0.02, "requests": 1}
+    assert tracker.get_session_usage()["total_tokens"] == 10
+
+    tracker.add_usage(_usage(1, 0.0), "s2")  # 가장 오래 쓰지 않은 s1 제거
+    assert tracker.get_session_usage("s1")["total_requests"] == 0
+    tracker.reset_session_usage()
+    assert tracker.get_session_usage()["total_requests"] == 0
+    assert tracker.get_total_usage_from_history()["total_requests"] == 4
+
+
+def test_backend_does_not_import_streamlit(tmp_path):
+    code = (
+        "import sys\n"
+        "from backend.managers.usage_tracker import UsageTracker\n"
+        "from backend.managers.model_manager import EnhancedModelManager\n"
+        f"UsageTracker({str(tmp_path)!r}).get_session_usage()\n"
+        "assert 'streamlit' not in sys.modules, 'streamlit imported'\n"
+    )
+    root = Path(__file__).resolve().parent.parent
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
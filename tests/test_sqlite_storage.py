@@ -0,0 +1,277 @@
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.managers.chat_sessions import ChatSessionManager
+from backend.managers.favorite_manager import FavoriteManager
+from backend.managers.storage import (
+    SQLiteDatabase,
+    SQLiteFavoriteStore,
+    SQLiteUsageStore,
+)
+from backend.managers.storage.migrate import is_migrated, migrate_json_to_sqlite
+from backend.managers.usage_tracker import UsageTracker
+from backend.models.data_models import TokenUsage
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = SQLiteDatabase(str(tmp_path / "tedos.db"))
+    yield db
+    db.close()
+
+
+def _usage(tokens, cost, when, model="gpt-4o"):
+    return TokenUsage(
+        input_tokens=tokens // 2,
+        output_tokens=tokens - tokens // 2,
+        total_tokens=tokens,
+        model_name=model,
+        provider="openai",
+        timestamp=when,
+        cost_usd=cost,
+    )
+
+
+def test_sqlite_uses_wal_mode(database):
+    mode = database.connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_sqlite_session_roundtrip_and_index(tmp_path, database):
+    manager = ChatSessionManager(str(tmp_path), engine="sqlite", database=database)
+    session = manager.create_session("sqlite")
+    session.messages.append({"role": "user", "content": "안녕하세요"})
+    session.messages.append({"role": "assistant", "content": "반갑습니다"})
+    manager.update_session(session)
+    manager.pin_session(session.id)
+
+    reopened = ChatSessionManager(str(tmp_path), engine="sqlite", database=database)
+    summaries, _ = reopened.list_session_summaries()
+
+    assert [s.id for s in summaries] == [session.id]
+    assert summaries[0].is_pinned
+    assert summaries[0].preview == "반갑습니다"
+    assert reopened.get_session(session.id).messages == session.messages
+    assert not (tmp_path / "chat_sessions.json").exists()
+
+    session = reopened.get_session(session.id)
+    session.messages[-1]["content"] = "수정됨"
+    reopened.update_session(session)
+    assert reopened.get_session(session.id).messages[-1]["content"] == "수정됨"
+
+    assert reopened.delete_session(session.id)
+    count = database.connection().execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+    assert count == 0
+
+
+def test_sqlite_sessions_visible_across_workers(tmp_path):
+    worker_a = SQLiteDatabase(str(tmp_path / "tedos.db"))
+    worker_b = SQLiteDatabase(str(tmp_path / "tedos.db"))
+    try:
+        manager_a = ChatSessionManager(str(tmp_path), engine="sqlite", database=worker_a)
+        manager_b = ChatSessionManager(str(tmp_path), engine="sqlite", database=worker_b)
+
+        session = manager_a.create_session("from a")
+
+        summaries, _ = manager_b.list_session_summaries()
+        assert [s.id for s in summaries] == [session.id]
+        assert manager_b.get_session(session.id).title == "from a"
+    finally:
+        worker_a.close()
+        worker_b.close()
+
+
+def test_sqlite_unpin_sees_sessions_pinned_by_another_worker(tmp_path):
+    worker_a = SQLiteDatabase(str(tmp_path / "tedos.db"))
+    worker_b = SQLiteDatabase(str(tmp_path / "tedos.db"))
+    try:
+        manager_a = ChatSessionManager(str(tmp_path), engine="sqlite", database=worker_a)
+        manager_b = ChatSessionManager(str(tmp_path), engine="sqlite", database=worker_b)
+
+        session = manager_a.create_session("from a")
+        manager_a.pin_session(session.id)
+
+        assert manager_b.unpin_session(session.id) is True
+        assert manager_b.get_pinned_sessions_count() == 0
+        assert manager_b.get_session(session.id).is_pinned is False
+    finally:
+        worker_a.close()
+        worker_b.close()
+
+
+def test_sqlite_favorites_tag_query(tmp_path, database):
+    manager = FavoriteManager(str(tmp_path), store=SQLiteFavoriteStore(database))
+    now = datetime.now()
+    first = manager.add_favorite("s", "m1", "assistant", "Python tips", now, tags=["Code", "py"])
+    manager.add_favorite("s", "m2", "assistant", "Cooking", now, tags=["food"])
+    manager.update_favorite_details(first.id, notes="keep")
+
+    reloaded = FavoriteManager(str(tmp_path), store=SQLiteFavoriteStore(database))
+
+    assert [f.id for f in reloaded.find_favorites(tags=["code", "PY"])] == [first.id]
+    assert reloaded.find_favorites(tags=["code", "food"]) == []
+    assert [f.id for f in reloaded.find_favorites(query="KEEP")] == [first.id]
+    assert reloaded.remove_favorite(first.id)
+    assert len(FavoriteManager(str(tmp_path), store=SQLiteFavoriteStore(database)).list_all_favorites()) == 1
+
+
+def test_sqlite_usage_summary_matches_json_shape(tmp_path, database):
+    tracker = UsageTracker(str(tmp_path / "usage"), store=SQLiteUsageStore(database))
+    today = datetime.now()
+    old = today - timedelta(days=120)
+    tracker.store.add_many(
+        [_usage(100, 0.01, today), _usage(50, 0.02, today, "gpt-4o-mini"), _usage(10, 0.5, old)]
+    )
+
+    assert tracker.get_total_usage_from_history() == {
+        "total_tokens": 160,
+        "total_cost": 0.53,
+        "total_requests": 3,
+        "total_retries": 0,
+    }
+    assert tracker.get_today_usage_from_summary() == {
+        "total_tokens": 150,
+        "total_cost": 0.03,
+        "total_requests": 2,
+        "total_retries": 0,
+    }
+    day = tracker.get_usage_by_date_range(today.date(), today.date())[today.date().isoformat()]
+    assert day["by_model"]["openai_gpt-4o"] == {"tokens": 100, "cost": 0.01, "requests": 1}
+
+    snapshot = tracker.get_usage_snapshot()
+    assert snapshot["today_usage"] == tracker.get_today_usage_from_summary()
+    assert snapshot["usage_by_model"] == tracker.get_usage_by_model(30)
+
+    assert tracker.cleanup_old_data(keep_days=90) == 1
+    assert tracker.get_total_usage_from_history()["total_requests"] == 2
+    assert tracker.get_usage_snapshot()["total_usage"]["total_requests"] == 2
+
+
+def test_usage_retries_column_added_to_existing_database(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE usage (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+        "day TEXT NOT NULL, provider TEXT NOT NULL, model_name TEXT NOT NULL, "
+        "input_tokens INTEGER NOT NULL, output_tokens INTEGER NOT NULL, "
+        "total_tokens INTEGER NOT NULL, cost_usd REAL NOT NULL DEFAULT 0)"
+    )
+    conn.commit()
+    conn.close()
+
+    database = SQLiteDatabase(str(path))
+    try:
+        store = SQLiteUsageStore(database)
+        usage = _usage(10, 0.1, datetime.now())
+        usage.retries = 2
+        store.add(usage)
+        assert store.totals()["total_retries"] == 2
+        assert store.daily_summary()[usage.timestamp.date().isoformat()]["retries"] == 2
+    finally:
+        database.close()
+
+
+def test_migrate_json_layout_once(tmp_path, database):
+    sessions_dir = tmp_path / "sessions"
+    favorites_dir = tmp_path / "favorites"
+    usage_dir = tmp_path / "usage"
+
+    json_manager = ChatSessionManager(str(sessions_dir))
+    session = json_manager.create_session("legacy")
+    session.messages.append({"role": "user", "content": "old"})
+    json_manager.update_session(session)
+    json_manager.close()
+
+    FavoriteManager(str(favorites_dir)).add_favorite(
+        session.id, "m1", "user", "old", datetime.now(), tags=["x"]
+    )
+    # 필드가 빠진 즐겨찾기는 건너뛰고 나머지는 이전
+    favorites_file = favorites_dir / "favorites_data.json"
+    favorites = json.loads(favorites_file.read_text(encoding="utf-8"))
+    favorites["broken"] = {"id": "broken", "message_id": "m2"}
+    favorites_file.write_text(json.dumps(favorites), encoding="utf-8")
+
+    usage_dir.mkdir()
+    with open(usage_dir / "usage_history.jsonl", "w", encoding="utf-8") as f:
+        f.write(json.dumps(_usage(30, 0.1, datetime.now()).to_dict()) + "\n")
+        f.write("{broken\n")
+
+    counts = migrate_json_to_sqlite(
+        database, str(sessions_dir), str(favorites_dir), str(usage_dir)
+    )
+
+    assert counts == {"sessions": 1, "favorites": 1, "usage": 1}
+    assert is_migrated(database)
+    assert migrate_json_to_sqlite(
+        database, str(sessions_dir), str(favorites_dir), str(usage_dir)
+    ) == {"sessions": 0, "favorites": 0, "usage": 0}
+
+    manager = ChatSessionManager(str(sessions_dir), engine="sqlite", database=database)
+    assert manager.get_session(session.id).messages == session.messages
+    assert SQLiteUsageStore(database).totals()["total_tokens"] == 30
+    assert len(SQLiteFavoriteStore(database).find(tags=["X"])) == 1
+
+
+def test_failed_commit_rolls_back_and_connection_stays_usable(database):
+    with pytest.raises(sqlite3.IntegrityError):
+        with database.transaction() as conn:
+            # 지연된 외래 키 위반은 COMMIT 시점에 실패함
+            conn.execute("PRAGMA defer_foreign_keys=ON")
+            conn.execute(
+                "INSERT INTO messages (session_id, position, digest, body) VALUES ('x', 0, '', '')"
+            )
+
+    assert not database.connection().in_transaction
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO meta (key, value) VALUES ('after', '1')")
+    assert database.get_meta("after") == "1"
+    assert database.connection().execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 0
+
+
+def test_nested_transaction_failure_only_undoes_inner_writes(database):
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO meta (key, value) VALUES ('outer', '1')")
+        with pytest.raises(RuntimeError):
+            with database.transaction() as inner:
+                inner.execute("INSERT INTO meta (key, value) VALUES ('inner', '1')")
+                raise RuntimeError("boom")
+        assert conn.in_transaction
+
+    assert database.get_meta("outer") == "1"
+    assert database.get_meta("inner") is None
+    assert not database.connection().in_transaction
+
+
+def test_search_reindexes_only_sessions_changed_by_another_worker(tmp_path):
+    worker_a = SQLiteDatabase(str(tmp_path / "tedos.db"))
+    worker_b = SQLiteDatabase(str(tmp_path / "tedos.db"))
+    try:
+        manager_a = ChatSessionManager(str(tmp_path), engine="sqlite", database=worker_a)
+        manager_b = ChatSessionManager(str(tmp_path), engine="sqlite", database=worker_b)
+        sessions = [manager_a.create_session(f"topic {i}") for i in range(5)]
+        assert manager_b.search_sessions("topic")
+
+        loaded = []
+        original_load = manager_b.storage.load
+        manager_b.storage.load = lambda s_id: (loaded.append(s_id), original_load(s_id))[1]
+
+        edited = sessions[0]
+        edited.messages.append({"role": "user", "content": "aurora borealis"})
+        manager_a.update_session(edited)
+        added = manager_a.create_session("new one")
+        manager_a.delete_session(sessions[1].id)
+
+        results = manager_b.search_sessions("aurora")
+        assert [r.session_id for r in results] == [edited.id]
+        assert set(loaded) == {edited.id, added.id}
+        assert {r.session_id for r in manager_b.search_sessions("topic")} == {
+            s.id for s in sessions[2:]
+        } | {edited.id}
+    finally:
+        worker_a.close()
+        worker_b.close()
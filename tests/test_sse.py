@@ -0,0 +1,70 @@
+import asyncio
+import json
+
+from backend.utils.sse import EventBuffer, EventStreamRegistry, format_event
+
+
+def _parse(frames):
+    events = []
+    for frame in frames:
+        if frame.startswith(":"):
+            events.append(("comment", None, None))
+            continue
+        fields = dict(line.split(": ", 1) for line in frame.strip().split("\n"))
+        events.append((fields["event"], fields.get("id"), json.loads(fields["data"])))
+    return events
+
+
+def test_format_event_keeps_multiline_text_in_one_data_line():
+    frame = format_event("token", {"text": "line 1\nline 2\n\ndata: x"}, event_id=7, retry=1000)
+    assert frame == 'retry: 1000\nid: 7\nevent: token\ndata: {"text": "line 1\\nline 2\\n\\ndata: x"}\n\n'
+
+
+def test_resume_from_last_event_id_and_heartbeat():
+    async def main():
+        buffer = EventBuffer("g1", heartbeat_seconds=0.01)
+        buffer.append("token", {"text": "a"})
+        buffer.append("token", {"text": "b"})
+
+        frames = []
+
+        async def consume():
+            async for frame in buffer.subscribe(last_event_id=1):
+                frames.append(frame)
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.05)  # 이벤트가 없는 동안 하트비트
+        buffer.append("done", {"cancelled": False})
+        buffer.close()
+        await task
+        return frames
+
+    events = _parse(asyncio.run(main()))
+    assert events[0] == ("token", "2", {"text": "b"})
+    assert ("comment", None, None) in events
+    assert events[-1] == ("done", "3", {"cancelled": False})
+
+
+def test_trimmed_buffer_reports_gap_and_abandon_callback_fires():
+    async def main():
+        abandoned = []
+        buffer = EventBuffer("g2", max_events=2, grace_seconds=0.01, on_abandoned=lambda: abandoned.append(True))
+        for i in range(4):
+            buffer.append("token", {"text": str(i)})  # 4개가 되면 앞의 2개를 버림
+
+        gap = [frame async for frame in buffer.subscribe(last_event_id=1)]
+        await asyncio.sleep(0.05)
+        return gap, abandoned
+
+    gap, abandoned = asyncio.run(main())
+    assert _parse(gap)[0][0] == "error"
+    assert abandoned == [True]
+
+
+def test_registry_expires_closed_buffers():
+    registry = EventStreamRegistry(ttl_seconds=0)
+    buffer = registry.create("g3")
+    assert registry.get("g3") is buffer
+    buffer.close()
+    buffer.closed_at -= 1
+    assert registry.get("g3") is None
@@ -0,0 +1,44 @@
+from backend.models.enums import ModelProvider
+from backend.utils.token_counter import TokenCounter
+
+
+class FakeEncoding:
+    name = "fake_base"
+
+    def __init__(self):
+        self.batches = []
+
+    def encode_batch(self, texts, disallowed_special=()):
+        self.batches.append(list(texts))
+        return [text.split() for text in texts]
+
+
+def test_openai_counts_are_batched_and_memoized():
+    counter = TokenCounter()
+    encoding = FakeEncoding()
+    counter._encodings["gpt-4o"] = encoding
+
+    assert counter.method(ModelProvider.OPENAI, "gpt-4o") == "tiktoken:fake_base"
+    assert counter.count_texts(["a b c", "d e", "a b c", ""], "openai", "gpt-4o") == [3, 2, 3, 0]
+    assert encoding.batches == [["a b c", "d e"]]  # 같은 내용은 한 번만 인코딩
+
+    messages = [{"role": "user", "content": "a b c"}, {"role": "user", "content": "x y z w"}]
+    assert counter.count_messages(messages, "openai", "gpt-4o") == [3 + 4, 4 + 4]
+    assert encoding.batches[-1] == ["x y z w"]
+    assert counter.stats()["hits"] == 1
+
+
+def test_approximations_and_fallback_without_encoding():
+    counter = TokenCounter(memo_size=2)
+    counter._encodings["gpt-unknown"] = None  # 인코딩을 불러오지 못한 경우
+
+    text = "x" * 70
+    assert counter.count_text(text, ModelProvider.ANTHROPIC) == 20
+    assert counter.count_text(text, "google") == 18
+    assert counter.count_text(text, "openai", "gpt-unknown") == 18
+    assert not counter.is_exact("openai", "gpt-unknown")
+
+    image = {"type": "image_url", "image_url": {"url": "data:..."}}
+    message = {"role": "user", "content": [{"type": "text", "text": text}, image]}
+    assert counter.count_message(message, "anthropic") == 20 + 1000 + 4
+    assert counter.stats()["memo_size"] == 2
@@ -0,0 +1,112 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.managers.storage import SQLiteDatabase, SQLiteUsageStore
+from backend.managers.usage_tracker import UsageTracker
+from backend.models.data_models import TokenUsage
+
+BASE = datetime(2026, 3, 2, 9, 15)  # 월요일
+
+
+def _usage(tokens, cost, when, provider="openai", model="gpt-4o"):
+    return TokenUsage(
+        input_tokens=tokens // 2,
+        output_tokens=tokens - tokens // 2,
+        total_tokens=tokens,
+        model_name=model,
+        provider=provider,
+        timestamp=when,
+        cost_usd=cost,
+    )
+
+
+def _fill(tracker):
+    tracker.add_usage(_usage(100, 0.01, BASE))
+    tracker.add_usage(_usage(50, 0.02, BASE + timedelta(minutes=30)))  # 같은 시간 버킷
+    tracker.add_usage(_usage(30, 0.03, BASE + timedelta(hours=2), "anthropic", "claude"))
+    tracker.add_usage(_usage(20, 0.04, BASE + timedelta(days=1)))
+    tracker.add_usage(_usage(999, 9.0, BASE + timedelta(days=40)))  # 범위 밖
+
+
+def test_range_group_and_bucket_query(tmp_path):
+    tracker = UsageTracker(str(tmp_path), flush_interval=0)
+    _fill(tracker)
+    start, end = BASE.replace(hour=0, minute=0), BASE + timedelta(days=7)
+
+    result = tracker.query_usage(start, end, group_by=["provider"], bucket="day", percentiles=[50])
+    assert result["totals"]["tokens"] == 200
+    assert result["totals"]["requests"] == 4
+    assert result["rows"] == 3  # (시간, 모델) 버킷 수
+
+    openai, anthropic = result["groups"]
+    assert openai["key"] == {"provider": "openai"}
+    assert [(b["start"], b["tokens"], b["requests"]) for b in openai["buckets"]] == [
+        ("2026-03-02", 150, 2),
+        ("2026-03-03", 20, 1),
+    ]
+    assert openai["totals"]["cost"] == pytest.approx(0.07)
+    assert openai["percentiles"]["p50"]["tokens"] == 85.0
+    assert anthropic["totals"]["tokens"] == 30
+
+    hourly = tracker.query_usage(start, end, bucket="hour")
+    assert [b["start"] for b in hourly["groups"][0]["buckets"]][:2] == [
+        "2026-03-02T09:00:00",
+        "2026-03-02T11:00:00",
+    ]
+    weekly = tracker.query_usage(start, end, group_by=["model"], bucket="week")
+    assert {g["key"]["model"]: g["buckets"][0]["start"] for g in weekly["groups"]} == {
+        "gpt-4o": "2026-03-02",
+        "claude": "2026-03-02",
+    }
+    monthly = tracker.query_usage(start, BASE + timedelta(days=60), bucket="month")
+    assert [b["start"] for b in monthly["groups"][0]["buckets"]] == ["2026-03-01", "2026-04-01"]
+
+    with pytest.raises(ValueError):
+        tracker.query_usage(start, end, bucket="minute")
+    with pytest.raises(ValueError):
+        tracker.query_usage(start, end, group_by=["session"])
+
+
+def test_checkpoint_is_reused_and_only_new_lines_are_replayed(tmp_path):
+    tracker = UsageTracker(str(tmp_path), flush_interval=0)
+    _fill(tracker)
+    tracker.query_usage(BASE, BASE + timedelta(hours=1))
+    tracker.close()
+
+    checkpoint_file = tmp_path / "usage_hourly.json"
+    checkpoint = json.loads(checkpoint_file.read_text())
+    assert checkpoint["cursor"] == (tmp_path / "usage_history.jsonl").stat().st_size
+
+    # 체크포인트 앞부분은 다시 읽지 않음: 값을 바꿔 두면 그대로 이어서 더해짐
+    checkpoint["columns"]["tokens"][0] = 1000
+    checkpoint_file.write_text(json.dumps(checkpoint))
+    reopened = UsageTracker(str(tmp_path), flush_interval=0)
+    reopened.add_usage(_usage(7, 0.0, BASE + timedelta(minutes=45)))
+
+    result = reopened.query_usage(BASE, BASE + timedelta(hours=1), bucket="total")
+    assert result["totals"]["tokens"] == 1007
+    assert result["totals"]["requests"] == 3
+
+
+def test_sqlite_backend_query_and_cleanup(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "tedos.db"))
+    try:
+        tracker = UsageTracker(
+            str(tmp_path / "usage"), store=SQLiteUsageStore(database), flush_interval=0
+        )
+        now = datetime.now()
+        tracker.add_usage(_usage(100, 0.01, now - timedelta(days=200)))
+        tracker.add_usage(_usage(40, 0.02, now))
+        start = now - timedelta(days=365)
+
+        result = tracker.query_usage(start, now + timedelta(hours=1), bucket="total")
+        assert result["totals"]["tokens"] == 140
+
+        tracker.cleanup_old_data(keep_days=90)
+        result = tracker.query_usage(start, now + timedelta(hours=1), bucket="total")
+        assert result["totals"]["tokens"] == 40
+        tracker.close()
+    finally:
+        database.close()
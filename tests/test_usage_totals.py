@@ -0,0 +1,159 @@
+import json
+from datetime import datetime
+
+from backend.managers import usage_tracker
+from backend.managers.storage.base import write_json_atomic
+from backend.managers.usage_tracker import UsageTracker
+from backend.models.data_models import TokenUsage
+
+
+def _usage(tokens, cost, retries=0):
+    usage = TokenUsage(
+        input_tokens=tokens,
+        output_tokens=0,
+        total_tokens=tokens,
+        model_name="gpt-4o",
+        provider="openai",
+        timestamp=datetime.now(),
+        cost_usd=cost,
+    )
+    usage.retries = retries
+    return usage
+
+
+def test_totals_are_checkpointed_and_only_the_tail_is_replayed(tmp_path):
+    tracker = UsageTracker(str(tmp_path), flush_interval=0)
+    tracker.add_usage(_usage(100, 0.01, retries=2))
+    tracker.add_usage(_usage(50, 0.02))
+    expected = {"total_tokens": 150, "total_cost": 0.03, "total_requests": 2, "total_retries": 2}
+    assert tracker.get_total_usage_from_history() == expected
+    assert not list(tmp_path.glob("*.tmp"))
+
+    checkpoint_file = tmp_path / "usage_totals.json"
+    checkpoint = json.loads(checkpoint_file.read_text())
+    assert checkpoint["offset"] == (tmp_path / "usage_history.jsonl").stat().st_size
+
+    # 체크포인트 앞부분은 다시 읽지 않음: 합계를 바꿔 두면 그대로 이어서 더해짐
+    checkpoint["total_tokens"] = 1000
+    checkpoint_file.write_text(json.dumps(checkpoint))
+    with open(tmp_path / "usage_history.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps(_usage(7, 0.5).to_dict()) + "\n")
+        f.write("not json\n")
+        f.write('{"total_tokens": 3')  # 아직 쓰는 중인 줄
+
+    totals = UsageTracker(str(tmp_path), flush_interval=0).get_total_usage_from_history()
+    assert totals == {"total_tokens": 1007, "total_cost": 0.53, "total_requests": 3, "total_retries": 2}
+
+
+def test_replaced_history_is_recomputed(tmp_path):
+    tracker = UsageTracker(str(tmp_path), flush_interval=0)
+    tracker.add_usage(_usage(100, 0.01))
+    tracker.add_usage(_usage(50, 0.02))
+
+    # 다른 내용으로 교체 (크기는 더 커도 앞부분이 달라짐)
+    (tmp_path / "usage_history.jsonl").write_text(
+        json.dumps(_usage(99999, 1.0).to_dict()) + "\n" + json.dumps(_usage(1, 0.0).to_dict()) + "\n"
+    )
+    assert UsageTracker(str(tmp_path), flush_interval=0).get_total_usage_from_history()["total_tokens"] == 100000
+
+    (tmp_path / "usage_history.jsonl").unlink()
+    assert tracker.get_total_usage_from_history()["total_requests"] == 0
+
+
+def test_dashboard_snapshot_matches_individual_views_and_is_cached(tmp_path, monkeypatch):
+    import backend.managers.usage_tracker as usage_tracker_module
+
+    tracker = UsageTracker(str(tmp_path), flush_interval=0)
+    tracker.add_usage(_usage(100, 0.01))
+    tracker.add_usage(_usage(50, 0.02, retries=1))
+
+    # 다른 프로세스가 쓴 요약 파일 (mtime/크기가 바뀌면 다시 읽음)
+    summary = json.loads((tmp_path / "daily_summary.json").read_text())
+    summary["2000-01-01"] = {"total_tokens": 5, "total_cost": 1.0, "requests": 1, "by_model": {}}
+    (tmp_path / "daily_summary.json").write_text(json.dumps(summary))
+
+    snapshot = tracker.get_usage_snapshot()
+    assert snapshot == {
+        "total_usage": tracker.get_total_usage_from_history(),
+        "today_usage": tracker.get_today_usage_from_summary(),
+        "weekly_usage": tracker.get_weekly_usage(),
+        "monthly_usage": tracker.get_monthly_usage(),
+        "usage_by_model": tracker.get_usage_by_model(30),
+        "usage_trends": tracker.get_usage_trends(7),
+        "estimated_monthly_cost": tracker.estimate_monthly_cost(),
+    }
+
+    loads = []
+    original_load = json.load
+    monkeypatch.setattr(usage_tracker_module.json, "load", lambda f: loads.append(f) or original_load(f))
+    assert tracker.get_usage_snapshot() is snapshot
+    assert loads == []  # 평상시에는 요약 파일을 읽지 않음
+
+    tracker.add_usage(_usage(1, 0.0))
+    refreshed = tracker.get_usage_snapshot()
+    assert refreshed["today_usage"]["total_requests"] == 3
+    assert refreshed["total_usage"]["total_requests"] == 3
+    assert loads == []  # 기록 추가도 메모리 사본을 갱신
+
+
+def test_buffered_writes_from_many_threads_are_not_lost(tmp_path):
+    import threading
+
+    tracker = UsageTracker(str(tmp_path), flush_interval=60, batch_size=10000)
+
+    def worker():
+        for _ in range(50):
+            tracker.add_usage(_usage(2, 0.001, retries=1))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 아직 파일에는 쓰지 않았지만 조회에는 바로 반영
+    assert not (tmp_path / "usage_history.jsonl").exists()
+    assert tracker.get_today_usage_from_summary()["total_requests"] == 400
+    assert tracker.get_total_usage_from_history() == {
+        "total_tokens": 800, "total_cost": 0.4, "total_requests": 400, "total_retries": 400
+    }
+
+    tracker.close()  # 종료 시 버퍼를 모두 저장
+    assert len((tmp_path / "usage_history.jsonl").read_text().splitlines()) == 400
+    reopened = UsageTracker(str(tmp_path))
+    assert reopened.get_total_usage_from_history()["total_requests"] == 400
+    assert reopened.get_today_usage_from_summary()["total_requests"] == 400
+
+
+def test_full_batch_is_flushed_in_background(tmp_path):
+    import time
+
+    tracker = UsageTracker(str(tmp_path), flush_interval=60, batch_size=3, fsync_policy="none")
+    for _ in range(3):
+        tracker.add_usage(_usage(1, 0.0))
+
+    history = tmp_path / "usage_history.jsonl"
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and not (history.exists() and len(history.read_text().splitlines()) == 3):
+        time.sleep(0.01)
+    assert len(history.read_text().splitlines()) == 3
+    tracker.close()
+
+
+def test_totals_read_during_flush_count_each_record_once(tmp_path, monkeypatch):
+    tracker = UsageTracker(str(tmp_path), flush_interval=0)
+    seen = []
+
+    def reading_write(path, data, **kwargs):
+        # 히스토리 줄은 이미 쓰였고 요약 파일은 아직 쓰는 중인 시점
+        seen.append(tracker.get_total_usage_from_history())
+        seen.append(tracker.get_usage_snapshot()["total_usage"])
+        write_json_atomic(path, data, **kwargs)
+
+    monkeypatch.setattr(usage_tracker, "write_json_atomic", reading_write)
+    tracker.add_usage(_usage(15, 0.01))
+
+    expected = {"total_tokens": 15, "total_cost": 0.01, "total_requests": 1, "total_retries": 0}
+    assert seen == [expected, expected]
+    assert tracker.get_usage_snapshot()["total_usage"] == expected
+    assert tracker.get_total_usage_from_history() == expected